@@ -9,14 +9,21 @@ import logging
 from datetime import datetime, date
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from config.settings import settings, TZ_HOBART, TZ_UTC
 from app.middleware.rate_limit import rate_limit_middleware
-from app.services.sms import get_sms_service, PhoneUtils
+from app.services.sms import PhoneUtils
+from app.services.sms_queue import get_sms_queue
 from app.services.bom import get_bom_service
+from app.services.http_clients import close_http_clients
+from app.models.sqlite_pool import get_connection_pool
+from app.services.metrics import get_metrics, persist_metrics_snapshot
+from app.services.terrain_cache import warm_terrain_caches
+from app.services.route_catalogue import refresh_route_catalogue
+from app.services.waypoint_index import get_waypoint_index
 from app.services.routes import get_route
 from app.services.formatter import ForecastFormatter
 
@@ -27,6 +34,7 @@ from app.routers import webhook, admin, api, auth, payments, routes, library, an
 try:
     from apscheduler.schedulers.asyncio import AsyncIOScheduler
     from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
     SCHEDULER_AVAILABLE = True
 except ImportError:
     SCHEDULER_AVAILABLE = False
@@ -159,11 +167,10 @@ async def push_forecast_to_user(user, forecast_type: str = "morning"):
                 total_messages=1
             )
 
-        # Send SMS
-        sms_service = get_sms_service()
+        # Queue SMS (sent by the outbound queue workers)
         cmd = "PUSH_AM" if forecast_type == "morning" else "PUSH_PM"
-        await sms_service.send_message(user.phone, message, command_type=cmd, message_type="scheduled_push")
-        logger.info(f"Pushed {forecast_type} forecast to {PhoneUtils.mask(user.phone)}")
+        get_sms_queue().enqueue(user.phone, message, command_type=cmd, message_type="scheduled_push")
+        logger.info(f"Queued {forecast_type} forecast for {PhoneUtils.mask(user.phone)}")
 
     except Exception as e:
         logger.error(f"Forecast generation failed: {e}")
@@ -277,6 +284,17 @@ async def lifespan(app: FastAPI):
 
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
 
+    # Warm-load elevation and NWS grid lookups persisted by previous runs
+    warm_terrain_caches()
+
+    # Load every route file once, then index SMS waypoint codes
+    # (route files + custom waypoints)
+    refresh_route_catalogue()
+    get_waypoint_index().build()
+
+    # Start the outbound SMS queue workers (resumes anything left queued)
+    get_sms_queue().start()
+
     # Initialize scheduler
     if SCHEDULER_AVAILABLE:
         scheduler = AsyncIOScheduler(timezone=TZ_HOBART)
@@ -305,8 +323,24 @@ async def lifespan(app: FastAPI):
             name="Hourly Overdue Check"
         )
 
+        # Upstream latency / cache hit-rate snapshot into the monitoring metrics table
+        scheduler.add_job(
+            persist_metrics_snapshot,
+            CronTrigger(minute=f"*/{settings.METRICS_SNAPSHOT_MINUTES}", timezone=TZ_HOBART),
+            id="metrics_snapshot",
+            name="Metrics Snapshot"
+        )
+
+        # Hot-reload edited/added/removed route files (catalogue + waypoint codes)
+        scheduler.add_job(
+            refresh_route_catalogue,
+            IntervalTrigger(seconds=settings.ROUTE_CATALOGUE_REFRESH_SECONDS),
+            id="route_catalogue_refresh",
+            name="Route Catalogue Refresh"
+        )
+
         scheduler.start()
-        logger.info("Scheduler started: 6AM/6PM forecasts + hourly overdue check")
+        logger.info("Scheduler started: 6AM/6PM forecasts + hourly overdue check + metrics snapshots")
     else:
         logger.warning("APScheduler not installed - scheduled pushes disabled")
 
@@ -315,8 +349,9 @@ async def lifespan(app: FastAPI):
     # Cleanup
     if scheduler:
         scheduler.shutdown()
-    bom_service = get_bom_service()
-    await bom_service.close()
+    await get_sms_queue().stop()
+    await close_http_clients()
+    get_connection_pool().close()
     logger.info("Shutdown complete")
 
 
@@ -375,6 +410,16 @@ async def root_health():
     return await api.health_check()
 
 
+@app.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(api.require_admin_api_key)])
+async def metrics():
+    """
+    Upstream latency and cache hit/miss counters (Prometheus text format).
+
+    Internal: requires the X-Admin-Key header, like the other admin API endpoints.
+    """
+    return get_metrics().render_prometheus()
+
+
 # ============================================================================
 # Exception Handler
 # ============================================================================
@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from typing import Optional
 from contextlib import contextmanager
 
+from app.models.sqlite_pool import get_connection_pool
+
 
 DB_PATH = os.environ.get("THUNDERBIRD_DB_PATH", "thunderbird.db")
 
@@ -100,13 +102,9 @@ class AccountStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def create(self, email: str, password_hash: str) -> Account:
         """
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from typing import Optional, List
 from contextlib import contextmanager
 
+from app.models.sqlite_pool import get_connection_pool
+
 
 DB_PATH = os.environ.get("THUNDERBIRD_DB_PATH", "thunderbird.db")
 
@@ -218,13 +220,9 @@ class AffiliateStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_affiliate(self, row: sqlite3.Row) -> Affiliate:
         """Convert database row to Affiliate object."""
@@ -436,13 +434,9 @@ class CommissionStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_commission(self, row: sqlite3.Row) -> Commission:
         """Convert database row to Commission object."""
@@ -778,13 +772,9 @@ class AttributionStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_attribution(self, row: sqlite3.Row) -> Attribution:
         """Convert database row to Attribution object."""
@@ -903,13 +893,9 @@ class ClickStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_click(self, row: sqlite3.Row) -> AffiliateClick:
         """Convert database row to AffiliateClick object."""
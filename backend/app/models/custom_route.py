@@ -4,17 +4,49 @@ Custom route models for Thunderbird Global.
 Handles user-created routes, waypoints, and the route library (admin-uploaded trails).
 Custom routes belong to accounts, waypoints have globally unique SMS codes.
 """
+import logging
 import os
 import sqlite3
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Callable, Optional, List
 from contextlib import contextmanager
 from enum import Enum
 
+from app.models.sqlite_pool import get_connection_pool
+
+logger = logging.getLogger(__name__)
 
 DB_PATH = os.environ.get("THUNDERBIRD_DB_PATH", "thunderbird.db")
 
+# Called with (db_path, sms_codes) after waypoints are created, updated or
+# deleted, so in-memory indexes (waypoint_index.py) can update just those codes
+WaypointListener = Callable[[str, List[str]], None]
+_waypoint_listeners: List[WaypointListener] = []
+
+
+def add_waypoint_listener(listener: WaypointListener) -> None:
+    """Register a callback for custom waypoint changes."""
+    if listener not in _waypoint_listeners:
+        _waypoint_listeners.append(listener)
+
+
+def remove_waypoint_listener(listener: WaypointListener) -> None:
+    """Unregister a waypoint change callback."""
+    if listener in _waypoint_listeners:
+        _waypoint_listeners.remove(listener)
+
+
+def _waypoints_changed(db_path: str, sms_codes: List[str]) -> None:
+    """Tell listeners which SMS codes changed (a failing listener doesn't fail the write)."""
+    if not sms_codes:
+        return
+    for listener in list(_waypoint_listeners):
+        try:
+            listener(db_path, sms_codes)
+        except Exception as e:
+            logger.warning(f"Waypoint listener failed for {sms_codes}: {e}")
+
 
 class RouteStatus(str, Enum):
     """Status of a custom route."""
@@ -197,13 +229,9 @@ class CustomRouteStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_route(self, row: sqlite3.Row) -> CustomRoute:
         """Convert database row to CustomRoute object."""
@@ -348,6 +376,10 @@ class CustomRouteStore:
             True if deleted, False if not found
         """
         with self._get_connection() as conn:
+            codes = [row[0] for row in conn.execute(
+                "SELECT sms_code FROM custom_waypoints WHERE route_id = ?",
+                (route_id,)
+            )]
             # Delete waypoints first (manual cascade for SQLite)
             conn.execute(
                 "DELETE FROM custom_waypoints WHERE route_id = ?",
@@ -358,7 +390,9 @@ class CustomRouteStore:
                 (route_id,)
             )
             conn.commit()
-            return cursor.rowcount > 0
+
+        _waypoints_changed(self.db_path, codes)
+        return cursor.rowcount > 0
 
 
 class CustomWaypointStore:
@@ -369,13 +403,9 @@ class CustomWaypointStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_waypoint(self, row: sqlite3.Row) -> CustomWaypoint:
         """Convert database row to CustomWaypoint object."""
@@ -404,6 +434,12 @@ class CustomWaypointStore:
                 waypoints.append(self._row_to_waypoint(row))
         return waypoints
 
+    def list_all(self) -> List[CustomWaypoint]:
+        """Get every waypoint (used to build the waypoint code index)."""
+        with self._get_connection() as conn:
+            cursor = conn.execute("SELECT * FROM custom_waypoints")
+            return [self._row_to_waypoint(row) for row in cursor]
+
     def get_by_sms_code(self, sms_code: str) -> Optional[CustomWaypoint]:
         """Get waypoint by SMS code (globally unique)."""
         with self._get_connection() as conn:
@@ -458,18 +494,19 @@ class CustomWaypointStore:
             )
             conn.commit()
 
-            return CustomWaypoint(
-                id=cursor.lastrowid,
-                route_id=route_id,
-                type=waypoint_type,
-                name=name,
-                sms_code=sms_code.upper(),
-                lat=lat,
-                lng=lng,
-                elevation=elevation,
-                order_index=order_index,
-                created_at=datetime.fromisoformat(now)
-            )
+        _waypoints_changed(self.db_path, [sms_code.upper()])
+        return CustomWaypoint(
+            id=cursor.lastrowid,
+            route_id=route_id,
+            type=waypoint_type,
+            name=name,
+            sms_code=sms_code.upper(),
+            lat=lat,
+            lng=lng,
+            elevation=elevation,
+            order_index=order_index,
+            created_at=datetime.fromisoformat(now)
+        )
 
     def update(
         self,
@@ -523,7 +560,17 @@ class CustomWaypointStore:
                 params
             )
             conn.commit()
-            return cursor.rowcount > 0
+
+            # Reordering alone doesn't change what a code resolves to
+            codes = []
+            if any(value is not None for value in (name, waypoint_type, lat, lng, elevation)):
+                codes = [row[0] for row in conn.execute(
+                    "SELECT sms_code FROM custom_waypoints WHERE id = ?",
+                    (waypoint_id,)
+                )]
+
+        _waypoints_changed(self.db_path, codes)
+        return cursor.rowcount > 0
 
     def delete(self, waypoint_id: int) -> bool:
         """
@@ -533,12 +580,18 @@ class CustomWaypointStore:
             True if deleted, False if not found
         """
         with self._get_connection() as conn:
+            codes = [row[0] for row in conn.execute(
+                "SELECT sms_code FROM custom_waypoints WHERE id = ?",
+                (waypoint_id,)
+            )]
             cursor = conn.execute(
                 "DELETE FROM custom_waypoints WHERE id = ?",
                 (waypoint_id,)
             )
             conn.commit()
-            return cursor.rowcount > 0
+
+        _waypoints_changed(self.db_path, codes)
+        return cursor.rowcount > 0
 
     def check_sms_code_exists(self, sms_code: str) -> bool:
         """
@@ -568,13 +621,9 @@ class RouteLibraryStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_library(self, row: sqlite3.Row) -> RouteLibrary:
         """Convert database row to RouteLibrary object."""
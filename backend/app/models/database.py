@@ -10,6 +10,8 @@ from typing import Optional, List, Dict
 from dataclasses import dataclass, field
 from contextlib import contextmanager
 
+from app.models.sqlite_pool import get_connection_pool
+
 # Database file location - can be overridden by environment variable
 DB_PATH = os.environ.get("THUNDERBIRD_DB_PATH", "thunderbird.db")
 
@@ -165,13 +167,9 @@ class SQLiteUserStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
     
     def _row_to_user(self, row: sqlite3.Row, contacts: List[SafeCheckContact] = None) -> User:
         """Convert database row to User object. v3.0: handles optional dates."""
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from typing import Optional, List
 from contextlib import contextmanager
 
+from app.models.sqlite_pool import get_connection_pool
+
 
 DB_PATH = os.environ.get("THUNDERBIRD_DB_PATH", "thunderbird.db")
 
@@ -225,13 +227,9 @@ class OrderStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_order(self, row: sqlite3.Row) -> Order:
         """Convert database row to Order object."""
@@ -429,13 +427,9 @@ class BalanceStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def get_or_create(self, account_id: int) -> AccountBalance:
         """
@@ -654,13 +648,9 @@ class DiscountCodeStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """Get pooled database connection with row factory."""
+        with get_connection_pool().connection(self.db_path) as conn:
             yield conn
-        finally:
-            conn.close()
 
     def _row_to_discount_code(self, row: sqlite3.Row) -> DiscountCode:
         """Convert database row to DiscountCode object."""
@@ -0,0 +1,217 @@
+"""
+Pooled SQLite connections shared by all stores.
+
+Every store method used to open a fresh connection (default rollback
+journal, full fsync, empty statement cache) and close it again, so a
+single CAST reply paid several connects and schema reads.
+
+Design notes:
+- One long-lived connection per thread per database file, reused by
+  every store; the event loop thread and each threadpool worker get
+  their own, so connections are never shared between threads
+- Pragmas set once per connection: WAL, synchronous=NORMAL,
+  busy_timeout, mmap_size; bigger prepared statement cache. Tunables
+  come from the environment like THUNDERBIRD_DB_PATH, since the stores
+  connect at import time, before config.settings may be loaded
+- Leaving the outermost block rolls back anything uncommitted, matching
+  the old close-per-call behaviour; nested blocks share the connection
+- Reopened if the database file is replaced (restore, tests) or after
+  a fork; ":memory:" is never pooled, each block gets a fresh database
+- Connections close when their thread exits, or all at once via
+  close() at shutdown
+"""
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MEMORY = ":memory:"
+
+# Tunables (environment overrides)
+BUSY_TIMEOUT_MS = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+MMAP_SIZE_BYTES = int(os.environ.get("SQLITE_MMAP_SIZE_BYTES", str(64 * 1024 * 1024)))
+CACHED_STATEMENTS = int(os.environ.get("SQLITE_CACHED_STATEMENTS", "256"))
+
+
+class _PooledConnection:
+    """A thread's connection to one database file."""
+
+    __slots__ = ("conn", "file_id", "pid", "depth")
+
+    def __init__(self, conn: sqlite3.Connection, file_id: Optional[Tuple[int, int]]):
+        self.conn = conn
+        self.file_id = file_id
+        self.pid = os.getpid()
+        self.depth = 0
+
+
+class _ThreadConnections:
+    """A thread's {db_path: _PooledConnection}; closed when the thread goes."""
+
+    def __init__(self):
+        self.entries: Dict[str, _PooledConnection] = {}
+
+    def close(self) -> None:
+        for entry in self.entries.values():
+            try:
+                entry.conn.close()
+            except sqlite3.Error:
+                pass
+        self.entries.clear()
+
+    def __del__(self):
+        self.close()
+
+
+def _file_id(db_path: str) -> Optional[Tuple[int, int]]:
+    """(device, inode) of the database file, or None if it doesn't exist yet."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class ConnectionPool:
+    """
+    Per-thread SQLite connections keyed by database path.
+
+    Usage:
+        with get_connection_pool().connection(db_path) as conn:
+            conn.execute("UPDATE ...")
+            conn.commit()
+    """
+
+    def __init__(
+        self,
+        busy_timeout_ms: Optional[int] = None,
+        mmap_size: Optional[int] = None,
+        cached_statements: Optional[int] = None
+    ):
+        """
+        Args:
+            busy_timeout_ms: Wait for a locked database (default BUSY_TIMEOUT_MS)
+            mmap_size: Bytes of the file to memory-map (default MMAP_SIZE_BYTES)
+            cached_statements: Prepared statements kept per connection (default CACHED_STATEMENTS)
+        """
+        self.busy_timeout_ms = BUSY_TIMEOUT_MS if busy_timeout_ms is None else busy_timeout_ms
+        self.mmap_size = MMAP_SIZE_BYTES if mmap_size is None else mmap_size
+        self.cached_statements = cached_statements or CACHED_STATEMENTS
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads: "weakref.WeakSet[_ThreadConnections]" = weakref.WeakSet()
+        self.opened = 0
+        self.reused = 0
+
+    def open(self, db_path: str) -> sqlite3.Connection:
+        """Open a connection with the pool's pragmas (not pooled)."""
+        conn = sqlite3.connect(
+            db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,  # Only so close() can run from the shutdown thread
+        )
+        conn.row_factory = sqlite3.Row
+        if db_path != MEMORY:
+            configure(conn, self.busy_timeout_ms, self.mmap_size)
+        with self._lock:
+            self.opened += 1
+        return conn
+
+    def _thread_connections(self) -> _ThreadConnections:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = _ThreadConnections()
+            with self._lock:
+                self._threads.add(connections)
+        return connections
+
+    def _checkout(self, db_path: str) -> _PooledConnection:
+        connections = self._thread_connections().entries
+        entry = connections.get(db_path)
+        if entry is not None and entry.depth == 0:
+            if entry.pid != os.getpid():
+                # Inherited across fork: abandon without closing the parent's handle
+                del connections[db_path]
+                entry = None
+            elif entry.file_id != _file_id(db_path):
+                logger.info(f"SQLite file {db_path} replaced, reopening connection")
+                entry.conn.close()
+                del connections[db_path]
+                entry = None
+        if entry is None:
+            conn = self.open(db_path)
+            entry = connections[db_path] = _PooledConnection(conn, _file_id(db_path))
+        else:
+            with self._lock:
+                self.reused += 1
+        return entry
+
+    @contextmanager
+    def connection(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """
+        This thread's connection to `db_path`.
+
+        Uncommitted changes are rolled back when the outermost block exits.
+        """
+        if db_path == MEMORY:
+            conn = self.open(db_path)
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        entry = self._checkout(db_path)
+        entry.depth += 1
+        try:
+            yield entry.conn
+        finally:
+            entry.depth -= 1
+            if entry.depth == 0 and entry.conn.in_transaction:
+                entry.conn.rollback()
+
+    def stats(self) -> Dict[str, int]:
+        """Connections opened vs reused, and threads holding connections."""
+        with self._lock:
+            return {"opened": self.opened, "reused": self.reused, "threads": len(self._threads)}
+
+    def close(self) -> None:
+        """Close every pooled connection (shutdown, tests)."""
+        with self._lock:
+            threads = list(self._threads)
+        for connections in threads:
+            connections.close()
+
+
+def configure(conn: sqlite3.Connection, busy_timeout_ms: int, mmap_size: int) -> None:
+    """Apply the shared pragmas to a file-backed connection."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+    conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+
+
+# Singleton instance
+_pool: Optional[ConnectionPool] = None
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Get singleton connection pool."""
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool()
+    return _pool
+
+
+def reset_connection_pool() -> None:
+    """Close and reset the singleton pool (for testing)."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+    _pool = None
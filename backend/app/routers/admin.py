@@ -11,6 +11,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 
 from config.settings import settings, TZ_HOBART
 from app.services.sms import get_sms_service, PhoneUtils
+from app.services.sms_queue import get_sms_queue
 from app.services.admin import (
     user_store, User, UserStatus,
     create_session, validate_session, clear_session, check_password,
@@ -184,28 +185,17 @@ async def admin_push_forecast(phone: str, request: Request):
                 wind_threshold=wind_threshold
             )
 
-        # Send all messages
-        sms_service = get_sms_service()
-        sent_count = 0
-        errors = []
-
+        # Queue all messages (delivered in order by the queue workers)
         cmd_type = "ADMIN_PUSH_AM" if is_morning else "ADMIN_PUSH_PM"
-        for msg in messages:
-            result = await sms_service.send_message(to=phone, body=msg.content, command_type=cmd_type, message_type="admin_push")
-            if result.error:
-                errors.append(result.error)
-            else:
-                sent_count += 1
-
-        if errors:
-            return RedirectResponse(
-                f"/admin?msg=Sent {sent_count}/{len(messages)} messages. Errors: {'; '.join(errors[:2])}",
-                status_code=302
-            )
+        get_sms_queue().enqueue_batch(
+            phone, [msg.content for msg in messages],
+            command_type=cmd_type,
+            message_type="admin_push"
+        )
 
         forecast_type = "morning (hourly)" if is_morning else "evening (7-day)"
         return RedirectResponse(
-            f"/admin?msg=Sent {forecast_type} forecast to {phone} ({sent_count} messages)",
+            f"/admin?msg=Queued {forecast_type} forecast for {phone} ({len(messages)} messages)",
             status_code=302
         )
 
@@ -226,28 +216,25 @@ async def admin_push_all(request: Request):
     if not active:
         return RedirectResponse("/admin?msg=No active users to push to", status_code=302)
 
-    # Send to all active users
-    sms_service = get_sms_service()
-    sent = 0
+    # Queue for all active users
+    sms_queue = get_sms_queue()
+    queued = 0
     errors = 0
 
     for user in active:
         try:
-            result = await sms_service.send_message(
+            sms_queue.enqueue(
                 to=user.phone,
                 body=f"THUNDERBIRD: Batch forecast test for {user.route_id}",
                 command_type="ADMIN_BATCH",
                 message_type="admin_push"
             )
-            if result.error:
-                errors += 1
-            else:
-                sent += 1
+            queued += 1
         except Exception:
             errors += 1
 
     return RedirectResponse(
-        f"/admin?msg=Sent to {sent} users ({errors} errors)",
+        f"/admin?msg=Queued for {queued} users ({errors} errors)",
         status_code=302
     )
 
@@ -7,13 +7,14 @@ import logging
 from datetime import datetime, date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
 from pydantic import BaseModel
 
 from config.settings import settings, TZ_HOBART, TZ_UTC
 from app.services.sms import get_sms_service, PhoneUtils
 from app.services.bom import get_bom_service
-from app.services.routes import RouteLoader, get_route
+from app.services.routes import get_route
+from app.services.route_catalogue import CataloguePayload, get_route_catalogue
 
 
 def require_admin_api_key(x_admin_key: str = Header(..., alias="X-Admin-Key")):
@@ -244,63 +245,25 @@ async def get_cell_forecast(route_id: str, cell_id: str):
     }
 
 
+def _catalogue_response(payload: CataloguePayload, if_none_match: Optional[str]) -> Response:
+    """Precomputed catalogue JSON, or 304 if the client's ETag still matches."""
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+    if if_none_match and payload.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
+
+
 @router.get("/route-templates")
-async def list_route_templates():
+async def list_route_templates(if_none_match: Optional[str] = Header(None)):
     """List available route templates (predefined routes)."""
-    route_ids = RouteLoader.list_routes()
-    routes = []
-
-    for route_id in route_ids:
-        route = get_route(route_id)
-        if route:
-            routes.append({
-                "route_id": route.route_id,
-                "name": route.name,
-                "short_name": route.short_name,
-                "region": route.region,
-                "distance_km": route.distance_km,
-                "typical_days": route.typical_days,
-                "grade": route.grade,
-                "is_loop": route.is_loop
-            })
-
-    return {"routes": routes}
+    return _catalogue_response(get_route_catalogue().snapshot.listing, if_none_match)
 
 
 @router.get("/route-templates/{route_id}")
-async def get_route_template_info(route_id: str):
+async def get_route_template_info(route_id: str, if_none_match: Optional[str] = Header(None)):
     """Get detailed route template information."""
-    route = get_route(route_id)
-    if not route:
+    payload = get_route_catalogue().snapshot.details.get(route_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Route not found")
 
-    return {
-        "route_id": route.route_id,
-        "name": route.name,
-        "short_name": route.short_name,
-        "region": route.region,
-        "distance_km": route.distance_km,
-        "typical_days": route.typical_days,
-        "grade": route.grade,
-        "grade_description": route.grade_description,
-        "is_loop": route.is_loop,
-        "camps": [
-            {
-                "code": c.code,
-                "name": c.name,
-                "elevation": c.elevation,
-                "bom_cell": c.bom_cell
-            }
-            for c in route.camps
-        ],
-        "peaks": [
-            {
-                "code": p.code,
-                "name": p.name,
-                "elevation": p.elevation,
-                "type": p.type
-            }
-            for p in route.peaks
-        ],
-        "bom_cells": route.bom_cells
-    }
+    return _catalogue_response(payload, if_none_match)
@@ -585,14 +585,17 @@ async def get_forecast_preview(
             waypoint_sections = []
             day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
-            for wp in waypoints:
-                # Fetch 7-day forecast for this waypoint
-                wp_forecast = await bom.get_daily_forecast(
-                    lat=wp.lat,
-                    lon=wp.lng,
-                    days=7
-                )
+            # Fetch 7-day forecasts for every waypoint together (BOM requests
+            # concurrent, Open-Meteo supplements in one batched request)
+            wp_forecasts = await bom.get_forecasts(
+                [(wp.lat, wp.lng) for wp in waypoints],
+                days=7,
+                resolution="daily"
+            )
+            if not any(wp_forecasts):
+                raise ValueError("No forecast data available")
 
+            for wp, wp_forecast in zip(waypoints, wp_forecasts):
                 section_lines = [
                     f"{wp.sms_code}: {wp.name}",
                     f"{wp.lat:.4f}, {wp.lng:.4f}",
@@ -23,6 +23,9 @@ try:
 except ImportError:
     pass  # Will log warning when used
 from app.services.sms import get_sms_service, PhoneUtils, SMSCostCalculator
+from app.services.sms_queue import get_sms_queue
+from app.services.command_latency import DEFERRABLE_COMMANDS, command_key, get_command_latency
+from app.services.sms_context import SMSRequestContext
 from app.services.commands import CommandParser, CommandType, ResponseGenerator
 from app.services.onboarding import onboarding_manager, OnboardingState
 from app.services.routes import get_route
@@ -120,9 +123,11 @@ async def handle_inbound_sms(
         success=True
     )
 
+    # Sender's user/account/balance, each loaded at most once for this message
+    context = SMSRequestContext(from_phone)
+
     # Beta gate: ALL commands require phone linked to an approved account
-    from app.models.account import account_store
-    account = account_store.get_by_phone(from_phone)
+    account = context.account
     if not account:
         # Exceptions: allow STOP (compliance), HELP, and KEY (informational commands)
         if text_upper in ["STOP", "HELP", "KEY"]:
@@ -171,16 +176,7 @@ async def handle_inbound_sms(
         # Process as normal command, bypass onboarding
         parser = CommandParser()
         parsed = parser.parse(body)
-        response_text = await process_command(from_phone, parsed)
-
-        # Log outbound response
-        log_twiml_response(from_phone, response_text, cmd_word, "response")
-
-        twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Message>{html.escape(response_text)}</Message>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return await reply_to_command(from_phone, parsed, cmd_word, context)
 
     # START command routing - distinguish registered vs unregistered
     is_start_command = text_upper in ["START", "REGISTER"]
@@ -227,10 +223,54 @@ async def handle_inbound_sms(
     parsed = parser.parse(body)
 
     # Generate response based on command
-    response_text = await process_command(from_phone, parsed)
+    return await reply_to_command(from_phone, parsed, cmd_word, context)
+
+
+# Deferred replies still being generated (held so they aren't garbage collected)
+_deferred_replies: set = set()
+
+# Sent instead when a deferred reply fails: the hiker only got an empty ack
+DEFERRED_FAILURE_REPLY = "Forecast unavailable, please retry."
+
+
+async def reply_to_command(
+    phone: str,
+    parsed,
+    cmd_word: str,
+    context: Optional[SMSRequestContext] = None
+) -> Response:
+    """
+    Run a command and answer it in the TwiML response, or defer slow ones.
+
+    Forecast commands that aren't done within the inline budget (or that
+    have recently run over it) get an empty TwiML ack; the reply is sent
+    through the outbound SMS queue when ready. See command_latency.py.
+    """
+    if parsed.command_type not in DEFERRABLE_COMMANDS:
+        response_text = await process_command(phone, parsed, context)
+    else:
+        tracker = get_command_latency()
+        key = command_key(parsed)
+        task = asyncio.create_task(tracker.timed(key, process_command(phone, parsed, context)))
+        wait = 0 if tracker.expect_slow(key) else tracker.budget
+        done, _ = await asyncio.wait({task}, timeout=wait)
+
+        if task not in done:
+            tracker.deferred += 1
+            logger.info(f"Deferring {key} reply to {PhoneUtils.mask(phone)}")
+            _deferred_replies.add(task)
+            task.add_done_callback(lambda t: _deliver_deferred_reply(t, phone, cmd_word))
+            return Response(
+                content="""<?xml version="1.0" encoding="UTF-8"?>
+<Response></Response>""",
+                media_type="application/xml"
+            )
+
+        tracker.inline += 1
+        response_text = task.result()
 
     # Log outbound response
-    log_twiml_response(from_phone, response_text, cmd_word, "response")
+    log_twiml_response(phone, response_text, cmd_word, "response")
 
     # Return TwiML response (XML-escape to handle & and < characters)
     twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
@@ -244,6 +284,26 @@ async def handle_inbound_sms(
     )
 
 
+def _deliver_deferred_reply(task: asyncio.Task, phone: str, cmd_word: str) -> None:
+    """
+    Queue a deferred reply once generated (logged by the send, like any outbound SMS).
+
+    If generating it failed, a short failure reply is queued instead.
+    """
+    _deferred_replies.discard(task)
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        logger.error(f"Deferred {cmd_word} reply failed for {PhoneUtils.mask(phone)}: {task.exception()}")
+        reply = DEFERRED_FAILURE_REPLY
+    else:
+        reply = task.result()
+    try:
+        get_sms_queue().enqueue(phone, reply, command_type=cmd_word, message_type="response")
+    except Exception as e:
+        logger.error(f"Failed to queue deferred {cmd_word} reply: {e}")
+
+
 async def send_quick_start_guide(phone: str):
     """Send the quick start guide messages after onboarding completion."""
     session = onboarding_manager.get_session(phone)
@@ -257,17 +317,18 @@ async def send_quick_start_guide(phone: str):
     # Get quick start guide messages
     messages = onboarding_manager.get_quick_start_guide(session)
 
-    # Get SMS service
-    sms_service = get_sms_service()
-
-    # Send each message with delay (per spec: 2.5s inter-message delay)
-    for i, message in enumerate(messages):
-        try:
-            await asyncio.sleep(2.5)  # Delay between messages
-            await sms_service.send_message(phone, message, command_type="ONBOARDING", message_type="quick_start")
-            logger.info(f"Sent quick start [{i+1}/{len(messages)}] to {PhoneUtils.mask(phone)}")
-        except Exception as e:
-            logger.error(f"Failed to send quick start message: {e}")
+    # Queue the guide: delivered in order with the spec's 2.5s inter-message
+    # delay, starting after the TwiML "All set" reply
+    try:
+        get_sms_queue().enqueue_batch(
+            phone, messages,
+            command_type="ONBOARDING",
+            message_type="quick_start",
+            delay=settings.SMS_INTER_MESSAGE_DELAY
+        )
+        logger.info(f"Queued quick start ({len(messages)} messages) for {PhoneUtils.mask(phone)}")
+    except Exception as e:
+        logger.error(f"Failed to queue quick start messages: {e}")
 
     # Clear the onboarding session
     onboarding_manager.clear_session(phone)
@@ -302,23 +363,29 @@ async def notify_admin_new_registration(trail_name: str, route_name: str):
         return
 
     try:
-        sms_service = get_sms_service()
-        await sms_service.send_message(
+        get_sms_queue().enqueue(
             to=admin_phone,
             body=f"{trail_name} just registered for Thunderbird on {route_name}",
             command_type="ADMIN",
             message_type="admin_notification"
         )
-        logger.info(f"Admin notified of new registration: {trail_name}")
+        logger.info(f"Admin notification queued for new registration: {trail_name}")
     except Exception as e:
         logger.error(f"Failed to notify admin of registration: {e}")
 
 
-async def process_command(phone: str, parsed) -> str:
-    """Process parsed command and return response text."""
+async def process_command(phone: str, parsed, context: Optional[SMSRequestContext] = None) -> str:
+    """
+    Process parsed command and return response text.
+
+    `context` carries the sender's lookups from the webhook; a fresh one
+    is made when called without it.
+    """
     from app.services.formatter import ForecastFormatter
     from app.services.bom import get_bom_service
 
+    context = context or SMSRequestContext(phone)
+
     if parsed.command_type == CommandType.HELP:
         return ResponseGenerator.help_message()
 
@@ -334,10 +401,10 @@ async def process_command(phone: str, parsed) -> str:
         if parsed.args.get("is_gps"):
             lat = parsed.args.get("gps_lat")
             lon = parsed.args.get("gps_lon")
-            return await generate_cast_forecast_gps(lat, lon, hours=12, phone=phone)
+            return await generate_cast_forecast_gps(lat, lon, hours=12, phone=phone, context=context)
 
         camp_code = parsed.args.get("location_code") or parsed.args.get("camp_code", "")
-        return await generate_cast_forecast(camp_code, hours=12, phone=phone)
+        return await generate_cast_forecast(camp_code, hours=12, phone=phone, context=context)
 
     elif parsed.command_type == CommandType.CAST24:
         # 24hr hourly forecast
@@ -348,10 +415,10 @@ async def process_command(phone: str, parsed) -> str:
         if parsed.args.get("is_gps"):
             lat = parsed.args.get("gps_lat")
             lon = parsed.args.get("gps_lon")
-            return await generate_cast_forecast_gps(lat, lon, hours=24, phone=phone)
+            return await generate_cast_forecast_gps(lat, lon, hours=24, phone=phone, context=context)
 
         camp_code = parsed.args.get("location_code") or parsed.args.get("camp_code", "")
-        return await generate_cast_forecast(camp_code, hours=24, phone=phone)
+        return await generate_cast_forecast(camp_code, hours=24, phone=phone, context=context)
 
     elif parsed.command_type == CommandType.CAST7:
         # 7-day forecast - location, CAMPS, PEAKS, or GPS coordinates
@@ -359,17 +426,17 @@ async def process_command(phone: str, parsed) -> str:
             return parsed.error_message or "CAST7 requires location.\n\nExample: CAST7 LAKEO, CAST7 CAMPS, or CAST7 PEAKS"
 
         if parsed.args.get("all_camps"):
-            return await generate_cast7_all_camps(phone)
+            return await generate_cast7_all_camps(phone, context=context)
         elif parsed.args.get("all_peaks"):
-            return await generate_cast7_all_peaks(phone)
+            return await generate_cast7_all_peaks(phone, context=context)
         elif parsed.args.get("is_gps"):
             # GPS coordinates
             lat = parsed.args.get("gps_lat")
             lon = parsed.args.get("gps_lon")
-            return await generate_cast7_forecast_gps(lat, lon, phone=phone)
+            return await generate_cast7_forecast_gps(lat, lon, phone=phone, context=context)
         else:
             camp_code = parsed.args.get("location_code", "")
-            return await generate_cast7_forecast(camp_code, phone=phone)
+            return await generate_cast7_forecast(camp_code, phone=phone, context=context)
 
     elif parsed.command_type == CommandType.UNKNOWN:
         if not parsed.is_valid:
@@ -379,9 +446,8 @@ async def process_command(phone: str, parsed) -> str:
     elif parsed.command_type == CommandType.CAMP_CODE:
         camp_code = parsed.args.get("camp_code", "").upper()
 
-        # Get user from store
         from app.models.database import user_store
-        user = user_store.get_user(phone)
+        user = context.user
 
         if not user:
             return "You're not registered. Send START to begin."
@@ -405,7 +471,7 @@ async def process_command(phone: str, parsed) -> str:
 
         # Generate forecast for this location
         try:
-            forecast_msg = await generate_cast_forecast(camp_code, phone=phone)
+            forecast_msg = await generate_cast_forecast(camp_code, phone=phone, context=context)
             return f"Checked in at {camp.name}\n\n{forecast_msg}"
         except Exception as e:
             logger.error(f"Forecast error on check-in: {e}")
@@ -416,7 +482,7 @@ async def process_command(phone: str, parsed) -> str:
             return parsed.error_message
 
         from app.models.database import user_store
-        user = user_store.get_user(phone)
+        user = context.user
 
         if not user:
             return "You're not registered. Send START to begin."
@@ -442,7 +508,7 @@ async def process_command(phone: str, parsed) -> str:
             return parsed.error_message
 
         from app.models.database import user_store
-        user = user_store.get_user(phone)
+        user = context.user
 
         if not user:
             return "You're not registered. Send START to begin."
@@ -461,7 +527,7 @@ async def process_command(phone: str, parsed) -> str:
 
     elif parsed.command_type == CommandType.SAFELIST:
         from app.models.database import user_store
-        user = user_store.get_user(phone)
+        user = context.user
 
         if not user:
             return "You're not registered. Send START to begin."
@@ -488,7 +554,6 @@ async def process_command(phone: str, parsed) -> str:
 
     elif parsed.command_type == CommandType.BUY:
         # Process BUY $10 top-up via stored card
-        from app.models.account import account_store
         from app.services.payments import get_payment_service
         from app.services.balance import get_balance_service
 
@@ -499,8 +564,7 @@ async def process_command(phone: str, parsed) -> str:
         if amount != 10:
             return "Only $10 top-ups are available via SMS.\n\nText: BUY $10"
 
-        # Look up account by phone
-        account = account_store.get_by_phone(phone)
+        account = context.account
         if not account:
             return "No account linked to this phone number.\n\nVisit thunderbird.bot to link your account."
 
@@ -532,7 +596,6 @@ async def process_command(phone: str, parsed) -> str:
 
     elif parsed.command_type == CommandType.TOPUP:
         # Process YES$10/YES$25/YES$50 top-up confirmation via stored card
-        from app.models.account import account_store
         from app.services.payments import get_payment_service
         from app.services.balance import get_balance_service
 
@@ -542,8 +605,7 @@ async def process_command(phone: str, parsed) -> str:
         amount = parsed.args.get("amount")
         amount_cents = parsed.args.get("amount_cents")
 
-        # Look up account by phone
-        account = account_store.get_by_phone(phone)
+        account = context.account
         if not account:
             return "No account linked to this phone.\n\nVisit thunderbird.bot to set up your account."
 
@@ -580,8 +642,8 @@ async def process_command(phone: str, parsed) -> str:
         from app.models.database import user_store
 
         # Try account first (web users), fall back to user (SMS-only users)
-        account = account_store.get_by_phone(phone)
-        user = user_store.get_user(phone)
+        account = context.account
+        user = context.user
 
         if not account and not user:
             return "You're not registered. Send START to begin."
@@ -643,7 +705,7 @@ async def notify_safecheck_contacts(user, camp, notification_type: str = "checki
     if not contacts:
         return
 
-    sms_service = get_sms_service()
+    sms_queue = get_sms_queue()
 
     # Get route for context
     route = get_route(user.route_id)
@@ -703,25 +765,25 @@ async def notify_safecheck_contacts(user, camp, notification_type: str = "checki
     else:
         return
 
-    # Send to all contacts
+    # Queue for all contacts (sent concurrently by the queue workers)
     for contact in contacts:
         try:
-            await sms_service.send_message(contact.phone, message, command_type="SAFECHECK", message_type="safecheck_notify")
-            logger.info(f"SafeCheck {notification_type} sent to {PhoneUtils.mask(contact.phone)}")
+            sms_queue.enqueue(contact.phone, message, command_type="SAFECHECK", message_type="safecheck_notify")
+            logger.info(f"SafeCheck {notification_type} queued for {PhoneUtils.mask(contact.phone)}")
         except Exception as e:
             logger.error(f"SafeCheck notification failed to {PhoneUtils.mask(contact.phone)}: {e}")
 
 
-def get_low_balance_warning(account_id: int) -> str:
+def get_low_balance_warning(account_id: int, balance_cents: Optional[int] = None) -> str:
     """
     Check if account has low balance and return warning message if needed.
 
     Returns empty string if balance is OK, warning message otherwise.
+    Pass `balance_cents` when already known to skip the lookup.
     """
-    from app.services.balance import get_balance_service
-
-    balance_service = get_balance_service()
-    balance_cents = balance_service.get_balance(account_id)
+    if balance_cents is None:
+        from app.services.balance import get_balance_service
+        balance_cents = get_balance_service().get_balance(account_id)
 
     # Warn if balance <= $2.00
     if balance_cents <= 200:
@@ -734,56 +796,26 @@ def get_low_balance_warning(account_id: int) -> str:
     return ""
 
 
-async def generate_cast_forecast(camp_code: str, hours: int = 12, phone: str = None) -> str:
+async def generate_cast_forecast(
+    camp_code: str,
+    hours: int = 12,
+    phone: str = None,
+    context: Optional[SMSRequestContext] = None
+) -> str:
     """Generate CAST forecast for a specific camp/peak."""
-    from app.services.routes import RouteLoader, get_route, get_other_peaks_in_cell
+    from app.services.routes import get_other_peaks_in_cell
+    from app.services.waypoint_index import get_waypoint_index
     from app.services.bom import get_bom_service
     from app.services.formatter import FormatCastLabeled
-    from app.models.account import account_store
-    from app.models.database import user_store
-
-    # Get user's unit preference - check User (SMS) first, then Account (web)
-    unit_system = "metric"
-    if phone:
-        user = user_store.get_user(phone)
-        if user and user.unit_system:
-            unit_system = user.unit_system
-        else:
-            account = account_store.get_by_phone(phone)
-            if account and account.unit_system:
-                unit_system = account.unit_system
-
-    # Find the waypoint across all routes
-    waypoint = None
-    route = None
-    is_peak = False
-
-    for route_id in RouteLoader.list_routes():
-        try:
-            r = get_route(route_id)
-            if not r:
-                continue
 
-            # Check camps
-            camp = r.get_camp(camp_code.upper())
-            if camp:
-                waypoint = camp
-                route = r
-                is_peak = False
-                break
-
-            # Check peaks
-            peak = r.get_peak(camp_code.upper())
-            if peak:
-                waypoint = peak
-                route = r
-                is_peak = True
-                break
+    if phone and context is None:
+        context = SMSRequestContext(phone)
 
-        except Exception as e:
-            logger.warning(f"Could not load route {route_id}: {e}")
-            continue
+    # Get user's unit preference - check User (SMS) first, then Account (web)
+    unit_system = context.unit_system if context else "metric"
 
+    # Find the waypoint across all routes and custom waypoints
+    waypoint = get_waypoint_index().lookup(camp_code)
     if not waypoint:
         return f"Unknown location: {camp_code}\n\nText ROUTE for valid codes."
 
@@ -795,7 +827,9 @@ async def generate_cast_forecast(camp_code: str, hours: int = 12, phone: str = N
 
     try:
         bom_service = get_bom_service()
-        forecast = await bom_service.get_hourly_forecast(lat, lon, hours=hours)
+        forecast = await bom_service.get_hourly_forecast(
+            lat, lon, hours=hours, latency_budget=settings.SMS_FORECAST_BUDGET_SECONDS
+        )
 
         # Format as CAST response using labeled format with unit support
         message = FormatCastLabeled.format(
@@ -808,8 +842,8 @@ async def generate_cast_forecast(camp_code: str, hours: int = 12, phone: str = N
         )
 
         # For peaks, add "Also covers:" if other peaks share the same BOM cell
-        if is_peak and route:
-            other_peaks = get_other_peaks_in_cell(route, camp_code)
+        if waypoint.is_peak and waypoint.route:
+            other_peaks = get_other_peaks_in_cell(waypoint.route, camp_code)
             if other_peaks:
                 other_names = ", ".join(p.name for p in other_peaks[:3])  # Limit to 3
                 if len(other_peaks) > 3:
@@ -817,10 +851,8 @@ async def generate_cast_forecast(camp_code: str, hours: int = 12, phone: str = N
                 message += f"\n\nAlso covers: {other_names}"
 
         # Check for low balance and append warning if needed
-        if phone:
-            account = account_store.get_by_phone(phone)
-            if account and account.stripe_customer_id:
-                message += get_low_balance_warning(account.id)
+        if context and context.account and context.account.stripe_customer_id:
+            message += get_low_balance_warning(context.account.id, context.balance_cents)
 
         return message
 
@@ -829,7 +861,13 @@ async def generate_cast_forecast(camp_code: str, hours: int = 12, phone: str = N
         return f"Unable to get forecast for {camp_code}. Please try again."
 
 
-async def generate_cast_forecast_gps(lat: float, lon: float, hours: int = 12, phone: str = None) -> str:
+async def generate_cast_forecast_gps(
+    lat: float,
+    lon: float,
+    hours: int = 12,
+    phone: str = None,
+    context: Optional[SMSRequestContext] = None
+) -> str:
     """
     Generate CAST forecast for GPS coordinates.
 
@@ -845,19 +883,12 @@ async def generate_cast_forecast_gps(lat: float, lon: float, hours: int = 12, ph
     from app.services.weather.router import get_weather_router
     from app.services.weather.converter import normalized_to_cell_forecast
     from app.services.formatter import FormatCastLabeled
-    from app.models.account import account_store
-    from app.models.database import user_store
+
+    if phone and context is None:
+        context = SMSRequestContext(phone)
 
     # Get user's unit preference
-    unit_system = "metric"
-    if phone:
-        user = user_store.get_user(phone)
-        if user and user.unit_system:
-            unit_system = user.unit_system
-        else:
-            account = account_store.get_by_phone(phone)
-            if account and account.unit_system:
-                unit_system = account.unit_system
+    unit_system = context.unit_system if context else "metric"
 
     try:
         # Detect country from GPS coordinates
@@ -871,14 +902,17 @@ async def generate_cast_forecast_gps(lat: float, lon: float, hours: int = 12, ph
 
         if country_code == "AU":
             # Australian coordinates: use BOM service (backwards compatible)
-            forecast = await bom_service.get_hourly_forecast(lat, lon, hours=hours)
+            forecast = await bom_service.get_hourly_forecast(
+                lat, lon, hours=hours, latency_budget=settings.SMS_FORECAST_BUDGET_SECONDS
+            )
         else:
             # International: use WeatherRouter
             weather_router = get_weather_router()
             normalized = await weather_router.get_forecast(
                 lat, lon,
                 country_code=country_code or "",
-                days=2  # Need 2 days for hourly data
+                days=2,  # Need 2 days for hourly data
+                latency_budget=settings.SMS_FORECAST_BUDGET_SECONDS
             )
             # Convert to CellForecast for formatter compatibility
             forecast = normalized_to_cell_forecast(
@@ -901,10 +935,8 @@ async def generate_cast_forecast_gps(lat: float, lon: float, hours: int = 12, ph
         )
 
         # Check for low balance and append warning if needed
-        if phone:
-            account = account_store.get_by_phone(phone)
-            if account and account.stripe_customer_id:
-                message += get_low_balance_warning(account.id)
+        if context and context.account and context.account.stripe_customer_id:
+            message += get_low_balance_warning(context.account.id, context.balance_cents)
 
         return message
 
@@ -913,40 +945,24 @@ async def generate_cast_forecast_gps(lat: float, lon: float, hours: int = 12, ph
         return f"Unable to get forecast for GPS {lat:.4f},{lon:.4f}. Please try again."
 
 
-async def generate_cast7_forecast(location_code: str, phone: str = None) -> str:
+async def generate_cast7_forecast(
+    location_code: str,
+    phone: str = None,
+    context: Optional[SMSRequestContext] = None
+) -> str:
     """Generate 7-day forecast for a specific camp/peak."""
-    from app.services.routes import RouteLoader, get_route
+    from app.services.waypoint_index import get_waypoint_index
     from app.services.bom import get_bom_service
     from app.services.formatter import ForecastFormatter
-    from app.models.account import account_store
-    from app.models.database import user_store
+
+    if phone and context is None:
+        context = SMSRequestContext(phone)
 
     # Get user's unit preference - check User (SMS) first, then Account (web)
-    unit_system = "metric"
-    if phone:
-        user = user_store.get_user(phone)
-        if user and user.unit_system:
-            unit_system = user.unit_system
-        else:
-            account = account_store.get_by_phone(phone)
-            if account and account.unit_system:
-                unit_system = account.unit_system
-
-    # Find the waypoint
-    waypoint = None
-    for route_id in RouteLoader.list_routes():
-        r = get_route(route_id)
-        if not r:
-            continue
-        camp = r.get_camp(location_code.upper())
-        if camp:
-            waypoint = camp
-            break
-        peak = r.get_peak(location_code.upper())
-        if peak:
-            waypoint = peak
-            break
+    unit_system = context.unit_system if context else "metric"
 
+    # Find the waypoint across all routes and custom waypoints
+    waypoint = get_waypoint_index().lookup(location_code)
     if not waypoint:
         return f"Unknown location: {location_code}\n\nText ROUTE for valid codes."
 
@@ -966,7 +982,12 @@ async def generate_cast7_forecast(location_code: str, phone: str = None) -> str:
         return f"Unable to get 7-day forecast for {location_code}. Please try again."
 
 
-async def generate_cast7_forecast_gps(lat: float, lon: float, phone: str = None) -> str:
+async def generate_cast7_forecast_gps(
+    lat: float,
+    lon: float,
+    phone: str = None,
+    context: Optional[SMSRequestContext] = None
+) -> str:
     """
     Generate 7-day CAST7 forecast for GPS coordinates.
 
@@ -982,19 +1003,12 @@ async def generate_cast7_forecast_gps(lat: float, lon: float, phone: str = None)
     from app.services.weather.router import get_weather_router
     from app.services.weather.converter import normalized_to_cell_forecast
     from app.services.formatter import ForecastFormatter
-    from app.models.account import account_store
-    from app.models.database import user_store
+
+    if phone and context is None:
+        context = SMSRequestContext(phone)
 
     # Get user's unit preference
-    unit_system = "metric"
-    if phone:
-        user = user_store.get_user(phone)
-        if user and user.unit_system:
-            unit_system = user.unit_system
-        else:
-            account = account_store.get_by_phone(phone)
-            if account and account.unit_system:
-                unit_system = account.unit_system
+    unit_system = context.unit_system if context else "metric"
 
     try:
         # Detect country from GPS coordinates
@@ -1015,7 +1029,8 @@ async def generate_cast7_forecast_gps(lat: float, lon: float, phone: str = None)
             normalized = await weather_router.get_forecast(
                 lat, lon,
                 country_code=country_code or "",
-                days=7
+                days=7,
+                latency_budget=settings.SMS_FORECAST_BUDGET_SECONDS
             )
             # Convert to CellForecast for formatter compatibility
             forecast = normalized_to_cell_forecast(
@@ -1037,10 +1052,8 @@ async def generate_cast7_forecast_gps(lat: float, lon: float, phone: str = None)
         )
 
         # Check for low balance and append warning if needed
-        if phone:
-            account = account_store.get_by_phone(phone)
-            if account and account.stripe_customer_id:
-                message += get_low_balance_warning(account.id)
+        if context and context.account and context.account.stripe_customer_id:
+            message += get_low_balance_warning(context.account.id, context.balance_cents)
 
         return message
 
@@ -1049,24 +1062,23 @@ async def generate_cast7_forecast_gps(lat: float, lon: float, phone: str = None)
         return f"Unable to get 7-day forecast for GPS {lat:.4f},{lon:.4f}. Please try again."
 
 
-async def generate_cast7_all_camps(phone: str) -> str:
+async def generate_cast7_all_camps(phone: str, context: Optional[SMSRequestContext] = None) -> str:
     """Generate 7-day grouped forecast for all camps on user's route."""
-    from app.models.database import user_store
-    from app.models.account import account_store
     from app.services.formatter import FormatCAST7Grouped
     from app.services.bom import get_bom_service
+    from app.services.route_fanout import fetch_route_forecasts
     from datetime import datetime
     from collections import defaultdict
     from config.settings import TZ_HOBART
 
+    context = context or SMSRequestContext(phone)
+
     # Check for active trail first (Phase 7: multi-trail support)
-    account = account_store.get_by_phone(phone)
-    active_trail_id = None
-    if account:
-        active_trail_id = account_store.get_active_trail_id(account.id)
+    account = context.account
+    active_trail_id = context.active_trail_id
 
     # Get user for backwards compatibility (SMS registration)
-    user = user_store.get_user(phone)
+    user = context.user
 
     # If account exists but no active trail and no legacy user.route_id
     if account and not active_trail_id and not user:
@@ -1086,10 +1098,18 @@ async def generate_cast7_all_camps(phone: str) -> str:
         forecast_data = {}
         today = datetime.now(TZ_HOBART).date()
 
+        # One batched fetch per weather zone; temps adjusted per camp
+        forecasts = await fetch_route_forecasts(
+            route.camps,
+            lambda points: bom_service.get_forecasts(points, days=7, resolution="daily")
+        )
+
         for camp in route.camps:
-            try:
-                forecast = await bom_service.get_daily_forecast(camp.lat, camp.lon, days=7)
+            forecast = forecasts.get(camp.code)
+            if forecast is None:
+                continue
 
+            try:
                 # Convert forecast to dict format for grouping
                 camp_days = []
                 if hasattr(forecast, 'periods') and forecast.periods:
@@ -1141,24 +1161,23 @@ async def generate_cast7_all_camps(phone: str) -> str:
         return "Unable to get forecasts. Please try again."
 
 
-async def generate_cast7_all_peaks(phone: str) -> str:
+async def generate_cast7_all_peaks(phone: str, context: Optional[SMSRequestContext] = None) -> str:
     """Generate 7-day grouped forecast for all peaks on user's route."""
-    from app.models.database import user_store
-    from app.models.account import account_store
     from app.services.formatter import FormatCAST7Grouped
     from app.services.bom import get_bom_service
+    from app.services.route_fanout import fetch_route_forecasts
     from datetime import datetime
     from collections import defaultdict
     from config.settings import TZ_HOBART
 
+    context = context or SMSRequestContext(phone)
+
     # Check for active trail first (Phase 7: multi-trail support)
-    account = account_store.get_by_phone(phone)
-    active_trail_id = None
-    if account:
-        active_trail_id = account_store.get_active_trail_id(account.id)
+    account = context.account
+    active_trail_id = context.active_trail_id
 
     # Get user for backwards compatibility (SMS registration)
-    user = user_store.get_user(phone)
+    user = context.user
 
     # If account exists but no active trail and no legacy user.route_id
     if account and not active_trail_id and not user:
@@ -1177,10 +1196,18 @@ async def generate_cast7_all_peaks(phone: str) -> str:
         # Build forecast data dict for all peaks
         forecast_data = {}
 
+        # One batched fetch per weather zone; temps adjusted per peak
+        forecasts = await fetch_route_forecasts(
+            route.peaks,
+            lambda points: bom_service.get_forecasts(points, days=7, resolution="daily")
+        )
+
         for peak in route.peaks:
-            try:
-                forecast = await bom_service.get_daily_forecast(peak.lat, peak.lon, days=7)
+            forecast = forecasts.get(peak.code)
+            if forecast is None:
+                continue
 
+            try:
                 # Convert forecast to dict format for grouping
                 peak_days = []
                 if hasattr(forecast, 'periods') and forecast.periods:
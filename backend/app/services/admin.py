@@ -566,35 +566,31 @@ def render_admin(users, message: str = "") -> str:
     liability_cents = 0
 
     try:
-        import sqlite3
+        from app.models.sqlite_pool import get_connection_pool
         db_path = "thunderbird.db"
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-
-        # Get completed orders for revenue
-        cursor = conn.execute(
-            "SELECT COUNT(*) as cnt, COALESCE(SUM(amount_cents), 0) as total FROM orders WHERE status = 'completed'"
-        )
-        row = cursor.fetchone()
-        order_count = row["cnt"] or 0
-        revenue_cents = row["total"] or 0
-
-        # Get total outstanding balance (liability)
-        cursor = conn.execute(
-            "SELECT COALESCE(SUM(balance_cents), 0) as total FROM account_balances"
-        )
-        row = cursor.fetchone()
-        liability_cents = row["total"] or 0
-
-        # Count beta credits given (from transactions with "Beta" in description)
-        cursor = conn.execute(
-            "SELECT COUNT(DISTINCT account_id) as cnt, COALESCE(SUM(amount_cents), 0) as total FROM transactions WHERE description LIKE '%beta%' AND amount_cents > 0"
-        )
-        row = cursor.fetchone()
-        beta_accounts = row["cnt"] or 0
-        beta_credits_cents = row["total"] or 0
-
-        conn.close()
+        with get_connection_pool().connection(db_path) as conn:
+            # Get completed orders for revenue
+            cursor = conn.execute(
+                "SELECT COUNT(*) as cnt, COALESCE(SUM(amount_cents), 0) as total FROM orders WHERE status = 'completed'"
+            )
+            row = cursor.fetchone()
+            order_count = row["cnt"] or 0
+            revenue_cents = row["total"] or 0
+
+            # Get total outstanding balance (liability)
+            cursor = conn.execute(
+                "SELECT COALESCE(SUM(balance_cents), 0) as total FROM account_balances"
+            )
+            row = cursor.fetchone()
+            liability_cents = row["total"] or 0
+
+            # Count beta credits given (from transactions with "Beta" in description)
+            cursor = conn.execute(
+                "SELECT COUNT(DISTINCT account_id) as cnt, COALESCE(SUM(amount_cents), 0) as total FROM transactions WHERE description LIKE '%beta%' AND amount_cents > 0"
+            )
+            row = cursor.fetchone()
+            beta_accounts = row["cnt"] or 0
+            beta_credits_cents = row["total"] or 0
     except Exception:
         pass
 
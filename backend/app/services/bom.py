@@ -11,15 +11,71 @@ import random
 import geohash2
 import logging
 from datetime import datetime, date, timedelta
-from typing import Optional, Dict, List, Any, Tuple
-from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, Tuple, Callable, Awaitable
+from dataclasses import dataclass, field, replace
+from copy import copy
 import httpx
 from zoneinfo import ZoneInfo
 
 from config.settings import settings, BOMGridConfig, TZ_HOBART
+from app.services.circuit_breaker import CircuitBreakerError, get_breaker
+from app.services.hedging import HedgeStats, HedgeTimeout, hedged_race
+from app.services.http_clients import get_http_client, BOM, OPEN_METEO
+from app.services.dem import get_dem_store
+from app.services.forecast_models import CellForecast, ForecastPeriod, RecentPrecipitation
+from app.services.forecast_views import bom_3hourly_period, freezing_level, to_3hourly
+from app.services.terrain_cache import get_terrain_cache, POINT_ELEVATION
+from app.services.weather.columnar import (
+    HourlyColumns,
+    LazyPeriods,
+    CIRCULAR_MEAN,
+    MAX,
+    MEAN,
+    MIN,
+    SUM,
+)
+from app.services.weather.precip_history import get_precip_history
 
 logger = logging.getLogger(__name__)
 
+# BOM request failures that fall back to Open-Meteo
+BOM_REQUEST_ERRORS = (httpx.HTTPError, CircuitBreakerError)
+
+# Open-Meteo forecast period field -> (hourly variable, reducer)
+OPENMETEO_PERIOD_REDUCERS = {
+    "temp_min": ("temperature_2m", MIN),
+    "temp_max": ("temperature_2m", MAX),
+    "rain_chance": ("precipitation_probability", MAX),
+    "rain_total": ("precipitation", SUM),
+    "snow_total": ("snowfall", SUM),
+    "wind_avg": ("wind_speed_10m", MEAN),
+    "wind_max": ("wind_gusts_10m", MAX),
+    "cloud_cover": ("cloud_cover", MEAN),
+    "freezing_level": ("freezing_level_height", MEAN),
+}
+OPENMETEO_HOURLY_VARIABLES = sorted({variable for variable, _ in OPENMETEO_PERIOD_REDUCERS.values()})
+
+# Open-Meteo supplement: one 7-day hourly block per location serves every
+# resolution; the daily views are derived from it locally
+SUPPLEMENT_HOURLY_VARIABLES = [
+    "dew_point_2m",
+    "cape",
+    "wind_speed_10m",
+    "wind_gusts_10m",
+    "wind_direction_10m",
+]
+SUPPLEMENT_FORECAST_DAYS = 7
+
+# Daily supplement field -> (hourly variable, reducer), named after the
+# Open-Meteo daily variables they replace
+SUPPLEMENT_DAILY_REDUCERS = {
+    "wind_speed_10m_max": ("wind_speed_10m", MAX),
+    "wind_gusts_10m_max": ("wind_gusts_10m", MAX),
+    "wind_direction_10m_dominant": ("wind_direction_10m", CIRCULAR_MEAN),
+    "dew_point_2m_mean": ("dew_point_2m", MEAN),
+    "cape_max": ("cape", MAX),
+}
+
 
 def parse_iso_datetime(dt_string: str) -> datetime:
     """Parse ISO datetime string, handling 'Z' suffix for UTC."""
@@ -29,71 +85,37 @@ def parse_iso_datetime(dt_string: str) -> datetime:
     return datetime.fromisoformat(dt_string)
 
 
-@dataclass
-class ForecastPeriod:
-    """Single forecast period data."""
-    datetime: datetime
-    period: str  # 'N', 'AM', 'PM'
-    
-    # Temperature
-    temp_min: float
-    temp_max: float
-    
-    # Precipitation
-    rain_chance: int  # percentage
-    rain_min: float
-    rain_max: float
-    snow_min: float
-    snow_max: float
-    
-    # Wind
-    wind_avg: int
-    wind_max: int
-    
-    # Cloud/visibility
-    cloud_cover: int  # percentage
-    cloud_base: int  # meters AGL (calculated from dewpoint via LCL formula)
-
-    # Freezing level
-    freezing_level: int  # meters ASL
-
-    # Thunderstorm
-    cape: int  # J/kg
-
-    # Dewpoint for LCL cloud base calculation (optional, comes after required fields)
-    dewpoint: Optional[float] = None  # Celsius
-
+def _detached(forecast: CellForecast, **changes) -> CellForecast:
+    """
+    Copy of a cached forecast that callers can edit freely.
 
-@dataclass
-class RecentPrecipitation:
-    """Recent precipitation totals for trail condition assessment."""
-    rain_24h: float = 0.0  # mm in last 24 hours
-    rain_48h: float = 0.0  # mm in last 48 hours
-    rain_72h: float = 0.0  # mm in last 72 hours
-    snow_24h: float = 0.0  # cm in last 24 hours
-    snow_48h: float = 0.0  # cm in last 48 hours
-    snow_72h: float = 0.0  # cm in last 72 hours
+    Periods (and recent precipitation) are copied too: joiners of one
+    fetch and later cache hits would otherwise share the cached objects.
+    """
+    return replace(
+        forecast,
+        periods=[copy(period) for period in forecast.periods],
+        recent_precip=copy(forecast.recent_precip),
+        **changes
+    )
 
 
 @dataclass
-class CellForecast:
-    """Complete forecast for a weather zone (formerly called 'BOM cell')."""
-    cell_id: str  # Our zone identifier (e.g., "201-117"), not a BOM concept
-    geohash: str  # BOM API uses geohash for lookups
-    lat: float
-    lon: float
-    base_elevation: int
-
-    periods: List[ForecastPeriod]
-
-    fetched_at: datetime
-    expires_at: datetime
-    is_cached: bool = False
-    cache_age_hours: float = 0.0
-    source: str = "bom"  # 'bom' or 'mock'
+class OpenMeteoSupplement:
+    """
+    Open-Meteo data BOM lacks, fetched in one request and split into views.
 
-    # Recent precipitation for trail conditions
-    recent_precip: Optional[RecentPrecipitation] = None
+    Daily views are keyed by local date ("2026-01-28"), hourly views by
+    local hour ("2026-01-28T06:00"). fetched is False for the empty
+    supplement returned when Open-Meteo fails (never cached).
+    """
+    wind_by_date: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    dewpoint_by_date: Dict[str, float] = field(default_factory=dict)
+    cape_by_date: Dict[str, int] = field(default_factory=dict)
+    dewpoint_by_hour: Dict[str, float] = field(default_factory=dict)
+    cape_by_hour: Dict[str, int] = field(default_factory=dict)
+    recent_precip: RecentPrecipitation = field(default_factory=RecentPrecipitation)
+    fetched: bool = False
 
 
 class BOMService:
@@ -114,23 +136,54 @@ class BOMService:
     BOM_API_BASE = "https://api.weather.bom.gov.au/v1"
     OPENMETEO_API_BASE = "https://api.open-meteo.com/v1/forecast"
     OPENMETEO_ELEVATION_API = "https://api.open-meteo.com/v1/elevation"
-    
+
+    # Upper bound on cached forecasts (geohash x resolution x days)
+    FORECAST_CACHE_MAX_ENTRIES = 1000
+
+    # Days covered by the hourly forecast (CAST12/CAST24); shorter 3-hourly
+    # requests can be derived from it (settings.BOM_DERIVE_3HOURLY)
+    HOURLY_FORECAST_DAYS = 2
+
     def __init__(self, use_mock: bool = None):
         self.use_mock = use_mock if use_mock is not None else settings.MOCK_BOM_API
-        self._client: Optional[httpx.AsyncClient] = None
-        self._elevation_cache: Dict[str, int] = {}  # Cache elevation lookups
+        self._elevation_cache = get_terrain_cache(POINT_ELEVATION)  # Persistent elevation lookups
+
+        # Forecast cache keyed by "geohash:resolution:days" -> (forecast, cached_until)
+        self._forecast_cache: Dict[str, Tuple[CellForecast, datetime]] = {}
+        # In-flight upstream fetches, shared by concurrent misses for the same key
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Open-Meteo supplements shared by every resolution, keyed by geohash
+        # -> (supplement, cached_until)
+        self._supplement_cache: Dict[str, Tuple[OpenMeteoSupplement, datetime]] = {}
+        # In-flight supplement fetches (batched or single):
+        # supplement key -> (batch task, index into its results)
+        self._pending_supplements: Dict[str, Tuple[asyncio.Task, int]] = {}
+
+        # Latency-budgeted fetches: BOM hedged with Open-Meteo after hedge_delay
+        self.hedge_delay: float = settings.WEATHER_HEDGE_DELAY_SECONDS
+        self.hedge_stats = HedgeStats()
     
     async def get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with BOM-compatible headers."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/json"
-                }
-            )
-        return self._client
+        """Get the shared pooled HTTP client with BOM-compatible headers (BOM_API_BASE only)."""
+        return get_http_client(
+            BOM,
+            timeout=30.0,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept": "application/json"
+            }
+        )
+
+    async def get_openmeteo_client(self) -> httpx.AsyncClient:
+        """Get the shared pooled Open-Meteo client (supplements, fallback, elevation, precip history)."""
+        return get_http_client(
+            OPEN_METEO,
+            timeout=30.0,
+            headers={
+                "User-Agent": "Thunderbird-Weather/1.0",
+                "Accept": "application/json",
+            },
+        )
     
     async def get_grid_elevation(self, lat: float, lon: float) -> int:
         """
@@ -140,16 +193,28 @@ class BOMService:
         BOM temperatures are valid for the cell-average elevation, not this value.
         Use get_cell_model_elevation() for the elevation BOM temps are based on.
 
+        Reads local DEM tiles when available, else the Open-Meteo elevation API.
+
         Returns elevation in meters (integer).
         """
         # Round to 3 decimal places for cache key (gives ~100m precision)
         cache_key = f"{lat:.3f},{lon:.3f}"
         
-        if cache_key in self._elevation_cache:
-            return self._elevation_cache[cache_key]
+        cached = self._elevation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Local DEM tiles first (no network on the SMS path)
+        dem = get_dem_store()
+        if dem is not None:
+            local = dem.elevation(lat, lon)
+            if local is not None:
+                elevation = int(round(local))
+                self._elevation_cache.set(cache_key, elevation)
+                return elevation
         
         try:
-            client = await self.get_client()
+            client = await self.get_openmeteo_client()
             response = await client.get(
                 self.OPENMETEO_ELEVATION_API,
                 params={"latitude": lat, "longitude": lon}
@@ -158,7 +223,7 @@ class BOMService:
             data = response.json()
             
             elevation = int(data.get("elevation", [0])[0])
-            self._elevation_cache[cache_key] = elevation
+            self._elevation_cache.set(cache_key, elevation)
             logger.info(f"Grid elevation at ({lat}, {lon}): {elevation}m")
             return elevation
             
@@ -194,12 +259,100 @@ class BOMService:
             # Fallback to point elevation
             return await self.get_grid_elevation(lat, lon)
 
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
-    
+    def _forecast_cache_key(self, geohash: str, resolution: str, days: int) -> str:
+        """Cache key for a forecast: BOM geohash, resolution and day count."""
+        return f"{geohash}:{resolution}:{days}"
+
+    async def _get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[CellForecast]],
+        latency_budget: Optional[float] = None
+    ) -> CellForecast:
+        """
+        Return a cached forecast, or fetch it once for all concurrent callers.
+
+        A burst of requests for the same geohash (e.g. several hikers at one
+        hut) shares a single in-flight upstream fetch instead of each paying
+        for the BOM call, Open-Meteo supplements and elevation lookup.
+
+        Args:
+            key: Forecast cache key (see _forecast_cache_key)
+            fetch: Zero-argument coroutine factory performing the upstream fetch
+            latency_budget: Seconds this caller will wait (None = no limit)
+
+        Returns:
+            CellForecast (is_cached=True when served from cache); always a
+            copy, so callers may edit it without touching the cached entry
+        """
+        now = datetime.now(TZ_HOBART)
+        entry = self._forecast_cache.get(key)
+        if entry is not None:
+            forecast, cached_until = entry
+            if now < cached_until:
+                logger.debug(f"Forecast cache hit for {key}")
+                age_hours = (now - forecast.fetched_at).total_seconds() / 3600
+                return _detached(forecast, is_cached=True, cache_age_hours=round(age_hours, 2))
+            del self._forecast_cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(key, fetch))
+            self._inflight[key] = task
+        else:
+            logger.debug(f"Joining in-flight forecast fetch for {key}")
+
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        if latency_budget is None:
+            return _detached(await asyncio.shield(task))
+
+        # A budgeted caller may have joined an unbudgeted fetch
+        try:
+            return _detached(await asyncio.wait_for(asyncio.shield(task), latency_budget))
+        except asyncio.TimeoutError:
+            raise BOMAPIError(f"No forecast for {key} within {latency_budget:.1f}s budget")
+
+    async def _fetch_and_cache(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[CellForecast]]
+    ) -> CellForecast:
+        """Run an upstream fetch and store the result in the forecast cache."""
+        try:
+            forecast = await fetch()
+        finally:
+            self._inflight.pop(key, None)
+
+        # Never cache mock data from the last-resort fallback
+        if forecast.source != "mock":
+            if len(self._forecast_cache) >= self.FORECAST_CACHE_MAX_ENTRIES:
+                self._evict_forecast_cache()
+            cached_until = datetime.now(TZ_HOBART) + timedelta(
+                minutes=settings.BOM_FORECAST_CACHE_TTL_MINUTES
+            )
+            self._forecast_cache[key] = (forecast, cached_until)
+
+        return forecast
+
+    def _evict_forecast_cache(self) -> None:
+        """Drop expired forecasts, then the oldest entry if still full."""
+        self._evict_expired(self._forecast_cache)
+
+    def _evict_expired(self, cache: Dict[str, Tuple[Any, datetime]]) -> None:
+        """Drop expired entries from a (value, cached_until) cache, then the oldest if still full."""
+        now = datetime.now(TZ_HOBART)
+        expired = [k for k, (_, until) in cache.items() if now >= until]
+        for k in expired:
+            del cache[k]
+        if len(cache) >= self.FORECAST_CACHE_MAX_ENTRIES:
+            # Dicts preserve insertion order - first key is the oldest entry
+            del cache[next(iter(cache))]
+
+    def clear_forecast_cache(self) -> None:
+        """Clear cached forecasts and supplements (for testing)."""
+        self._forecast_cache.clear()
+        self._supplement_cache.clear()
+
     def _lat_lon_to_geohash(self, lat: float, lon: float, precision: int = 6) -> str:
         """Convert lat/lon to geohash (6 chars = ~1km precision)."""
         return geohash2.encode(lat, lon, precision=precision)
@@ -209,7 +362,8 @@ class BOMService:
         lat: float,
         lon: float,
         days: int = 7,
-        resolution: str = "3hourly"
+        resolution: str = "3hourly",
+        latency_budget: Optional[float] = None
     ) -> CellForecast:
         """
         Get forecast for a location.
@@ -219,6 +373,8 @@ class BOMService:
             lon: Longitude
             days: Number of forecast days (1-7)
             resolution: "3hourly" or "hourly"
+            latency_budget: Seconds allowed for an answer (SMS replies). When
+                set, a slow BOM request is hedged with Open-Meteo.
         
         Returns:
             CellForecast with periods
@@ -232,14 +388,32 @@ class BOMService:
         
         if self.use_mock:
             return self._generate_mock_forecast(cell_id, geohash, lat, lon, days, resolution)
-        
-        return await self._fetch_real_forecast(cell_id, geohash, lat, lon, days, resolution)
+
+        # Inside the hourly horizon, 3-hourly can be aggregated from the hourly
+        # forecast (cached for CAST12/CAST24) instead of a second pipeline
+        if (
+            settings.BOM_DERIVE_3HOURLY
+            and resolution == "3hourly"
+            and days <= self.HOURLY_FORECAST_DAYS
+        ):
+            hourly = await self.get_forecast(
+                lat, lon, days=self.HOURLY_FORECAST_DAYS, resolution="hourly", latency_budget=latency_budget
+            )
+            if hourly.source == "bom":
+                return to_3hourly(hourly, days)
+
+        return await self._get_or_fetch(
+            self._forecast_cache_key(geohash, resolution, days),
+            lambda: self._fetch_real_forecast(cell_id, geohash, lat, lon, days, resolution, latency_budget),
+            latency_budget,
+        )
     
     async def get_hourly_forecast(
         self,
         lat: float,
         lon: float,
-        hours: int = 12
+        hours: int = 12,
+        latency_budget: Optional[float] = None
     ) -> CellForecast:
         """
         Get hourly forecast for next N hours (for FORECAST command).
@@ -248,11 +422,14 @@ class BOMService:
             lat: Latitude
             lon: Longitude
             hours: Number of hours (default 12)
+            latency_budget: Seconds allowed for an answer (see get_forecast)
 
         Returns:
             CellForecast with hourly periods
         """
-        return await self.get_forecast(lat, lon, days=2, resolution="hourly")
+        return await self.get_forecast(
+            lat, lon, days=self.HOURLY_FORECAST_DAYS, resolution="hourly", latency_budget=latency_budget
+        )
 
     async def get_daily_forecast(
         self,
@@ -282,14 +459,126 @@ class BOMService:
             grid_elevation = await self.get_grid_elevation(lat, lon)
             return self._generate_mock_forecast(cell_id, geohash, lat, lon, days, "daily", grid_elevation)
 
-        client = await self.get_client()
+        return await self._get_or_fetch(
+            self._forecast_cache_key(geohash, "daily", days),
+            lambda: self._fetch_real_daily_forecast(cell_id, geohash, lat, lon, days),
+        )
+
+    async def get_forecasts(
+        self,
+        points: List[Tuple[float, float]],
+        days: int = 7,
+        resolution: str = "daily",
+        max_concurrency: Optional[int] = None
+    ) -> List[Optional[CellForecast]]:
+        """
+        Get forecasts for many points (route-wide commands, previews, pushes).
+
+        BOM has no multi-location endpoint, so BOM requests run concurrently
+        (bounded by max_concurrency). The Open-Meteo supplements for every
+        point that isn't already cached or in flight go out as one batched
+        request per OPEN_METEO_MAX_LOCATIONS points, started alongside them.
+
+        Args:
+            points: (lat, lon) tuples
+            days: Number of forecast days (ignored for "hourly", as get_hourly_forecast)
+            resolution: "daily", "hourly" or "3hourly" (3-hourly has no supplement)
+            max_concurrency: Points fetched at once (default ROUTE_FANOUT_CONCURRENCY)
+
+        Returns:
+            CellForecast per point, in order (None where the fetch failed)
+        """
+        if resolution == "daily":
+            fetch_one = lambda lat, lon: self.get_daily_forecast(lat, lon, days=days)
+        elif resolution == "hourly":
+            days = self.HOURLY_FORECAST_DAYS
+            fetch_one = lambda lat, lon: self.get_forecast(lat, lon, days=days, resolution="hourly")
+        else:
+            fetch_one = lambda lat, lon: self.get_forecast(lat, lon, days=days, resolution=resolution)
+
+        if not self.use_mock:
+            if resolution in ("daily", "hourly"):
+                self._prefetch_supplements(points, days, resolution)
+            elif days <= self.HOURLY_FORECAST_DAYS:
+                # Derived from the hourly forecast (see get_forecast)
+                self._prefetch_supplements(points, self.HOURLY_FORECAST_DAYS, "hourly")
+
+        semaphore = asyncio.Semaphore(max_concurrency or settings.ROUTE_FANOUT_CONCURRENCY)
+
+        async def fetch(lat: float, lon: float) -> Optional[CellForecast]:
+            async with semaphore:
+                try:
+                    return await fetch_one(lat, lon)
+                except Exception as e:
+                    logger.warning(f"Forecast failed for ({lat}, {lon}): {e}")
+                    return None
+
+        return await asyncio.gather(*(fetch(lat, lon) for lat, lon in points))
+
+    def _prefetch_supplements(
+        self,
+        points: List[Tuple[float, float]],
+        days: int,
+        resolution: str
+    ) -> List[str]:
+        """
+        Start one batched supplement fetch for the points that will need one.
+
+        Skips points whose forecast is cached or in flight, points whose
+        supplement is cached or already being fetched, and all but the first
+        point per BOM geohash. Each point's forecast fetch picks up its share
+        via _fetch_openmeteo_supplement.
+
+        Returns:
+            Supplement keys registered
+        """
+        now = datetime.now(TZ_HOBART)
+        needed: Dict[str, Tuple[float, float]] = {}
+        for lat, lon in points:
+            key = self._forecast_cache_key(self._lat_lon_to_geohash(lat, lon), resolution, days)
+            entry = self._forecast_cache.get(key)
+            if key in needed or key in self._inflight or (entry is not None and now < entry[1]):
+                continue
+            supplement_key = self._supplement_key(lat, lon)
+            if supplement_key in self._pending_supplements or self._cached_supplement(supplement_key):
+                continue
+            needed[key] = (lat, lon)
+
+        if not needed:
+            return []
+
+        batch_points = list(needed.values())
+        self._start_supplement_batch(batch_points)
+        return [self._supplement_key(lat, lon) for lat, lon in batch_points]
+
+    async def _fetch_real_daily_forecast(
+        self,
+        cell_id: str,
+        geohash: str,
+        lat: float,
+        lon: float,
+        days: int
+    ) -> CellForecast:
+        """
+        Fetch real daily forecast from BOM, supplemented by Open-Meteo.
+
+        Falls back to Open-Meteo hourly data if the BOM daily endpoint fails
+        (or its circuit breaker is open).
+        """
+        elevation_task = supplement_task = None
 
         # Try BOM daily endpoint first
         try:
-            url = f"{self.BOM_API_BASE}/locations/{geohash}/forecasts/daily"
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
+            # An open circuit breaker skips BOM and its helpers entirely
+            get_breaker("bom:daily").reject_if_open()
+
+            # Cell elevation and Open-Meteo supplements (BOM daily lacks wind, dewpoint,
+            # CAPE and recent precip) don't depend on the BOM response - start them now
+            # so all upstream calls run in one parallel round
+            elevation_task = asyncio.ensure_future(self.get_cell_model_elevation(lat, lon, cell_id))
+            supplement_task = asyncio.ensure_future(self._fetch_openmeteo_supplement(lat, lon))
+
+            data = await self._request_bom(geohash, "daily")
 
             logger.info(f"BOM API success for {geohash} (daily)")
 
@@ -297,21 +586,21 @@ class BOMService:
             # forecast_region is a string (e.g., "Hobart"), not an object
             bom_cell_id = data.get("metadata", {}).get("forecast_region", cell_id)
 
-            # Get cell model elevation (average elevation across the BOM cell)
-            model_elevation = await self.get_cell_model_elevation(lat, lon, bom_cell_id)
-
-            # Fetch Open-Meteo supplements (BOM daily lacks wind, dewpoint, CAPE, and recent precip)
-            wind_by_date = await self._fetch_openmeteo_wind_supplement(lat, lon, days)
-            dewpoint_by_date, cape_by_date = await self._fetch_openmeteo_dewpoint_cape_supplement(lat, lon, days)
-            recent_precip = await self._fetch_openmeteo_recent_precip(lat, lon)
+            # Cell model elevation is the average elevation across the BOM cell
+            model_elevation, supplement = await asyncio.gather(elevation_task, supplement_task)
 
             return self._parse_bom_daily_response(
-                bom_cell_id, geohash, lat, lon, data, days, model_elevation, wind_by_date, dewpoint_by_date, cape_by_date, recent_precip
+                bom_cell_id, geohash, lat, lon, data, days, model_elevation,
+                supplement.wind_by_date, supplement.dewpoint_by_date, supplement.cape_by_date,
+                supplement.recent_precip
             )
 
-        except httpx.HTTPError as e:
+        except BOM_REQUEST_ERRORS as e:
             logger.warning(f"BOM daily API failed for {geohash}: {e}")
 
+        finally:
+            self._cancel_pending(elevation_task, supplement_task)
+
         # Fall back to Open-Meteo
         # Note: Open-Meteo returns temps already downscaled to 90m DEM, so use point elevation
         grid_elevation = await self.get_grid_elevation(lat, lon)
@@ -390,13 +679,13 @@ class BOMService:
 
                 # Get wind from Open-Meteo supplement, or estimate from icon
                 date_key = date_str[:10]  # Extract YYYY-MM-DD
+                icon = day_data.get("icon_descriptor", "")
                 if wind_by_date and date_key in wind_by_date:
                     wind_data = wind_by_date[date_key]
                     wind_avg = wind_data.get("wind_avg", 20)
                     wind_max = wind_data.get("wind_max", 30)
                 else:
                     # Fallback: estimate from icon/conditions (BOM daily doesn't include wind)
-                    icon = day_data.get("icon_descriptor", "")
                     if "storm" in icon or "wind" in icon:
                         wind_avg, wind_max = 35, 55
                     elif "shower" in icon or "rain" in icon:
@@ -479,7 +768,8 @@ class BOMService:
         lat: float,
         lon: float,
         days: int,
-        resolution: str = "3hourly"
+        resolution: str = "3hourly",
+        latency_budget: Optional[float] = None
     ) -> CellForecast:
         """
         Fetch real forecast from weather APIs.
@@ -487,351 +777,405 @@ class BOMService:
         Primary: BOM API (hourly or 3-hourly)
         Fallback: Open-Meteo API (if BOM fails)
         
+        With a latency budget, Open-Meteo is also fired if BOM hasn't
+        answered within hedge_delay, and the first valid answer wins.
+        
         Args:
             resolution: "hourly" or "3hourly"
+            latency_budget: Overall seconds allowed, or None for no hedging
         """
-        client = await self.get_client()
-        
-        # Choose BOM endpoint based on resolution
-        endpoint = "hourly" if resolution == "hourly" else "3-hourly"
+        if latency_budget is not None:
+            return await self._fetch_hedged_forecast(
+                cell_id, geohash, lat, lon, days, resolution, latency_budget
+            )
 
-        # Try BOM first
+        # Try BOM first (an open circuit breaker fails straight away)
         try:
-            url = f"{self.BOM_API_BASE}/locations/{geohash}/forecasts/{endpoint}"
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            logger.info(f"BOM API success for {geohash} ({endpoint})")
-
-            # Extract BOM's cell identifier from response metadata
-            # forecast_region is a string (e.g., "Hobart"), not an object
-            bom_cell_id = data.get("metadata", {}).get("forecast_region", cell_id)
-
-            # Get cell model elevation (average elevation across the BOM cell)
-            # This is the elevation BOM temperatures are valid for
-            model_elevation = await self.get_cell_model_elevation(lat, lon, bom_cell_id)
-
-            if resolution == "hourly":
-                # Fetch hourly dewpoint, CAPE, and recent precip from Open-Meteo
-                dewpoint_by_hour, cape_by_hour = await self._fetch_openmeteo_hourly_dewpoint_cape(lat, lon, days)
-                recent_precip = await self._fetch_openmeteo_recent_precip(lat, lon)
-                return self._parse_bom_hourly_response(bom_cell_id, geohash, lat, lon, data, days, model_elevation, dewpoint_by_hour, cape_by_hour, recent_precip)
-            else:
-                return self._parse_bom_3hourly_response(bom_cell_id, geohash, lat, lon, data, days, model_elevation)
-            
-        except httpx.HTTPError as e:
+            return await self._fetch_bom_forecast(cell_id, geohash, lat, lon, days, resolution)
+        except BOM_REQUEST_ERRORS as e:
             logger.warning(f"BOM API failed for {geohash}: {e}")
 
         # Fall back to Open-Meteo
-        # Note: Open-Meteo returns temps already downscaled to 90m DEM, so use point elevation
-        grid_elevation = await self.get_grid_elevation(lat, lon)
         try:
             logger.info(f"Falling back to Open-Meteo for {lat}, {lon}")
-            return await self._fetch_openmeteo_forecast(cell_id, geohash, lat, lon, days, resolution, grid_elevation)
-            
+            return await self._fetch_openmeteo_fallback(cell_id, geohash, lat, lon, days, resolution)
+
         except httpx.HTTPError as e:
             logger.error(f"Open-Meteo API also failed: {e}")
-            
-            # Last resort: mock data (only if configured)
-            if settings.BOM_FALLBACK_TO_MOCK:
-                logger.warning("Falling back to mock forecast (both APIs failed)")
-                return self._generate_mock_forecast(cell_id, geohash, lat, lon, days, resolution, grid_elevation)
-            
-            raise BOMAPIError(f"All weather APIs failed: {e}")
+            return await self._last_resort_forecast(cell_id, geohash, lat, lon, days, resolution, e)
 
-    async def _fetch_openmeteo_wind_supplement(
+    async def _fetch_hedged_forecast(
         self,
+        cell_id: str,
+        geohash: str,
         lat: float,
         lon: float,
-        days: int
-    ) -> Dict[str, Dict[str, float]]:
-        """
-        Fetch wind data from Open-Meteo to supplement BOM daily forecasts.
+        days: int,
+        resolution: str,
+        latency_budget: float
+    ) -> CellForecast:
+        """Race BOM against a delayed Open-Meteo fallback within a time budget."""
+        try:
+            forecast, _ = await hedged_race(
+                lambda: self._fetch_bom_forecast(cell_id, geohash, lat, lon, days, resolution),
+                lambda: self._fetch_openmeteo_fallback(cell_id, geohash, lat, lon, days, resolution),
+                hedge_delay=self.hedge_delay,
+                budget=latency_budget,
+                stats=self.hedge_stats,
+                label=f"BOM/{geohash}",
+            )
+            return forecast
 
-        BOM daily endpoint doesn't include wind data, so we fetch it from
-        Open-Meteo and aggregate hourly wind to daily max/avg.
+        except (*BOM_REQUEST_ERRORS, HedgeTimeout) as e:
+            logger.error(f"No weather API answered for {geohash}: {e}")
+            return await self._last_resort_forecast(cell_id, geohash, lat, lon, days, resolution, e)
 
-        Args:
-            lat: Latitude
-            lon: Longitude
-            days: Number of days
+    async def _fetch_bom_forecast(
+        self,
+        cell_id: str,
+        geohash: str,
+        lat: float,
+        lon: float,
+        days: int,
+        resolution: str = "3hourly"
+    ) -> CellForecast:
+        """
+        Fetch and parse the BOM hourly or 3-hourly forecast.
 
-        Returns:
-            Dict mapping date strings to wind data:
-            {
-                "2026-01-28": {"wind_avg": 25.0, "wind_max": 45.0, "wind_dir": "SW"},
-                ...
-            }
+        Raises:
+            httpx.HTTPError: If the BOM request fails
+            CircuitBreakerError: If the endpoint's breaker is open or it timed out
         """
+        # Choose BOM endpoint based on resolution
+        endpoint = "hourly" if resolution == "hourly" else "3-hourly"
+        get_breaker(f"bom:{endpoint}").reject_if_open()
+
+        # Start the cell elevation lookup (and for hourly, the Open-Meteo
+        # dewpoint/CAPE/recent precip supplement) alongside the BOM request
+        elevation_task = asyncio.ensure_future(self.get_cell_model_elevation(lat, lon, cell_id))
+        supplement_task = None
+        if resolution == "hourly":
+            supplement_task = asyncio.ensure_future(self._fetch_openmeteo_supplement(lat, lon))
+
         try:
-            client = await self.get_client()
+            data = await self._request_bom(geohash, endpoint)
 
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "daily": ",".join([
-                    "wind_speed_10m_max",
-                    "wind_gusts_10m_max",
-                    "wind_direction_10m_dominant",
-                ]),
-                "timezone": "Australia/Hobart",
-                "forecast_days": min(days, 7)
-            }
+            logger.info(f"BOM API success for {geohash} ({endpoint})")
 
-            response = await client.get(self.OPENMETEO_API_BASE, params=params)
-            response.raise_for_status()
-            data = response.json()
+            # Extract BOM's cell identifier from response metadata
+            # forecast_region is a string (e.g., "Hobart"), not an object
+            bom_cell_id = data.get("metadata", {}).get("forecast_region", cell_id)
 
-            daily = data.get("daily", {})
-            dates = daily.get("time", [])
-            wind_speeds = daily.get("wind_speed_10m_max", [])
-            wind_gusts = daily.get("wind_gusts_10m_max", [])
-            wind_dirs = daily.get("wind_direction_10m_dominant", [])
+            # Get cell model elevation (average elevation across the BOM cell)
+            # This is the elevation BOM temperatures are valid for
+            model_elevation = await elevation_task
 
-            wind_by_date: Dict[str, Dict[str, Any]] = {}
-            for i, date_str in enumerate(dates):
-                wind_speed = wind_speeds[i] if i < len(wind_speeds) else None
-                wind_gust = wind_gusts[i] if i < len(wind_gusts) else None
-                wind_dir = wind_dirs[i] if i < len(wind_dirs) else None
+            if resolution == "hourly":
+                supplement = await supplement_task
+                return self._parse_bom_hourly_response(
+                    bom_cell_id, geohash, lat, lon, data, days, model_elevation,
+                    supplement.dewpoint_by_hour, supplement.cape_by_hour, supplement.recent_precip
+                )
+            else:
+                return self._parse_bom_3hourly_response(bom_cell_id, geohash, lat, lon, data, days, model_elevation)
 
-                if wind_speed is not None:
-                    # Convert wind direction degrees to compass
-                    compass_dir = self._degrees_to_compass(wind_dir) if wind_dir else "N"
+        finally:
+            self._cancel_pending(elevation_task, supplement_task)
 
-                    wind_by_date[date_str] = {
-                        "wind_avg": round(wind_speed, 1),
-                        "wind_max": round(wind_gust, 1) if wind_gust else round(wind_speed * 1.4, 1),
-                        "wind_dir": compass_dir,
-                    }
+    async def _request_bom(self, geohash: str, endpoint: str) -> Dict[str, Any]:
+        """
+        GET a BOM forecast endpoint through its circuit breaker ("bom:<endpoint>").
 
-            logger.info(f"Fetched Open-Meteo wind supplement for {len(wind_by_date)} days")
-            return wind_by_date
+        Raises:
+            httpx.HTTPError: If the BOM request fails
+            CircuitBreakerError: If the breaker is open or the request timed out
+        """
+        url = f"{self.BOM_API_BASE}/locations/{geohash}/forecasts/{endpoint}"
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch Open-Meteo wind supplement: {e}")
-            return {}
+        async def request() -> Dict[str, Any]:
+            client = await self.get_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.json()
 
-    def _degrees_to_compass(self, degrees: float) -> str:
-        """Convert wind direction in degrees to compass direction."""
-        if degrees is None:
-            return "N"
-        directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-        index = round(degrees / 45) % 8
-        return directions[index]
+        return await get_breaker(f"bom:{endpoint}").call(request)
 
-    async def _fetch_openmeteo_dewpoint_cape_supplement(
+    async def _fetch_openmeteo_fallback(
         self,
+        cell_id: str,
+        geohash: str,
         lat: float,
         lon: float,
-        days: int
-    ) -> Tuple[Dict[str, float], Dict[str, int]]:
+        days: int,
+        resolution: str = "3hourly"
+    ) -> CellForecast:
+        """Fetch the Open-Meteo fallback forecast at the point DEM elevation."""
+        # Note: Open-Meteo returns temps already downscaled to 90m DEM, so use point elevation
+        grid_elevation = await self.get_grid_elevation(lat, lon)
+        return await self._fetch_openmeteo_forecast(cell_id, geohash, lat, lon, days, resolution, grid_elevation)
+
+    async def _last_resort_forecast(
+        self,
+        cell_id: str,
+        geohash: str,
+        lat: float,
+        lon: float,
+        days: int,
+        resolution: str,
+        error: Exception
+    ) -> CellForecast:
+        """Mock data if configured, otherwise BOMAPIError (both APIs failed)."""
+        if settings.BOM_FALLBACK_TO_MOCK:
+            logger.warning("Falling back to mock forecast (both APIs failed)")
+            grid_elevation = await self.get_grid_elevation(lat, lon)
+            return self._generate_mock_forecast(cell_id, geohash, lat, lon, days, resolution, grid_elevation)
+
+        raise BOMAPIError(f"All weather APIs failed: {error}")
+
+    @staticmethod
+    def _cancel_pending(*tasks: Optional[asyncio.Future]) -> None:
+        """Cancel helper tasks whose result is no longer needed."""
+        for task in tasks:
+            if task is not None and not task.done():
+                task.cancel()
+
+    def _supplement_key(self, lat: float, lon: float) -> str:
+        """Supplement cache key: the BOM geohash, as for the forecast cache."""
+        return self._lat_lon_to_geohash(lat, lon)
+
+    def _cached_supplement(self, key: str) -> Optional[OpenMeteoSupplement]:
+        """A fresh cached supplement, or None."""
+        entry = self._supplement_cache.get(key)
+        if entry is None:
+            return None
+        supplement, cached_until = entry
+        if datetime.now(TZ_HOBART) >= cached_until:
+            del self._supplement_cache[key]
+            return None
+        return supplement
+
+    def _start_supplement_batch(self, points: List[Tuple[float, float]]) -> asyncio.Task:
         """
-        Fetch dewpoint and CAPE data from Open-Meteo for cloud base and storm prediction.
+        Start a supplement fetch and register each point's share of it.
 
-        BOM doesn't provide dewpoint or CAPE, so we fetch from Open-Meteo:
-        - Dewpoint: For LCL cloud base calculation
-        - CAPE: For thunderstorm/lightning prediction
+        Later callers for the same geohash join the registered fetch;
+        entries are dropped once it finishes (results are cached by then).
+        """
+        batch = asyncio.ensure_future(self._fetch_openmeteo_supplements(points))
+        keys = []
+        for index, (lat, lon) in enumerate(points):
+            key = self._supplement_key(lat, lon)
+            self._pending_supplements[key] = (batch, index)
+            keys.append(key)
+
+        def unregister(task: asyncio.Task) -> None:
+            for key in keys:
+                pending = self._pending_supplements.get(key)
+                if pending is not None and pending[0] is task:
+                    del self._pending_supplements[key]
+
+        batch.add_done_callback(unregister)
+        return batch
+
+    async def _fetch_openmeteo_supplement(self, lat: float, lon: float) -> OpenMeteoSupplement:
+        """
+        Get every Open-Meteo variable BOM lacks for one point.
+
+        One supplement serves hourly, 3-hourly and daily forecasts, so it
+        comes from the cache when any resolution fetched it recently, or
+        from the point's share of a batch get_forecasts() prefetched,
+        otherwise from a single-point request.
 
         Args:
             lat: Latitude
             lon: Longitude
-            days: Number of days
 
         Returns:
-            Tuple of (dewpoint_by_date, cape_by_date):
-            - dewpoint_by_date: {"2026-01-28": 12.5, ...}
-            - cape_by_date: {"2026-01-28": 850, ...}
+            OpenMeteoSupplement (empty views on failure)
         """
-        try:
-            client = await self.get_client()
-
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "daily": "dew_point_2m_mean,cape_max",
-                "timezone": "Australia/Hobart",
-                "forecast_days": min(days, 7)
-            }
-
-            response = await client.get(self.OPENMETEO_API_BASE, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            daily = data.get("daily", {})
-            dates = daily.get("time", [])
-            dewpoints = daily.get("dew_point_2m_mean", [])
-            capes = daily.get("cape_max", [])
-
-            dewpoint_by_date: Dict[str, float] = {}
-            cape_by_date: Dict[str, int] = {}
+        key = self._supplement_key(lat, lon)
+        cached = self._cached_supplement(key)
+        if cached is not None:
+            logger.debug(f"Supplement cache hit for {key}")
+            return cached
 
-            for i, date_str in enumerate(dates):
-                dewpoint = dewpoints[i] if i < len(dewpoints) else None
-                cape = capes[i] if i < len(capes) else None
+        pending = self._pending_supplements.get(key)
+        if pending is None:
+            pending = (self._start_supplement_batch([(lat, lon)]), 0)
 
-                if dewpoint is not None:
-                    dewpoint_by_date[date_str] = round(dewpoint, 1)
-                if cape is not None:
-                    cape_by_date[date_str] = int(cape)
-
-            logger.info(f"Fetched Open-Meteo dewpoint/CAPE supplement for {len(dewpoint_by_date)} days")
-            return dewpoint_by_date, cape_by_date
-
-        except Exception as e:
-            logger.warning(f"Failed to fetch Open-Meteo dewpoint/CAPE supplement: {e}")
-            return {}, {}
+        batch, index = pending
+        # Shield so a cancelled forecast fetch doesn't cancel the shared batch
+        return (await asyncio.shield(batch))[index]
 
-    async def _fetch_openmeteo_hourly_dewpoint_cape(
+    async def _fetch_openmeteo_supplements(
         self,
-        lat: float,
-        lon: float,
-        days: int
-    ) -> Tuple[Dict[str, float], Dict[str, int]]:
+        points: List[Tuple[float, float]]
+    ) -> List[OpenMeteoSupplement]:
         """
-        Fetch hourly dewpoint and CAPE data from Open-Meteo.
+        Fetch Open-Meteo supplements for many points in as few requests as possible.
+
+        BOM doesn't provide wind (daily endpoint), dewpoint or CAPE, so one
+        Open-Meteo call asks for all of them for up to
+        OPEN_METEO_MAX_LOCATIONS points (comma-separated coordinates), and each
+        location's hourly block is split into the views the BOM parsers expect:
+        - Wind: daily max/gust + dominant direction (daily views)
+        - Dewpoint: for LCL cloud base calculation (hourly and daily mean)
+        - CAPE: for thunderstorm/lightning prediction (hourly and daily max)
+
+        Recent precipitation comes from the precipitation history cache,
+        updated concurrently. Successful supplements are cached for
+        BOM_FORECAST_CACHE_TTL_MINUTES.
 
         Args:
-            lat: Latitude
-            lon: Longitude
-            days: Number of days
+            points: (lat, lon) tuples
 
         Returns:
-            Tuple of (dewpoint_by_hour, cape_by_hour):
-            - dewpoint_by_hour: {"2026-01-28T06:00": 12.5, ...}
-            - cape_by_hour: {"2026-01-28T06:00": 850, ...}
+            OpenMeteoSupplement per point, in order (empty views on failure)
         """
+        size = max(1, settings.OPEN_METEO_MAX_LOCATIONS)
+        chunks = [points[i:i + size] for i in range(0, len(points), size)]
+        client = await self.get_openmeteo_client()
+        *results, recent = await asyncio.gather(
+            *(self._fetch_supplement_chunk(chunk) for chunk in chunks),
+            get_precip_history().get_recent(client, points),
+        )
+        supplements = [supplement for chunk in results for supplement in chunk]
+        for supplement, totals in zip(supplements, recent):
+            if totals:
+                supplement.recent_precip = RecentPrecipitation(**totals)
+
+        cached_until = datetime.now(TZ_HOBART) + timedelta(minutes=settings.BOM_FORECAST_CACHE_TTL_MINUTES)
+        for (lat, lon), supplement in zip(points, supplements):
+            if supplement.fetched:
+                if len(self._supplement_cache) >= self.FORECAST_CACHE_MAX_ENTRIES:
+                    self._evict_expired(self._supplement_cache)
+                self._supplement_cache[self._supplement_key(lat, lon)] = (supplement, cached_until)
+        return supplements
+
+    async def _fetch_supplement_chunk(
+        self,
+        points: List[Tuple[float, float]]
+    ) -> List[OpenMeteoSupplement]:
+        """One Open-Meteo supplement request for up to OPEN_METEO_MAX_LOCATIONS points."""
         try:
-            client = await self.get_client()
+            client = await self.get_openmeteo_client()
 
             params = {
-                "latitude": lat,
-                "longitude": lon,
-                "hourly": "dew_point_2m,cape",
+                "latitude": ",".join(str(lat) for lat, _ in points),
+                "longitude": ",".join(str(lon) for _, lon in points),
+                "hourly": ",".join(SUPPLEMENT_HOURLY_VARIABLES),
                 "timezone": "Australia/Hobart",
-                "forecast_days": min(days, 7)
+                "forecast_days": SUPPLEMENT_FORECAST_DAYS,
             }
 
             response = await client.get(self.OPENMETEO_API_BASE, params=params)
             response.raise_for_status()
             data = response.json()
 
-            hourly = data.get("hourly", {})
-            times = hourly.get("time", [])
-            dewpoints = hourly.get("dew_point_2m", [])
-            capes = hourly.get("cape", [])
+            # One location returns an object, several return a list
+            locations = data if isinstance(data, list) else [data]
+            if len(locations) != len(points):
+                raise ValueError(f"expected {len(points)} locations, got {len(locations)}")
 
-            dewpoint_by_hour: Dict[str, float] = {}
-            cape_by_hour: Dict[str, int] = {}
+        except Exception as e:
+            logger.warning(f"Failed to fetch Open-Meteo supplement: {e}")
+            return [OpenMeteoSupplement() for _ in points]
 
-            for i, time_str in enumerate(times):
-                dewpoint = dewpoints[i] if i < len(dewpoints) else None
-                cape = capes[i] if i < len(capes) else None
+        logger.info(f"Fetched Open-Meteo supplement for {len(points)} point(s)")
+        return [self._parse_openmeteo_supplement(location) for location in locations]
 
-                if dewpoint is not None:
-                    dewpoint_by_hour[time_str] = round(dewpoint, 1)
-                if cape is not None:
-                    cape_by_hour[time_str] = int(cape)
+    def _parse_openmeteo_supplement(self, data: Dict[str, Any]) -> OpenMeteoSupplement:
+        """Split one location's hourly supplement block into the parser views."""
+        hourly = data.get("hourly", {})
+        supplement = OpenMeteoSupplement(fetched=True)
+        supplement.dewpoint_by_hour, supplement.cape_by_hour = self._split_dewpoint_cape(
+            hourly, "dew_point_2m", "cape"
+        )
 
-            logger.info(f"Fetched Open-Meteo hourly dewpoint/CAPE for {len(dewpoint_by_hour)} hours")
-            return dewpoint_by_hour, cape_by_hour
+        # Daily views with the same rules as Open-Meteo's daily variables
+        days = HourlyColumns.from_hourly(hourly, SUPPLEMENT_HOURLY_VARIABLES).daily(SUPPLEMENT_DAILY_REDUCERS)
+        daily: Dict[str, list] = {"time": [start[:10] for start in days.starts]}
+        for name in SUPPLEMENT_DAILY_REDUCERS:
+            daily[name] = [days.value(name, i) for i in range(len(days))]
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch Open-Meteo hourly dewpoint/CAPE: {e}")
-            return {}, {}
+        supplement.wind_by_date = self._split_wind_by_date(daily)
+        supplement.dewpoint_by_date, supplement.cape_by_date = self._split_dewpoint_cape(
+            daily, "dew_point_2m_mean", "cape_max"
+        )
+        return supplement
 
-    async def _fetch_openmeteo_recent_precip(
-        self,
-        lat: float,
-        lon: float
-    ) -> RecentPrecipitation:
+    def _split_wind_by_date(self, daily: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch recent precipitation from Open-Meteo for trail condition assessment.
-
-        Uses past_days=3 to get the last 72 hours of precipitation data.
-
-        Args:
-            lat: Latitude
-            lon: Longitude
+        Extract daily wind from an Open-Meteo daily block.
 
         Returns:
-            RecentPrecipitation with 24h/48h/72h totals
-        """
-        try:
-            client = await self.get_client()
-
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "hourly": "precipitation,snowfall",
-                "timezone": "Australia/Hobart",
-                "past_days": 3,
-                "forecast_days": 0,  # Only want past data
+            Dict mapping date strings to wind data:
+            {
+                "2026-01-28": {"wind_avg": 25.0, "wind_max": 45.0, "wind_dir": "SW"},
+                ...
             }
+        """
+        dates = daily.get("time", [])
+        wind_speeds = daily.get("wind_speed_10m_max", [])
+        wind_gusts = daily.get("wind_gusts_10m_max", [])
+        wind_dirs = daily.get("wind_direction_10m_dominant", [])
+
+        wind_by_date: Dict[str, Dict[str, Any]] = {}
+        for i, date_str in enumerate(dates):
+            wind_speed = wind_speeds[i] if i < len(wind_speeds) else None
+            wind_gust = wind_gusts[i] if i < len(wind_gusts) else None
+            wind_dir = wind_dirs[i] if i < len(wind_dirs) else None
+
+            if wind_speed is not None:
+                # Convert wind direction degrees to compass
+                compass_dir = self._degrees_to_compass(wind_dir) if wind_dir else "N"
+
+                wind_by_date[date_str] = {
+                    "wind_avg": round(wind_speed, 1),
+                    "wind_max": round(wind_gust, 1) if wind_gust else round(wind_speed * 1.4, 1),
+                    "wind_dir": compass_dir,
+                }
 
-            response = await client.get(self.OPENMETEO_API_BASE, params=params)
-            response.raise_for_status()
-            data = response.json()
+        return wind_by_date
 
-            hourly = data.get("hourly", {})
-            times = hourly.get("time", [])
-            rain_values = hourly.get("precipitation", [])
-            snow_values = hourly.get("snowfall", [])
+    def _degrees_to_compass(self, degrees: float) -> str:
+        """Convert wind direction in degrees to compass direction."""
+        if degrees is None:
+            return "N"
+        directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+        index = round(degrees / 45) % 8
+        return directions[index]
 
-            now = datetime.now(TZ_HOBART)
+    def _split_dewpoint_cape(
+        self,
+        block: Dict[str, Any],
+        dewpoint_key: str,
+        cape_key: str
+    ) -> Tuple[Dict[str, float], Dict[str, int]]:
+        """
+        Extract dewpoint and CAPE from an Open-Meteo daily or hourly block.
 
-            rain_24h = 0.0
-            rain_48h = 0.0
-            rain_72h = 0.0
-            snow_24h = 0.0
-            snow_48h = 0.0
-            snow_72h = 0.0
+        Returns:
+            Tuple of (dewpoint_by_time, cape_by_time), keyed by the block's
+            time strings, e.g. {"2026-01-28": 12.5} or {"2026-01-28T06:00": 12.5}
+        """
+        times = block.get("time", [])
+        dewpoints = block.get(dewpoint_key, [])
+        capes = block.get(cape_key, [])
 
-            for i, time_str in enumerate(times):
-                try:
-                    # Parse time (Open-Meteo returns local time based on timezone param)
-                    period_time = datetime.fromisoformat(time_str)
-                    if period_time.tzinfo is None:
-                        period_time = period_time.replace(tzinfo=TZ_HOBART)
-
-                    hours_ago = (now - period_time).total_seconds() / 3600
-
-                    if hours_ago < 0:
-                        continue
-
-                    rain = rain_values[i] if i < len(rain_values) and rain_values[i] is not None else 0.0
-                    snow = snow_values[i] if i < len(snow_values) and snow_values[i] is not None else 0.0
-
-                    if hours_ago <= 24:
-                        rain_24h += rain
-                        snow_24h += snow
-                    if hours_ago <= 48:
-                        rain_48h += rain
-                        snow_48h += snow
-                    if hours_ago <= 72:
-                        rain_72h += rain
-                        snow_72h += snow
-
-                except (ValueError, TypeError):
-                    continue
+        dewpoint_by_time: Dict[str, float] = {}
+        cape_by_time: Dict[str, int] = {}
 
-            logger.info(
-                f"Recent precip: rain={rain_24h:.1f}/{rain_48h:.1f}/{rain_72h:.1f}mm, "
-                f"snow={snow_24h:.1f}/{snow_48h:.1f}/{snow_72h:.1f}cm"
-            )
+        for i, time_str in enumerate(times):
+            dewpoint = dewpoints[i] if i < len(dewpoints) else None
+            cape = capes[i] if i < len(capes) else None
 
-            return RecentPrecipitation(
-                rain_24h=round(rain_24h, 1),
-                rain_48h=round(rain_48h, 1),
-                rain_72h=round(rain_72h, 1),
-                snow_24h=round(snow_24h, 1),
-                snow_48h=round(snow_48h, 1),
-                snow_72h=round(snow_72h, 1),
-            )
+            if dewpoint is not None:
+                dewpoint_by_time[time_str] = round(dewpoint, 1)
+            if cape is not None:
+                cape_by_time[time_str] = int(cape)
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch recent precipitation: {e}")
-            return RecentPrecipitation()
+        return dewpoint_by_time, cape_by_time
 
     async def _fetch_openmeteo_forecast(
         self,
@@ -856,7 +1200,7 @@ class BOMService:
             resolution: "hourly" or "3hourly"
             grid_elevation: DEM elevation at this point (for temp adjustments)
         """
-        client = await self.get_client()
+        client = await self.get_openmeteo_client()
         
         params = {
             "latitude": lat,
@@ -915,110 +1259,76 @@ class BOMService:
             }
         }
         """
-        periods = []
         now = datetime.now(TZ_HOBART)
-        
-        hourly = data.get("hourly", {})
-        times = hourly.get("time", [])
-        
-        # Step size: 1 for hourly, 3 for 3-hourly
+        columns = HourlyColumns.from_hourly(data.get("hourly", {}), OPENMETEO_HOURLY_VARIABLES)
+
+        # Step size: 1 for hourly, 3 for 3-hourly (NaN = no valid hours)
         step = 1 if resolution == "hourly" else 3
-        
-        for i in range(0, len(times), step):
-            if resolution == "3hourly" and i + 2 >= len(times):
-                break
-            
+        windows = columns.aggregate(step, OPENMETEO_PERIOD_REDUCERS)
+
+        # Period start times; windows with a bad timestamp are skipped
+        starts = []
+        for i, time_str in enumerate(windows.starts):
             try:
-                # Parse time
-                period_time = parse_iso_datetime(times[i])
-                period_time = period_time.replace(tzinfo=TZ_HOBART)
-                
-                # Determine period name
-                hour = period_time.hour
-                if resolution == "hourly":
-                    # For hourly, use hour as period (e.g., "06", "07", etc.)
-                    period_name = f"{hour:02d}"
-                else:
-                    # For 3-hourly, use N/AM/PM
-                    if hour < 6:
-                        period_name = "N"
-                    elif hour < 12:
-                        period_name = "AM"
-                    elif hour < 18:
-                        period_name = "PM"
-                    else:
-                        period_name = "N"
-                
-                # For hourly, use single hour; for 3-hourly, aggregate
-                agg_range = range(i, i+1) if resolution == "hourly" else range(i, min(i+3, len(times)))
-                
-                temps = [hourly["temperature_2m"][j] for j in agg_range 
-                         if hourly["temperature_2m"][j] is not None]
-                precip_probs = [hourly["precipitation_probability"][j] for j in agg_range
-                                if hourly["precipitation_probability"][j] is not None]
-                precips = [hourly["precipitation"][j] for j in agg_range
-                           if hourly["precipitation"][j] is not None]
-                snowfalls = [hourly["snowfall"][j] for j in agg_range
-                             if hourly.get("snowfall", [None]*len(times))[j] is not None]
-                wind_speeds = [hourly["wind_speed_10m"][j] for j in agg_range
-                               if hourly["wind_speed_10m"][j] is not None]
-                wind_gusts = [hourly["wind_gusts_10m"][j] for j in agg_range
-                              if hourly["wind_gusts_10m"][j] is not None]
-                cloud_covers = [hourly["cloud_cover"][j] for j in agg_range
-                                if hourly["cloud_cover"][j] is not None]
-                freezing_levels = [hourly["freezing_level_height"][j] for j in agg_range
-                                   if hourly.get("freezing_level_height", [None]*len(times))[j] is not None]
-                
-                # Calculate aggregates (or single values for hourly)
-                temp_min = min(temps) if temps else 10
-                temp_max = max(temps) if temps else 15
-                rain_chance = max(precip_probs) if precip_probs else 0
-                rain_total = sum(precips) if precips else 0
-                snow_total = sum(snowfalls) if snowfalls else 0
-                wind_avg = int(sum(wind_speeds) / len(wind_speeds)) if wind_speeds else 20
-                wind_max = int(max(wind_gusts)) if wind_gusts else wind_avg + 15
-                cloud_cover = int(sum(cloud_covers) / len(cloud_covers)) if cloud_covers else 50
-                freezing_level = int(sum(freezing_levels) / len(freezing_levels)) if freezing_levels else 1500
-                
-                # Estimate cloud base from cloud cover
-                cloud_base = 800 if cloud_cover > 80 else (1000 if cloud_cover > 50 else 1500)
-                
-                period = ForecastPeriod(
-                    datetime=period_time,
-                    period=period_name,
-                    temp_min=temp_min,
-                    temp_max=temp_max,
-                    rain_chance=rain_chance,
-                    rain_min=0,  # Open-Meteo doesn't provide min
-                    rain_max=round(rain_total, 1),
-                    snow_min=0,
-                    snow_max=round(snow_total, 1),  # Direct from API!
-                    wind_avg=wind_avg,
-                    wind_max=wind_max,
-                    cloud_cover=cloud_cover,  # Direct from API!
-                    cloud_base=cloud_base,
-                    freezing_level=freezing_level,  # Direct from API!
-                    cape=0  # Open-Meteo has this but we're not using it
-                )
-                periods.append(period)
-                
-            except (KeyError, ValueError, TypeError) as e:
+                starts.append((i, parse_iso_datetime(time_str).replace(tzinfo=TZ_HOBART)))
+            except (ValueError, TypeError) as e:
                 logger.warning(f"Error parsing Open-Meteo period {i}: {e}")
-                continue
-        
+
+        def build_period(index: int) -> ForecastPeriod:
+            i, period_time = starts[index]
+            value = windows.value
+
+            # Determine period name
+            hour = period_time.hour
+            if resolution == "hourly":
+                # For hourly, use hour as period (e.g., "06", "07", etc.)
+                period_name = f"{hour:02d}"
+            elif hour < 6:
+                period_name = "N"
+            elif hour < 12:
+                period_name = "AM"
+            elif hour < 18:
+                period_name = "PM"
+            else:
+                period_name = "N"
+
+            wind_avg = int(value("wind_avg", i, 20))
+            cloud_cover = int(value("cloud_cover", i, 50))
+
+            # Estimate cloud base from cloud cover
+            cloud_base = 800 if cloud_cover > 80 else (1000 if cloud_cover > 50 else 1500)
+
+            return ForecastPeriod(
+                datetime=period_time,
+                period=period_name,
+                temp_min=value("temp_min", i, 10),
+                temp_max=value("temp_max", i, 15),
+                rain_chance=int(value("rain_chance", i, 0)),
+                rain_min=0,  # Open-Meteo doesn't provide min
+                rain_max=round(value("rain_total", i, 0), 1),
+                snow_min=0,
+                snow_max=round(value("snow_total", i, 0), 1),  # Direct from API!
+                wind_avg=wind_avg,
+                wind_max=int(value("wind_max", i, wind_avg + 15)),
+                cloud_cover=cloud_cover,  # Direct from API!
+                cloud_base=cloud_base,
+                freezing_level=int(value("freezing_level", i, 1500)),  # Direct from API!
+                cape=0  # Open-Meteo has this but we're not using it
+            )
+
         return CellForecast(
             cell_id=cell_id,
             geohash=geohash,
             lat=lat,
             lon=lon,
             base_elevation=grid_elevation,  # Actual DEM elevation for temp adjustments
-            periods=periods,
+            periods=LazyPeriods(len(starts), build_period),
             fetched_at=now,
             expires_at=now + timedelta(hours=settings.BOM_CACHE_TTL_HOURS),
             is_cached=False,
             source="openmeteo"
         )
-    
+
     def _parse_bom_hourly_response(
         self,
         cell_id: str,
@@ -1189,66 +1499,26 @@ class BOMService:
                 if local_time > cutoff:
                     continue
                 
-                # Determine period name based on LOCAL hour
-                hour = local_time.hour
-                if hour < 6:
-                    period_name = "N"  # Night/early morning
-                elif hour < 12:
-                    period_name = "AM"
-                elif hour < 18:
-                    period_name = "PM"
-                else:
-                    period_name = "N"  # Evening/night
-                
                 # Extract rain data
                 rain = period_data.get("rain", {})
                 rain_amount = rain.get("amount", {})
                 rain_chance = rain.get("chance", 0) or 0
-                rain_min = rain_amount.get("min", 0) or 0
-                rain_max = rain_amount.get("max", 0) or 0
-                
+
                 # Extract wind data
                 wind = period_data.get("wind", {})
                 wind_avg = wind.get("speed_kilometre", 20) or 20
                 wind_max = wind.get("gust_speed_kilometre", wind_avg + 10) or (wind_avg + 10)
-                
-                # Temperature
-                temp = period_data.get("temp", 10)
-                temp_feels = period_data.get("temp_feels_like", temp)
-                
-                # Estimate temp range from single value
-                temp_max = temp
-                temp_min = temp - 3 if period_name == "PM" else temp - 1
-                
-                # Calculate freezing level from temperature
-                freezing_level = self.calculate_freezing_level(temp, 800)
-                
-                # Snow estimate (if temp < 2 and rain)
-                snow_max = (rain_max / 3) if temp < 2 and rain_max > 0 else 0
-                snow_min = snow_max * 0.3
-                
-                # Cloud - estimate from rain chance
-                cloud_cover = min(100, rain_chance + 30) if rain_chance > 0 else random.randint(20, 50)
-                cloud_base = 800 if cloud_cover > 80 else 1200
-                
-                period = ForecastPeriod(
-                    datetime=local_time,  # Store local time
-                    period=period_name,
-                    temp_min=temp_min,
-                    temp_max=temp_max,
+
+                # Shared with the 3-hourly view derived from hourly data
+                periods.append(bom_3hourly_period(
+                    local_time,  # Store local time
+                    temp=period_data.get("temp", 10),
                     rain_chance=rain_chance,
-                    rain_min=rain_min,
-                    rain_max=rain_max,
-                    snow_min=round(snow_min, 1),
-                    snow_max=round(snow_max, 1),
+                    rain_min=rain_amount.get("min", 0) or 0,
+                    rain_max=rain_amount.get("max", 0) or 0,
                     wind_avg=wind_avg,
                     wind_max=wind_max,
-                    cloud_cover=cloud_cover,
-                    cloud_base=cloud_base,
-                    freezing_level=freezing_level,
-                    cape=0  # BOM doesn't provide CAPE in this endpoint
-                )
-                periods.append(period)
+                ))
                 
             except (KeyError, ValueError) as e:
                 print(f"Error parsing period: {e}")
@@ -1449,11 +1719,7 @@ class BOMService:
         Calculate freezing level from base temperature.
         Section 6.7.2
         """
-        if base_temp <= 0:
-            return int(base_elevation)
-        
-        height_to_freeze = (base_temp / lapse_rate) * 100
-        return int(base_elevation + height_to_freeze)
+        return freezing_level(base_temp, base_elevation, lapse_rate)
     
     def adjust_temp_for_elevation(
         self,
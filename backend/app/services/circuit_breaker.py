@@ -0,0 +1,257 @@
+"""
+Per-provider circuit breakers with adaptive timeouts.
+
+When BOM's undocumented API or Environment Canada is down, every request
+used to wait for its own failure or 30s client timeout before falling
+back. A breaker per provider endpoint remembers recent outcomes and
+short-circuits straight to the fallback while the upstream is failing.
+
+Design notes:
+- CLOSED: calls pass through; the last `window` outcomes are kept and
+  the breaker opens once at least `min_calls` of them show an error rate
+  of `error_rate` or more
+- OPEN: calls fail immediately with CircuitOpenError for `open_seconds`
+- HALF_OPEN: one trial call is let through; success closes the breaker
+  (fresh window), failure re-opens it
+- Timeout per call = observed p99 of successful calls x multiplier,
+  clamped to [min_timeout, max_timeout]; max_timeout until enough samples
+- Timeouts count as failures; cancelled calls (hedge losers) count as neither
+- Breakers are process-wide, one per name ("bom:hourly", "weather:NWS"),
+  and their state is exposed via breaker_states() for monitoring
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreakerError(Exception):
+    """A call was refused or cut short by a circuit breaker."""
+    pass
+
+
+class CircuitOpenError(CircuitBreakerError):
+    """The breaker is open; the caller should go straight to its fallback."""
+    pass
+
+
+class CircuitTimeout(CircuitBreakerError):
+    """The call exceeded the breaker's adaptive timeout."""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker around one upstream endpoint.
+
+    Usage:
+        breaker = get_breaker("bom:hourly")
+        data = await breaker.call(lambda: fetch(url))
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 50,
+        min_calls: int = 10,
+        error_rate: float = 0.5,
+        open_seconds: float = 30.0,
+        min_timeout: float = 2.0,
+        max_timeout: float = 30.0,
+        timeout_multiplier: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            name: Provider and endpoint, e.g. "bom:daily"
+            window: Recent calls kept for error rate and latency
+            min_calls: Calls needed in the window before the breaker can open
+            error_rate: Failure fraction that opens the breaker
+            open_seconds: How long an open breaker refuses calls
+            min_timeout: Lower bound on the adaptive timeout (seconds)
+            max_timeout: Upper bound, and the timeout until enough samples
+            timeout_multiplier: Headroom applied to the observed p99
+            clock: Monotonic time source (seconds)
+        """
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.open_seconds = open_seconds
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self._clock = clock
+
+        # (succeeded, elapsed seconds) per recent call
+        self._outcomes: Deque[Tuple[bool, float]] = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open after open_seconds."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            logger.info(f"Circuit {self.name} half-open, allowing a trial call")
+        return self._state
+
+    def current_error_rate(self) -> float:
+        """Failure fraction over the window (0.0 if empty)."""
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok, _ in self._outcomes if not ok) / len(self._outcomes)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Latency percentile of successful calls in the window, or None."""
+        samples = sorted(elapsed for ok, elapsed in self._outcomes if ok)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * percentile))]
+
+    def timeout(self) -> float:
+        """Per-call timeout: p99 x multiplier within [min_timeout, max_timeout]."""
+        successes = sum(1 for ok, _ in self._outcomes if ok)
+        if successes < self.min_calls:
+            return self.max_timeout
+        p99 = self.latency_percentile(0.99)
+        return min(self.max_timeout, max(self.min_timeout, p99 * self.timeout_multiplier))
+
+    def reject_if_open(self) -> None:
+        """
+        Raise CircuitOpenError if a call would be refused right now.
+
+        Lets callers skip work they'd only start alongside the call.
+        """
+        state = self.state
+        if state == OPEN or (state == HALF_OPEN and self._trial_in_flight):
+            self.rejected += 1
+            raise CircuitOpenError(f"Circuit {self.name} is open")
+
+    async def call(self, request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a request through the breaker.
+
+        Args:
+            request: Zero-argument coroutine factory
+
+        Returns:
+            The request's result
+
+        Raises:
+            CircuitOpenError: Breaker open (request not started)
+            CircuitTimeout: Request exceeded the adaptive timeout
+            Exception: Whatever the request raised
+        """
+        self.reject_if_open()
+        trial = self.state == HALF_OPEN
+        if trial:
+            self._trial_in_flight = True
+
+        timeout = self.timeout()
+        started = self._clock()
+        try:
+            result = await asyncio.wait_for(request(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._record(False, self._clock() - started, trial)
+            raise CircuitTimeout(f"Circuit {self.name}: no answer within {timeout:.1f}s")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._record(False, self._clock() - started, trial)
+            raise
+        finally:
+            if trial:
+                self._trial_in_flight = False
+
+        self._record(True, self._clock() - started, trial)
+        return result
+
+    def _record(self, succeeded: bool, elapsed: float, trial: bool) -> None:
+        """Record an outcome and move between states."""
+        if trial:
+            if succeeded:
+                self._outcomes.clear()
+                self._state = CLOSED
+                logger.info(f"Circuit {self.name} closed after successful trial")
+            else:
+                self._open()
+        elif self._state == CLOSED:
+            self._outcomes.append((succeeded, elapsed))
+            if (not succeeded and len(self._outcomes) >= self.min_calls
+                    and self.current_error_rate() >= self.error_rate):
+                self._open()
+            return
+
+        if succeeded:
+            self._outcomes.append((succeeded, elapsed))
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self.times_opened += 1
+        logger.warning(
+            f"Circuit {self.name} opened (error rate {self.current_error_rate():.0%}), "
+            f"skipping for {self.open_seconds:.0f}s"
+        )
+
+    def snapshot(self) -> dict:
+        """State, error rate, latencies and timeout for monitoring."""
+        p50 = self.latency_percentile(0.5)
+        p99 = self.latency_percentile(0.99)
+        return {
+            "name": self.name,
+            "state": self.state,
+            "calls": len(self._outcomes),
+            "error_rate": round(self.current_error_rate(), 3),
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "p99_seconds": round(p99, 3) if p99 is not None else None,
+            "timeout_seconds": round(self.timeout(), 3),
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
+
+
+# Process-wide breakers by name
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Get (creating on first use) the breaker for a provider endpoint."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(
+            name,
+            window=settings.CIRCUIT_BREAKER_WINDOW,
+            min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+            error_rate=settings.CIRCUIT_BREAKER_ERROR_RATE,
+            open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+            min_timeout=settings.CIRCUIT_BREAKER_MIN_TIMEOUT_SECONDS,
+            max_timeout=settings.CIRCUIT_BREAKER_MAX_TIMEOUT_SECONDS,
+            timeout_multiplier=settings.CIRCUIT_BREAKER_TIMEOUT_MULTIPLIER,
+        )
+    return breaker
+
+
+def breaker_states() -> List[dict]:
+    """Snapshots of every breaker, sorted by name."""
+    return [_breakers[name].snapshot() for name in sorted(_breakers)]
+
+
+def reset_breakers() -> None:
+    """Drop all breakers (for testing)."""
+    _breakers.clear()
@@ -0,0 +1,135 @@
+"""
+Per-command reply latency, for choosing inline vs deferred SMS replies.
+
+Inbound SMS used to be answered only in the TwiML response, so a CAST7
+CAMPS/PEAKS reply that took longer than Twilio's 15s webhook timeout
+never reached the hiker.
+
+Design notes:
+- Forecast commands run as a task; if it finishes within
+  SMS_INLINE_REPLY_BUDGET_SECONDS the reply goes back in the TwiML as
+  before, otherwise the webhook returns an empty TwiML ack and the reply
+  is delivered through the outbound SMS queue when ready
+- Commands whose recent p90 latency is over the budget are deferred
+  straight away instead of waiting the budget out first
+- Latency is kept per command key ("CAST7:CAMPS", "CAST12:GPS", ...) over
+  the last SMS_REPLY_LATENCY_WINDOW replies, whichever way they were
+  delivered, so a command goes back inline once upstreams recover
+- Only forecast commands are deferrable; the rest answer from our own
+  database and stay inline
+"""
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Deque, Dict, Optional, TypeVar
+
+from app.services.commands import CommandType
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Commands that may be answered out of band
+DEFERRABLE_COMMANDS = frozenset({
+    CommandType.CAST, CommandType.CAST12, CommandType.CAST24, CommandType.CAST7,
+})
+
+# Samples needed before a command's history is trusted
+_MIN_SAMPLES = 3
+
+
+def command_key(parsed) -> str:
+    """
+    Latency key for a parsed command.
+
+    CAST7 CAMPS/PEAKS fan out across a whole route and GPS forecasts may
+    use a different provider, so they're tracked apart from single codes.
+    """
+    key = parsed.command_type.value
+    if parsed.args.get("all_camps"):
+        return f"{key}:CAMPS"
+    if parsed.args.get("all_peaks"):
+        return f"{key}:PEAKS"
+    if parsed.args.get("is_gps"):
+        return f"{key}:GPS"
+    return key
+
+
+class CommandLatencyTracker:
+    """
+    Rolling reply latency per command key.
+
+    Usage:
+        tracker = get_command_latency()
+        if tracker.expect_slow(key):
+            ...  # defer without waiting
+        reply = await tracker.timed(key, process_command(phone, parsed))
+    """
+
+    def __init__(self, budget: Optional[float] = None, window: Optional[int] = None):
+        """
+        Args:
+            budget: Seconds an inline reply may take (default SMS_INLINE_REPLY_BUDGET_SECONDS)
+            window: Recent replies kept per command (default SMS_REPLY_LATENCY_WINDOW)
+        """
+        self.budget = settings.SMS_INLINE_REPLY_BUDGET_SECONDS if budget is None else budget
+        self.window = window or settings.SMS_REPLY_LATENCY_WINDOW
+        self._samples: Dict[str, Deque[float]] = {}
+        self.inline = 0
+        self.deferred = 0
+
+    def observe(self, key: str, seconds: float) -> None:
+        """Record how long a command took to produce its reply."""
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    async def timed(self, key: str, reply: Awaitable[T]) -> T:
+        """Await a reply, recording its latency (failures included)."""
+        started = time.monotonic()
+        try:
+            return await reply
+        finally:
+            self.observe(key, time.monotonic() - started)
+
+    def estimate(self, key: str, percentile: float = 0.9) -> Optional[float]:
+        """Latency percentile over the window, or None without enough samples."""
+        samples = self._samples.get(key)
+        if not samples or len(samples) < _MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
+
+    def expect_slow(self, key: str) -> bool:
+        """True if recent replies for this command have run over budget."""
+        estimate = self.estimate(key)
+        return estimate is not None and estimate > self.budget
+
+    def stats(self) -> dict:
+        """Inline/deferred counts and p90 per command."""
+        return {
+            "inline": self.inline,
+            "deferred": self.deferred,
+            "budget_seconds": self.budget,
+            "p90_seconds": {key: self.estimate(key) for key in sorted(self._samples)},
+        }
+
+
+# Singleton instance
+_tracker: Optional[CommandLatencyTracker] = None
+
+
+def get_command_latency() -> CommandLatencyTracker:
+    """Get singleton command latency tracker."""
+    global _tracker
+    if _tracker is None:
+        _tracker = CommandLatencyTracker()
+    return _tracker
+
+
+def reset_command_latency() -> None:
+    """Reset the singleton tracker (for testing)."""
+    global _tracker
+    _tracker = None
@@ -0,0 +1,243 @@
+"""
+Local DEM tile store for offline elevation lookups.
+
+Cell-average elevation used to need 49 Open Topo Data lookups per new cell,
+and point elevation an Open-Meteo call, both on the SMS hot path. With SRTM
+tiles on disk, the same numbers come from memory-mapped files in well under
+a millisecond.
+
+Tile format (SRTM .hgt):
+- One 1°x1° tile per file, named by its south-west corner (e.g. S44E146.hgt)
+- Square grid of big-endian signed 16-bit metres, row 0 = north edge
+- 1201x1201 (3 arc-second) or 3601x3601 (1 arc-second); any square size works
+- -32768 marks voids
+
+Design notes:
+- Tiles are mmap'd on first use and kept open (read-only, shared by the OS page cache),
+  viewed as a numpy (n, n) big-endian int16 array without copying
+- Whole point grids are sampled in one synchronous call (no network, no awaits):
+  points are grouped by tile and each tile interpolates its points as arrays
+- Bilinear interpolation, void corners masked out of the weights
+- Missing tiles/voids return None so callers can fall back to HTTP
+"""
+import logging
+import math
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# SRTM void marker
+HGT_VOID = -32768
+
+# Tiles tried for a point, as (south, west) offsets from its own tile;
+# non-zero offsets only for points exactly on that tile edge
+_EDGE_NEIGHBOURS = ((0, 0), (0, -1), (-1, 0), (-1, -1))
+
+
+class HGTTile:
+    """A single memory-mapped SRTM .hgt tile."""
+
+    def __init__(self, path: Path, south: int, west: int):
+        """
+        Map a tile into memory.
+
+        Args:
+            path: Path to the .hgt file
+            south: Latitude of the tile's south edge
+            west: Longitude of the tile's west edge
+
+        Raises:
+            ValueError: If the file is not a square grid of 16-bit samples
+        """
+        self.path = path
+        self.south = south
+        self.west = west
+
+        size = path.stat().st_size
+        samples = int(math.isqrt(size // 2))
+        if samples < 2 or samples * samples * 2 != size:
+            raise ValueError(f"{path.name} is not a square .hgt grid ({size} bytes)")
+        self.samples = samples
+
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._grid = np.frombuffer(self._mm, dtype=">i2").reshape(samples, samples)
+
+    def sample_many(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Bilinear elevations for arrays of points inside this tile.
+
+        Args:
+            lats: Latitudes (south..south+1)
+            lons: Longitudes (west..west+1)
+
+        Returns:
+            Float array of metres, NaN where all surrounding samples are void
+        """
+        last = self.samples - 1
+        rows = (self.south + 1 - np.asarray(lats, dtype=float)) * last
+        cols = (np.asarray(lons, dtype=float) - self.west) * last
+        r0 = np.clip(np.floor(rows), 0, last - 1).astype(np.intp)
+        c0 = np.clip(np.floor(cols), 0, last - 1).astype(np.intp)
+        dr = np.clip(rows - r0, 0.0, 1.0)
+        dc = np.clip(cols - c0, 0.0, 1.0)
+
+        # Corners as (4, n): NW, NE, SW, SE
+        values = self._grid[
+            np.stack([r0, r0, r0 + 1, r0 + 1]),
+            np.stack([c0, c0 + 1, c0, c0 + 1]),
+        ]
+        weights = np.stack([(1 - dr) * (1 - dc), (1 - dr) * dc, dr * (1 - dc), dr * dc])
+        weights = np.where(values == HGT_VOID, 0.0, weights)
+
+        weight = weights.sum(axis=0)
+        total = (values * weights).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(weight > 0, total / weight, np.nan)
+
+    def sample(self, lat: float, lon: float) -> Optional[float]:
+        """Bilinear elevation at one point, or None if all surrounding samples are void."""
+        value = self.sample_many(np.array([lat]), np.array([lon]))[0]
+        return None if np.isnan(value) else float(value)
+
+    def close(self) -> None:
+        """Unmap the tile."""
+        del self._grid  # Release the buffer export before unmapping
+        self._mm.close()
+
+
+class DEMTileStore:
+    """
+    Directory of SRTM .hgt tiles with lazy memory mapping.
+
+    Tiles are opened on first use; missing or unreadable tiles are
+    remembered so they aren't probed again.
+    """
+
+    def __init__(self, tile_dir: str):
+        """
+        Initialize store.
+
+        Args:
+            tile_dir: Directory containing .hgt tiles
+        """
+        self.tile_dir = Path(tile_dir)
+        self._tiles: Dict[Tuple[int, int], Optional[HGTTile]] = {}
+
+    @staticmethod
+    def tile_name(south: int, west: int) -> str:
+        """SRTM file name for the tile with this south-west corner, e.g. S44E146."""
+        ns = "N" if south >= 0 else "S"
+        ew = "E" if west >= 0 else "W"
+        return f"{ns}{abs(south):02d}{ew}{abs(west):03d}"
+
+    def _tile(self, south: int, west: int) -> Optional[HGTTile]:
+        """Get (opening if needed) the tile with this south-west corner."""
+        key = (south, west)
+        if key in self._tiles:
+            return self._tiles[key]
+
+        tile = None
+        name = self.tile_name(south, west)
+        for filename in (f"{name}.hgt", f"{name.lower()}.hgt"):
+            path = self.tile_dir / filename
+            if path.exists():
+                try:
+                    tile = HGTTile(path, south, west)
+                    logger.info(f"Mapped DEM tile {path.name} ({tile.samples}x{tile.samples})")
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Unusable DEM tile {path}: {e}")
+                break
+
+        self._tiles[key] = tile
+        return tile
+
+    def sample_points(self, points: Sequence[Tuple[float, float]]) -> List[Optional[float]]:
+        """
+        Elevations for a batch of points (e.g. a whole cell sampling grid).
+
+        Args:
+            points: (lat, lon) tuples
+
+        Returns:
+            Elevations in meters (None where no tile or only voids)
+        """
+        if not points:
+            return []
+        coords = np.asarray(points, dtype=float).reshape(-1, 2)
+        lats, lons = coords[:, 0], coords[:, 1]
+        souths = np.floor(lats).astype(int)
+        wests = np.floor(lons).astype(int)
+
+        elevations = np.full(len(coords), np.nan)
+        pending = np.ones(len(coords), dtype=bool)
+        # Points on a tile edge may use the neighbouring tile if theirs is missing
+        for d_south, d_west in _EDGE_NEIGHBOURS:
+            candidates = pending.copy()
+            if d_south:
+                candidates &= lats == souths
+            if d_west:
+                candidates &= lons == wests
+            if not candidates.any():
+                continue
+
+            indices = np.flatnonzero(candidates)
+            # One integer per tile (south-west corner), so grouping is a 1-D unique
+            keys = (souths[indices] + d_south + 90) * 360 + (wests[indices] + d_west + 180)
+            tiles, groups = np.unique(keys, return_inverse=True)
+            for group, key in enumerate(tiles.tolist()):
+                south, west = divmod(key, 360)
+                tile = self._tile(south - 90, west - 180)
+                if tile is None:
+                    continue
+                members = indices if len(tiles) == 1 else indices[groups.reshape(-1) == group]
+                elevations[members] = tile.sample_many(lats[members], lons[members])
+                pending[members] = False
+
+        return [None if value != value else value for value in elevations.tolist()]  # NaN -> None
+
+    def elevation(self, lat: float, lon: float) -> Optional[float]:
+        """Elevation at a single point, or None if not covered."""
+        return self.sample_points([(lat, lon)])[0]
+
+    def close(self) -> None:
+        """Unmap all open tiles."""
+        for tile in self._tiles.values():
+            if tile is not None:
+                tile.close()
+        self._tiles.clear()
+
+
+# Singleton instance
+_dem_store: Optional[DEMTileStore] = None
+
+
+def get_dem_store() -> Optional[DEMTileStore]:
+    """
+    Get the singleton DEM tile store.
+
+    Returns:
+        DEMTileStore, or None when DEM_TILE_DIR is unset or missing
+    """
+    global _dem_store
+    if _dem_store is None:
+        tile_dir = settings.DEM_TILE_DIR
+        if not tile_dir or not os.path.isdir(tile_dir):
+            return None
+        _dem_store = DEMTileStore(tile_dir)
+    return _dem_store
+
+
+def reset_dem_store() -> None:
+    """Close and drop the singleton store (for testing)."""
+    global _dem_store
+    if _dem_store is not None:
+        _dem_store.close()
+    _dem_store = None
@@ -8,7 +8,8 @@ to enable correct lapse rate adjustments.
 Approach:
 1. Define a 2.2km x 2.2km grid centered on the user's location
    (matching BOM ACCESS model resolution)
-2. Sample elevation across the grid using Open Topo Data API
+2. Sample elevation across the grid from local DEM tiles (app.services.dem),
+   falling back to the Open Topo Data API for points they don't cover
 3. Return grid average as the base elevation for temperature adjustments
 
 The temperature adjustment formula:
@@ -20,18 +21,20 @@ References:
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Dict, Optional, Tuple
 
-import httpx
+from app.services.dem import get_dem_store
+from app.services.http_clients import get_http_client, OPEN_TOPO_DATA
+from app.services.terrain_cache import get_terrain_cache, CELL_ELEVATION
 
 logger = logging.getLogger(__name__)
 
 # Lapse rate for temperature adjustment (°C per 100m)
 LAPSE_RATE = 0.65
 
-# Cache for cell boundaries and elevations
-_cell_cache: Dict[str, "CellElevationData"] = {}
+# Cache for cell boundaries and elevations (bounded LRU, persisted across restarts)
+_cell_cache = get_terrain_cache(CELL_ELEVATION)
 
 
 @dataclass
@@ -50,7 +53,7 @@ class CellElevationData:
 
 async def get_point_elevation(lat: float, lon: float) -> Optional[float]:
     """
-    Get elevation at a single point using Open Topo Data API.
+    Get elevation at a single point from local DEM tiles or Open Topo Data API.
 
     Args:
         lat: Latitude
@@ -59,16 +62,23 @@ async def get_point_elevation(lat: float, lon: float) -> Optional[float]:
     Returns:
         Elevation in meters, or None if unavailable
     """
+    dem = get_dem_store()
+    if dem is not None:
+        elevation = dem.elevation(lat, lon)
+        if elevation is not None:
+            return elevation
+
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            r = await client.get(
-                "https://api.opentopodata.org/v1/srtm90m",
-                params={"locations": f"{lat},{lon}"}
-            )
-            if r.status_code == 200:
-                data = r.json()
-                if data.get("status") == "OK" and data.get("results"):
-                    return data["results"][0].get("elevation")
+        client = get_http_client(OPEN_TOPO_DATA)
+        r = await client.get(
+            "https://api.opentopodata.org/v1/srtm90m",
+            params={"locations": f"{lat},{lon}"},
+            timeout=15
+        )
+        if r.status_code == 200:
+            data = r.json()
+            if data.get("status") == "OK" and data.get("results"):
+                return data["results"][0].get("elevation")
     except Exception as e:
         logger.warning(f"Failed to get elevation for ({lat}, {lon}): {e}")
 
@@ -94,24 +104,41 @@ async def get_bulk_elevations(points: list[Tuple[float, float]]) -> list[Optiona
     locations = "|".join(f"{lat},{lon}" for lat, lon in points)
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.get(
-                "https://api.opentopodata.org/v1/srtm90m",
-                params={"locations": locations}
-            )
-            if r.status_code == 200:
-                data = r.json()
-                if data.get("status") == "OK":
-                    return [
-                        result.get("elevation")
-                        for result in data.get("results", [])
-                    ]
+        client = get_http_client(OPEN_TOPO_DATA)
+        r = await client.get(
+            "https://api.opentopodata.org/v1/srtm90m",
+            params={"locations": locations},
+            timeout=30
+        )
+        if r.status_code == 200:
+            data = r.json()
+            if data.get("status") == "OK":
+                return [
+                    result.get("elevation")
+                    for result in data.get("results", [])
+                ]
     except Exception as e:
         logger.warning(f"Failed to get bulk elevations: {e}")
 
     return [None] * len(points)
 
 
+def sample_local_elevations(points: list[Tuple[float, float]]) -> list[Optional[float]]:
+    """
+    Elevations for points from local DEM tiles.
+
+    Args:
+        points: List of (lat, lon) tuples
+
+    Returns:
+        List of elevations (None for points without local coverage)
+    """
+    dem = get_dem_store()
+    if dem is None:
+        return [None] * len(points)
+    return dem.sample_points(points)
+
+
 async def get_cell_elevation_data(
     lat: float,
     lon: float,
@@ -139,9 +166,10 @@ async def get_cell_elevation_data(
     import geohash2
     cache_key = geohash2.encode(lat, lon, precision=5)
 
-    if cache_key in _cell_cache:
+    cached = _cell_cache.get(cache_key)
+    if cached is not None:
         logger.debug(f"Cell elevation cache hit: {cache_key}")
-        return _cell_cache[cache_key]
+        return CellElevationData(**cached)
 
     logger.info(f"Computing elevation data for grid at ({lat:.4f}, {lon:.4f})")
 
@@ -171,7 +199,13 @@ async def get_cell_elevation_data(
             p_lon = west + j * lon_step
             points.append((p_lat, p_lon))
 
-    elevations = await get_bulk_elevations(points)
+    elevations = sample_local_elevations(points)
+    missing = [i for i, e in enumerate(elevations) if e is None]
+    if missing:
+        # Fill points the local tiles don't cover from Open Topo Data
+        fetched = await get_bulk_elevations([points[i] for i in missing])
+        for i, elevation in zip(missing, fetched):
+            elevations[i] = elevation
     valid_elevations = [e for e in elevations if e is not None]
 
     if not valid_elevations:
@@ -195,7 +229,7 @@ async def get_cell_elevation_data(
     )
 
     # Cache the result
-    _cell_cache[cache_key] = cell_data
+    _cell_cache.set(cache_key, asdict(cell_data))
 
     logger.info(
         f"Grid {cache_key}: avg={avg_elevation:.0f}m, "
@@ -142,15 +142,19 @@ class ForecastGenerator:
         messages = []
         total = len(zones)
         
-        for idx, (zone_id, zone_camps) in enumerate(zones.items(), 1):
+        # Fetch every zone together rather than one at a time
+        forecasts = await self.bom_service.get_forecasts(
+            [(zone_camps[0].lat, zone_camps[0].lon) for zone_camps in zones.values()],
+            days=7,
+            resolution="3hourly"
+        )
+        
+        for idx, ((zone_id, zone_camps), forecast) in enumerate(zip(zones.items(), forecasts), 1):
             representative_camp = zone_camps[0]
             
             try:
-                forecast = await self.bom_service.get_forecast(
-                    lat=representative_camp.lat,
-                    lon=representative_camp.lon,
-                    days=7
-                )
+                if forecast is None:
+                    raise ValueError("no forecast returned")
                 
                 # Get nearby peaks for this zone
                 nearby_peaks = self._get_peaks_in_zone(route, zone_id)
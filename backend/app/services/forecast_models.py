@@ -0,0 +1,78 @@
+"""
+Forecast data types shared by the weather services.
+
+Design notes:
+- Kept out of bom.py so modules that bom.py itself uses (forecast_views)
+  can import them at module level; bom.py re-exports them, so existing
+  "from app.services.bom import CellForecast" imports keep working
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class ForecastPeriod:
+    """Single forecast period data."""
+    datetime: datetime
+    period: str  # 'N', 'AM', 'PM'
+    
+    # Temperature
+    temp_min: float
+    temp_max: float
+    
+    # Precipitation
+    rain_chance: int  # percentage
+    rain_min: float
+    rain_max: float
+    snow_min: float
+    snow_max: float
+    
+    # Wind
+    wind_avg: int
+    wind_max: int
+    
+    # Cloud/visibility
+    cloud_cover: int  # percentage
+    cloud_base: int  # meters AGL (calculated from dewpoint via LCL formula)
+
+    # Freezing level
+    freezing_level: int  # meters ASL
+
+    # Thunderstorm
+    cape: int  # J/kg
+
+    # Dewpoint for LCL cloud base calculation (optional, comes after required fields)
+    dewpoint: Optional[float] = None  # Celsius
+
+
+@dataclass(slots=True)
+class RecentPrecipitation:
+    """Recent precipitation totals for trail condition assessment."""
+    rain_24h: float = 0.0  # mm in last 24 hours
+    rain_48h: float = 0.0  # mm in last 48 hours
+    rain_72h: float = 0.0  # mm in last 72 hours
+    snow_24h: float = 0.0  # cm in last 24 hours
+    snow_48h: float = 0.0  # cm in last 48 hours
+    snow_72h: float = 0.0  # cm in last 72 hours
+
+
+@dataclass(slots=True)
+class CellForecast:
+    """Complete forecast for a weather zone (formerly called 'BOM cell')."""
+    cell_id: str  # Our zone identifier (e.g., "201-117"), not a BOM concept
+    geohash: str  # BOM API uses geohash for lookups
+    lat: float
+    lon: float
+    base_elevation: int
+
+    periods: List[ForecastPeriod]
+
+    fetched_at: datetime
+    expires_at: datetime
+    is_cached: bool = False
+    cache_age_hours: float = 0.0
+    source: str = "bom"  # 'bom' or 'mock'
+
+    # Recent precipitation for trail conditions
+    recent_precip: Optional[RecentPrecipitation] = None
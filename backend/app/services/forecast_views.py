@@ -0,0 +1,158 @@
+"""
+Coarser forecast views derived from the hourly BOM forecast.
+
+CAST12/CAST24 fetch the hourly forecast (2 days) for a location; a CAST
+or 3-hourly request for the same location inside that horizon runs a
+second pipeline against BOM's 3-hourly endpoint. With
+BOM_DERIVE_3HOURLY on, it's aggregated locally from the cached hourly
+forecast instead.
+
+Design notes:
+- Windows are local 00-03, 03-06, ... blocks named N/AM/PM like the
+  3-hourly parsers; the window already under way is kept (partial)
+- Each window is reduced to what a BOM 3-hourly row carries (temperature
+  at the window start, peak rain chance, summed rain, mean wind, peak
+  gust) and turned into a period by bom_3hourly_period(), the same rules
+  the 3-hourly parser applies, so CAST content doesn't change: one
+  temperature per window, cloud from the rain chance, no CAPE/dewpoint
+- Only BOM hourly forecasts are derived; an Open-Meteo fallback keeps
+  its own 3-hourly parse
+- Past the hourly horizon (CAST7) BOM's 3-hourly product is still fetched
+"""
+import random
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from typing import List, Sequence, Tuple
+
+from config.settings import TZ_HOBART
+from app.services.forecast_models import CellForecast, ForecastPeriod
+
+WINDOW_HOURS = 3
+
+
+def period_name(hour: int) -> str:
+    """3-hourly period name for a local hour: N (night), AM or PM."""
+    if hour < 6:
+        return "N"
+    if hour < 12:
+        return "AM"
+    if hour < 18:
+        return "PM"
+    return "N"
+
+
+def freezing_level(base_temp: float, base_elevation: float, lapse_rate: float = 0.65) -> int:
+    """
+    Calculate freezing level from base temperature.
+    Section 6.7.2
+    """
+    if base_temp <= 0:
+        return int(base_elevation)
+
+    height_to_freeze = (base_temp / lapse_rate) * 100
+    return int(base_elevation + height_to_freeze)
+
+
+def bom_3hourly_period(
+    local_time: datetime,
+    temp: float,
+    rain_chance: int,
+    rain_min: float,
+    rain_max: float,
+    wind_avg: int,
+    wind_max: int
+) -> ForecastPeriod:
+    """
+    ForecastPeriod for one BOM 3-hourly row.
+
+    Args:
+        local_time: Window start (local time)
+        temp: The row's single temperature
+        rain_chance: Chance of rain (%)
+        rain_min: Lower bound of the rain amount (mm)
+        rain_max: Upper bound of the rain amount (mm)
+        wind_avg: Wind speed (km/h)
+        wind_max: Gust speed (km/h)
+    """
+    name = period_name(local_time.hour)
+
+    # Estimate temp range from single value
+    temp_max = temp
+    temp_min = temp - 3 if name == "PM" else temp - 1
+
+    # Snow estimate (if temp < 2 and rain)
+    snow_max = (rain_max / 3) if temp < 2 and rain_max > 0 else 0
+    snow_min = snow_max * 0.3
+
+    # Cloud - estimate from rain chance
+    cloud_cover = min(100, rain_chance + 30) if rain_chance > 0 else random.randint(20, 50)
+    cloud_base = 800 if cloud_cover > 80 else 1200
+
+    return ForecastPeriod(
+        datetime=local_time,
+        period=name,
+        temp_min=temp_min,
+        temp_max=temp_max,
+        rain_chance=rain_chance,
+        rain_min=rain_min,
+        rain_max=rain_max,
+        snow_min=round(snow_min, 1),
+        snow_max=round(snow_max, 1),
+        wind_avg=wind_avg,
+        wind_max=wind_max,
+        cloud_cover=cloud_cover,
+        cloud_base=cloud_base,
+        freezing_level=freezing_level(temp, 800),
+        cape=0  # BOM doesn't provide CAPE in the 3-hourly endpoint
+    )
+
+
+def aggregate_periods(periods: Sequence[ForecastPeriod]) -> ForecastPeriod:
+    """
+    Combine consecutive BOM hourly periods into one 3-hourly period.
+
+    Args:
+        periods: Hourly periods in one window (at least one)
+
+    Returns:
+        ForecastPeriod stamped at the window start, as the 3-hourly
+        parser would build it
+    """
+    first = periods[0]
+    start = first.datetime.replace(
+        hour=first.datetime.hour - first.datetime.hour % WINDOW_HOURS, minute=0, second=0, microsecond=0
+    )
+
+    return bom_3hourly_period(
+        start,
+        temp=round((first.temp_min + first.temp_max) / 2, 1),  # Hourly parse stores temp +/- 1
+        rain_chance=max(p.rain_chance for p in periods),
+        rain_min=round(sum(p.rain_min for p in periods), 1),
+        rain_max=round(sum(p.rain_max for p in periods), 1),
+        wind_avg=int(sum(p.wind_avg for p in periods) / len(periods)),
+        wind_max=max(p.wind_max for p in periods),
+    )
+
+
+def to_3hourly(forecast: CellForecast, days: int) -> CellForecast:
+    """
+    3-hourly view of a BOM hourly forecast.
+
+    Args:
+        forecast: Hourly CellForecast (periods in time order)
+        days: Days ahead to keep (at most the hourly forecast's span)
+
+    Returns:
+        New CellForecast with 3-hourly periods; the hourly one is untouched
+        (it may be shared through the forecast cache)
+    """
+    cutoff = datetime.now(TZ_HOBART) + timedelta(days=days)
+    windows: "OrderedDict[Tuple[date, int], List[ForecastPeriod]]" = OrderedDict()
+    for period in forecast.periods:
+        key = (period.datetime.date(), period.datetime.hour // WINDOW_HOURS)
+        windows.setdefault(key, []).append(period)
+
+    periods = [aggregate_periods(window) for window in windows.values()]
+    # Like the 3-hourly parser: windows starting past the cutoff are dropped
+    return replace(forecast, periods=[p for p in periods if p.datetime <= cutoff])
@@ -0,0 +1,171 @@
+"""
+Latency-budgeted hedged requests.
+
+Inbound SMS must be answered inside Twilio's webhook timeout, but provider
+clients allow 30s per request and the fallback provider normally only
+starts once the primary has failed. hedged_race() bounds that:
+
+- Primary starts immediately
+- If the primary fails, the fallback starts straight away (as before)
+- If the primary hasn't answered by hedge_delay, the fallback starts too
+  and the first valid answer wins; the other request is cancelled
+- Nothing valid within the overall budget raises HedgeTimeout
+
+Every race records which path won (and how long it took) in a HedgeStats,
+so the hedge delay can be tuned from real latencies.
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Race outcomes
+OUTCOME_PRIMARY = "primary"                  # Primary answered before the hedge fired
+OUTCOME_PRIMARY_HEDGED = "primary_hedged"    # Hedge fired, primary still answered first
+OUTCOME_FALLBACK_HEDGED = "fallback_hedged"  # Hedge fired, fallback answered first
+OUTCOME_FALLBACK = "fallback"                # Primary failed, fallback answered
+OUTCOME_FAILED = "failed"                    # Every path failed
+OUTCOME_TIMEOUT = "timeout"                  # No valid answer within budget
+
+
+class HedgeTimeout(Exception):
+    """No valid answer arrived within the latency budget."""
+    pass
+
+
+class HedgeStats:
+    """
+    Outcome counters and recent latencies for hedged races.
+
+    Keeps the last `sample_size` latencies per outcome. If most races end
+    in primary_hedged, the hedge delay is too short; if fallback_hedged
+    answers are rare but slow primaries common, it is too long.
+    """
+
+    def __init__(self, sample_size: int = 200):
+        self.sample_size = sample_size
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def record(self, outcome: str, elapsed: float) -> None:
+        """Record one race outcome and its elapsed time in seconds."""
+        self._counts[outcome] = self._counts.get(outcome, 0) + 1
+        samples = self._latencies.setdefault(outcome, deque(maxlen=self.sample_size))
+        samples.append(elapsed)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-outcome counts and latency percentiles.
+
+        Returns:
+            Dict of outcome -> {count, p50_seconds, p95_seconds}
+        """
+        result = {}
+        for outcome, count in self._counts.items():
+            samples = sorted(self._latencies[outcome])
+            result[outcome] = {
+                "count": count,
+                "p50_seconds": round(samples[len(samples) // 2], 3),
+                "p95_seconds": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+            }
+        return result
+
+    def reset(self) -> None:
+        """Clear all recorded outcomes (for testing)."""
+        self._latencies.clear()
+        self._counts.clear()
+
+
+async def hedged_race(
+    primary: Callable[[], Awaitable[T]],
+    fallback: Optional[Callable[[], Awaitable[T]]],
+    hedge_delay: float,
+    budget: float,
+    stats: Optional[HedgeStats] = None,
+    label: str = "",
+) -> Tuple[T, str]:
+    """
+    Race a primary request against a delayed fallback within a time budget.
+
+    Args:
+        primary: Zero-argument coroutine factory for the primary request
+        fallback: Coroutine factory for the fallback, or None for a budget-only wait
+        hedge_delay: Seconds to give the primary before firing the fallback
+        budget: Overall seconds allowed for a valid answer
+        stats: Optional HedgeStats recording the outcome
+        label: Short description for log lines
+
+    Returns:
+        Tuple of (result, outcome) where outcome is one of the OUTCOME_* values
+
+    Raises:
+        HedgeTimeout: No valid answer within budget
+        Exception: The last error seen, if every path failed
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + budget
+
+    primary_task = asyncio.ensure_future(primary())
+    fallback_task: Optional[asyncio.Future] = None
+    pending = {primary_task}
+    hedged = False
+    last_error: Optional[BaseException] = None
+
+    def finish(outcome: str) -> None:
+        elapsed = loop.time() - started
+        if stats is not None:
+            stats.record(outcome, elapsed)
+        logger.info(f"Hedged request {label}: {outcome} after {elapsed:.2f}s")
+
+    try:
+        while pending:
+            now = loop.time()
+            if now >= deadline:
+                break
+
+            timeout = deadline - now
+            if fallback_task is None and fallback is not None:
+                timeout = min(timeout, max(started + hedge_delay - now, 0))
+
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                if task.exception() is None:
+                    if task is primary_task:
+                        outcome = OUTCOME_PRIMARY_HEDGED if hedged else OUTCOME_PRIMARY
+                    else:
+                        outcome = OUTCOME_FALLBACK_HEDGED if hedged else OUTCOME_FALLBACK
+                    finish(outcome)
+                    return task.result(), outcome
+
+                last_error = task.exception()
+                which = "primary" if task is primary_task else "fallback"
+                logger.warning(f"Hedged request {label}: {which} failed: {last_error}")
+
+            if fallback_task is None and fallback is not None:
+                # Fire the fallback: either the primary failed, or it is slow
+                hedged = primary_task in pending
+                fallback_task = asyncio.ensure_future(fallback())
+                pending.add(fallback_task)
+    finally:
+        for task in (primary_task, fallback_task):
+            if task is None:
+                continue
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # Mark retrieved so losers don't log warnings
+
+    if pending:
+        finish(OUTCOME_TIMEOUT)
+        raise HedgeTimeout(f"No answer for {label} within {budget:.1f}s")
+
+    finish(OUTCOME_FAILED)
+    raise last_error
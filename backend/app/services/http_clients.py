@@ -0,0 +1,281 @@
+"""
+Shared pooled HTTP clients for weather, elevation and SMS providers.
+
+Every provider used to build its own httpx.AsyncClient (and the elevation
+service a new one per call), so each paid its own TCP+TLS handshakes and
+no connection was reused between providers talking to the same host.
+
+Design notes:
+- One connection pool (transport) per upstream service, created on first
+  use; each service is one host, so its connection limits are per-host
+- Clients are keyed on service, headers and timeout and share their
+  service's pool, so BOMService and OpenMeteoProvider each keep their own
+  User-Agent and a provider's timeout= is honoured
+- Keep-alive connections are reused across requests and providers
+- HTTP/2 when HTTP2_ENABLED and the optional h2 package is installed
+- All clients closed together in the FastAPI lifespan shutdown
+- Every request's latency is recorded in the metrics registry by
+  provider/endpoint/status (InstrumentedTransport)
+"""
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Dict, FrozenSet, Optional, Tuple
+
+import httpx
+
+from app.services.metrics import get_metrics
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Upstream service names
+BOM = "bom"
+OPEN_METEO = "open-meteo"
+NWS = "nws"
+ENVIRONMENT_CANADA = "environment-canada"
+MET_OFFICE = "met-office"
+OPEN_TOPO_DATA = "open-topo-data"
+TWILIO = "twilio"
+
+
+def _h2_available() -> bool:
+    """Check whether the optional h2 package (httpx HTTP/2 support) is installed."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+# Path segments followed by identifiers (BOM geohash, NWS coordinates,
+# NWS office and grid x,y), collapsed so endpoint labels stay low-cardinality
+_ID_SEGMENTS = {"locations": 1, "points": 1, "gridpoints": 2}
+
+
+def endpoint_label(url: httpx.URL) -> str:
+    """
+    Templated request path for metrics labels.
+
+    "/v1/locations/r22489/forecasts/hourly" -> "/v1/locations/*/forecasts/hourly",
+    "/gridpoints/HNX/33,35/forecast" -> "/gridpoints/*/*/forecast"
+    """
+    labels = []
+    collapse = 0
+    for segment in url.path.strip("/").split("/"):
+        if collapse:
+            labels.append("*")
+            collapse -= 1
+        else:
+            labels.append("*" if "," in segment else segment)
+            collapse = _ID_SEGMENTS.get(segment, 0)
+    return "/" + "/".join(labels)
+
+
+class _TimedStream(httpx.AsyncByteStream):
+    """Response body that records the request's latency once it's read and closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, record):
+        self._stream = stream
+        self._record = record
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._record is not None:
+                self._record()
+                self._record = None
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper recording each request's latency per endpoint and status.
+
+    Latency runs until the response body has been read, so large
+    Open-Meteo batches are measured in full. Requests that get no
+    response (connect errors, timeouts) are recorded as status "error".
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, provider: str):
+        self._transport = transport
+        self.provider = provider
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = endpoint_label(request.url)
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            get_metrics().observe_upstream(
+                self.provider, endpoint, "error", time.perf_counter() - started
+            )
+            raise
+
+        def record() -> None:
+            get_metrics().observe_upstream(
+                self.provider, endpoint, str(response.status_code), time.perf_counter() - started
+            )
+
+        if isinstance(response.stream, httpx.ByteStream):
+            record()  # Body already in memory
+        else:
+            response.stream = _TimedStream(response.stream, record)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+ClientKey = Tuple[str, FrozenSet[Tuple[str, str]], float]
+
+
+class _ServicePool:
+    """One service's pooled transport and the clients sharing it."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+        self.clients: Dict[ClientKey, httpx.AsyncClient] = {}
+
+
+class HTTPClientRegistry:
+    """
+    Process-wide registry of pooled httpx clients, one pool per upstream service.
+
+    Callers asking for different headers or timeout get their own client
+    on the same pool (with a warning, since it's usually unintended).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            max_connections: Connection limit per service (host)
+            max_keepalive: Idle keep-alive connections kept per service
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Negotiate HTTP/2 where the server supports it
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        if http2 and not _h2_available():
+            logger.warning("HTTP2_ENABLED but h2 is not installed - using HTTP/1.1")
+            self.http2 = False
+        self._pools: Dict[str, _ServicePool] = {}
+
+    def get(
+        self,
+        name: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+    ) -> httpx.AsyncClient:
+        """
+        Get the shared client for a service and settings, creating it on first use.
+
+        Args:
+            name: Upstream service name (e.g. OPEN_METEO)
+            headers: Default headers for the client
+            timeout: Default request timeout in seconds
+
+        Returns:
+            Pooled httpx.AsyncClient
+        """
+        key: ClientKey = (name, frozenset((headers or {}).items()), float(timeout))
+        pool = self._pools.get(name)
+        if pool is not None and any(client.is_closed for client in pool.clients.values()):
+            # Closing any client closes the shared transport: start the service over
+            pool = None
+        if pool is None:
+            transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+            pool = self._pools[name] = _ServicePool(InstrumentedTransport(transport, name))
+
+        client = pool.clients.get(key)
+        if client is None:
+            if pool.clients:
+                logger.warning(
+                    f"Pooled HTTP client for {name} requested with different headers/timeout "
+                    f"(timeout={timeout}); creating a separate client on the same pool"
+                )
+            client = httpx.AsyncClient(headers=headers, timeout=timeout, transport=pool.transport)
+            pool.clients[key] = client
+            logger.debug(f"Created pooled HTTP client for {name}")
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client (FastAPI shutdown)."""
+        clients = [client for pool in self._pools.values() for client in pool.clients.values()]
+        self._pools.clear()
+        results = await asyncio.gather(
+            *(client.aclose() for client in clients), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Error closing HTTP client: {result}")
+
+    def stats(self) -> dict:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dict with service names, limits and HTTP/2 flag
+        """
+        return {
+            "clients": sorted(self._pools),
+            "max_connections": self.limits.max_connections,
+            "max_keepalive": self.limits.max_keepalive_connections,
+            "http2": self.http2,
+        }
+
+
+# Singleton instance
+_registry: Optional[HTTPClientRegistry] = None
+
+
+def get_http_registry() -> HTTPClientRegistry:
+    """Get singleton HTTP client registry."""
+    global _registry
+    if _registry is None:
+        _registry = HTTPClientRegistry(
+            max_connections=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive=settings.HTTP_MAX_KEEPALIVE_PER_HOST,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            http2=settings.HTTP2_ENABLED,
+        )
+    return _registry
+
+
+def get_http_client(
+    name: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30.0,
+) -> httpx.AsyncClient:
+    """Get the shared pooled client for an upstream service."""
+    return get_http_registry().get(name, headers=headers, timeout=timeout)
+
+
+async def close_http_clients() -> None:
+    """Close all pooled clients and drop the registry (FastAPI shutdown)."""
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+    _registry = None
+
+
+def reset_http_clients() -> None:
+    """Drop the singleton registry without closing clients (for testing)."""
+    global _registry
+    _registry = None
@@ -0,0 +1,338 @@
+"""
+In-process metrics: upstream latency and cache hit rates.
+
+We couldn't tell which provider or cache layer was slow: the caches only
+counted entries and the providers only logged. This registry keeps cheap
+counters that every layer updates as it goes.
+
+Design notes:
+- Latency histograms per upstream provider/endpoint/status, recorded by
+  the pooled HTTP clients (see http_clients.InstrumentedTransport)
+- hit/miss/stale/coalesced counters per cache ("weather", "weather_legacy",
+  "cell_elevation", "point_elevation", "nws_grid")
+- Fixed buckets, so recording is O(1) and reading never scans cache entries
+- render_prometheus() backs the /metrics endpoint
+- persist_metrics_snapshot() writes what happened since the last snapshot
+  into the monitoring app_metrics table (scheduled every few minutes),
+  one row per provider/endpoint; the health check metrics table is left
+  to the checks
+"""
+import bisect
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Cache results
+HIT = "hit"
+MISS = "miss"
+STALE = "stale"
+COALESCED = "coalesced"
+
+CACHE_RESULTS = (HIT, MISS, STALE, COALESCED)
+
+# (provider, endpoint, status)
+UpstreamKey = Tuple[str, str, str]
+
+
+class Histogram:
+    """Cumulative bucketed latency distribution."""
+
+    __slots__ = ("bounds", "buckets", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one sample."""
+        self.buckets[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def copy(self) -> "Histogram":
+        other = Histogram(self.bounds)
+        other.buckets = list(self.buckets)
+        other.count = self.count
+        other.sum = self.sum
+        return other
+
+    def minus(self, earlier: Optional["Histogram"]) -> "Histogram":
+        """Samples recorded since `earlier` (a copy of this histogram)."""
+        delta = self.copy()
+        if earlier is not None:
+            delta.buckets = [now - then for now, then in zip(self.buckets, earlier.buckets)]
+            delta.count -= earlier.count
+            delta.sum -= earlier.sum
+        return delta
+
+    def plus(self, other: "Histogram") -> "Histogram":
+        """Both histograms' samples combined (same bounds)."""
+        total = self.copy()
+        total.buckets = [mine + theirs for mine, theirs in zip(self.buckets, other.buckets)]
+        total.count += other.count
+        total.sum += other.sum
+        return total
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Upper bound of the bucket holding the given percentile.
+
+        Returns None when empty; samples past the last bound report it.
+        """
+        if self.count == 0:
+            return None
+        rank = percentile * self.count
+        seen = 0
+        for bound, in_bucket in zip(self.bounds, self.buckets):
+            seen += in_bucket
+            if seen >= rank:
+                return bound
+        return self.bounds[-1]
+
+
+class MetricsRegistry:
+    """
+    Process-wide upstream latency histograms and cache counters.
+
+    Usage:
+        metrics = get_metrics()
+        metrics.observe_upstream("bom", "/v1/locations/*/forecasts/hourly", "200", 0.42)
+        metrics.count_cache("weather", HIT)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._upstream: Dict[UpstreamKey, Histogram] = {}
+        self._cache: Dict[str, Dict[str, int]] = {}
+        # State at the last persisted snapshot, for interval deltas
+        self._persisted_upstream: Dict[UpstreamKey, Histogram] = {}
+        self._persisted_cache: Dict[str, Dict[str, int]] = {}
+
+    def observe_upstream(self, provider: str, endpoint: str, status: str, seconds: float) -> None:
+        """
+        Record one upstream request.
+
+        Args:
+            provider: Upstream service (http_clients name, e.g. "bom")
+            endpoint: Templated path, e.g. "/v1/locations/*/forecasts/daily"
+            status: HTTP status code, or "error" if no response arrived
+            seconds: Time until the response body was read
+        """
+        key = (provider, endpoint, status)
+        with self._lock:
+            histogram = self._upstream.get(key)
+            if histogram is None:
+                histogram = self._upstream[key] = Histogram()
+            histogram.observe(seconds)
+
+    def count_cache(self, cache: str, result: str) -> None:
+        """Count one cache lookup outcome (HIT, MISS, STALE or COALESCED)."""
+        with self._lock:
+            counters = self._cache.get(cache)
+            if counters is None:
+                counters = self._cache[cache] = dict.fromkeys(CACHE_RESULTS, 0)
+            counters[result] += 1
+
+    def cache_counters(self, cache: str) -> Dict[str, int]:
+        """Counters for one cache (zeros if never used)."""
+        with self._lock:
+            return dict(self._cache.get(cache) or dict.fromkeys(CACHE_RESULTS, 0))
+
+    def snapshot(self) -> dict:
+        """
+        Everything recorded since startup.
+
+        Returns:
+            Dict with "upstream" (one entry per provider/endpoint/status
+            with count, mean and percentiles) and "caches" (counters and
+            hit rate per cache)
+        """
+        with self._lock:
+            upstream = {key: histogram.copy() for key, histogram in self._upstream.items()}
+            caches = {name: dict(counters) for name, counters in self._cache.items()}
+        return {
+            "upstream": [_upstream_summary(key, upstream[key]) for key in sorted(upstream)],
+            "caches": {name: _cache_summary(caches[name]) for name in sorted(caches)},
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition of every series."""
+        with self._lock:
+            upstream = {key: histogram.copy() for key, histogram in self._upstream.items()}
+            caches = {name: dict(counters) for name, counters in self._cache.items()}
+
+        lines = [
+            "# HELP thunderbird_upstream_request_seconds Upstream HTTP request latency",
+            "# TYPE thunderbird_upstream_request_seconds histogram",
+        ]
+        for (provider, endpoint, status) in sorted(upstream):
+            histogram = upstream[(provider, endpoint, status)]
+            labels = f'provider="{provider}",endpoint="{_escape(endpoint)}",status="{status}"'
+            cumulative = 0
+            for bound, in_bucket in zip(histogram.bounds + ("+Inf",), histogram.buckets):
+                cumulative += in_bucket
+                lines.append(f'thunderbird_upstream_request_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"thunderbird_upstream_request_seconds_sum{{{labels}}} {histogram.sum:.6f}")
+            lines.append(f"thunderbird_upstream_request_seconds_count{{{labels}}} {histogram.count}")
+
+        lines += [
+            "# HELP thunderbird_cache_requests_total Cache lookups by result",
+            "# TYPE thunderbird_cache_requests_total counter",
+        ]
+        for name in sorted(caches):
+            for result in CACHE_RESULTS:
+                lines.append(
+                    f'thunderbird_cache_requests_total{{cache="{name}",result="{result}"}} {caches[name][result]}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def interval_snapshot(self) -> dict:
+        """
+        What was recorded since the previous interval snapshot.
+
+        Marks the current state as persisted; series with nothing new
+        are left out.
+
+        Returns:
+            Like snapshot(), but with one upstream entry per
+            provider/endpoint: statuses are folded into "statuses"
+            (count per status) and "error_count" (5xx or "error")
+        """
+        with self._lock:
+            upstream: Dict[Tuple[str, str], Histogram] = {}
+            statuses: Dict[Tuple[str, str], Dict[str, int]] = {}
+            for key, histogram in self._upstream.items():
+                delta = histogram.minus(self._persisted_upstream.get(key))
+                if delta.count:
+                    provider, endpoint, status = key
+                    series = (provider, endpoint)
+                    upstream[series] = delta.plus(upstream[series]) if series in upstream else delta
+                    statuses.setdefault(series, {})[status] = delta.count
+                self._persisted_upstream[key] = histogram.copy()
+
+            caches = {}
+            for name, counters in self._cache.items():
+                before = self._persisted_cache.get(name, {})
+                delta = {result: counters[result] - before.get(result, 0) for result in CACHE_RESULTS}
+                if any(delta.values()):
+                    caches[name] = delta
+                self._persisted_cache[name] = dict(counters)
+
+        return {
+            "upstream": [
+                _interval_summary(series, upstream[series], statuses[series]) for series in sorted(upstream)
+            ],
+            "caches": {name: _cache_summary(caches[name]) for name in sorted(caches)},
+        }
+
+    def clear(self) -> None:
+        """Drop every series (for testing)."""
+        with self._lock:
+            self._upstream.clear()
+            self._cache.clear()
+            self._persisted_upstream.clear()
+            self._persisted_cache.clear()
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _upstream_summary(key: UpstreamKey, histogram: Histogram) -> dict:
+    provider, endpoint, status = key
+    return {"provider": provider, "endpoint": endpoint, "status": status, **_latency_summary(histogram)}
+
+
+def _interval_summary(series: Tuple[str, str], histogram: Histogram, statuses: Dict[str, int]) -> dict:
+    provider, endpoint = series
+    return {
+        "provider": provider,
+        "endpoint": endpoint,
+        "statuses": dict(sorted(statuses.items())),
+        "error_count": sum(count for status, count in statuses.items() if _is_error(status)),
+        **_latency_summary(histogram),
+    }
+
+
+def _latency_summary(histogram: Histogram) -> dict:
+    return {
+        "count": histogram.count,
+        "mean_ms": round(histogram.sum / histogram.count * 1000, 1) if histogram.count else None,
+        "p50_ms": _ms(histogram.percentile(0.5)),
+        "p95_ms": _ms(histogram.percentile(0.95)),
+        "p99_ms": _ms(histogram.percentile(0.99)),
+    }
+
+
+def _is_error(status: str) -> bool:
+    """5xx or no response at all."""
+    return status == "error" or status.startswith("5")
+
+
+def _cache_summary(counters: Dict[str, int]) -> dict:
+    lookups = counters[HIT] + counters[MISS]
+    return {**counters, "hit_rate": round(counters[HIT] / lookups, 3) if lookups else None}
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def persist_metrics_snapshot() -> int:
+    """
+    Store the interval since the last snapshot in the monitoring database.
+
+    One row per upstream provider/endpoint ("upstream:<provider>:<endpoint>",
+    status and error counts in the metadata) and per cache ("cache:<name>"),
+    written to app_metrics rather than the health check metrics table so
+    they never show up in check statuses, uptime or daily summaries.
+    Scheduled job; a no-op when the monitoring package isn't available.
+
+    Returns:
+        Number of rows written
+    """
+    try:
+        from monitoring.storage import init_db, store_app_metric
+    except ImportError:
+        logger.debug("Monitoring storage not available - metrics snapshot skipped")
+        return 0
+
+    snapshot = get_metrics().interval_snapshot()
+    rows: List[Tuple[str, dict]] = [
+        (f"upstream:{series['provider']}:{series['endpoint']}", series)
+        for series in snapshot["upstream"]
+    ]
+    rows += [(f"cache:{name}", counters) for name, counters in snapshot["caches"].items()]
+
+    if rows:
+        init_db()
+        for series, metadata in rows:
+            store_app_metric(series, metadata)
+        logger.info(f"Persisted metrics snapshot: {len(rows)} series")
+    return len(rows)
+
+
+# Singleton instance
+_metrics: Optional[MetricsRegistry] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get singleton metrics registry."""
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
+
+
+def reset_metrics() -> None:
+    """Reset the singleton registry (for testing)."""
+    global _metrics
+    _metrics = None
@@ -365,14 +365,13 @@ class RouteBuilderService:
         codes = set()
         # Query all waypoints and extract codes
         # This is done via direct database query for efficiency
-        import sqlite3
         from app.models.custom_route import DB_PATH
+        from app.models.sqlite_pool import get_connection_pool
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.execute("SELECT sms_code FROM custom_waypoints")
-            for row in cursor:
-                codes.add(row[0])
-            conn.close()
+            with get_connection_pool().connection(DB_PATH) as conn:
+                cursor = conn.execute("SELECT sms_code FROM custom_waypoints")
+                for row in cursor:
+                    codes.add(row[0])
         except Exception:
             pass  # Table might not exist yet
         return codes
@@ -393,17 +392,14 @@ class RouteBuilderService:
             CustomWaypoint if found and owned, None otherwise
         """
         # Get waypoint first
-        import sqlite3
         from app.models.custom_route import DB_PATH
+        from app.models.sqlite_pool import get_connection_pool
         try:
-            conn = sqlite3.connect(DB_PATH)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM custom_waypoints WHERE id = ?",
-                (waypoint_id,)
-            )
-            row = cursor.fetchone()
-            conn.close()
+            with get_connection_pool().connection(DB_PATH) as conn:
+                row = conn.execute(
+                    "SELECT * FROM custom_waypoints WHERE id = ?",
+                    (waypoint_id,)
+                ).fetchone()
             if not row:
                 return None
 
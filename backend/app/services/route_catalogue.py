@@ -0,0 +1,253 @@
+"""
+Hot-reloadable catalogue of the bundled route configurations.
+
+RouteLoader used to cache parsed routes forever (edits needed a restart),
+list_routes() globbed config/routes on every call, and /route-templates
+rebuilt its JSON by loading every route per request.
+
+Design notes:
+- Every route file is parsed once into an immutable snapshot; refresh()
+  polls file mtimes (startup + scheduled job) and re-parses only files
+  that changed, reusing the Route objects of the rest
+- A new snapshot is built off to the side and swapped in with a single
+  assignment, so readers always see one consistent version
+- Template listing and per-route detail JSON are serialized into the
+  snapshot with a content-hash ETag, so the endpoints just return bytes
+  (or 304 Not Modified)
+- A file that fails to parse (e.g. caught mid-write) keeps its previous
+  version and is retried on the next poll
+- Listeners are called with each new snapshot (the waypoint code index
+  rebuilds from it)
+"""
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from app.services.routes import Route, RouteLoader
+from config.settings import ROUTES_DIR
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CataloguePayload:
+    """Serialized JSON response body and its ETag."""
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_data(cls, data) -> "CataloguePayload":
+        body = json.dumps(data, separators=(",", ":")).encode()
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogueSnapshot:
+    """One consistent version of every bundled route and its payloads."""
+    version: int
+    routes: Mapping[str, Route]  # Route ID (file stem) -> Route
+    mtimes: Mapping[str, int]  # Route ID -> file mtime_ns
+    listing: CataloguePayload
+    details: Mapping[str, CataloguePayload]
+
+
+def route_summary(route: Route) -> dict:
+    """Template listing entry."""
+    return {
+        "route_id": route.route_id,
+        "name": route.name,
+        "short_name": route.short_name,
+        "region": route.region,
+        "distance_km": route.distance_km,
+        "typical_days": route.typical_days,
+        "grade": route.grade,
+        "is_loop": route.is_loop
+    }
+
+
+def route_detail(route: Route) -> dict:
+    """Template detail payload."""
+    return {
+        **route_summary(route),
+        "grade_description": route.grade_description,
+        "camps": [
+            {
+                "code": c.code,
+                "name": c.name,
+                "elevation": c.elevation,
+                "bom_cell": c.bom_cell
+            }
+            for c in route.camps
+        ],
+        "peaks": [
+            {
+                "code": p.code,
+                "name": p.name,
+                "elevation": p.elevation,
+                "type": p.type
+            }
+            for p in route.peaks
+        ],
+        "bom_cells": route.bom_cells
+    }
+
+
+_EMPTY = CatalogueSnapshot(
+    version=0,
+    routes=MappingProxyType({}),
+    mtimes=MappingProxyType({}),
+    listing=CataloguePayload.from_data({"routes": []}),
+    details=MappingProxyType({}),
+)
+
+
+class RouteCatalogue:
+    """
+    Bundled routes, reloaded when their files change.
+
+    Usage:
+        catalogue = get_route_catalogue()
+        route = catalogue.get("overland_track")
+        payload = catalogue.snapshot.listing  # bytes + ETag
+    """
+
+    def __init__(self, routes_dir: Path = ROUTES_DIR):
+        """
+        Args:
+            routes_dir: Directory of route JSON files (file stem = route ID)
+        """
+        self.routes_dir = routes_dir
+        self._snapshot: Optional[CatalogueSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._listeners: List[Callable[[CatalogueSnapshot], None]] = []
+
+    @property
+    def snapshot(self) -> CatalogueSnapshot:
+        """Current snapshot (loads every route on first use)."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.refresh()
+            snapshot = self._snapshot
+        return snapshot
+
+    def get(self, route_id: str) -> Optional[Route]:
+        """Route by ID, or None."""
+        return self.snapshot.routes.get(route_id)
+
+    def route_ids(self) -> List[str]:
+        """Every route ID, sorted."""
+        return list(self.snapshot.routes)
+
+    def add_listener(self, listener: Callable[[CatalogueSnapshot], None]) -> None:
+        """Call `listener` with every new snapshot from now on."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[CatalogueSnapshot], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def refresh(self) -> bool:
+        """
+        Re-read changed, added and removed route files and swap in a new snapshot.
+
+        Returns:
+            True if a new snapshot was swapped in
+        """
+        with self._refresh_lock:
+            current = self._snapshot or _EMPTY
+            files = self._scan()
+            if self._snapshot is not None and {
+                route_id: mtime for route_id, (_, mtime) in files.items()
+            } == current.mtimes:
+                return False
+
+            routes: Dict[str, Route] = {}
+            details: Dict[str, CataloguePayload] = {}
+            mtimes: Dict[str, int] = {}
+            for route_id, (path, mtime) in sorted(files.items()):
+                held = current.routes.get(route_id)
+                if held is not None and current.mtimes.get(route_id) == mtime:
+                    route = held
+                else:
+                    route = self._load(path)
+                    if route is None:
+                        if held is None:
+                            continue
+                        # Keep the previous version; the old mtime makes the next poll retry
+                        route, mtime = held, current.mtimes[route_id]
+                routes[route_id] = route
+                mtimes[route_id] = mtime
+                details[route_id] = (
+                    current.details[route_id] if route is held
+                    else CataloguePayload.from_data(route_detail(route))
+                )
+
+            if self._snapshot is not None and mtimes == current.mtimes and routes.keys() == current.routes.keys():
+                return False
+
+            snapshot = CatalogueSnapshot(
+                version=current.version + 1,
+                routes=MappingProxyType(routes),
+                mtimes=MappingProxyType(mtimes),
+                listing=CataloguePayload.from_data({"routes": [route_summary(r) for r in routes.values()]}),
+                details=MappingProxyType(details),
+            )
+            self._snapshot = snapshot
+
+        logger.info(f"Route catalogue v{snapshot.version}: {len(snapshot.routes)} routes")
+        for listener in list(self._listeners):
+            try:
+                listener(snapshot)
+            except Exception as e:
+                logger.warning(f"Route catalogue listener failed: {e}")
+        return True
+
+    def _scan(self) -> Dict[str, Tuple[Path, int]]:
+        """Route ID -> (path, mtime_ns) for every route file."""
+        found: Dict[str, Tuple[Path, int]] = {}
+        if self.routes_dir.exists():
+            for path in self.routes_dir.glob("*.json"):
+                try:
+                    found[path.stem] = (path, path.stat().st_mtime_ns)
+                except OSError:
+                    continue
+        return found
+
+    @staticmethod
+    def _load(path: Path) -> Optional[Route]:
+        """Parse a route file, or None if it's unreadable (the route is left out)."""
+        try:
+            with open(path) as f:
+                return RouteLoader._parse_route(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Error loading route {path.stem}: {e}")
+            return None
+
+
+# Singleton instance
+_catalogue: Optional[RouteCatalogue] = None
+
+
+def get_route_catalogue() -> RouteCatalogue:
+    """Get singleton route catalogue."""
+    global _catalogue
+    if _catalogue is None:
+        _catalogue = RouteCatalogue()
+    return _catalogue
+
+
+def refresh_route_catalogue() -> bool:
+    """Pick up edited, added or removed route files (startup and scheduled job)."""
+    return get_route_catalogue().refresh()
+
+
+def reset_route_catalogue() -> None:
+    """Reset the singleton catalogue (for testing)."""
+    global _catalogue
+    _catalogue = None
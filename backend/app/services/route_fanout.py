@@ -0,0 +1,108 @@
+"""
+Cell-deduplicated forecast fan-out for whole-route commands.
+
+CAST7 CAMPS / PEAKS used to fetch one forecast per waypoint in a serial
+loop - 10-20 sequential BOM + Open-Meteo round trips for Western Arthurs,
+close to the webhook timeout - even though many waypoints share a weather
+zone and get identical model data.
+
+Design notes:
+- Waypoints grouped by weather zone (Waypoint.bom_cell); one fetch per zone
+  at the zone's first waypoint
+- All zones go to one batch fetch (BOMService.get_forecasts: BOM requests
+  concurrent under ROUTE_FANOUT_CONCURRENCY, Open-Meteo supplements batched)
+- Per-waypoint forecasts derived from the zone forecast by adjusting
+  temperatures from the model elevation to the waypoint's elevation
+- A failed zone drops only its waypoints (logged); the rest still answer
+"""
+import logging
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.services.bom import CellForecast
+from app.services.formatter import adjust_temp_for_elevation
+from app.services.routes import Waypoint
+
+logger = logging.getLogger(__name__)
+
+# fetch_many(points) -> zone forecast per point (None where it failed)
+ZoneFetch = Callable[[List[Tuple[float, float]]], Awaitable[List[Optional[CellForecast]]]]
+
+
+def group_by_zone(waypoints: Sequence[Waypoint]) -> "OrderedDict[str, List[Waypoint]]":
+    """
+    Group waypoints by weather zone, keeping route order.
+
+    Args:
+        waypoints: Camps or peaks in route order
+
+    Returns:
+        OrderedDict of zone ID -> waypoints in that zone
+    """
+    zones: "OrderedDict[str, List[Waypoint]]" = OrderedDict()
+    for waypoint in waypoints:
+        zones.setdefault(waypoint.bom_cell, []).append(waypoint)
+    return zones
+
+
+def forecast_for_waypoint(forecast: CellForecast, waypoint: Waypoint) -> CellForecast:
+    """
+    Derive a waypoint's forecast from its zone forecast.
+
+    Temperatures are lapse-rate adjusted from the model elevation
+    (forecast.base_elevation) to the waypoint's elevation; everything
+    else is shared with the zone.
+
+    Args:
+        forecast: Zone forecast
+        waypoint: Waypoint in that zone
+
+    Returns:
+        CellForecast for the waypoint (new object; zone forecast untouched)
+    """
+    base = forecast.base_elevation
+    periods = [
+        replace(
+            p,
+            temp_min=adjust_temp_for_elevation(p.temp_min, base, waypoint.elevation),
+            temp_max=adjust_temp_for_elevation(p.temp_max, base, waypoint.elevation),
+        )
+        for p in forecast.periods
+    ]
+    return replace(forecast, lat=waypoint.lat, lon=waypoint.lon, periods=periods)
+
+
+async def fetch_route_forecasts(
+    waypoints: Sequence[Waypoint],
+    fetch_many: ZoneFetch
+) -> Dict[str, CellForecast]:
+    """
+    Fetch forecasts for many waypoints, one upstream fetch per zone.
+
+    Args:
+        waypoints: Camps or peaks in route order
+        fetch_many: Batch zone fetch, e.g.
+            lambda points: bom.get_forecasts(points, days=7, resolution="daily")
+
+    Returns:
+        Dict of waypoint code -> elevation-adjusted forecast, in route order.
+        Waypoints whose zone failed are omitted.
+    """
+    zones = group_by_zone(waypoints)
+    anchors = [(members[0].lat, members[0].lon) for members in zones.values()]
+    forecasts = await fetch_many(anchors)
+    logger.debug(f"Fetched {len(zones)} zones for {len(waypoints)} waypoints")
+
+    zone_forecasts = dict(zip(zones.keys(), forecasts))
+    for zone_id, forecast in zone_forecasts.items():
+        if forecast is None:
+            codes = ", ".join(w.code for w in zones[zone_id])
+            logger.warning(f"Could not fetch forecast for zone {zone_id} ({codes})")
+
+    results: Dict[str, CellForecast] = {}
+    for waypoint in waypoints:
+        forecast = zone_forecasts.get(waypoint.bom_cell)
+        if forecast is not None:
+            results[waypoint.code] = forecast_for_waypoint(forecast, waypoint)
+    return results
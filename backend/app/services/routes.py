@@ -3,12 +3,10 @@ Route Configuration Loader
 Based on THUNDERBIRD_SPEC_v2.4 Section 3
 """
 
-import json
-from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 
-from config.settings import ROUTES_DIR, BOMGridConfig
+from config.settings import BOMGridConfig
 
 
 @dataclass
@@ -118,11 +116,12 @@ class Route:
 
 class RouteLoader:
     """
-    Load and cache route configurations from JSON files.
+    Load route configurations from JSON files.
+
+    Routes are held by the route catalogue (route_catalogue.py), which
+    parses every file once and reloads files whose mtime changes.
     """
     
-    _cache: Dict[str, Route] = {}
-    
     @classmethod
     def load(cls, route_id: str) -> Optional[Route]:
         """
@@ -134,26 +133,8 @@ class RouteLoader:
         Returns:
             Route configuration or None if not found
         """
-        # Check cache first
-        if route_id in cls._cache:
-            return cls._cache[route_id]
-        
-        # Load from file
-        config_path = ROUTES_DIR / f"{route_id}.json"
-        if not config_path.exists():
-            return None
-        
-        try:
-            with open(config_path) as f:
-                data = json.load(f)
-            
-            route = cls._parse_route(data)
-            cls._cache[route_id] = route
-            return route
-            
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error loading route {route_id}: {e}")
-            return None
+        from app.services.route_catalogue import get_route_catalogue
+        return get_route_catalogue().get(route_id)
     
     @classmethod
     def _parse_route(cls, data: Dict[str, Any]) -> Route:
@@ -236,16 +217,14 @@ class RouteLoader:
     @classmethod
     def list_routes(cls) -> List[str]:
         """List available route IDs."""
-        routes = []
-        if ROUTES_DIR.exists():
-            for path in ROUTES_DIR.glob("*.json"):
-                routes.append(path.stem)
-        return routes
+        from app.services.route_catalogue import get_route_catalogue
+        return get_route_catalogue().route_ids()
     
     @classmethod
     def clear_cache(cls):
-        """Clear route cache."""
-        cls._cache.clear()
+        """Reload route files changed since they were loaded."""
+        from app.services.route_catalogue import get_route_catalogue
+        get_route_catalogue().refresh()
 
 
 def get_route(route_id: str) -> Optional[Route]:
@@ -10,9 +10,9 @@ from typing import Optional, List, Tuple
 from dataclasses import dataclass
 import logging
 
-from twilio.rest import Client
 from twilio.request_validator import RequestValidator
 
+from app.services.http_clients import get_http_client, TWILIO
 from config.settings import settings, TZ_HOBART, SMSCostConfig
 
 logger = logging.getLogger(__name__)
@@ -123,6 +123,10 @@ class SMSService:
     """
     SMS sending and receiving service.
     Handles Twilio integration, rate limiting, and batch sending.
+
+    Messages are sent through Twilio's REST API on the pooled async HTTP
+    client, so a send never blocks the event loop (the twilio library's
+    Client is synchronous).
     """
     
     def __init__(self):
@@ -131,10 +135,9 @@ class SMSService:
         self.from_number = settings.TWILIO_PHONE_NUMBER  # Default fallback
         self.from_number_au = getattr(settings, 'TWILIO_PHONE_NUMBER_AU', None)
         self.from_number_us = getattr(settings, 'TWILIO_PHONE_NUMBER_US', None)
-        self._client: Optional[Client] = None
         self._validator: Optional[RequestValidator] = None
 
-    def _get_from_number(self, to: str) -> str:
+    def get_from_number(self, to: str) -> str:
         """
         Select appropriate Twilio number based on destination country.
         Uses local numbers to minimize international SMS costs.
@@ -160,15 +163,6 @@ class SMSService:
         # Fallback to default
         return self.from_number
     
-    @property
-    def client(self) -> Client:
-        """Get or create Twilio client."""
-        if self._client is None:
-            if not self.account_sid or not self.auth_token:
-                raise SMSError("Twilio credentials not configured")
-            self._client = Client(self.account_sid, self.auth_token)
-        return self._client
-    
     @property
     def validator(self) -> RequestValidator:
         """Get or create request validator."""
@@ -234,9 +228,9 @@ class SMSService:
 
         try:
             # Select optimal number for destination country
-            from_number = self._get_from_number(normalized_to)
+            from_number = self.get_from_number(normalized_to)
 
-            message = self.client.messages.create(
+            sid = await self._create_message(
                 to=normalized_to,
                 from_=from_number,
                 body=body
@@ -255,7 +249,7 @@ class SMSService:
                 body=body,
                 segments=segments,
                 cost_cents=cost_cents,
-                sid=message.sid,
+                sid=sid,
                 sent_at=datetime.now(TZ_HOBART)
             )
 
@@ -273,6 +267,38 @@ class SMSService:
                 error=str(e)
             )
 
+    async def _create_message(self, to: str, from_: str, body: str) -> str:
+        """
+        Create a message via the Twilio REST API without blocking the event loop.
+
+        Returns:
+            Message SID
+
+        Raises:
+            SMSError: Credentials missing, or Twilio rejected the message
+            httpx.HTTPError: Network failure or timeout
+        """
+        if not self.account_sid or not self.auth_token:
+            raise SMSError("Twilio credentials not configured")
+
+        client = get_http_client(TWILIO, timeout=settings.TWILIO_TIMEOUT_SECONDS)
+        response = await client.post(
+            f"{settings.TWILIO_API_BASE_URL}/Accounts/{self.account_sid}/Messages.json",
+            data={"To": to, "From": from_, "Body": body},
+            auth=(self.account_sid, self.auth_token),
+        )
+
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {}
+        if response.status_code >= 400:
+            raise SMSError(
+                f"Twilio error {payload.get('code', response.status_code)}: "
+                f"{payload.get('message', response.reason_phrase)}"
+            )
+        return payload.get("sid")
+
     def _log_message(self, phone: str, message_type: str, command_type: str, content: str, segments: int, cost_aud: float, success: bool):
         """Log message to database for analytics."""
         try:
@@ -0,0 +1,86 @@
+"""
+Per-message identity map for inbound SMS handling.
+
+One CAST SMS used to look the sender's account up three times (beta gate,
+unit preference, low-balance warning) and their user row once or twice
+more, each lookup on a fresh SQLite connection.
+
+Design notes:
+- One SMSRequestContext per inbound message, created by the webhook and
+  passed through process_command to the forecast generators
+- user, account, active trail and balance are each loaded on first use
+  and remembered for the rest of the message (None results included), so
+  commands that never need the balance never query it
+- Read-only view: handlers that write (UNITS, BUY, position updates)
+  still go to the stores and re-read where the new value matters
+"""
+from typing import Optional
+
+_UNSET = object()
+
+
+class SMSRequestContext:
+    """
+    Sender's user, account, active trail and balance, loaded at most once.
+
+    Usage:
+        context = SMSRequestContext(phone)
+        if context.account and context.account.stripe_customer_id:
+            warning = get_low_balance_warning(context.account.id, context.balance_cents)
+    """
+
+    def __init__(self, phone: str):
+        """
+        Args:
+            phone: Sender phone number (normalized)
+        """
+        self.phone = phone
+        self._user = _UNSET
+        self._account = _UNSET
+        self._active_trail_id = _UNSET
+        self._balance_cents = _UNSET
+
+    @property
+    def user(self):
+        """SMS-registered User, or None."""
+        if self._user is _UNSET:
+            from app.models.database import user_store
+            self._user = user_store.get_user(self.phone)
+        return self._user
+
+    @property
+    def account(self):
+        """Web Account linked to this phone, or None."""
+        if self._account is _UNSET:
+            from app.models.account import account_store
+            self._account = account_store.get_by_phone(self.phone)
+        return self._account
+
+    @property
+    def active_trail_id(self) -> Optional[int]:
+        """Account's active trail ID, or None (no account or no active trail)."""
+        if self._active_trail_id is _UNSET:
+            self._active_trail_id = None
+            if self.account:
+                from app.models.account import account_store
+                self._active_trail_id = account_store.get_active_trail_id(self.account.id)
+        return self._active_trail_id
+
+    @property
+    def balance_cents(self) -> Optional[int]:
+        """Account balance in cents, or None without an account."""
+        if self._balance_cents is _UNSET:
+            self._balance_cents = None
+            if self.account:
+                from app.services.balance import get_balance_service
+                self._balance_cents = get_balance_service().get_balance(self.account.id)
+        return self._balance_cents
+
+    @property
+    def unit_system(self) -> str:
+        """Unit preference: User (SMS) first, then Account (web), else metric."""
+        if self.user and self.user.unit_system:
+            return self.user.unit_system
+        if self.account and self.account.unit_system:
+            return self.account.unit_system
+        return "metric"
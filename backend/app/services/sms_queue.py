@@ -0,0 +1,484 @@
+"""
+Durable outbound SMS queue with a pool of async send workers.
+
+SafeCheck notifications, the quick start guide, the 6AM/6PM pushes and
+the admin pushes used to send inline from request handlers and scheduled
+jobs (the guide with asyncio.sleep between messages), so throughput was
+bounded by our handlers and a restart lost whatever hadn't gone out yet.
+
+Design notes:
+- Callers enqueue() and return; rows live in a small SQLite table
+  (SMS_QUEUE_DB_PATH) until sent or given up on
+- A dispatcher claims ready rows and hands them to SMS_QUEUE_WORKERS
+  workers, which send through SMSService.send_message
+- Each sender number is paced to SMS_QUEUE_SENDER_RATE_PER_SECOND
+- Messages to one recipient go out in enqueue order, at least
+  SMS_INTER_MESSAGE_DELAY apart (what send_batch did ad hoc): only the
+  oldest unfinished row per recipient is eligible
+- Failed sends retry after SMS_RETRY_DELAY, doubling each time, up to
+  SMS_MAX_RETRIES retries; later messages to that recipient wait meanwhile
+- Results are written back in one transaction per dispatcher pass
+- Rows still "sending" at startup (crash mid-send) are sent again, so
+  delivery is at-least-once
+- Sent and failed rows are kept SMS_QUEUE_RETENTION_DAYS, then purged
+"""
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from app.services.sms import PhoneUtils, SMSService, get_sms_service
+from config.settings import resolve_backend_path, settings
+
+logger = logging.getLogger(__name__)
+
+# Row statuses
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+# Longest the dispatcher sleeps between passes; it wakes sooner for new
+# messages, finished sends and the next retry or spacing deadline
+_POLL_SECONDS = 5.0
+
+# Seconds between purges of old sent/failed rows
+_PURGE_INTERVAL_SECONDS = 3600.0
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedSMS:
+    """One outbound message claimed for sending."""
+    id: int
+    to: str
+    body: str
+    sender: str
+    command_type: Optional[str]
+    message_type: str
+    attempts: int
+
+
+class OutboxStore:
+    """
+    SQLite table of outbound messages.
+
+    One long-lived connection guarded by a lock; ":memory:" keeps the
+    queue in-process (tests).
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (creating if needed) the outbox database.
+
+        Args:
+            db_path: SQLite file path, or ":memory:"
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sms_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                to_phone TEXT NOT NULL,
+                body TEXT NOT NULL,
+                sender TEXT NOT NULL,
+                command_type TEXT,
+                message_type TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                sent_at REAL,
+                sid TEXT,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_sms_outbox_ready
+                ON sms_outbox (status, next_attempt_at);
+            CREATE INDEX IF NOT EXISTS idx_sms_outbox_recipient
+                ON sms_outbox (to_phone, status, id);
+        """)
+        self._conn.commit()
+
+    def add(self, rows: Sequence[Tuple[str, str, str, Optional[str], str]], not_before: float) -> List[int]:
+        """
+        Insert (to, body, sender, command_type, message_type) rows in order.
+
+        Returns:
+            Row IDs
+        """
+        now = time.time()
+        ids = []
+        with self._lock:
+            for to, body, sender, command_type, message_type in rows:
+                cursor = self._conn.execute(
+                    "INSERT INTO sms_outbox (to_phone, body, sender, command_type, message_type, "
+                    "next_attempt_at, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (to, body, sender, command_type, message_type, not_before, now)
+                )
+                ids.append(cursor.lastrowid)
+            self._conn.commit()
+        return ids
+
+    def claim(self, limit: int, now: float, skip: Set[str]) -> List[QueuedSMS]:
+        """
+        Mark up to `limit` ready rows as sending and return them.
+
+        Only the oldest unfinished row per recipient is ready, so each
+        recipient's messages go out in order. Recipients in `skip` are
+        passed over.
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT id, to_phone, body, sender, command_type, message_type, attempts
+                FROM sms_outbox AS o
+                WHERE status = 'pending' AND next_attempt_at <= ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM sms_outbox AS e
+                      WHERE e.to_phone = o.to_phone AND e.id < o.id
+                        AND e.status IN ('pending', 'sending')
+                  )
+                ORDER BY id
+                LIMIT ?
+            """, (now, limit + len(skip))).fetchall()
+            claimed = [QueuedSMS(*row) for row in rows if row[1] not in skip][:limit]
+            if claimed:
+                self._conn.executemany(
+                    "UPDATE sms_outbox SET status = 'sending' WHERE id = ?",
+                    [(item.id,) for item in claimed]
+                )
+                self._conn.commit()
+        return claimed
+
+    def finish(self, updates: Sequence[Tuple[str, int, float, Optional[str], Optional[str], Optional[float], int]]) -> None:
+        """Write (status, attempts, next_attempt_at, sid, error, sent_at, id) results in one transaction."""
+        if not updates:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE sms_outbox SET status = ?, attempts = ?, next_attempt_at = ?, "
+                "sid = ?, error = ?, sent_at = ? WHERE id = ?",
+                updates
+            )
+            self._conn.commit()
+
+    def next_due(self, after: float) -> Optional[float]:
+        """Earliest future next_attempt_at (delayed or retrying rows), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM sms_outbox "
+                "WHERE status = 'pending' AND next_attempt_at > ?",
+                (after,)
+            ).fetchone()
+        return row[0]
+
+    def recover(self) -> int:
+        """Return rows left "sending" by a previous process to the queue."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE sms_outbox SET status = 'pending' WHERE status = 'sending'"
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def purge(self, older_than: float) -> int:
+        """Delete sent and failed rows created before `older_than` (epoch seconds)."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM sms_outbox WHERE status IN ('sent', 'failed') AND created_at < ?",
+                (older_than,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def get(self, row_id: int) -> Optional[dict]:
+        """One row as a dict, or None."""
+        with self._lock:
+            cursor = self._conn.execute("SELECT * FROM sms_outbox WHERE id = ?", (row_id,))
+            row = cursor.fetchone()
+            columns = [c[0] for c in cursor.description]
+        return dict(zip(columns, row)) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """Row count per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM sms_outbox GROUP BY status"
+            ).fetchall()
+        return {status: 0 for status in (PENDING, SENDING, SENT, FAILED)} | dict(rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class _SenderPacer:
+    """Spaces sends from one number at least 1/rate seconds apart."""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class SMSQueue:
+    """
+    Persistent outbound SMS queue drained by async workers.
+
+    Usage:
+        queue = get_sms_queue()
+        queue.enqueue(phone, "SafeCheck: All OK", command_type="SAFECHECK")
+        queue.enqueue_batch(phone, guide_messages, message_type="quick_start")
+    """
+
+    def __init__(
+        self,
+        store: Optional[OutboxStore] = None,
+        sms_service: Optional[SMSService] = None,
+        workers: Optional[int] = None,
+        sender_rate: Optional[float] = None,
+        recipient_gap: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+    ):
+        """
+        Args:
+            store: Outbox table (default: SMS_QUEUE_DB_PATH)
+            sms_service: Sends each message (default: the app's service)
+            workers: Concurrent sends (default SMS_QUEUE_WORKERS)
+            sender_rate: Messages per second per sender number
+            recipient_gap: Minimum seconds between messages to one recipient
+            max_retries: Retries after the first failed attempt
+            retry_delay: Seconds before the first retry (doubles each time)
+        """
+        self.store = store or OutboxStore(resolve_backend_path(settings.SMS_QUEUE_DB_PATH))
+        self.sms_service = sms_service or get_sms_service()
+        self.workers = workers or settings.SMS_QUEUE_WORKERS
+        self.sender_rate = settings.SMS_QUEUE_SENDER_RATE_PER_SECOND if sender_rate is None else sender_rate
+        self.recipient_gap = settings.SMS_INTER_MESSAGE_DELAY if recipient_gap is None else recipient_gap
+        self.max_retries = settings.SMS_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_delay = settings.SMS_RETRY_DELAY if retry_delay is None else retry_delay
+
+        self._pacers: Dict[str, _SenderPacer] = {}
+        self._busy: Set[str] = set()  # Recipients with a message in a worker
+        self._spacing: Dict[str, float] = {}  # Recipient -> earliest next send (epoch)
+        self._completed: List[Tuple[QueuedSMS, Optional[str], Optional[str], float]] = []
+        self._ready: Optional[asyncio.Queue] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._purged_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        to: str,
+        body: str,
+        command_type: Optional[str] = None,
+        message_type: str = "response",
+        delay: float = 0.0,
+    ) -> int:
+        """
+        Queue one message.
+
+        Args:
+            to: Recipient phone number (normalized here)
+            body: Message content
+            command_type: Command that triggered this (for the message log)
+            message_type: Type of message (for the message log)
+            delay: Seconds before the message may be sent
+
+        Returns:
+            Outbox row ID
+
+        Raises:
+            ValueError: Invalid phone number
+        """
+        return self.enqueue_batch(to, [body], command_type, message_type, delay)[0]
+
+    def enqueue_batch(
+        self,
+        to: str,
+        bodies: Sequence[str],
+        command_type: Optional[str] = None,
+        message_type: str = "response",
+        delay: float = 0.0,
+    ) -> List[int]:
+        """
+        Queue messages to one recipient, delivered in this order.
+
+        Same arguments as enqueue(), with a list of bodies.
+        """
+        normalized = PhoneUtils.normalize(to)
+        sender = self.sms_service.get_from_number(normalized)
+        ids = self.store.add(
+            [(normalized, body, sender, command_type, message_type) for body in bodies],
+            not_before=time.time() + delay,
+        )
+        logger.info(f"Queued {len(ids)} SMS for {PhoneUtils.mask(normalized)}")
+        if self._wake is not None:
+            self._wake.set()
+        return ids
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start the dispatcher and workers (call from the running event loop)."""
+        if self.running:
+            return
+        recovered = self.store.recover()
+        if recovered:
+            logger.warning(f"Re-queued {recovered} SMS interrupted mid-send")
+
+        self._ready = asyncio.Queue()
+        self._wake = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._dispatch())] + [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+        logger.info(f"SMS queue started: {self.workers} workers")
+
+    async def stop(self) -> None:
+        """Stop the workers and write back finished sends (FastAPI shutdown)."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._flush()
+        self._ready = None
+        self._wake = None
+        self._busy.clear()
+
+    # ------------------------------------------------------------------
+    # Dispatcher and workers
+    # ------------------------------------------------------------------
+
+    async def _dispatch(self) -> None:
+        """Write back results, claim ready rows for idle workers, repeat."""
+        while True:
+            timeout = _POLL_SECONDS
+            try:
+                self._flush()
+                self._purge_old()
+                now = time.time()
+                self._spacing = {to: at for to, at in self._spacing.items() if at > now}
+                free = self.workers - len(self._busy)
+                for item in self.store.claim(free, now, skip=self._busy | self._spacing.keys()):
+                    self._busy.add(item.to)
+                    self._ready.put_nowait(item)
+
+                # Rows that are ready but waiting on a busy worker or an
+                # earlier message get a wake-up when that finishes instead
+                deadlines = list(self._spacing.values())
+                due = self.store.next_due(after=now)
+                if due is not None:
+                    deadlines.append(due)
+                if deadlines:
+                    timeout = min(timeout, max(min(deadlines) - time.time(), 0.01))
+            except sqlite3.Error as e:
+                logger.error(f"SMS queue dispatch failed: {e}")
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _work(self) -> None:
+        """Send claimed messages, paced per sender number."""
+        while True:
+            item = await self._ready.get()
+            sid = error = None
+            try:
+                await self._pacer(item.sender).wait()
+                result = await self.sms_service.send_message(
+                    item.to, item.body,
+                    command_type=item.command_type,
+                    message_type=item.message_type
+                )
+                sid, error = result.sid, result.error
+            except asyncio.CancelledError:
+                raise  # Row stays "sending"; recovered on next start
+            except Exception as e:
+                error = str(e)
+
+            finished = time.time()
+            self._completed.append((item, sid, error, finished))
+            self._spacing[item.to] = finished + self.recipient_gap
+            self._busy.discard(item.to)
+            self._wake.set()
+
+    def _purge_old(self) -> None:
+        """Drop sent/failed rows past retention, at most hourly."""
+        if self._purged_at and time.monotonic() - self._purged_at < _PURGE_INTERVAL_SECONDS:
+            return
+        self._purged_at = time.monotonic()
+        purged = self.store.purge(time.time() - settings.SMS_QUEUE_RETENTION_DAYS * 86400)
+        if purged:
+            logger.info(f"Purged {purged} old SMS outbox rows")
+
+    def _pacer(self, sender: str) -> _SenderPacer:
+        pacer = self._pacers.get(sender)
+        if pacer is None:
+            pacer = self._pacers[sender] = _SenderPacer(self.sender_rate)
+        return pacer
+
+    def _flush(self) -> None:
+        """Write finished sends back to the outbox in one transaction."""
+        completed, self._completed = self._completed, []
+        updates = []
+        for item, sid, error, finished in completed:
+            attempts = item.attempts + 1
+            if error is None:
+                updates.append((SENT, attempts, finished, sid, None, finished, item.id))
+            elif attempts > self.max_retries:
+                logger.error(f"SMS to {PhoneUtils.mask(item.to)} failed after {attempts} attempts: {error}")
+                updates.append((FAILED, attempts, finished, None, error, None, item.id))
+            else:
+                retry_at = finished + self.retry_delay * 2 ** (attempts - 1)
+                updates.append((PENDING, attempts, retry_at, None, error, None, item.id))
+        try:
+            self.store.finish(updates)
+        except sqlite3.Error:
+            self._completed[:0] = completed  # Retry on the next pass
+            raise
+
+    def stats(self) -> dict:
+        """Outbox counts per status plus in-flight sends."""
+        return {**self.store.counts(), "in_flight": len(self._busy), "workers": self.workers}
+
+
+# Singleton instance
+_sms_queue: Optional[SMSQueue] = None
+
+
+def get_sms_queue() -> SMSQueue:
+    """Get singleton SMS queue."""
+    global _sms_queue
+    if _sms_queue is None:
+        _sms_queue = SMSQueue()
+    return _sms_queue
+
+
+def reset_sms_queue() -> None:
+    """Reset the singleton queue (for testing)."""
+    global _sms_queue
+    _sms_queue = None
@@ -0,0 +1,312 @@
+"""
+Persistent, size-bounded cache for terrain lookups.
+
+Terrain doesn't change, but the cell elevation grid, point elevations and
+NWS grid metadata used to live in unbounded dicts that were lost on every
+deploy, so the first requests afterwards paid the full lookup cost again.
+
+Design notes:
+- In-memory LRU (OrderedDict) bounded by TERRAIN_CACHE_MAX_ENTRIES per namespace
+- Every write also goes to a small SQLite file (TERRAIN_CACHE_DB_PATH)
+- Memory misses fall through to SQLite before the caller hits the network
+- warm_terrain_caches() preloads the most recent rows at startup
+- Values must be JSON-compatible (callers store dataclasses via asdict)
+- hit/miss/eviction counters per namespace (stats()), hits and misses
+  also counted in the metrics registry under the namespace name
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.services.metrics import HIT, MISS, get_metrics
+from config.settings import resolve_backend_path, settings
+
+logger = logging.getLogger(__name__)
+
+# Namespaces
+CELL_ELEVATION = "cell_elevation"
+POINT_ELEVATION = "point_elevation"
+NWS_GRID = "nws_grid"
+
+TERRAIN_NAMESPACES = (CELL_ELEVATION, POINT_ELEVATION, NWS_GRID)
+
+
+class TerrainStore:
+    """
+    SQLite key/value table shared by all terrain cache namespaces.
+
+    One long-lived connection guarded by a lock; ":memory:" keeps the
+    store in-process (tests, or persistence disabled).
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (creating if needed) the terrain cache database.
+
+        Args:
+            db_path: SQLite file path, or ":memory:"
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS terrain_cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """Get a stored JSON value, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM terrain_cache WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, namespace: str, key: str, value: str) -> None:
+        """Insert or replace a JSON value."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO terrain_cache (namespace, key, value, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, value, time.time())
+            )
+            self._conn.commit()
+
+    def recent(self, namespace: str, limit: int) -> list:
+        """Most recently written (key, value) rows, newest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT key, value FROM terrain_cache WHERE namespace = ? "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (namespace, limit)
+            ).fetchall()
+
+    def delete_namespace(self, namespace: str) -> None:
+        """Remove every row in a namespace."""
+        with self._lock:
+            self._conn.execute("DELETE FROM terrain_cache WHERE namespace = ?", (namespace,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class TerrainCache:
+    """
+    Size-bounded LRU in front of the persistent terrain store.
+
+    Usage:
+        cache = get_terrain_cache(POINT_ELEVATION)
+        elevation = cache.get(key)
+        if elevation is None:
+            elevation = await fetch()
+            cache.set(key, elevation)
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        store: Optional[TerrainStore],
+        max_entries: int = 5000,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            namespace: Key namespace within the shared store
+            store: Persistent store, or None for memory only
+            max_entries: In-memory LRU bound
+        """
+        self.namespace = namespace
+        self.store = store
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Insert into the in-memory LRU, evicting the least recently used."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value from memory, then disk.
+
+        Returns:
+            Cached value, or None on miss
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            get_metrics().count_cache(self.namespace, HIT)
+            return self._entries[key]
+
+        if self.store is not None:
+            raw = self.store.get(self.namespace, key)
+            if raw is not None:
+                try:
+                    value = json.loads(raw)
+                except ValueError as e:
+                    logger.warning(f"Discarding bad {self.namespace} entry {key}: {e}")
+                else:
+                    self._remember(key, value)
+                    self.disk_hits += 1
+                    get_metrics().count_cache(self.namespace, HIT)
+                    return value
+
+        self.misses += 1
+        get_metrics().count_cache(self.namespace, MISS)
+        return None
+
+    def peek(self, key: str) -> Optional[Any]:
+        """
+        Look up a value without touching LRU order or hit/miss counters.
+
+        Returns:
+            Cached value, or None if neither memory nor disk has it
+        """
+        if key in self._entries:
+            return self._entries[key]
+        if self.store is not None:
+            raw = self.store.get(self.namespace, key)
+            if raw is not None:
+                try:
+                    return json.loads(raw)
+                except ValueError:
+                    return None
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value in memory and persist it."""
+        self._remember(key, value)
+        if self.store is not None:
+            try:
+                self.store.put(self.namespace, key, json.dumps(value))
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning(f"Failed to persist {self.namespace} entry {key}: {e}")
+
+    def warm(self) -> int:
+        """
+        Preload the most recently written entries from disk.
+
+        Returns:
+            Number of entries loaded
+        """
+        if self.store is None:
+            return 0
+
+        loaded = 0
+        # Oldest first so the newest end up most recently used
+        for key, raw in reversed(self.store.recent(self.namespace, self.max_entries)):
+            try:
+                self._remember(key, json.loads(raw))
+                loaded += 1
+            except ValueError as e:
+                logger.warning(f"Skipping bad {self.namespace} entry {key}: {e}")
+        return loaded
+
+    def clear(self, persistent: bool = False) -> None:
+        """
+        Clear the in-memory LRU (and optionally the disk rows).
+
+        Args:
+            persistent: Also delete this namespace from the store
+        """
+        self._entries.clear()
+        if persistent and self.store is not None:
+            self.store.delete_namespace(self.namespace)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with size, max_entries, hits, disk_hits, misses, evictions
+        """
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Singleton store and per-namespace caches
+_store: Optional[TerrainStore] = None
+_caches: Dict[str, TerrainCache] = {}
+
+
+def _get_store() -> Optional[TerrainStore]:
+    """Open the shared terrain store, or None if persistence is disabled/unavailable."""
+    global _store
+    if _store is None and settings.TERRAIN_CACHE_DB_PATH:
+        try:
+            _store = TerrainStore(resolve_backend_path(settings.TERRAIN_CACHE_DB_PATH))
+        except sqlite3.Error as e:
+            logger.warning(f"Terrain cache store unavailable, using memory only: {e}")
+            return None
+    return _store
+
+
+def get_terrain_cache(namespace: str) -> TerrainCache:
+    """Get the singleton cache for a namespace."""
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = TerrainCache(
+            namespace,
+            _get_store(),
+            max_entries=settings.TERRAIN_CACHE_MAX_ENTRIES,
+        )
+        _caches[namespace] = cache
+    return cache
+
+
+def warm_terrain_caches() -> Dict[str, int]:
+    """
+    Warm-load every terrain namespace from disk (FastAPI startup).
+
+    Returns:
+        Dict of namespace -> entries loaded
+    """
+    loaded = {namespace: get_terrain_cache(namespace).warm() for namespace in TERRAIN_NAMESPACES}
+    logger.info(f"Warm-loaded terrain caches: {loaded}")
+    return loaded
+
+
+def terrain_cache_stats() -> Dict[str, dict]:
+    """Get stats for every registered namespace."""
+    return {namespace: cache.stats() for namespace, cache in _caches.items()}
+
+
+def reset_terrain_caches() -> None:
+    """Close the store and drop all caches (for testing)."""
+    global _store
+    _caches.clear()
+    if _store is not None:
+        _store.close()
+    _store = None
@@ -0,0 +1,210 @@
+"""
+In-memory index from SMS waypoint code to waypoint and route.
+
+CAST / CAST7 used to resolve a code by globbing config/routes/*.json and
+scanning every route's camp and peak lists, and custom waypoints needed
+their own database query - all on every inbound SMS.
+
+Design notes:
+- One dict lookup per code: bundled route waypoints first (camps before
+  peaks, routes in route_id order - first wins for codes shared between
+  routes), then custom waypoints
+- Bundled route entries are rebuilt when the route catalogue swaps in a
+  new snapshot (see route_catalogue.py), only for routes that changed;
+  nothing touches the filesystem per SMS
+- Custom waypoints are loaded with one query, then kept current by the
+  store's change callbacks, which name just the SMS codes that changed
+- Library routes get SMS codes when cloned, so they are covered as the
+  custom waypoints they become
+"""
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.models.custom_route import (
+    CustomWaypoint,
+    CustomWaypointStore,
+    WaypointType,
+    add_waypoint_listener,
+    custom_waypoint_store,
+    remove_waypoint_listener,
+)
+from app.services.route_catalogue import CatalogueSnapshot, RouteCatalogue, get_route_catalogue
+from app.services.routes import Route
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedWaypoint:
+    """Where an SMS code points: coordinates plus the route it belongs to."""
+    code: str
+    name: str
+    lat: float
+    lon: float
+    elevation: int
+    is_peak: bool
+    route_id: str  # Bundled route ID, or "custom:<id>"
+    route: Optional[Route] = None  # Bundled routes only (for peak groups)
+
+
+def _route_entries(route: Route) -> Dict[str, IndexedWaypoint]:
+    """Index entries for a bundled route (camps win over peaks with the same code)."""
+    entries: Dict[str, IndexedWaypoint] = {}
+    for waypoints, is_peak in ((route.camps, False), (route.peaks, True)):
+        for waypoint in waypoints:
+            entries.setdefault(waypoint.code.upper(), IndexedWaypoint(
+                code=waypoint.code.upper(),
+                name=waypoint.name,
+                lat=waypoint.lat,
+                lon=waypoint.lon,
+                elevation=waypoint.elevation,
+                is_peak=is_peak,
+                route_id=route.route_id,
+                route=route,
+            ))
+    return entries
+
+
+def _custom_entry(waypoint: CustomWaypoint) -> IndexedWaypoint:
+    return IndexedWaypoint(
+        code=waypoint.sms_code.upper(),
+        name=waypoint.name,
+        lat=waypoint.lat,
+        lon=waypoint.lng,
+        elevation=int(round(waypoint.elevation or 0)),
+        is_peak=waypoint.type == WaypointType.PEAK,
+        route_id=f"custom:{waypoint.route_id}",
+    )
+
+
+class WaypointIndex:
+    """
+    Code -> waypoint index over bundled routes and custom waypoints.
+
+    Usage:
+        entry = get_waypoint_index().lookup("LAKEO")
+        if entry:
+            forecast = await bom.get_hourly_forecast(entry.lat, entry.lon)
+    """
+
+    def __init__(
+        self,
+        catalogue: Optional[RouteCatalogue] = None,
+        waypoint_store: Optional[CustomWaypointStore] = None
+    ):
+        """
+        Args:
+            catalogue: Bundled routes (default: the app's route catalogue)
+            waypoint_store: Custom waypoint store (default: the app's store)
+        """
+        self.catalogue = catalogue or get_route_catalogue()
+        self.waypoint_store = waypoint_store or custom_waypoint_store
+
+        # route_id -> (Route it was built from, that route's entries)
+        self._routes: Dict[str, Tuple[Route, Dict[str, IndexedWaypoint]]] = {}
+        self._bundled: Dict[str, IndexedWaypoint] = {}
+        self._custom: Dict[str, IndexedWaypoint] = {}
+        self._built = False
+        self._custom_loaded = False
+        self.rebuilds = 0
+
+        self.catalogue.add_listener(self._on_catalogue)
+        add_waypoint_listener(self._on_waypoints_changed)
+
+    def lookup(self, code: str) -> Optional[IndexedWaypoint]:
+        """
+        Resolve an SMS code (case-insensitive).
+
+        Builds the index on first use; afterwards no I/O.
+        """
+        if not self._built:
+            self.build()
+        code = code.upper()
+        return self._bundled.get(code) or self._custom.get(code)
+
+    def build(self) -> None:
+        """Index the current catalogue and load custom waypoints (startup)."""
+        self._built = True
+        self._on_catalogue(self.catalogue.snapshot)
+
+    def _on_catalogue(self, snapshot: CatalogueSnapshot) -> None:
+        """
+        Catalogue callback: re-index the routes whose Route object changed.
+
+        Also retries the custom waypoint load if it failed before.
+        """
+        if not self._custom_loaded:
+            self._load_custom()
+
+        routes = {}
+        for route_id, route in snapshot.routes.items():
+            held = self._routes.get(route_id)
+            routes[route_id] = held if held is not None and held[0] is route else (route, _route_entries(route))
+
+        # Merge in route_id order so shared codes resolve the same way every time
+        bundled: Dict[str, IndexedWaypoint] = {}
+        for route_id in sorted(routes):
+            for code, entry in routes[route_id][1].items():
+                bundled.setdefault(code, entry)
+
+        self._routes = routes
+        self._bundled = bundled
+        self.rebuilds += 1
+        logger.info(f"Waypoint index: {len(bundled)} route codes from {len(routes)} routes")
+
+    def _load_custom(self) -> None:
+        """Load every custom waypoint in one query."""
+        try:
+            waypoints = self.waypoint_store.list_all()
+        except sqlite3.Error as e:
+            logger.warning(f"Custom waypoints unavailable for the waypoint index: {e}")
+            return
+        self._custom = {entry.code: entry for entry in map(_custom_entry, waypoints)}
+        self._custom_loaded = True
+
+    def _on_waypoints_changed(self, db_path: str, codes: List[str]) -> None:
+        """Store callback: re-read just the changed codes."""
+        if not self._custom_loaded or db_path != self.waypoint_store.db_path:
+            return
+        for code in codes:
+            waypoint = self.waypoint_store.get_by_sms_code(code)
+            if waypoint is None:
+                self._custom.pop(code.upper(), None)
+            else:
+                self._custom[code.upper()] = _custom_entry(waypoint)
+
+    def close(self) -> None:
+        """Stop listening for catalogue and waypoint changes."""
+        self.catalogue.remove_listener(self._on_catalogue)
+        remove_waypoint_listener(self._on_waypoints_changed)
+
+    def stats(self) -> dict:
+        """Indexed code and route counts."""
+        return {
+            "routes": len(self._routes),
+            "route_codes": len(self._bundled),
+            "custom_codes": len(self._custom),
+            "rebuilds": self.rebuilds,
+        }
+
+
+# Singleton instance
+_waypoint_index: Optional[WaypointIndex] = None
+
+
+def get_waypoint_index() -> WaypointIndex:
+    """Get singleton waypoint index."""
+    global _waypoint_index
+    if _waypoint_index is None:
+        _waypoint_index = WaypointIndex()
+    return _waypoint_index
+
+
+def reset_waypoint_index() -> None:
+    """Reset the singleton index (for testing)."""
+    global _waypoint_index
+    if _waypoint_index is not None:
+        _waypoint_index.close()
+    _waypoint_index = None
@@ -6,14 +6,18 @@ Phase 6: International Weather
 - WTHR-10: Response normalization
 
 Provides the foundation that all country-specific providers build upon.
+
+Forecast types are slotted dataclasses (no per-instance __dict__): the
+weather caches hold thousands of periods, so per-object overhead adds up.
+Measure with scripts/bench_forecast_memory.py.
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherAlert:
     """
     Weather alert/warning from a provider.
@@ -27,7 +31,7 @@ class WeatherAlert:
     expires: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedForecast:
     """
     Normalized forecast period across all providers.
@@ -80,11 +84,12 @@ class NormalizedForecast:
     # Summary
     description: str = ""
 
-    # Alerts (usually empty for period forecasts)
-    alerts: List[WeatherAlert] = field(default_factory=list)
+    # Alerts (usually empty for period forecasts; the shared empty tuple
+    # saves a list per cached period)
+    alerts: Sequence[WeatherAlert] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class RecentPrecipitation:
     """
     Recent precipitation totals for trail condition assessment.
@@ -102,7 +107,7 @@ class RecentPrecipitation:
     snow_72h: float = 0.0  # cm in last 72 hours
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedDailyForecast:
     """
     Multi-day forecast with normalized periods.
@@ -1,10 +1,10 @@
 """
-Weather caching layer with 1-hour TTL.
+Weather caching layer with model-run-aware expiry and stale serving.
 
 Phase 6: International Weather
 
 Provides in-memory caching for weather forecasts to reduce API calls
-and improve response times. Cache keys include provider, coordinates,
+and improve response times. Cache keys include provider, location
 and requested days to ensure correct data is returned.
 
 Design notes:
@@ -12,45 +12,79 @@ Design notes:
 - Per-process cache (fine for single server MVP)
 - Restarts clear cache (acceptable for weather data)
 - Memory bounded by active locations
+- Locations snap to the provider's native model cell (see grid.py), so
+  nearby waypoints in one cell share an entry
+- Entries expire when the model's next run is published (see schedule.py),
+  or after the fixed TTL for providers without a known schedule
+- Expired entries are kept for max_stale_seconds so the router can serve
+  them while revalidating or during a provider outage (get_stale)
+- Hits, misses and stale serves are counted as they happen (stats() and
+  the "weather" series in the metrics registry)
 - Could be replaced with Redis for horizontal scaling
 """
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, Tuple
 
+from app.services.metrics import HIT, MISS, STALE, get_metrics
 from app.services.weather.base import NormalizedDailyForecast
+from app.services.weather.grid import location_key
+from app.services.weather.schedule import get_model_schedule
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 # Default cache TTL: 1 hour
 DEFAULT_TTL_SECONDS = 3600
 
+# Default window expired entries are kept for stale serving: 6 hours
+DEFAULT_MAX_STALE_SECONDS = 21600
+
 
 class WeatherCache:
     """
-    In-memory cache for weather forecasts with 1-hour TTL.
+    In-memory cache for weather forecasts with model-run-aware expiry.
 
     Thread-safe for single-threaded async operations.
     Uses UTC timestamps for consistent expiry across timezones.
     """
 
-    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_stale_seconds: int = DEFAULT_MAX_STALE_SECONDS
+    ):
         """
         Initialize cache.
 
         Args:
-            ttl_seconds: Time-to-live for cache entries (default 3600 = 1 hour)
+            ttl_seconds: Time-to-live for providers without a run schedule
+                (default 3600 = 1 hour)
+            max_stale_seconds: How long past expiry an entry is kept for
+                stale serving (default 21600 = 6 hours)
         """
         self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
         self._cache: Dict[str, Tuple[NormalizedDailyForecast, datetime]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
 
-    def _make_key(self, provider: str, lat: float, lon: float, days: int) -> str:
+    def key_for(self, provider: str, lat: float, lon: float, days: int) -> str:
         """
-        Generate cache key from parameters.
+        Cache key for a request (also used to coalesce in-flight fetches).
 
-        Uses 4 decimal places for coordinates (~11m precision).
+        Uses the provider's model cell ID where its grid is known,
+        otherwise 4 decimal places for coordinates (~11m precision).
         """
-        return f"{provider}:{lat:.4f},{lon:.4f}:{days}"
+        return f"{provider}:{location_key(provider, lat, lon)}:{days}"
+
+    def _expires_at(self, provider: str, now: datetime) -> datetime:
+        """Expiry for a new entry: next model run if scheduled, else TTL."""
+        schedule = get_model_schedule(provider)
+        if schedule is not None:
+            return schedule.next_run_available(now)
+        return now + timedelta(seconds=self.ttl_seconds)
 
     def get(
         self,
@@ -71,22 +105,26 @@ class WeatherCache:
         Returns:
             NormalizedDailyForecast if cached and valid, None otherwise
         """
-        key = self._make_key(provider, lat, lon, days)
+        key = self.key_for(provider, lat, lon, days)
         entry = self._cache.get(key)
 
         if entry is None:
             logger.debug(f"Cache miss for {key}")
+            self._count(MISS)
             return None
 
         forecast, expires_at = entry
         now = datetime.now(timezone.utc)
 
         if now >= expires_at:
-            # Expired - remove from cache
+            # Expired - keep for stale serving until past max_stale_seconds
             logger.debug(f"Cache expired for {key}")
-            del self._cache[key]
+            if now >= expires_at + timedelta(seconds=self.max_stale_seconds):
+                del self._cache[key]
+            self._count(MISS)
             return None
 
+        self._count(HIT)
         logger.debug(f"Cache hit for {key}, expires in {(expires_at - now).seconds}s")
         return forecast
 
@@ -108,15 +146,60 @@ class WeatherCache:
             days: Number of forecast days
             forecast: Forecast data to cache
         """
-        key = self._make_key(provider, lat, lon, days)
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+        key = self.key_for(provider, lat, lon, days)
+        expires_at = self._expires_at(provider, datetime.now(timezone.utc))
 
         self._cache[key] = (forecast, expires_at)
         logger.debug(f"Cached {key}, expires at {expires_at}")
 
+    def get_stale(
+        self,
+        provider: str,
+        lat: float,
+        lon: float,
+        days: int,
+        max_stale_seconds: Optional[int] = None
+    ) -> Optional[NormalizedDailyForecast]:
+        """
+        Get a cached forecast even if expired, within a staleness window.
+
+        Args:
+            provider: Provider name
+            lat: Latitude
+            lon: Longitude
+            days: Number of forecast days requested
+            max_stale_seconds: How far past expiry is acceptable
+                (default: the cache's max_stale_seconds)
+
+        Returns:
+            NormalizedDailyForecast if cached and not too stale, None otherwise
+        """
+        if max_stale_seconds is None:
+            max_stale_seconds = self.max_stale_seconds
+
+        entry = self._cache.get(self.key_for(provider, lat, lon, days))
+        if entry is None:
+            return None
+
+        forecast, expires_at = entry
+        if datetime.now(timezone.utc) >= expires_at + timedelta(seconds=max_stale_seconds):
+            return None
+        self._count(STALE)
+        return forecast
+
+    def _count(self, result: str) -> None:
+        """Count a lookup outcome here and in the metrics registry."""
+        if result == HIT:
+            self.hits += 1
+        elif result == MISS:
+            self.misses += 1
+        else:
+            self.stale_hits += 1
+        get_metrics().count_cache("weather", result)
+
     def invalidate(self, provider: str, lat: float, lon: float) -> int:
         """
-        Remove all cached entries for a location.
+        Remove all cached entries for a location (its whole model cell).
 
         Useful when data needs to be refreshed (e.g., after error).
 
@@ -129,7 +212,7 @@ class WeatherCache:
             Number of entries removed
         """
         # Build prefix to match any days value
-        prefix = f"{provider}:{lat:.4f},{lon:.4f}:"
+        prefix = f"{provider}:{location_key(provider, lat, lon)}:"
 
         keys_to_remove = [
             key for key in self._cache.keys()
@@ -158,17 +241,17 @@ class WeatherCache:
 
     def cleanup_expired(self) -> int:
         """
-        Remove all expired entries from cache.
+        Remove entries too stale to serve (past max_stale_seconds).
 
         Called periodically to prevent memory buildup.
 
         Returns:
             Number of entries removed
         """
-        now = datetime.now(timezone.utc)
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.max_stale_seconds)
         expired_keys = [
             key for key, (_, expires_at) in self._cache.items()
-            if now >= expires_at
+            if cutoff >= expires_at
         ]
 
         for key in expired_keys:
@@ -189,7 +272,11 @@ class WeatherCache:
         Get cache statistics.
 
         Returns:
-            Dict with size, valid_count, expired_count
+            Dict with size, valid, expired (still servable as stale), TTL
+            settings and hit/miss/stale counters
+
+        Note: valid/expired scan every entry; the counters (and the
+        metrics registry) don't.
         """
         now = datetime.now(timezone.utc)
         valid = 0
@@ -206,6 +293,10 @@ class WeatherCache:
             "valid": valid,
             "expired": expired,
             "ttl_seconds": self.ttl_seconds,
+            "max_stale_seconds": self.max_stale_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
         }
 
 
@@ -217,7 +308,9 @@ def get_weather_cache() -> WeatherCache:
     """Get singleton weather cache instance."""
     global _weather_cache
     if _weather_cache is None:
-        _weather_cache = WeatherCache()
+        _weather_cache = WeatherCache(
+            max_stale_seconds=settings.WEATHER_CACHE_MAX_STALE_SECONDS
+        )
     return _weather_cache
 
 
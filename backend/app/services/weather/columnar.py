@@ -0,0 +1,292 @@
+"""
+Columnar (struct-of-arrays) hourly forecast data.
+
+Phase 6: International Weather
+
+Open-Meteo returns hourly variables as parallel arrays. Parsing used to walk
+them one 3-hour window at a time, pulling every variable out with its own
+list comprehension - ~11 variables x 80 windows for a 7-day forecast with 3
+past days. Holding each variable as a float64 column turns aggregation into
+a reshape plus one reduction per output field.
+
+Design notes:
+- Missing/None hours are NaN; reducers skip them, and a window with no
+  valid hours reduces to NaN so callers can apply their own defaults
+- Windows are consecutive `step`-hour blocks from the first hour; a
+  trailing partial window is dropped (same as the old per-window loops)
+- daily() groups on the local date of each timestamp
+- LazyPeriods builds period objects on first access, so a formatter that
+  reads 8 periods doesn't pay for 80
+"""
+import math
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import numpy as np
+
+# Window reducers
+MIN = "min"
+MAX = "max"
+MEAN = "mean"
+SUM = "sum"
+FIRST = "first"  # First valid hour in the window
+CIRCULAR_MEAN = "circular_mean"  # Vector mean of directions in degrees
+
+# Output field -> (hourly variable, reducer)
+Reducers = Dict[str, Tuple[str, str]]
+
+T = TypeVar("T")
+
+
+def _to_column(values: Optional[Sequence], length: int) -> np.ndarray:
+    """Hourly values as a float64 column of `length`, None/missing -> NaN."""
+    column = np.full(length, np.nan)
+    if values:
+        values = list(values[:length])
+        column[:len(values)] = np.array(values, dtype=float)
+    return column
+
+
+def _parse_times(times: Sequence[str]) -> np.ndarray:
+    """ISO timestamps as datetime64[m]; unparseable entries become NaT."""
+    try:
+        return np.array(times, dtype="datetime64[m]")
+    except ValueError:
+        stamps = []
+        for time_str in times:
+            try:
+                stamps.append(np.datetime64(time_str, "m"))
+            except ValueError:
+                stamps.append(np.datetime64("NaT", "m"))
+        return np.array(stamps, dtype="datetime64[m]")
+
+
+def _reduce(windows: np.ndarray, how: str) -> np.ndarray:
+    """Reduce each row of a (windows, hours) array, ignoring NaN."""
+    valid = ~np.isnan(windows)
+    counts = valid.sum(axis=1)
+
+    if how == SUM:
+        result = np.where(valid, windows, 0.0).sum(axis=1)
+    elif how == MEAN:
+        result = np.where(valid, windows, 0.0).sum(axis=1) / np.maximum(counts, 1)
+    elif how == MIN:
+        result = np.where(valid, windows, np.inf).min(axis=1)
+    elif how == MAX:
+        result = np.where(valid, windows, -np.inf).max(axis=1)
+    elif how == FIRST:
+        result = windows[np.arange(len(windows)), valid.argmax(axis=1)]
+    elif how == CIRCULAR_MEAN:
+        radians = np.radians(np.where(valid, windows, 0.0))
+        sin = np.where(valid, np.sin(radians), 0.0).sum(axis=1)
+        cos = np.where(valid, np.cos(radians), 0.0).sum(axis=1)
+        result = np.round(np.degrees(np.arctan2(sin, cos)), 6) % 360
+    else:
+        raise ValueError(f"Unknown reducer: {how}")
+
+    return np.where(counts == 0, np.nan, result)
+
+
+class WindowAggregates:
+    """
+    Aggregated fields for consecutive windows of hourly data.
+
+    Usage:
+        windows = columns.aggregate(3, {"temp_min": ("temperature_2m", MIN)})
+        windows.value("temp_min", 0, default=10.0)
+    """
+
+    def __init__(self, starts: List[str], fields: Dict[str, np.ndarray]):
+        """
+        Args:
+            starts: Timestamp string of each window's first hour
+            fields: Output field -> one value per window (NaN = no data)
+        """
+        self.starts = starts
+        self.fields = fields
+        self._lists: Dict[str, list] = {}
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def value(self, name: str, index: int, default: Optional[float] = None) -> Optional[float]:
+        """
+        One window's value for a field.
+
+        Args:
+            name: Output field name
+            index: Window index
+            default: Returned when the window had no valid hours
+
+        Returns:
+            Python float, or default
+        """
+        values = self._lists.get(name)
+        if values is None:
+            # Python floats once per field rather than a numpy scalar per read
+            values = self._lists[name] = self.fields[name].tolist()
+        result = values[index]
+        return default if math.isnan(result) else result
+
+
+class HourlyColumns:
+    """
+    Hourly forecast variables held as parallel float64 columns.
+
+    Usage:
+        columns = HourlyColumns.from_hourly(data["hourly"], ["temperature_2m", "precipitation"])
+        windows = columns.aggregate(3, {"rain": ("precipitation", SUM)})
+    """
+
+    def __init__(self, times: Sequence[str], columns: Dict[str, np.ndarray]):
+        """
+        Args:
+            times: ISO timestamp per hour
+            columns: Variable name -> column the same length as times
+        """
+        self.times = list(times)
+        self.columns = columns
+
+    @classmethod
+    def from_hourly(cls, hourly: dict, variables: Iterable[str]) -> "HourlyColumns":
+        """
+        Build columns from an Open-Meteo "hourly" block.
+
+        Variables absent from the block become all-NaN columns; short
+        ones are NaN-padded to the length of "time".
+
+        Args:
+            hourly: {"time": [...], "<variable>": [...], ...}
+            variables: Variables to load
+        """
+        times = hourly.get("time", [])
+        return cls(times, {name: _to_column(hourly.get(name), len(times)) for name in variables})
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def column(self, name: str) -> np.ndarray:
+        """A variable's column (all NaN if it wasn't loaded)."""
+        column = self.columns.get(name)
+        if column is None:
+            column = np.full(len(self.times), np.nan)
+        return column
+
+    def aggregate(self, step: int, reducers: Reducers) -> WindowAggregates:
+        """
+        Aggregate into consecutive `step`-hour windows.
+
+        Args:
+            step: Hours per window (1 = hourly, 3 = 3-hourly, 24 = daily)
+            reducers: Output field -> (variable, reducer)
+
+        Returns:
+            WindowAggregates, one entry per complete window
+        """
+        if step < 1:
+            raise ValueError(f"Window step must be positive, got {step}")
+
+        count = len(self.times) // step
+        fields = {
+            name: _reduce(self.column(variable)[:count * step].reshape(count, step), how)
+            for name, (variable, how) in reducers.items()
+        }
+        return WindowAggregates(self.times[0:count * step:step], fields)
+
+    def daily(self, reducers: Reducers) -> WindowAggregates:
+        """
+        Aggregate into calendar days, one window per local date in the series.
+
+        Grouped on the timestamps' date rather than 24-hour blocks, so
+        23/25-hour DST days and a series not starting at midnight still
+        line up with dates. Days are NaN-padded to the longest one.
+        """
+        dates = [time_str[:10] for time_str in self.times]
+        starts = np.array([i for i, date in enumerate(dates) if i == 0 or date != dates[i - 1]], dtype=int)
+        lengths = np.diff(np.append(starts, len(dates)))
+        width = int(lengths.max()) if len(lengths) else 1
+
+        # (days, width) indices into the columns; hours past a day's end are padding
+        offsets = np.arange(width)
+        index = np.minimum(starts[:, None] + offsets, max(len(dates) - 1, 0))
+        padding = offsets >= lengths[:, None]
+
+        fields = {}
+        for name, (variable, how) in reducers.items():
+            column = self.column(variable)
+            windows = column[index] if len(column) else np.empty((0, width))
+            fields[name] = _reduce(np.where(padding, np.nan, windows), how)
+        return WindowAggregates([self.times[i] for i in starts], fields)
+
+    def hours_before(self, now: datetime) -> np.ndarray:
+        """
+        Hours from each timestamp to `now`, on now's wall clock.
+
+        Timestamps are naive local times, so `now` should already be in
+        the series' timezone. Unparseable timestamps give NaN.
+        """
+        reference = np.datetime64(now.replace(tzinfo=None), "m")
+        return (reference - _parse_times(self.times)) / np.timedelta64(1, "h")
+
+    def past_totals(self, variable: str, now: datetime, horizons: Sequence[int]) -> List[float]:
+        """
+        Sum a variable over the hours up to each horizon before `now`.
+
+        Future hours are excluded; missing values count as zero.
+
+        Args:
+            variable: Hourly variable, e.g. "precipitation"
+            now: Current time in the series' timezone
+            horizons: Hours to look back, e.g. (24, 48, 72)
+
+        Returns:
+            One total per horizon
+        """
+        hours_ago = self.hours_before(now)
+        values = np.nan_to_num(self.column(variable))
+        with np.errstate(invalid="ignore"):
+            past = hours_ago >= 0
+            return [float(values[past & (hours_ago <= horizon)].sum()) for horizon in horizons]
+
+
+class LazyPeriods(Sequence[T]):
+    """
+    Read-only sequence that builds period objects on first access.
+
+    Built objects are kept, so callers that update a period in place
+    (e.g. precipitation supplements) see their change on the next read.
+    """
+
+    def __init__(self, count: int, build: Callable[[int], T]):
+        """
+        Args:
+            count: Number of periods
+            build: index -> period object
+        """
+        self._build = build
+        self._items: List[Optional[T]] = [None] * count
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("period index out of range")
+
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._build(index)
+        return item
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyPeriods)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        built = sum(item is not None for item in self._items)
+        return f"LazyPeriods({len(self._items)} periods, {built} built)"
@@ -0,0 +1,131 @@
+"""
+Native model grids for weather cache keys.
+
+Phase 6: International Weather
+
+Two hikers 50m apart inside the same 2.5km model cell get identical data
+from the upstream model, so the forecast cache keys on the model cell
+rather than the raw coordinates. Lapse-rate adjustment to each waypoint's
+elevation happens downstream and is unaffected.
+
+Design notes:
+- Regular lat/lon grids (JMA MSM, AROME) snap to the nearest grid node
+- BOM snaps to the geohash-6 cell the BOM API itself resolves
+- NWS keys on the office/gridX,gridY the /points lookup resolved, once
+  that lookup is in the persistent grid cache; until then the point keeps
+  the 4-decimal coordinate key, so unresolved points never share wrongly
+- ICON-CH2 and ECMWF (rotated/reduced grids behind Open-Meteo) are
+  approximated by square cells of the native spacing s, rounded to the
+  nearest node. Points sharing a key are at most one cell diagonal apart
+  (s*sqrt(2): 2.8km ICON-CH2, 12.7km IFS), so a hit can serve the
+  neighbouring model cell's forecast; two points in one model cell can
+  also land on different keys, which only costs a cache miss
+- Providers without a known grid keep the 4-decimal (~11m) coordinate key
+- Only primary providers are listed: the precipitation supplements (HRRR,
+  GEM) are fetched per request and never go through the forecast cache
+"""
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from app.services.weather.providers.nws import cached_gridpoint
+from app.services.weather.providers.openmeteo import MODEL_NAMES, OpenMeteoModel
+
+KM_PER_DEGREE = 111.32
+
+
+@dataclass(frozen=True)
+class ModelGrid:
+    """
+    A model's horizontal grid, used to turn coordinates into cell IDs.
+
+    lon_step=None means a projected grid with roughly square cells: the
+    longitude step is derived from lat_step at the cell row's latitude.
+    """
+    name: str
+    lat_step: float
+    lon_step: Optional[float] = None
+    nearest: bool = True  # Snap to nearest node (True) or containing cell (False)
+
+    @classmethod
+    def projected(cls, name: str, spacing_km: float) -> "ModelGrid":
+        """
+        Approximate a projected grid with the given native spacing.
+
+        Cells are squares of spacing_km on a lat/lon lattice, not the
+        model's own cells; see the module notes for the error bound.
+        """
+        return cls(name=name, lat_step=spacing_km / KM_PER_DEGREE)
+
+    def _index(self, value: float, step: float) -> int:
+        if self.nearest:
+            return round(value / step)
+        return math.floor(value / step)
+
+    def cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        """
+        Grid (row, col) containing a point.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            (row, col) integer indices
+        """
+        row = self._index(lat, self.lat_step)
+        lon_step = self.lon_step
+        if lon_step is None:
+            row_lat = min(abs(row * self.lat_step), 89.0)
+            lon_step = self.lat_step / math.cos(math.radians(row_lat))
+        return row, self._index(lon, lon_step)
+
+    def cell_id(self, lat: float, lon: float) -> str:
+        """Stable cell identifier, e.g. "icon-ch2-2km/2594,306"."""
+        row, col = self.cell(lat, lon)
+        return f"{self.name}/{row},{col}"
+
+
+# BOM API forecasts are per geohash-6 cell (2^15 x 2^15 over the globe)
+BOM_ACCESS_C = ModelGrid("bom-geohash6", lat_step=180 / 2 ** 15, lon_step=360 / 2 ** 15, nearest=False)
+AROME = ModelGrid("arome-0.01", lat_step=0.01, lon_step=0.01)
+ICON_CH2 = ModelGrid.projected("icon-ch2-2km", 2.0)
+JMA_MSM = ModelGrid("msm-0.05x0.0625", lat_step=0.05, lon_step=0.0625)
+ECMWF_IFS = ModelGrid.projected("ifs-9km", 9.0)
+
+# Provider name (WeatherProvider.provider_name) -> native grid
+PROVIDER_GRIDS: Dict[str, ModelGrid] = {
+    "BOM": BOM_ACCESS_C,
+    MODEL_NAMES[OpenMeteoModel.METEOFRANCE]: AROME,
+    MODEL_NAMES[OpenMeteoModel.ICON_CH]: ICON_CH2,
+    MODEL_NAMES[OpenMeteoModel.JMA]: JMA_MSM,
+    MODEL_NAMES[OpenMeteoModel.ECMWF]: ECMWF_IFS,
+}
+
+
+def get_model_grid(provider: str) -> Optional[ModelGrid]:
+    """Native grid for a provider name, or None if unknown."""
+    return PROVIDER_GRIDS.get(provider)
+
+
+def location_key(provider: str, lat: float, lon: float) -> str:
+    """
+    Location part of a forecast cache key.
+
+    Args:
+        provider: Provider name
+        lat: Latitude
+        lon: Longitude
+
+    Returns:
+        Model cell ID for providers with a known grid (NWS: resolved
+        gridpoint), else "lat,lon" at 4 decimals
+    """
+    if provider == "NWS":
+        gridpoint = cached_gridpoint(lat, lon)
+        if gridpoint is not None:
+            return f"nws/{gridpoint}"
+    grid = get_model_grid(provider)
+    if grid is None:
+        return f"{lat:.4f},{lon:.4f}"
+    return grid.cell_id(lat, lon)
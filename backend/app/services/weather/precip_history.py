@@ -0,0 +1,280 @@
+"""
+Recent precipitation history, cached apart from forecast data.
+
+Phase 6: International Weather
+
+Trail conditions use rain/snow totals over the last 24/48/72 hours. Every
+Open-Meteo forecast (and BOM supplement) used to ask for past_days=3, so
+each refetch carried three days of history that had barely changed since
+the last one.
+
+Design notes:
+- One rolling 72-hour series per grid cell (geohash-6, as for BOM), keyed
+  by UTC hour; lookups within the hour it was updated for are free
+- An update fetches only the hours since the last one (past_hours), plus
+  the hour already held for the previous update, which was still running;
+  hours older than 72 are dropped and the 24/48/72h sums rolled forward
+- Cells are batched into comma-separated requests like the forecasts, and
+  concurrent lookups for a cell share one in-flight update
+- A failed update keeps serving the last totals until they are 72 hours
+  old (the history request never fails a forecast)
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import geohash2
+import httpx
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+OPENMETEO_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+HISTORY_HOURS = 72
+HORIZONS = (24, 48, 72)
+
+# Totals keyed like RecentPrecipitation fields: {"rain_24h": 1.2, ...}
+PrecipTotals = Dict[str, float]
+
+
+def current_utc_hour(now: Optional[datetime] = None) -> datetime:
+    """The UTC hour `now` falls in (defaults to the current time)."""
+    now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    return now.replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass(slots=True)
+class PrecipHistory:
+    """Hourly past rain (mm) and snow (cm) for one grid cell."""
+    hours: Dict[datetime, Tuple[float, float]] = field(default_factory=dict)
+    through: Optional[datetime] = None  # UTC hour of the last update
+    totals: PrecipTotals = field(default_factory=dict)
+
+    def missing_hours(self, hour: datetime) -> int:
+        """Past hours to fetch to bring the series up to `hour`."""
+        if self.through is None:
+            return HISTORY_HOURS
+        return max(1, min(HISTORY_HOURS, int((hour - self.through) / timedelta(hours=1))))
+
+    def roll_forward(
+        self,
+        hour: datetime,
+        times: Sequence[str],
+        rain: Sequence[Optional[float]],
+        snow: Sequence[Optional[float]]
+    ) -> None:
+        """
+        Merge newly fetched hours and recompute the totals for `hour`.
+
+        Args:
+            hour: Current UTC hour; later (forecast) hours are ignored
+            times: GMT timestamps, e.g. "2026-01-28T06:00"
+            rain: Precipitation per timestamp (mm, None = 0)
+            snow: Snowfall per timestamp (cm, None = 0)
+        """
+        for i, time_str in enumerate(times):
+            try:
+                stamp = datetime.fromisoformat(time_str).replace(tzinfo=timezone.utc)
+            except (TypeError, ValueError):
+                continue
+            if stamp > hour:
+                continue
+            self.hours[stamp] = (
+                (rain[i] if i < len(rain) else None) or 0.0,
+                (snow[i] if i < len(snow) else None) or 0.0,
+            )
+
+        oldest = hour - timedelta(hours=HISTORY_HOURS - 1)
+        for stamp in [stamp for stamp in self.hours if stamp < oldest]:
+            del self.hours[stamp]
+
+        totals: PrecipTotals = {}
+        for horizon in HORIZONS:
+            start = hour - timedelta(hours=horizon - 1)
+            window = [values for stamp, values in self.hours.items() if stamp >= start]
+            totals[f"rain_{horizon}h"] = round(sum(rain for rain, _ in window), 1)
+            totals[f"snow_{horizon}h"] = round(sum(snow for _, snow in window), 1)
+
+        self.through = hour
+        self.totals = totals
+
+
+class PrecipHistoryCache:
+    """
+    Rolling recent-precipitation series per grid cell.
+
+    Usage:
+        totals = await get_precip_history().get_recent(client, [(lat, lon)])
+        recent = RecentPrecipitation(**totals[0]) if totals[0] else None
+    """
+
+    def __init__(self, max_cells: int = 5000):
+        """
+        Args:
+            max_cells: Upper bound on cells held (oldest update dropped first)
+        """
+        self.max_cells = max_cells
+        self._cells: Dict[str, PrecipHistory] = {}
+        # Cell key -> update task covering it
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.fetches = 0
+
+    @staticmethod
+    def cell_key(lat: float, lon: float) -> str:
+        """Grid cell for a point: geohash-6 (~1km)."""
+        return geohash2.encode(lat, lon, precision=6)
+
+    async def get_recent(
+        self,
+        client: httpx.AsyncClient,
+        points: Sequence[Tuple[float, float]]
+    ) -> List[Optional[PrecipTotals]]:
+        """
+        Recent precipitation totals for many points.
+
+        Cells not yet updated this UTC hour are fetched together, the
+        newest hours only, OPEN_METEO_MAX_LOCATIONS cells per request.
+
+        Args:
+            client: HTTP client to send Open-Meteo requests with
+            points: (lat, lon) tuples
+
+        Returns:
+            Totals per point, in order (None when nothing is known for the cell)
+        """
+        hour = current_utc_hour()
+        keys = [self.cell_key(lat, lon) for lat, lon in points]
+
+        needed: Dict[str, Tuple[float, float]] = {}
+        for key, point in zip(keys, points):
+            history = self._cells.get(key)
+            if history is not None and history.through == hour:
+                self.hits += 1
+            elif key not in self._inflight:
+                needed.setdefault(key, point)
+
+        if needed:
+            self._start_updates(client, hour, needed)
+
+        tasks = {self._inflight[key] for key in keys if key in self._inflight}
+        if tasks:
+            # Shield so one cancelled caller doesn't cancel a shared update
+            await asyncio.shield(asyncio.gather(*tasks))
+
+        return [self._totals(key, hour) for key in keys]
+
+    def _totals(self, key: str, hour: datetime) -> Optional[PrecipTotals]:
+        """Latest totals for a cell, unless its last update is 72+ hours old."""
+        history = self._cells.get(key)
+        if history is None or history.through is None:
+            return None
+        if hour - history.through >= timedelta(hours=HISTORY_HOURS):
+            return None
+        return history.totals
+
+    def _start_updates(
+        self,
+        client: httpx.AsyncClient,
+        hour: datetime,
+        needed: Dict[str, Tuple[float, float]]
+    ) -> None:
+        """Start one update task per OPEN_METEO_MAX_LOCATIONS cells and register them."""
+        cells = list(needed.items())
+        size = max(1, settings.OPEN_METEO_MAX_LOCATIONS)
+        for i in range(0, len(cells), size):
+            chunk = cells[i:i + size]
+            task = asyncio.ensure_future(self._update(client, hour, chunk))
+            chunk_keys = [key for key, _ in chunk]
+            for key in chunk_keys:
+                self._inflight[key] = task
+
+            def unregister(task: asyncio.Task, chunk_keys: List[str] = chunk_keys) -> None:
+                for key in chunk_keys:
+                    if self._inflight.get(key) is task:
+                        del self._inflight[key]
+
+            task.add_done_callback(unregister)
+
+    async def _update(
+        self,
+        client: httpx.AsyncClient,
+        hour: datetime,
+        cells: List[Tuple[str, Tuple[float, float]]]
+    ) -> None:
+        """Fetch the newest hours for up to OPEN_METEO_MAX_LOCATIONS cells and roll them forward."""
+        histories = [self._cells.get(key) or PrecipHistory() for key, _ in cells]
+        params = {
+            "latitude": ",".join(str(lat) for _, (lat, _) in cells),
+            "longitude": ",".join(str(lon) for _, (_, lon) in cells),
+            "hourly": "precipitation,snowfall",
+            "timezone": "GMT",
+            "past_hours": max(history.missing_hours(hour) for history in histories),
+            "forecast_hours": 1,  # The current hour
+        }
+
+        try:
+            self.fetches += 1
+            response = await client.get(OPENMETEO_FORECAST_URL, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            # One location returns an object, several return a list
+            locations = data if isinstance(data, list) else [data]
+            if len(locations) != len(cells):
+                raise ValueError(f"expected {len(cells)} locations, got {len(locations)}")
+
+        except Exception as e:
+            logger.warning(f"Failed to update precipitation history for {len(cells)} cell(s): {e}")
+            return
+
+        for (key, _), history, location in zip(cells, histories, locations):
+            hourly = location.get("hourly", {})
+            history.roll_forward(
+                hour, hourly.get("time", []), hourly.get("precipitation", []), hourly.get("snowfall", [])
+            )
+            self._store(key, history)
+
+        logger.debug(f"Precipitation history updated for {len(cells)} cell(s), {params['past_hours']}h")
+
+    def _store(self, key: str, history: PrecipHistory) -> None:
+        """Insert or refresh a cell, dropping the least recently updated if full."""
+        self._cells.pop(key, None)
+        if len(self._cells) >= self.max_cells:
+            # Dicts preserve insertion order - first key is the oldest update
+            del self._cells[next(iter(self._cells))]
+        self._cells[key] = history
+
+    def clear(self) -> None:
+        """Drop all cells (for testing)."""
+        self._cells.clear()
+        self.hits = 0
+        self.fetches = 0
+
+    def stats(self) -> dict:
+        """Cell count and hit/fetch counters."""
+        return {"cells": len(self._cells), "hits": self.hits, "fetches": self.fetches}
+
+
+# Singleton instance
+_precip_history: Optional[PrecipHistoryCache] = None
+
+
+def get_precip_history() -> PrecipHistoryCache:
+    """Get singleton precipitation history cache."""
+    global _precip_history
+    if _precip_history is None:
+        _precip_history = PrecipHistoryCache()
+    return _precip_history
+
+
+def reset_precip_history() -> None:
+    """Reset the singleton cache instance (for testing)."""
+    global _precip_history
+    if _precip_history is not None:
+        _precip_history.clear()
+    _precip_history = None
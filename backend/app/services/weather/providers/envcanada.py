@@ -24,6 +24,7 @@ from typing import List, Optional
 
 import httpx
 
+from app.services.http_clients import get_http_client, ENVIRONMENT_CANADA
 from app.services.weather.base import (
     WeatherProvider,
     NormalizedForecast,
@@ -79,7 +80,6 @@ class EnvironmentCanadaProvider(WeatherProvider):
             timeout: HTTP request timeout in seconds
         """
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
 
     @property
     def provider_name(self) -> str:
@@ -92,22 +92,15 @@ class EnvironmentCanadaProvider(WeatherProvider):
         return True
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                headers={
-                    "User-Agent": "Thunderbird-Weather/1.0",
-                    "Accept": "application/json",
-                },
-            )
-        return self._client
-
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Get the shared pooled HTTP client (see app.services.http_clients)."""
+        return get_http_client(
+            ENVIRONMENT_CANADA,
+            timeout=self.timeout,
+            headers={
+                "User-Agent": "Thunderbird-Weather/1.0",
+                "Accept": "application/json",
+            },
+        )
 
     async def get_forecast(
         self,
@@ -292,7 +285,6 @@ class EnvironmentCanadaProvider(WeatherProvider):
                     freezing_level=None,  # Not provided by EC
                     snow_amount=round(snow_amount, 1),
                     description=text_summary[:200] if text_summary else short_text[:200] if short_text else "No forecast available",
-                    alerts=[],
                 )
                 periods.append(period)
 
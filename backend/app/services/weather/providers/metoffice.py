@@ -23,6 +23,7 @@ from typing import List, Optional
 
 import httpx
 
+from app.services.http_clients import get_http_client, MET_OFFICE
 from app.services.weather.base import (
     WeatherProvider,
     NormalizedForecast,
@@ -116,7 +117,6 @@ class MetOfficeProvider(WeatherProvider):
         """
         self.api_key = os.environ.get("METOFFICE_API_KEY")
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
 
     @property
     def provider_name(self) -> str:
@@ -129,23 +129,16 @@ class MetOfficeProvider(WeatherProvider):
         return False
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                headers={
-                    "User-Agent": "Thunderbird-Weather/1.0",
-                    "Accept": "application/json",
-                    "apikey": self.api_key or "",
-                },
-            )
-        return self._client
-
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Get the shared pooled HTTP client (see app.services.http_clients)."""
+        return get_http_client(
+            MET_OFFICE,
+            timeout=self.timeout,
+            headers={
+                "User-Agent": "Thunderbird-Weather/1.0",
+                "Accept": "application/json",
+                "apikey": self.api_key or "",
+            },
+        )
 
     async def get_forecast(
         self,
@@ -359,7 +352,6 @@ class MetOfficeProvider(WeatherProvider):
                     freezing_level=None,  # Not in Met Office free tier
                     snow_amount=round(snow_amount, 1),
                     description=description,
-                    alerts=[],
                 )
                 periods.append(period)
 
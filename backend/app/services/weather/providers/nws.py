@@ -17,12 +17,14 @@ Grid info is cached since it doesn't change for coordinates.
 """
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 import httpx
 
+from app.services.http_clients import get_http_client, NWS
+from app.services.terrain_cache import get_terrain_cache, NWS_GRID
 from app.services.weather.base import (
     WeatherProvider,
     NormalizedForecast,
@@ -56,6 +58,30 @@ DIRECTION_MAP = {
 }
 
 
+def grid_cache_key(lat: float, lon: float) -> str:
+    """Grid info cache key (4 decimal precision = ~11m accuracy)."""
+    return f"{lat:.4f},{lon:.4f}"
+
+
+def cached_gridpoint(lat: float, lon: float) -> Optional[str]:
+    """
+    NWS gridpoint for coordinates whose grid info is already cached.
+
+    Doesn't call the API or count as a grid cache lookup.
+
+    Args:
+        lat: Latitude
+        lon: Longitude
+
+    Returns:
+        "OFFICE/gridX,gridY" (e.g. "SEW/134,50"), or None if not resolved yet
+    """
+    cached = get_terrain_cache(NWS_GRID).peek(grid_cache_key(lat, lon))
+    if not cached or not cached.get("office"):
+        return None
+    return f"{cached['office']}/{cached['gridX']},{cached['gridY']}"
+
+
 @dataclass
 class _GridInfo:
     """
@@ -90,8 +116,7 @@ class NWSProvider(WeatherProvider):
             timeout: HTTP request timeout in seconds
         """
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
-        self._grid_cache: Dict[str, _GridInfo] = {}
+        self._grid_cache = get_terrain_cache(NWS_GRID)  # Persistent, grid info never changes
 
     @property
     def provider_name(self) -> str:
@@ -104,19 +129,12 @@ class NWSProvider(WeatherProvider):
         return True
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                headers=NWS_HEADERS,
-            )
-        return self._client
-
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Get the shared pooled HTTP client (see app.services.http_clients)."""
+        return get_http_client(
+            NWS,
+            timeout=self.timeout,
+            headers=NWS_HEADERS,
+        )
 
     async def _get_grid_info(self, lat: float, lon: float) -> _GridInfo:
         """
@@ -135,11 +153,12 @@ class NWSProvider(WeatherProvider):
             httpx.HTTPStatusError: For API errors (404 = outside US)
             httpx.TimeoutException: For timeout
         """
-        # Check cache first (4 decimal precision = ~11m accuracy)
-        cache_key = f"{lat:.4f},{lon:.4f}"
-        if cache_key in self._grid_cache:
+        # Check cache first
+        cache_key = grid_cache_key(lat, lon)
+        cached = self._grid_cache.get(cache_key)
+        if cached is not None:
             logger.debug(f"Grid cache hit for {cache_key}")
-            return self._grid_cache[cache_key]
+            return _GridInfo(**cached)
 
         client = await self._get_client()
 
@@ -185,7 +204,7 @@ class NWSProvider(WeatherProvider):
             logger.warning(f"Failed to fetch NWS grid elevation: {e}")
 
         # Cache the result
-        self._grid_cache[cache_key] = grid_info
+        self._grid_cache.set(cache_key, asdict(grid_info))
         logger.debug(f"Cached grid info for {cache_key}: {grid_info.office}")
 
         return grid_info
@@ -359,7 +378,6 @@ class NWSProvider(WeatherProvider):
             freezing_level=None,  # NWS doesn't provide in basic forecast
             snow_amount=0.0,  # NWS doesn't provide exact amounts
             description=short,
-            alerts=[],
         )
 
     def _parse_wind_speed(self, wind_str: str) -> tuple[float, float]:
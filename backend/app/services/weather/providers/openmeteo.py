@@ -20,13 +20,16 @@ Used as:
 - Primary provider for countries without native API (FR, IT, CH, NZ, ZA)
 - Reference implementation for normalization patterns
 """
+import asyncio
 import logging
 from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import httpx
 
+from app.services.http_clients import get_http_client, OPEN_METEO
+from config.settings import settings
 from app.services.weather.base import (
     WeatherProvider,
     NormalizedForecast,
@@ -34,6 +37,16 @@ from app.services.weather.base import (
     WeatherAlert,
     RecentPrecipitation,
 )
+from app.services.weather.columnar import (
+    HourlyColumns,
+    LazyPeriods,
+    FIRST,
+    MAX,
+    MEAN,
+    MIN,
+    SUM,
+)
+from app.services.weather.precip_history import get_precip_history
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +186,26 @@ def degrees_to_compass(degrees: Optional[float]) -> str:
     return "N"
 
 
+# 3-hour period field -> (hourly variable, reducer)
+PERIOD_REDUCERS = {
+    "temp_min": ("temperature_2m", MIN),
+    "temp_max": ("temperature_2m", MAX),
+    "dewpoint": ("dew_point_2m", MEAN),
+    "rain_chance": ("precipitation_probability", MAX),
+    "rain_amount": ("precipitation", SUM),
+    "snow_amount": ("snowfall", SUM),
+    "wind_avg": ("wind_speed_10m", MEAN),
+    "wind_max": ("wind_gusts_10m", MAX),
+    "wind_direction": ("wind_direction_10m", FIRST),
+    "cloud_cover": ("cloud_cover", MEAN),
+    "freezing_level": ("freezing_level_height", MEAN),
+    "cape": ("cape", MAX),  # Peak storm potential in the period
+}
+
+# Hourly variables loaded into columns (periods + recent precipitation)
+HOURLY_VARIABLES = sorted({variable for variable, _ in PERIOD_REDUCERS.values()})
+
+
 def parse_iso_datetime(dt_string: str) -> datetime:
     """Parse ISO datetime string from Open-Meteo API."""
     # Open-Meteo returns "2026-01-21T00:00" format (no timezone)
@@ -224,7 +257,6 @@ class OpenMeteoProvider(WeatherProvider):
 
         self.timeout = timeout
         self._endpoint = MODEL_ENDPOINTS[self.model]
-        self._client: Optional[httpx.AsyncClient] = None
 
     @property
     def provider_name(self) -> str:
@@ -237,22 +269,15 @@ class OpenMeteoProvider(WeatherProvider):
         return False
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                headers={
-                    "User-Agent": "Thunderbird-Weather/1.0",
-                    "Accept": "application/json",
-                },
-            )
-        return self._client
-
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Get the shared pooled HTTP client (see app.services.http_clients)."""
+        return get_http_client(
+            OPEN_METEO,
+            timeout=self.timeout,
+            headers={
+                "User-Agent": "Thunderbird-Weather/1.0",
+                "Accept": "application/json",
+            },
+        )
 
     async def get_forecast(
         self,
@@ -274,12 +299,57 @@ class OpenMeteoProvider(WeatherProvider):
         Returns:
             NormalizedDailyForecast with 3-hour period forecasts
         """
+        return (await self.get_forecasts([(lat, lon)], days))[0]
+
+    async def get_forecasts(
+        self,
+        points: List[Tuple[float, float]],
+        days: int = 7
+    ) -> List[NormalizedDailyForecast]:
+        """
+        Get normalized forecasts for many points in as few requests as possible.
+
+        Open-Meteo accepts comma-separated coordinate lists, so points are
+        sent OPEN_METEO_MAX_LOCATIONS at a time (chunks fetched concurrently)
+        instead of one request per point. Recent precipitation comes from
+        the precipitation history cache, updated alongside.
+
+        Args:
+            points: (lat, lon) tuples
+            days: Number of forecast days (1-16)
+
+        Returns:
+            NormalizedDailyForecast per point, in order
+
+        Raises:
+            httpx.HTTPError: If any request fails
+        """
+        size = max(1, settings.OPEN_METEO_MAX_LOCATIONS)
+        chunks = [points[i:i + size] for i in range(0, len(points), size)]
+        client = await self._get_client()
+        *results, recent = await asyncio.gather(
+            *(self._fetch_chunk(chunk, days) for chunk in chunks),
+            get_precip_history().get_recent(client, points),
+        )
+
+        forecasts = [forecast for chunk in results for forecast in chunk]
+        for forecast, totals in zip(forecasts, recent):
+            if totals:
+                forecast.recent_precip = RecentPrecipitation(**totals)
+        return forecasts
+
+    async def _fetch_chunk(
+        self,
+        points: List[Tuple[float, float]],
+        days: int
+    ) -> List[NormalizedDailyForecast]:
+        """One Open-Meteo request for up to OPEN_METEO_MAX_LOCATIONS points."""
         client = await self._get_client()
 
         # Build request parameters
         params = {
-            "latitude": lat,
-            "longitude": lon,
+            "latitude": ",".join(str(lat) for lat, _ in points),
+            "longitude": ",".join(str(lon) for _, lon in points),
             "hourly": ",".join([
                 "temperature_2m",
                 "dew_point_2m",  # For LCL cloud base calculation
@@ -296,7 +366,6 @@ class OpenMeteoProvider(WeatherProvider):
             ]),
             "timezone": "auto",
             "forecast_days": min(days, 16),
-            "past_days": 3,  # Get last 72 hours for trail condition assessment
         }
 
         # MeteoSwiss ICON-CH requires explicit model parameter
@@ -306,10 +375,17 @@ class OpenMeteoProvider(WeatherProvider):
         elif self.model == OpenMeteoModel.HRRR:
             params["models"] = "hrrr_conus"  # 3km, US CONUS only
 
-        logger.info(
-            f"Fetching Open-Meteo forecast for ({lat}, {lon}), {days} days, "
-            f"model={self.model.value}"
-        )
+        if len(points) == 1:
+            lat, lon = points[0]
+            logger.info(
+                f"Fetching Open-Meteo forecast for ({lat}, {lon}), {days} days, "
+                f"model={self.model.value}"
+            )
+        else:
+            logger.info(
+                f"Fetching Open-Meteo forecast for {len(points)} points, {days} days, "
+                f"model={self.model.value}"
+            )
 
         try:
             response = await client.get(self._endpoint, params=params)
@@ -319,12 +395,22 @@ class OpenMeteoProvider(WeatherProvider):
             logger.error(f"Open-Meteo API error: {e}")
             raise
 
-        # Extract model elevation from response (90m DEM by default)
-        model_elevation = data.get("elevation")
-        if model_elevation is not None:
-            model_elevation = int(model_elevation)
+        # One location returns an object, several return a list
+        locations = data if isinstance(data, list) else [data]
+        if len(locations) != len(points):
+            raise httpx.DecodingError(
+                f"Open-Meteo returned {len(locations)} locations for {len(points)} points"
+            )
+
+        forecasts = []
+        for (lat, lon), location in zip(points, locations):
+            # Extract model elevation from response (90m DEM by default)
+            model_elevation = location.get("elevation")
+            if model_elevation is not None:
+                model_elevation = int(model_elevation)
 
-        return self._parse_response(lat, lon, data, model_elevation)
+            forecasts.append(self._parse_response(lat, lon, location, model_elevation))
+        return forecasts
 
     def _parse_response(
         self,
@@ -339,8 +425,8 @@ class OpenMeteoProvider(WeatherProvider):
         Aggregates hourly data into 3-hour periods for consistency
         with the existing BOM provider pattern.
 
-        Also calculates recent precipitation from past_days data for
-        trail condition assessment.
+        Recent precipitation isn't part of the forecast request; see
+        get_forecasts.
 
         Args:
             lat: Latitude
@@ -349,16 +435,12 @@ class OpenMeteoProvider(WeatherProvider):
             model_elevation: Elevation in meters that temperature data is valid for
                            (from API's 90m DEM downscaling)
         """
-        periods: List[NormalizedForecast] = []
         fetched_at = datetime.now(timezone.utc)
 
         hourly = data.get("hourly", {})
-        times = hourly.get("time", [])
-
-        # Calculate recent precipitation from past data
-        recent_precip = self._calculate_recent_precipitation(hourly, times, fetched_at)
+        columns = HourlyColumns.from_hourly(hourly, HOURLY_VARIABLES)
 
-        if not times:
+        if not columns.times:
             logger.warning("Empty response from Open-Meteo API")
             return NormalizedDailyForecast(
                 provider=self.provider_name,
@@ -372,177 +454,66 @@ class OpenMeteoProvider(WeatherProvider):
                 model_elevation=model_elevation,
             )
 
-        # Aggregate hourly data into 3-hour periods
-        step = 3
-        for i in range(0, len(times), step):
-            if i + step > len(times):
-                break
+        # Aggregate hourly data into 3-hour periods (NaN = no valid hours)
+        windows = columns.aggregate(3, PERIOD_REDUCERS)
 
+        # Period start times; windows with a bad timestamp are skipped
+        starts = []
+        for i, time_str in enumerate(windows.starts):
             try:
-                # Parse timestamp for period start
-                period_time = parse_iso_datetime(times[i])
-
-                # Get the 3-hour range for aggregation
-                agg_range = range(i, min(i + step, len(times)))
-
-                # Extract values, handling None gracefully
-                temps = self._get_values(hourly, "temperature_2m", agg_range)
-                dewpoints = self._get_values(hourly, "dew_point_2m", agg_range)
-                precip_probs = self._get_values(hourly, "precipitation_probability", agg_range)
-                precips = self._get_values(hourly, "precipitation", agg_range)
-                snowfalls = self._get_values(hourly, "snowfall", agg_range)
-                wind_speeds = self._get_values(hourly, "wind_speed_10m", agg_range)
-                wind_gusts = self._get_values(hourly, "wind_gusts_10m", agg_range)
-                wind_dirs = self._get_values(hourly, "wind_direction_10m", agg_range)
-                cloud_covers = self._get_values(hourly, "cloud_cover", agg_range)
-                freezing_levels = self._get_values(hourly, "freezing_level_height", agg_range)
-                cape_values = self._get_values(hourly, "cape", agg_range)
-
-                # Calculate aggregates
-                temp_min = min(temps) if temps else 10.0
-                temp_max = max(temps) if temps else 15.0
-                dewpoint = round(sum(dewpoints) / len(dewpoints), 1) if dewpoints else None
-                rain_chance = int(max(precip_probs)) if precip_probs else 0
-                rain_amount = sum(precips) if precips else 0.0
-                snow_amount = sum(snowfalls) if snowfalls else 0.0
-                wind_avg = sum(wind_speeds) / len(wind_speeds) if wind_speeds else 20.0
-                wind_max = max(wind_gusts) if wind_gusts else wind_avg + 15
-                wind_direction = degrees_to_compass(wind_dirs[0] if wind_dirs else None)
-                cloud_cover = int(sum(cloud_covers) / len(cloud_covers)) if cloud_covers else 50
-                freezing_level = int(sum(freezing_levels) / len(freezing_levels)) if freezing_levels else None
-                cape = int(max(cape_values)) if cape_values else None  # Max CAPE in period (peak storm potential)
-
-                # Generate description
-                description = self._generate_description(
-                    temp_max, rain_chance, rain_amount, snow_amount, wind_max, cloud_cover
-                )
-
-                period = NormalizedForecast(
-                    provider=self.provider_name,
-                    lat=lat,
-                    lon=lon,
-                    timestamp=period_time,
-                    temp_min=round(temp_min, 1),
-                    temp_max=round(temp_max, 1),
-                    rain_chance=rain_chance,
-                    rain_amount=round(rain_amount, 1),
-                    wind_avg=round(wind_avg, 1),
-                    wind_max=round(wind_max, 1),
-                    wind_direction=wind_direction,
-                    cloud_cover=cloud_cover,
-                    dewpoint=dewpoint,  # For LCL cloud base calculation
-                    freezing_level=freezing_level,
-                    snow_amount=round(snow_amount, 1),
-                    cape=cape,  # Storm potential indicator
-                    description=description,
-                    alerts=[],
-                )
-                periods.append(period)
-
-            except (KeyError, ValueError, TypeError) as e:
+                starts.append((i, parse_iso_datetime(time_str)))
+            except (ValueError, TypeError) as e:
                 logger.warning(f"Error parsing Open-Meteo period {i}: {e}")
-                continue
 
-        logger.info(f"Parsed {len(periods)} periods from Open-Meteo response (elevation={model_elevation}m)")
+        def build_period(index: int) -> NormalizedForecast:
+            i, period_time = starts[index]
+            value = windows.value
+
+            temp_max = value("temp_max", i, 15.0)
+            rain_chance = int(value("rain_chance", i, 0))
+            rain_amount = value("rain_amount", i, 0.0)
+            snow_amount = value("snow_amount", i, 0.0)
+            wind_avg = value("wind_avg", i, 20.0)
+            wind_max = value("wind_max", i, wind_avg + 15)
+            cloud_cover = int(value("cloud_cover", i, 50))
+            dewpoint = value("dewpoint", i)
+            freezing_level = value("freezing_level", i)
+            cape = value("cape", i)  # Max CAPE in period (peak storm potential)
+
+            return NormalizedForecast(
+                provider=self.provider_name,
+                lat=lat,
+                lon=lon,
+                timestamp=period_time,
+                temp_min=round(value("temp_min", i, 10.0), 1),
+                temp_max=round(temp_max, 1),
+                rain_chance=rain_chance,
+                rain_amount=round(rain_amount, 1),
+                wind_avg=round(wind_avg, 1),
+                wind_max=round(wind_max, 1),
+                wind_direction=degrees_to_compass(value("wind_direction", i)),
+                cloud_cover=cloud_cover,
+                dewpoint=round(dewpoint, 1) if dewpoint is not None else None,  # For LCL cloud base calculation
+                freezing_level=int(freezing_level) if freezing_level is not None else None,
+                snow_amount=round(snow_amount, 1),
+                cape=int(cape) if cape is not None else None,  # Storm potential indicator
+                description=self._generate_description(
+                    temp_max, rain_chance, rain_amount, snow_amount, wind_max, cloud_cover
+                ),
+            )
+
+        logger.info(f"Parsed {len(starts)} periods from Open-Meteo response (elevation={model_elevation}m)")
 
         return NormalizedDailyForecast(
             provider=self.provider_name,
             lat=lat,
             lon=lon,
             country_code="",  # Will be set by caller based on coordinates
-            periods=periods,
+            periods=LazyPeriods(len(starts), build_period),
             alerts=[],  # Open-Meteo doesn't support alerts
             fetched_at=fetched_at,
             is_fallback=False,
             model_elevation=model_elevation,
-            recent_precip=recent_precip,
-        )
-
-    def _get_values(
-        self,
-        hourly: dict,
-        key: str,
-        indices: range
-    ) -> List[float]:
-        """Extract non-None values for given indices from hourly data."""
-        values = hourly.get(key, [])
-        result = []
-        for i in indices:
-            if i < len(values) and values[i] is not None:
-                result.append(float(values[i]))
-        return result
-
-    def _calculate_recent_precipitation(
-        self,
-        hourly: dict,
-        times: List[str],
-        now: datetime
-    ) -> RecentPrecipitation:
-        """
-        Calculate recent precipitation totals from past hourly data.
-
-        Sums precipitation for the last 24, 48, and 72 hours to help
-        assess trail conditions (mud, stream levels, snow pack).
-
-        Args:
-            hourly: Hourly data from Open-Meteo response
-            times: List of ISO datetime strings
-            now: Current timestamp
-
-        Returns:
-            RecentPrecipitation with 24h/48h/72h totals
-        """
-        rain_values = hourly.get("precipitation", [])
-        snow_values = hourly.get("snowfall", [])
-
-        rain_24h = 0.0
-        rain_48h = 0.0
-        rain_72h = 0.0
-        snow_24h = 0.0
-        snow_48h = 0.0
-        snow_72h = 0.0
-
-        for i, time_str in enumerate(times):
-            try:
-                period_time = parse_iso_datetime(time_str)
-                # Make period_time timezone-aware if it isn't
-                if period_time.tzinfo is None:
-                    period_time = period_time.replace(tzinfo=timezone.utc)
-
-                hours_ago = (now - period_time).total_seconds() / 3600
-
-                # Only count past hours (negative hours_ago means future)
-                if hours_ago < 0:
-                    continue
-
-                rain = rain_values[i] if i < len(rain_values) and rain_values[i] is not None else 0.0
-                snow = snow_values[i] if i < len(snow_values) and snow_values[i] is not None else 0.0
-
-                if hours_ago <= 24:
-                    rain_24h += rain
-                    snow_24h += snow
-                if hours_ago <= 48:
-                    rain_48h += rain
-                    snow_48h += snow
-                if hours_ago <= 72:
-                    rain_72h += rain
-                    snow_72h += snow
-
-            except (ValueError, TypeError):
-                continue
-
-        logger.debug(
-            f"Recent precipitation: rain={rain_24h:.1f}/{rain_48h:.1f}/{rain_72h:.1f}mm, "
-            f"snow={snow_24h:.1f}/{snow_48h:.1f}/{snow_72h:.1f}cm"
-        )
-
-        return RecentPrecipitation(
-            rain_24h=round(rain_24h, 1),
-            rain_48h=round(rain_48h, 1),
-            rain_72h=round(rain_72h, 1),
-            snow_24h=round(snow_24h, 1),
-            snow_48h=round(snow_48h, 1),
-            snow_72h=round(snow_72h, 1),
         )
 
     def _generate_description(
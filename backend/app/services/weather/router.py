@@ -9,6 +9,9 @@ The router is the integration point that:
 - Supplements providers with missing metrics from Open-Meteo
 - Tracks data source for display (is_fallback flag)
 - Caches successful responses (1-hour TTL)
+- Coalesces concurrent requests for the same location into one fetch
+- Optionally hedges slow primaries with the fallback inside a latency budget
+- Skips providers whose circuit breaker is open (see circuit_breaker.py)
 
 Provider mapping (resolution):
 - AU: BOM ACCESS-C (2.2km) - native Australian weather service
@@ -38,8 +41,9 @@ Storm/Lightning prediction:
 - European Alps: Afternoon convective storms (orographic + heating)
 - Tasmania: Frontal systems with embedded thunderstorms
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Awaitable, Dict, List, Optional
 
 from app.services.weather.base import (
     WeatherProvider,
@@ -53,6 +57,10 @@ from app.services.weather.providers.metoffice import MetOfficeProvider
 from app.services.weather.providers.openmeteo import OpenMeteoProvider, OpenMeteoModel
 from app.services.weather.providers.bom import BOMProvider
 from app.services.weather.base import NormalizedForecast
+from app.services.circuit_breaker import CircuitBreaker, get_breaker
+from app.services.metrics import COALESCED, get_metrics
+from app.services.hedging import HedgeStats, HedgeTimeout, hedged_race
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -84,9 +92,26 @@ class WeatherRouter:
     - Unknown: Open-Meteo fallback
 
     Caching:
-    - Uses WeatherCache with 1-hour TTL
-    - Cache key includes provider, coordinates, and days
+    - Uses WeatherCache (expires with the model's next run, else 1-hour TTL)
+    - Cache key includes provider, model cell, and days
     - Fallback results cached under fallback provider name
+    - Entries expired less than stale_while_revalidate ago are returned
+      instantly while a background fetch refreshes them
+    - If every provider fails (or the latency budget runs out), an entry up
+      to the cache's max_stale_seconds old is returned instead of an error
+
+    Request coalescing:
+    - Concurrent cache misses for the same key await one shared fetch task
+      (primary + supplement + fallback), so N simultaneous GPS CASTs for
+      one point make a single set of upstream calls
+    - originating_requests counts fetches started, coalesced_requests counts
+      callers that joined an in-flight fetch
+
+    Latency budget (SMS replies):
+    - get_forecast(..., latency_budget=s) fires the Open-Meteo fallback if
+      the primary hasn't answered within hedge_delay, and returns the first
+      valid answer within the budget
+    - hedge_stats records which path won, for tuning hedge_delay
     """
 
     def __init__(self):
@@ -127,6 +152,20 @@ class WeatherRouter:
         # Cache instance
         self.cache: WeatherCache = get_weather_cache()
 
+        # In-flight fetches keyed like the cache, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.originating_requests = 0
+        self.coalesced_requests = 0
+
+        # Stale serving
+        self.stale_while_revalidate: int = settings.WEATHER_CACHE_STALE_WHILE_REVALIDATE_SECONDS
+        self.stale_revalidations = 0
+        self.stale_on_error = 0
+
+        # Hedged (latency-budgeted) fetches
+        self.hedge_delay: float = settings.WEATHER_HEDGE_DELAY_SECONDS
+        self.hedge_stats = HedgeStats()
+
     def get_provider(self, country_code: str) -> WeatherProvider:
         """
         Get the primary provider for a country code.
@@ -151,26 +190,33 @@ class WeatherRouter:
         lat: float,
         lon: float,
         country_code: str,
-        days: int = 7
+        days: int = 7,
+        latency_budget: Optional[float] = None
     ) -> NormalizedDailyForecast:
         """
         Get weather forecast for coordinates with automatic fallback.
 
         Tries the primary provider for the country first. If that fails,
         falls back to Open-Meteo. Sets is_fallback=True on the result
-        when fallback is used.
+        when fallback is used. Recently expired cache entries are returned
+        immediately and refreshed in the background; older stale entries
+        are returned only when the fetch fails.
 
         Args:
             lat: Latitude (-90 to 90)
             lon: Longitude (-180 to 180)
             country_code: ISO 3166-1 alpha-2 country code
             days: Number of forecast days (1-16)
+            latency_budget: Seconds allowed for an answer (SMS replies). When
+                set, a slow primary is hedged with the fallback after
+                hedge_delay and the first valid answer wins.
 
         Returns:
             NormalizedDailyForecast with periods and is_fallback flag set
 
         Raises:
-            WeatherProviderError: If all providers fail
+            WeatherProviderError: If all providers fail or the budget runs out
+                and no stale forecast is available
         """
         provider = self.get_provider(country_code)
         country_upper = country_code.upper() if country_code else ""
@@ -181,18 +227,108 @@ class WeatherRouter:
             logger.debug(f"Cache hit for {provider.provider_name}:{lat:.4f},{lon:.4f}:{days}")
             return cached
 
-        # Try primary provider
-        try:
-            logger.info(f"Fetching forecast from {provider.provider_name} for {country_upper}")
-            forecast = await provider.get_forecast(lat, lon, days)
-            forecast.country_code = country_upper
-            forecast.is_fallback = False
+        key = f"{country_upper}:{self.cache.key_for(provider.provider_name, lat, lon, days)}"
 
-            # Supplement with Open-Meteo precipitation if needed (CA, US)
-            if country_upper in self.precip_supplements:
-                forecast = await self._supplement_precipitation(
-                    forecast, lat, lon, country_upper, days
+        # Stale-while-revalidate: answer now, refresh in the background
+        stale = self.cache.get_stale(
+            provider.provider_name, lat, lon, days, self.stale_while_revalidate
+        )
+        if stale:
+            self.stale_revalidations += 1
+            logger.debug(f"Serving stale {key} while revalidating")
+            self._join_fetch(key, provider, lat, lon, country_upper, days)
+            return stale
+
+        task = self._join_fetch(key, provider, lat, lon, country_upper, days, latency_budget)
+        try:
+            # Shield so one cancelled caller doesn't cancel the shared fetch
+            if latency_budget is None:
+                return await asyncio.shield(task)
+
+            # The hedged fetch enforces the same budget; this bounds the wait
+            # if it started slightly earlier for another budgeted caller
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), latency_budget)
+            except asyncio.TimeoutError:
+                raise WeatherProviderError(
+                    f"No forecast for {country_upper} within {latency_budget:.1f}s budget"
                 )
+        except WeatherProviderError:
+            stale = self.cache.get_stale(provider.provider_name, lat, lon, days)
+            if stale is None:
+                raise
+            self.stale_on_error += 1
+            logger.warning(f"Providers failed for {key}, serving stale forecast")
+            return stale
+
+    def _join_fetch(
+        self,
+        key: str,
+        provider: WeatherProvider,
+        lat: float,
+        lon: float,
+        country_upper: str,
+        days: int,
+        latency_budget: Optional[float] = None
+    ) -> asyncio.Task:
+        """
+        Get the in-flight fetch for a key, starting one if needed.
+
+        Budgeted (hedged) and unbudgeted fetches are separate in-flight
+        entries: a web/API caller that asked for no deadline never joins
+        a fetch that gives up when an SMS budget runs out.
+        """
+        if latency_budget is not None:
+            key = f"{key}:hedged"
+        task = self._inflight.get(key)
+        if task is None:
+            self.originating_requests += 1
+            task = asyncio.ensure_future(
+                self._fetch_forecast(key, provider, lat, lon, country_upper, days, latency_budget)
+            )
+            # Background refreshes have no awaiter to retrieve a failure
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        else:
+            self.coalesced_requests += 1
+            get_metrics().count_cache("weather", COALESCED)
+            logger.debug(f"Coalescing forecast request for {key}")
+        return task
+
+    async def _fetch_forecast(
+        self,
+        key: str,
+        provider: WeatherProvider,
+        lat: float,
+        lon: float,
+        country_upper: str,
+        days: int,
+        latency_budget: Optional[float] = None
+    ) -> NormalizedDailyForecast:
+        """
+        Run the shared fetch for an in-flight key.
+
+        Runs once per key; every coalesced caller awaits this task.
+        """
+        try:
+            if latency_budget is not None:
+                return await self._fetch_hedged(provider, lat, lon, country_upper, days, latency_budget)
+            return await self._fetch_with_fallback(provider, lat, lon, country_upper, days)
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch_with_fallback(
+        self,
+        provider: WeatherProvider,
+        lat: float,
+        lon: float,
+        country_upper: str,
+        days: int
+    ) -> NormalizedDailyForecast:
+        """Try the primary provider, then Open-Meteo fallback."""
+        # Try primary provider
+        try:
+            forecast = await self._fetch_primary(provider, lat, lon, country_upper, days)
 
             # Cache the result
             self.cache.set(provider.provider_name, lat, lon, days, forecast)
@@ -209,9 +345,7 @@ class WeatherRouter:
 
         try:
             logger.info(f"Falling back to Open-Meteo for {country_upper}")
-            forecast = await self.fallback.get_forecast(lat, lon, days)
-            forecast.country_code = country_upper
-            forecast.is_fallback = True  # Mark as fallback
+            forecast = await self._fetch_fallback(lat, lon, country_upper, days)
 
             # Cache under fallback provider name
             self.cache.set(self.fallback.provider_name, lat, lon, days, forecast)
@@ -221,13 +355,119 @@ class WeatherRouter:
             logger.error(f"All providers failed for {country_upper}: {e}")
             raise WeatherProviderError(f"Unable to fetch weather for {country_upper}")
 
+    async def _fetch_hedged(
+        self,
+        provider: WeatherProvider,
+        lat: float,
+        lon: float,
+        country_upper: str,
+        days: int,
+        latency_budget: float
+    ) -> NormalizedDailyForecast:
+        """
+        Race the primary against a delayed Open-Meteo fallback within a budget.
+
+        Same providers and caching as _fetch_with_fallback, but the fallback
+        also fires when the primary is merely slow (after hedge_delay).
+        Open-Meteo primaries have no fallback and just get the budget.
+        """
+        fallback = None
+        if "Open-Meteo" not in provider.provider_name:
+            fallback = lambda: self._fetch_fallback(lat, lon, country_upper, days)
+
+        try:
+            forecast, outcome = await hedged_race(
+                lambda: self._fetch_primary(provider, lat, lon, country_upper, days),
+                fallback,
+                hedge_delay=self.hedge_delay,
+                budget=latency_budget,
+                stats=self.hedge_stats,
+                label=f"{provider.provider_name}/{country_upper}",
+            )
+        except HedgeTimeout:
+            logger.error(f"No forecast for {country_upper} within {latency_budget:.1f}s budget")
+            raise WeatherProviderError(
+                f"Unable to fetch weather for {country_upper} within {latency_budget:.1f}s"
+            )
+        except Exception as e:
+            logger.error(f"All providers failed for {country_upper}: {e}")
+            raise WeatherProviderError(f"Unable to fetch weather for {country_upper}")
+
+        # Cache under whichever provider answered
+        cache_name = self.fallback.provider_name if forecast.is_fallback else provider.provider_name
+        self.cache.set(cache_name, lat, lon, days, forecast)
+        return forecast
+
+    async def _fetch_primary(
+        self,
+        provider: WeatherProvider,
+        lat: float,
+        lon: float,
+        country_upper: str,
+        days: int
+    ) -> NormalizedDailyForecast:
+        """
+        Fetch from the primary provider, merging in any precipitation supplement.
+
+        For countries with a precipitation supplement (US, CA, GB) the
+        supplement fetch starts alongside the primary, so latency is the
+        slower of the two rather than their sum. If the primary fails the
+        supplement is cancelled and the error propagates.
+
+        Raises:
+            CircuitOpenError: The provider's breaker is open (nothing fetched)
+        """
+        breaker = self._breaker(provider)
+        breaker.reject_if_open()  # Before starting the supplement
+
+        supplement = self.precip_supplements.get(country_upper)
+        supplement_task: Optional[asyncio.Task] = None
+        if supplement:
+            supplement_task = asyncio.ensure_future(supplement.get_forecast(lat, lon, days))
+
+        try:
+            logger.info(f"Fetching forecast from {provider.provider_name} for {country_upper}")
+            forecast = await breaker.call(lambda: provider.get_forecast(lat, lon, days))
+            forecast.country_code = country_upper
+            forecast.is_fallback = False
+
+            # Supplement with Open-Meteo precipitation if needed (CA, US, GB)
+            if supplement_task is not None:
+                forecast = await self._supplement_precipitation(
+                    forecast, lat, lon, country_upper, days, precip_task=supplement_task
+                )
+            return forecast
+
+        finally:
+            if supplement_task is not None:
+                if not supplement_task.done():
+                    supplement_task.cancel()
+                elif not supplement_task.cancelled():
+                    supplement_task.exception()  # Mark retrieved; primary failure wins
+
+    async def _fetch_fallback(
+        self,
+        lat: float,
+        lon: float,
+        country_upper: str,
+        days: int
+    ) -> NormalizedDailyForecast:
+        """Fetch from the Open-Meteo fallback and mark the result as fallback."""
+        forecast = await self._breaker(self.fallback).call(
+            lambda: self.fallback.get_forecast(lat, lon, days)
+        )
+        forecast.country_code = country_upper
+        forecast.is_fallback = True  # Mark as fallback
+        return forecast
+
     async def _supplement_precipitation(
         self,
         forecast: NormalizedDailyForecast,
         lat: float,
         lon: float,
         country_code: str,
-        days: int
+        days: int,
+        precip_task: Optional[Awaitable[NormalizedDailyForecast]] = None
     ) -> NormalizedDailyForecast:
         """
         Supplement forecast with precipitation and atmospheric data from Open-Meteo.
@@ -246,6 +486,8 @@ class WeatherRouter:
             lon: Longitude
             country_code: ISO country code
             days: Number of forecast days
+            precip_task: Supplement fetch already in flight (started alongside
+                the primary). Fetched here if not provided.
 
         Returns:
             Forecast with supplemented precipitation, freezing level, and dewpoint data
@@ -258,7 +500,9 @@ class WeatherRouter:
 
         try:
             logger.info(f"Supplementing {country_upper} forecast with {supplement.provider_name} precipitation")
-            precip_forecast = await supplement.get_forecast(lat, lon, days)
+            if precip_task is None:
+                precip_task = supplement.get_forecast(lat, lon, days)
+            precip_forecast = await precip_task
 
             # Build lookup of Open-Meteo periods by date
             precip_by_date: Dict[str, NormalizedForecast] = {}
@@ -295,6 +539,27 @@ class WeatherRouter:
 
         return forecast
 
+    @staticmethod
+    def _breaker(provider: WeatherProvider) -> CircuitBreaker:
+        """Circuit breaker for a provider's forecast endpoint."""
+        return get_breaker(f"weather:{provider.provider_name}")
+
+    def coalescing_stats(self) -> dict:
+        """
+        Get request coalescing counters.
+
+        Returns:
+            Dict with originating, coalesced and in_flight counts, and
+            stale forecasts served while revalidating or on error
+        """
+        return {
+            "originating": self.originating_requests,
+            "coalesced": self.coalesced_requests,
+            "in_flight": len(self._inflight),
+            "stale_revalidations": self.stale_revalidations,
+            "stale_on_error": self.stale_on_error,
+        }
+
     async def get_alerts(
         self,
         lat: float,
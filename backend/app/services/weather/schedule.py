@@ -0,0 +1,64 @@
+"""
+Model run publication schedules for weather cache expiry.
+
+Phase 6: International Weather
+
+A model's output only changes when a new run is published, so a cached
+forecast stays fresh until the next run is available rather than for a
+fixed hour. Refetching between runs just downloads the same numbers.
+
+Design notes:
+- Runs start every interval_hours from 00Z and become available
+  delay_minutes later (Open-Meteo ingest included; erring late)
+- Expiry = availability time of the next run after now
+- Providers without a known schedule (BOM, NWS and Met Office forecaster
+  products, best_match/GFS seamless blends) keep the fixed TTL
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from app.services.weather.providers.openmeteo import MODEL_NAMES, OpenMeteoModel
+
+
+@dataclass(frozen=True)
+class ModelSchedule:
+    """Run cadence and publication delay of a forecast model."""
+    interval_hours: int
+    delay_minutes: int
+
+    def next_run_available(self, now: datetime) -> datetime:
+        """
+        When the first run newer than what's available at `now` is published.
+
+        Args:
+            now: Current time (timezone-aware)
+
+        Returns:
+            UTC datetime the next run becomes available
+        """
+        interval = timedelta(hours=self.interval_hours)
+        delay = timedelta(minutes=self.delay_minutes)
+        midnight = now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # Latest run already published at `now`
+        runs = (now - delay - midnight) // interval
+        latest_run = midnight + runs * interval
+        return latest_run + interval + delay
+
+
+# Provider name (WeatherProvider.provider_name) -> run schedule
+PROVIDER_SCHEDULES: Dict[str, ModelSchedule] = {
+    MODEL_NAMES[OpenMeteoModel.HRRR]: ModelSchedule(interval_hours=1, delay_minutes=90),
+    MODEL_NAMES[OpenMeteoModel.GEM]: ModelSchedule(interval_hours=6, delay_minutes=240),
+    MODEL_NAMES[OpenMeteoModel.METEOFRANCE]: ModelSchedule(interval_hours=3, delay_minutes=120),
+    MODEL_NAMES[OpenMeteoModel.ICON_CH]: ModelSchedule(interval_hours=6, delay_minutes=180),
+    MODEL_NAMES[OpenMeteoModel.ICON_EU]: ModelSchedule(interval_hours=3, delay_minutes=150),
+    MODEL_NAMES[OpenMeteoModel.JMA]: ModelSchedule(interval_hours=3, delay_minutes=150),
+    MODEL_NAMES[OpenMeteoModel.ECMWF]: ModelSchedule(interval_hours=6, delay_minutes=480),
+}
+
+
+def get_model_schedule(provider: str) -> Optional[ModelSchedule]:
+    """Run schedule for a provider name, or None if unknown."""
+    return PROVIDER_SCHEDULES.get(provider)
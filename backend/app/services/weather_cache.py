@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 import hashlib
 import json
 
+from app.services.metrics import HIT, MISS, get_metrics
+
 
 class WeatherCache:
     """
@@ -55,11 +57,13 @@ class WeatherCache:
 
             # Check if expired
             if time.time() - timestamp < self.ttl_seconds:
+                get_metrics().count_cache("weather_legacy", HIT)
                 return data
             else:
                 # Remove expired entry
                 del self.cache[key]
 
+        get_metrics().count_cache("weather_legacy", MISS)
         return None
 
     def set(self, lat: float, lng: float, data: Any, forecast_type: str = "default") -> None:
@@ -40,6 +40,10 @@ class Settings(BaseSettings):
     TWILIO_PHONE_NUMBER: str = ""  # Default/fallback number
     TWILIO_PHONE_NUMBER_AU: Optional[str] = None  # Australian number (for AU users)
     TWILIO_PHONE_NUMBER_US: Optional[str] = None  # US toll-free (for US + intl users)
+    # Outbound sends go through the pooled async HTTP client (REST API),
+    # so a slow Twilio round-trip never blocks the event loop
+    TWILIO_API_BASE_URL: str = "https://api.twilio.com/2010-04-01"
+    TWILIO_TIMEOUT_SECONDS: float = 10.0
     
     # BOM API (undocumented api.weather.bom.gov.au - no API key required)
     # Just needs User-Agent header, uses geohash for location lookup
@@ -64,12 +68,87 @@ class Settings(BaseSettings):
     # Cache TTL
     BOM_CACHE_TTL_HOURS: int = 6
     BOM_CACHE_MAX_AGE_HOURS: int = 12
+    BOM_FORECAST_CACHE_TTL_MINUTES: int = 60  # In-process BOMService forecast cache
+    # Build short 3-hourly forecasts (CAST) from the cached hourly forecast
+    # instead of BOM's 3-hourly endpoint. Off until the derived windows have
+    # been checked against live 3-hourly responses
+    BOM_DERIVE_3HOURLY: bool = False
+
+    # Latency budget for forecasts answering inbound SMS (must beat Twilio's
+    # 15s webhook timeout). Fallback is fired if the primary is still
+    # pending after the hedge delay; first valid answer wins.
+    SMS_FORECAST_BUDGET_SECONDS: float = 10.0
+    WEATHER_HEDGE_DELAY_SECONDS: float = 3.0
+
+    # Forecast replies not ready within the inline budget are delivered via
+    # the outbound SMS queue instead (empty TwiML ack). Commands whose p90
+    # over the last WINDOW replies exceeds the budget are deferred at once.
+    SMS_INLINE_REPLY_BUDGET_SECONDS: float = 8.0
+    SMS_REPLY_LATENCY_WINDOW: int = 20
+
+    # Weather cache stale serving: expired forecasts are returned instantly
+    # (and refreshed in the background) for up to STALE_WHILE_REVALIDATE,
+    # and returned when every provider fails for up to MAX_STALE.
+    WEATHER_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = 3600
+    WEATHER_CACHE_MAX_STALE_SECONDS: int = 21600
+
+    # Circuit breakers per provider endpoint: open when ERROR_RATE of the
+    # last WINDOW calls failed (with at least MIN_CALLS), skip the provider
+    # for OPEN_SECONDS, then try one call. Per-call timeout is the observed
+    # p99 x TIMEOUT_MULTIPLIER, clamped to the MIN/MAX timeout.
+    CIRCUIT_BREAKER_WINDOW: int = 50
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_ERROR_RATE: float = 0.5
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0
+    CIRCUIT_BREAKER_MIN_TIMEOUT_SECONDS: float = 2.0
+    CIRCUIT_BREAKER_MAX_TIMEOUT_SECONDS: float = 30.0
+    CIRCUIT_BREAKER_TIMEOUT_MULTIPLIER: float = 2.0
+
+    # Minutes between metrics snapshots (upstream latency, cache hit rates)
+    # written to the monitoring app_metrics table; live values at /metrics (X-Admin-Key)
+    METRICS_SNAPSHOT_MINUTES: int = 5
+
+    # Weather zones fetched at once for whole-route commands (CAST7 CAMPS/PEAKS)
+    ROUTE_FANOUT_CONCURRENCY: int = 4
+
+    # Seconds between checks of route file mtimes; changed files are
+    # reloaded into the route catalogue and the SMS waypoint code index
+    ROUTE_CATALOGUE_REFRESH_SECONDS: int = 60
+
+    # Locations per batched Open-Meteo request (comma-separated coordinates)
+    OPEN_METEO_MAX_LOCATIONS: int = 50
+
+    # Shared HTTP client pool (one client per upstream weather/elevation/SMS service)
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_MAX_KEEPALIVE_PER_HOST: int = 10
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP2_ENABLED: bool = False  # Requires optional h2 package (httpx[http2])
+
+    # Local SRTM .hgt tiles (e.g. S44E146.hgt) for offline elevation lookups.
+    # Unset or missing tiles fall back to the Open Topo Data / Open-Meteo APIs.
+    DEM_TILE_DIR: Optional[str] = None
+
+    # Terrain cache (cell/point elevation, NWS grid metadata). Bounded LRU in
+    # memory, persisted to SQLite and warm-loaded at startup. "" disables disk.
+    # Relative paths are relative to the backend directory.
+    TERRAIN_CACHE_DB_PATH: str = "terrain_cache.db"
+    TERRAIN_CACHE_MAX_ENTRIES: int = 5000
     
     # SMS delivery (Section 8.9)
     SMS_INTER_MESSAGE_DELAY: float = 2.5  # seconds
     SMS_BATCH_GAP: float = 5.0  # seconds
     SMS_RETRY_DELAY: float = 30.0  # seconds
     SMS_MAX_RETRIES: int = 3
+
+    # Durable outbound SMS queue (SQLite). Workers send concurrently; each
+    # sender number is paced to SENDER_RATE messages/second, and messages to
+    # one recipient go out in order, SMS_INTER_MESSAGE_DELAY apart. Failed
+    # sends retry after SMS_RETRY_DELAY (doubling), up to SMS_MAX_RETRIES.
+    # Relative paths are relative to the backend directory.
+    SMS_QUEUE_DB_PATH: str = "sms_queue.db"
+    SMS_QUEUE_WORKERS: int = 4
+    SMS_QUEUE_SENDER_RATE_PER_SECOND: float = 1.0
+    SMS_QUEUE_RETENTION_DAYS: int = 7
     
     # Trip limits (Section 8.8)
     TRIP_BUFFER_DAYS: int = 3
@@ -138,6 +217,19 @@ CONFIG_DIR = BASE_DIR / "config"
 ROUTES_DIR = CONFIG_DIR / "routes"
 
 
+def resolve_backend_path(path: str) -> str:
+    """
+    Resolve a relative data file path against the backend directory.
+
+    Keeps SQLite side files in one place whatever the process's working
+    directory is (systemd, uvicorn, scripts). Absolute paths, "" and
+    ":memory:" are returned unchanged.
+    """
+    if not path or path == ":memory:" or os.path.isabs(path):
+        return path
+    return str(BASE_DIR / path)
+
+
 # Weather Zone Constants (Section 4.1)
 # NOTE: These are OUR zone identifiers for grouping waypoints, not BOM's.
 # BOM uses geohash for API lookups. Our zones reduce API calls by grouping
@@ -416,6 +416,30 @@ async def get_daily_summary(date: Optional[str] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/breakers")
+async def get_circuit_breakers():
+    """
+    Circuit breaker state per upstream weather endpoint.
+
+    Only populated when the monitoring API is mounted in the backend app
+    (breakers live in the backend process).
+
+    Returns:
+        JSON with breakers list: name, state, error_rate, p50/p99 latency,
+        timeout_seconds, rejected and times_opened per endpoint
+    """
+    try:
+        from app.services.circuit_breaker import breaker_states
+    except ImportError:
+        return {"breakers": [], "open": 0}
+
+    breakers = breaker_states()
+    return {
+        "breakers": breakers,
+        "open": sum(1 for b in breakers if b["state"] != "closed"),
+    }
+
+
 # ============================================================================
 # Log Aggregation Endpoints
 # ============================================================================
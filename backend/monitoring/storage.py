@@ -65,6 +65,22 @@ def init_db():
         ON metrics(check_name, status, timestamp_ms DESC)
     """)
 
+    # App metrics table (upstream latency / cache counters from the backend).
+    # Kept apart from health check results so they never count as checks.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS app_metrics (
+            id TEXT PRIMARY KEY,
+            timestamp_ms INTEGER NOT NULL,
+            series TEXT NOT NULL,
+            metadata TEXT
+        )
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_app_metrics_series
+        ON app_metrics(series, timestamp_ms DESC)
+    """)
+
     # Incidents table
     conn.execute("""
         CREATE TABLE IF NOT EXISTS incidents (
@@ -115,6 +131,29 @@ def store_metric(
     return metric_id
 
 
+def store_app_metric(series: str, metadata: dict) -> str:
+    """
+    Store one backend metrics snapshot row (not a health check).
+
+    Returns:
+        Row ID (UUID)
+    """
+    conn = get_connection()
+
+    row_id = str(uuid.uuid4())
+    timestamp_ms = int(datetime.utcnow().timestamp() * 1000)
+
+    conn.execute("""
+        INSERT INTO app_metrics (id, timestamp_ms, series, metadata)
+        VALUES (?, ?, ?, ?)
+    """, (row_id, timestamp_ms, series, json.dumps(metadata)))
+
+    conn.commit()
+    conn.close()
+
+    return row_id
+
+
 def get_recent_metrics(check_name: str, hours: int = 1) -> list[dict]:
     """Get recent metrics for a check."""
     conn = get_connection()
@@ -255,8 +294,14 @@ def cleanup_old_metrics(retention_days: int = 90):
         DELETE FROM metrics
         WHERE timestamp_ms < ?
     """, (cutoff_ms,))
-
     deleted_count = cursor.rowcount
+
+    cursor = conn.execute("""
+        DELETE FROM app_metrics
+        WHERE timestamp_ms < ?
+    """, (cutoff_ms,))
+    deleted_count += cursor.rowcount
+
     conn.commit()
     conn.close()
 
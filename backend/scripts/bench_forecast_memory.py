@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Forecast Cache Memory Benchmark.
+
+Reports bytes per cached forecast for the slotted forecast types against
+dict-backed twins of the same dataclasses (the layout before they were
+slotted, with a fresh alerts list per normalized period).
+
+Shapes:
+- BOM CellForecast: 7 days hourly (168 ForecastPeriods)
+- NormalizedDailyForecast: 7 days 3-hourly (56 NormalizedForecasts)
+
+Usage:
+    python scripts/bench_forecast_memory.py
+    python scripts/bench_forecast_memory.py --count 500
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.bom import CellForecast, ForecastPeriod, RecentPrecipitation
+from app.services.weather.base import NormalizedDailyForecast, NormalizedForecast
+
+
+def dict_backed(cls):
+    """Unslotted copy of a dataclass with the same fields and defaults."""
+    spec = []
+    for f in fields(cls):
+        if f.default is not MISSING:
+            spec.append((f.name, f.type, field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            spec.append((f.name, f.type, field(default_factory=f.default_factory)))
+        else:
+            spec.append((f.name, f.type))
+    return make_dataclass(cls.__name__, spec)
+
+
+SLOTTED = {
+    "cell": CellForecast,
+    "period": ForecastPeriod,
+    "recent": RecentPrecipitation,
+    "daily": NormalizedDailyForecast,
+    "normalized": NormalizedForecast,
+}
+DICT_BACKED = {name: dict_backed(cls) for name, cls in SLOTTED.items()}
+
+
+def build_cell_forecast(types: dict, seed: int):
+    """A 7-day hourly BOM forecast, values varied per seed like real data."""
+    start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+    periods = [
+        types["period"](
+            datetime=start + timedelta(hours=h),
+            period=f"{h % 24:02d}",
+            temp_min=seed + h * 0.1,
+            temp_max=seed + h * 0.1 + 1.5,
+            rain_chance=h % 100,
+            rain_min=0,
+            rain_max=h * 0.05 + seed,
+            snow_min=0,
+            snow_max=0.0,
+            wind_avg=20 + h % 30,
+            wind_max=35 + h % 40,
+            cloud_cover=h % 100,
+            cloud_base=1000 + h,
+            freezing_level=1500 + h,
+            cape=h,
+            dewpoint=seed + h * 0.01,
+        )
+        for h in range(168)
+    ]
+    return types["cell"](
+        cell_id=f"{seed}-117",
+        geohash="r22489",
+        lat=-43.1,
+        lon=146.2,
+        base_elevation=900,
+        periods=periods,
+        fetched_at=start,
+        expires_at=start + timedelta(hours=1),
+        recent_precip=types["recent"](rain_24h=seed * 0.1),
+    )
+
+
+def build_daily_forecast(types: dict, seed: int, per_period_alerts: bool):
+    """A 7-day 3-hourly normalized forecast."""
+    start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+    extra = {"alerts": []} if per_period_alerts else {}
+    periods = [
+        types["normalized"](
+            provider="Open-Meteo",
+            lat=45.0,
+            lon=6.8,
+            timestamp=start + timedelta(hours=3 * i),
+            temp_min=seed + i * 0.1,
+            temp_max=seed + i * 0.1 + 2.0,
+            rain_chance=i % 100,
+            rain_amount=i * 0.1 + seed,
+            wind_avg=20.0 + i,
+            wind_max=35.0 + i,
+            wind_direction="SW",
+            cloud_cover=i % 100,
+            dewpoint=seed + i * 0.01,
+            freezing_level=2500 + i,
+            snow_amount=0.0,
+            cape=i,
+            description="Cloudy, light rain",
+            **extra,
+        )
+        for i in range(56)
+    ]
+    return types["daily"](
+        provider="Open-Meteo",
+        lat=45.0,
+        lon=6.8,
+        country_code="FR",
+        periods=periods,
+        alerts=[],
+        fetched_at=start,
+    )
+
+
+def bytes_per_forecast(build, count: int) -> float:
+    """Traced allocation per forecast while `count` of them are held."""
+    gc.collect()
+    tracemalloc.start()
+    cache = [build(seed) for seed in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes per cached forecast, before/after slots")
+    parser.add_argument("--count", type=int, default=200, help="Forecasts held per measurement")
+    args = parser.parse_args()
+
+    cases = [
+        (
+            "CellForecast (168 hourly)",
+            lambda seed: build_cell_forecast(DICT_BACKED, seed),
+            lambda seed: build_cell_forecast(SLOTTED, seed),
+        ),
+        (
+            "NormalizedDailyForecast (56 x 3h)",
+            lambda seed: build_daily_forecast(DICT_BACKED, seed, per_period_alerts=True),
+            lambda seed: build_daily_forecast(SLOTTED, seed, per_period_alerts=False),
+        ),
+    ]
+
+    print(f"{'Forecast':<36} {'before':>10} {'after':>10} {'saved':>7}")
+    for name, before_fn, after_fn in cases:
+        before = bytes_per_forecast(before_fn, args.count)
+        after = bytes_per_forecast(after_fn, args.count)
+        saved = 100 * (before - after) / before
+        print(f"{name:<36} {before:>10,.0f} {after:>10,.0f} {saved:>6.0f}%")
+
+
+if __name__ == "__main__":
+    main()
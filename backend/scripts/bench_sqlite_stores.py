@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+SQLite Store Throughput Benchmark.
+
+Reports operations/second for AccountStore.get_by_phone and
+SQLiteUserStore.log_message on a temporary database file, with the
+per-call connection the stores used before (default journal and
+pragmas, connect + close every call) against the shared pool.
+
+Usage:
+    python scripts/bench_sqlite_stores.py
+    python scripts/bench_sqlite_stores.py --count 5000
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.account import AccountStore
+from app.models.database import SQLiteUserStore
+from app.models.sqlite_pool import ConnectionPool
+
+PHONE = "+61412345678"
+
+
+def per_call_connection(db_path: str):
+    """The stores' connection helper before pooling."""
+    @contextmanager
+    def get_connection():
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+    return get_connection
+
+
+def pooled_connection(db_path: str, pool: ConnectionPool):
+    @contextmanager
+    def get_connection():
+        with pool.connection(db_path) as conn:
+            yield conn
+    return get_connection
+
+
+def make_stores(db_path: str, get_connection):
+    """Stores on `db_path` using the given connection helper."""
+    users = SQLiteUserStore(db_path)
+    accounts = AccountStore(db_path)
+    users._get_connection = get_connection
+    accounts._get_connection = get_connection
+    return users, accounts
+
+
+def ops_per_second(fn, count: int) -> float:
+    fn()  # Warm up (first connect, schema load)
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - started)
+
+
+def run(db_path: str, get_connection, count: int) -> dict:
+    users, accounts = make_stores(db_path, get_connection)
+    return {
+        "get_by_phone": ops_per_second(lambda: accounts.get_by_phone(PHONE), count),
+        "log_message": ops_per_second(
+            lambda: users.log_message(
+                user_phone=PHONE, direction="inbound", message_type="command",
+                command_type="CAST", content="CAST LAKEO"
+            ),
+            count
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store ops/second, per-call connections vs pooled")
+    parser.add_argument("--count", type=int, default=2000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for name in ("before", "after"):
+            db_path = os.path.join(tmp, f"{name}.db")
+            users, accounts = make_stores(db_path, per_call_connection(db_path))
+            account = accounts.create("bench@example.com", "hash")
+            accounts.link_phone(account.id, PHONE)
+
+            pool = ConnectionPool()
+            helper = per_call_connection(db_path) if name == "before" else pooled_connection(db_path, pool)
+            results[name] = run(db_path, helper, args.count)
+            pool.close()
+
+    print(f"{'Operation':<16} {'before/s':>10} {'after/s':>10} {'speedup':>8}")
+    for op in ("get_by_phone", "log_message"):
+        before, after = results["before"][op], results["after"][op]
+        print(f"{op:<16} {before:>10,.0f} {after:>10,.0f} {after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config.settings import settings, TZ_HOBART
 from app.services.sms import get_sms_service
 from app.services.bom import get_bom_service, CellForecast
+from app.services.http_clients import close_http_clients
 from app.services.formatter import ForecastFormatter
 from app.services.routes import get_route, Route
 
@@ -50,17 +51,19 @@ async def get_return_forecasts(
     
     Returns: List of (name, forecast, elevation)
     """
-    forecasts = []
-    
-    for wp in route.return_waypoints:
-        code = wp["code"]
-        camp = route.get_camp(code)
-        
-        if camp:
-            forecast = await bom.get_forecast(camp.lat, camp.lon, days=7)
-            forecasts.append((camp.name, forecast, camp.elevation))
-    
-    return forecasts
+    camps = [route.get_camp(wp["code"]) for wp in route.return_waypoints]
+    camps = [camp for camp in camps if camp]
+
+    # All RETURN waypoints fetched together rather than one at a time
+    results = await bom.get_forecasts(
+        [(camp.lat, camp.lon) for camp in camps], days=7, resolution="3hourly"
+    )
+
+    return [
+        (camp.name, forecast, camp.elevation)
+        for camp, forecast in zip(camps, results)
+        if forecast is not None
+    ]
 
 
 async def generate_evening_forecast(user) -> list[str]:
@@ -157,11 +160,17 @@ async def generate_evening_forecast(user) -> list[str]:
                 remaining_cells[c.bom_cell] = []
             remaining_cells[c.bom_cell].append(c)
         
-        # Generate summaries
-        for cell_id, camps in remaining_cells.items():
+        # Generate summaries (one batched fetch for all remaining cells)
+        summary_forecasts = await bom.get_forecasts(
+            [(camps[0].lat, camps[0].lon) for camps in remaining_cells.values()],
+            days=7,
+            resolution="3hourly"
+        )
+        for (cell_id, camps), forecast in zip(remaining_cells.items(), summary_forecasts):
             first_camp = camps[0]
-            forecast = await bom.get_forecast(first_camp.lat, first_camp.lon, days=7)
-            
+            if forecast is None:
+                continue
+
             message = formatter.format_summary(
                 forecast=forecast,
                 cell_name=cell_id,
@@ -229,7 +238,7 @@ async def send_evening_forecasts():
             error_count += 1
     
     # Cleanup
-    await bom.close()
+    await close_http_clients()
     
     # Log summary
     duration = datetime.now(TZ_HOBART) - start_time
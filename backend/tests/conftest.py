@@ -11,6 +11,11 @@ from pathlib import Path
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Keep the persistent terrain cache in memory during tests
+os.environ.setdefault("TERRAIN_CACHE_DB_PATH", ":memory:")
+# ...and the outbound SMS queue
+os.environ.setdefault("SMS_QUEUE_DB_PATH", ":memory:")
+
 import pytest
 import sqlite3
 
@@ -395,6 +400,20 @@ def init_test_database():
     _test_db_initialized = True
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """
+    Start every test with closed circuit breakers.
+
+    Breakers are process-wide, so upstream failures simulated by one test
+    would otherwise open them for the next.
+    """
+    from app.services.circuit_breaker import reset_breakers
+    reset_breakers()
+    yield
+    reset_breakers()
+
+
 @pytest.fixture
 def test_db():
     """
@@ -0,0 +1,490 @@
+"""
+Tests for BOMService forecast caching and request coalescing.
+
+Tests:
+- Forecast cache keyed by geohash, resolution and days
+- Concurrent misses share one in-flight upstream fetch
+- Mock fallback results are never cached
+- Callers get copies; editing one never changes the cached forecast
+- Short 3-hourly forecasts derived from the cached hourly forecast (when enabled)
+- Open-Meteo supplements fetched in one request, concurrently with BOM,
+  and shared across resolutions with daily views derived from hourly
+- Latency-budgeted hedging of slow BOM requests with Open-Meteo
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.bom import BOMAPIError, BOMService, CellForecast, ForecastPeriod, OpenMeteoSupplement
+from app.services.weather.precip_history import reset_precip_history
+from config.settings import TZ_HOBART, settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_precip_history():
+    """Each test starts with an empty precipitation history cache."""
+    reset_precip_history()
+    yield
+    reset_precip_history()
+
+
+def make_cell_forecast(source: str = "bom") -> CellForecast:
+    """Build a minimal CellForecast for cache tests."""
+    now = datetime.now(TZ_HOBART)
+    return CellForecast(
+        cell_id="201-117",
+        geohash="r22489",
+        lat=-43.1486,
+        lon=146.2722,
+        base_elevation=863,
+        periods=[],
+        fetched_at=now,
+        expires_at=now + timedelta(hours=6),
+        source=source,
+    )
+
+
+class TestBOMForecastCache:
+    """Tests for the BOMService forecast cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_request_served_from_cache(self):
+        """Repeat request for the same geohash does not refetch."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast())
+
+        first = await bom.get_forecast(-43.1486, 146.2722, days=2, resolution="hourly")
+        second = await bom.get_forecast(-43.1486, 146.2722, days=2, resolution="hourly")
+
+        assert bom._fetch_real_forecast.await_count == 1
+        assert first.is_cached is False
+        assert second.is_cached is True
+
+    @pytest.mark.asyncio
+    async def test_nearby_point_in_same_geohash_hits_cache(self):
+        """Points ~10m apart share a 6-char geohash and hence a cache entry."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast())
+
+        await bom.get_hourly_forecast(-43.14860, 146.27220)
+        await bom.get_hourly_forecast(-43.14865, 146.27225)
+
+        assert bom._fetch_real_forecast.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_resolution_and_days_are_separate_keys(self):
+        """Different resolution or day count are cached separately."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast())
+
+        await bom.get_forecast(-43.1486, 146.2722, days=2, resolution="hourly")
+        await bom.get_forecast(-43.1486, 146.2722, days=3, resolution="3hourly")
+        await bom.get_forecast(-43.1486, 146.2722, days=7, resolution="3hourly")
+
+        assert bom._fetch_real_forecast.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_short_3hourly_derived_from_hourly(self):
+        """With derivation on, 3-hourly within the hourly horizon reuses the cached hourly fetch."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast())
+
+        with patch.object(settings, "BOM_DERIVE_3HOURLY", True):
+            await bom.get_hourly_forecast(-43.1486, 146.2722)
+            forecast = await bom.get_forecast(-43.1486, 146.2722, days=1, resolution="3hourly")
+
+        assert bom._fetch_real_forecast.await_count == 1
+        assert bom._fetch_real_forecast.await_args.args[5] == "hourly"
+        assert forecast.is_cached is True
+
+    @pytest.mark.asyncio
+    async def test_short_3hourly_fetched_by_default(self):
+        """Derivation is off by default: CAST keeps BOM's 3-hourly product."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast())
+
+        await bom.get_hourly_forecast(-43.1486, 146.2722)
+        await bom.get_forecast(-43.1486, 146.2722, days=1, resolution="3hourly")
+
+        assert [call.args[5] for call in bom._fetch_real_forecast.await_args_list] == ["hourly", "3hourly"]
+
+    @pytest.mark.asyncio
+    async def test_openmeteo_hourly_not_derived(self):
+        """An hourly Open-Meteo fallback isn't reshaped with BOM's 3-hourly rules."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast(source="openmeteo"))
+
+        with patch.object(settings, "BOM_DERIVE_3HOURLY", True):
+            await bom.get_forecast(-43.1486, 146.2722, days=1, resolution="3hourly")
+
+        assert [call.args[5] for call in bom._fetch_real_forecast.await_args_list] == ["hourly", "3hourly"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """A burst of concurrent requests costs one upstream round-trip."""
+        bom = BOMService(use_mock=False)
+        calls = 0
+
+        async def slow_fetch(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return make_cell_forecast()
+
+        bom._fetch_real_daily_forecast = slow_fetch
+
+        results = await asyncio.gather(*[
+            bom.get_daily_forecast(-43.1486, 146.2722, days=7)
+            for _ in range(10)
+        ])
+
+        assert calls == 1
+        assert len(results) == 10
+        assert all(r.cell_id == "201-117" for r in results)
+        assert bom._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_editing_returned_forecast_leaves_cache_intact(self):
+        """In-place edits (supplement merges, formatters) stay with the caller."""
+        bom = BOMService(use_mock=False)
+        fetched = make_cell_forecast()
+        fetched.periods = [
+            ForecastPeriod(
+                datetime=fetched.fetched_at, period="AM", temp_min=4.0, temp_max=9.0,
+                rain_chance=20, rain_min=0.0, rain_max=1.0, snow_min=0.0, snow_max=0.0,
+                wind_avg=15, wind_max=30, cloud_cover=50, cloud_base=900,
+                freezing_level=1400, cape=0,
+            )
+        ]
+        bom._fetch_real_forecast = AsyncMock(return_value=fetched)
+
+        first = await bom.get_hourly_forecast(-43.1486, 146.2722)
+        first.periods[0].rain_max = 25.0
+        first.periods.append(first.periods[0])
+        hit = await bom.get_hourly_forecast(-43.1486, 146.2722)
+        hit.periods[0].temp_max = 30.0
+        again = await bom.get_hourly_forecast(-43.1486, 146.2722)
+
+        assert bom._fetch_real_forecast.await_count == 1
+        assert len(again.periods) == 1
+        assert (again.periods[0].rain_max, again.periods[0].temp_max) == (1.0, 9.0)
+        assert again.periods[0] is not hit.periods[0]
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_propagates_and_is_not_cached(self):
+        """Concurrent callers all see the error; the next call retries."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(side_effect=RuntimeError("upstream down"))
+
+        results = await asyncio.gather(
+            bom.get_hourly_forecast(-43.1486, 146.2722),
+            bom.get_hourly_forecast(-43.1486, 146.2722),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert bom._fetch_real_forecast.await_count == 1
+
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast())
+        await bom.get_hourly_forecast(-43.1486, 146.2722)
+        assert bom._fetch_real_forecast.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mock_fallback_not_cached(self):
+        """Last-resort mock data is not cached."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast(source="mock"))
+
+        await bom.get_hourly_forecast(-43.1486, 146.2722)
+        await bom.get_hourly_forecast(-43.1486, 146.2722)
+
+        assert bom._fetch_real_forecast.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetched(self):
+        """Entries past their cache window are refetched."""
+        bom = BOMService(use_mock=False)
+        bom._fetch_real_forecast = AsyncMock(return_value=make_cell_forecast())
+
+        await bom.get_hourly_forecast(-43.1486, 146.2722)
+        key = next(iter(bom._forecast_cache))
+        forecast, _ = bom._forecast_cache[key]
+        bom._forecast_cache[key] = (forecast, datetime.now(TZ_HOBART) - timedelta(seconds=1))
+
+        await bom.get_hourly_forecast(-43.1486, 146.2722)
+        assert bom._fetch_real_forecast.await_count == 2
+
+
+def make_supplement_transport(days: int = 3):
+    """
+    Mock transport answering BOM daily, Open-Meteo supplement and
+    precipitation history requests.
+
+    Returns (transport, stats) where stats records request paths, kinds
+    ("bom", "supplement", "history") and the peak number of concurrently
+    open requests.
+    """
+    today = datetime.now(TZ_HOBART).date()
+    future = [(today + timedelta(days=n)).isoformat() for n in range(days)]
+    stats = {"paths": [], "kinds": [], "open": 0, "max_open": 0, "params": []}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        if "bom.gov.au" in request.url.host:
+            kind = "bom"
+        else:
+            kind = "history" if "past_hours" in params else "supplement"
+        stats["paths"].append(request.url.host + request.url.path)
+        stats["kinds"].append(kind)
+        stats["params"].append(params)
+        stats["open"] += 1
+        stats["max_open"] = max(stats["max_open"], stats["open"])
+        await asyncio.sleep(0.02)
+        stats["open"] -= 1
+
+        if kind == "bom":
+            return httpx.Response(200, json={
+                "metadata": {"forecast_region": "Western Arthurs"},
+                "data": [
+                    {
+                        "date": f"{d}T00:00:00Z",
+                        "temp_max": 14,
+                        "temp_min": 5,
+                        "rain": {"chance": 60, "amount": {"min": 1, "max": 8}},
+                        "icon_descriptor": "shower",
+                    }
+                    for d in future
+                ],
+            })
+
+        if kind == "history":
+            # GMT hours up to the current one, 0.5mm each
+            hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+            count = int(params["past_hours"]) + 1
+            times = [(hour - timedelta(hours=n)).strftime("%Y-%m-%dT%H:%M") for n in reversed(range(count))]
+            location = {"hourly": {"time": times, "precipitation": [0.5] * count, "snowfall": [0.0] * count}}
+        else:
+            # Hourly from local midnight today
+            hours = [(d, h) for d in future for h in range(24)]
+            location = {
+                "hourly": {
+                    "time": [f"{d}T{h:02d}:00" for d, h in hours],
+                    "wind_speed_10m": [20.0 + h % 11 for _, h in hours],
+                    "wind_gusts_10m": [55.0] * len(hours),
+                    "wind_direction_10m": [350 if h % 2 else 10 for _, h in hours],
+                    "dew_point_2m": [4.0] * len(hours),
+                    "cape": [350 if h == 15 else 100 for _, h in hours],
+                },
+            }
+        # Multi-location requests (comma-separated coordinates) get a list
+        count = request.url.params["latitude"].count(",") + 1
+        return httpx.Response(200, json=location if count == 1 else [location] * count)
+
+    return httpx.MockTransport(handler), stats
+
+
+def use_transport(bom: BOMService, transport: httpx.AsyncBaseTransport) -> None:
+    """Send both BOM and Open-Meteo requests through one mock transport."""
+    client = httpx.AsyncClient(transport=transport)
+    bom.get_client = AsyncMock(return_value=client)
+    bom.get_openmeteo_client = AsyncMock(return_value=client)
+
+
+class TestBOMSupplementFetch:
+    """Tests for the combined Open-Meteo supplement engine."""
+
+    @pytest.mark.asyncio
+    async def test_daily_uses_one_supplement_request_in_parallel(self):
+        """CAST7 issues one Open-Meteo request, concurrently with BOM."""
+        transport, stats = make_supplement_transport()
+        bom = BOMService(use_mock=False)
+        use_transport(bom, transport)
+        bom.get_cell_model_elevation = AsyncMock(return_value=800)
+
+        forecast = await bom.get_daily_forecast(-43.1486, 146.2722, days=3)
+
+        assert stats["kinds"].count("supplement") == 1
+        assert stats["kinds"].count("history") == 1
+        assert stats["max_open"] == 3
+        assert forecast.source == "bom"
+        assert forecast.recent_precip.rain_24h > 0
+
+        # Supplement values (not the pre-today past days) reach the periods
+        later = [p for p in forecast.periods if p.datetime.date() > datetime.now(TZ_HOBART).date()]
+        assert later
+        assert all(p.wind_avg == 30.0 and p.cape == 350 for p in later)
+
+    @pytest.mark.asyncio
+    async def test_supplement_shared_across_resolutions(self):
+        """CAST12 then CAST7 for one location make one Open-Meteo request."""
+        transport, stats = make_supplement_transport()
+        bom = BOMService(use_mock=False)
+        use_transport(bom, transport)
+        bom.get_cell_model_elevation = AsyncMock(return_value=800)
+
+        await bom.get_hourly_forecast(-43.1486, 146.2722)
+        daily = await bom.get_daily_forecast(-43.1486, 146.2722, days=3)
+
+        assert stats["kinds"].count("supplement") == 1
+        assert stats["kinds"].count("history") == 1
+        assert daily.recent_precip.rain_24h > 0
+
+    @pytest.mark.asyncio
+    async def test_supplement_derives_daily_views_from_hourly(self):
+        """Daily views come from the hourly block, past dates dropped."""
+        transport, stats = make_supplement_transport(days=2)
+        bom = BOMService(use_mock=False)
+        use_transport(bom, transport)
+
+        supplement = await bom._fetch_openmeteo_supplement(-43.1486, 146.2722)
+
+        today = datetime.now(TZ_HOBART).date().isoformat()
+        assert min(supplement.wind_by_date) == today
+        assert len(supplement.wind_by_date) == 2
+        assert supplement.wind_by_date[today] == {"wind_avg": 30.0, "wind_max": 55.0, "wind_dir": "N"}
+        assert supplement.dewpoint_by_date[today] == 4.0
+        assert supplement.cape_by_date[today] == 350
+        assert supplement.cape_by_hour[f"{today}T15:00"] == 350
+        assert supplement.recent_precip.rain_24h == 12.0
+
+        params = stats["params"][stats["kinds"].index("supplement")]
+        assert "daily" not in params
+        assert "past_days" not in params
+
+    @pytest.mark.asyncio
+    async def test_supplement_failure_returns_empty_views(self):
+        """Open-Meteo errors degrade to empty supplement, not a failed forecast."""
+        bom = BOMService(use_mock=False)
+        use_transport(bom, httpx.MockTransport(lambda request: httpx.Response(503)))
+
+        supplement = await bom._fetch_openmeteo_supplement(-43.1486, 146.2722)
+
+        assert supplement == OpenMeteoSupplement()
+
+
+class TestBOMBatchForecasts:
+    """Tests for multi-point forecasts with batched Open-Meteo supplements."""
+
+    POINTS = [(-43.1486, 146.2722), (-43.2100, 146.3500), (-43.3000, 146.4500)]
+
+    @pytest.mark.asyncio
+    async def test_supplements_batched_into_one_request(self):
+        """N points make N BOM calls but one Open-Meteo supplement request."""
+        transport, stats = make_supplement_transport()
+        bom = BOMService(use_mock=False)
+        use_transport(bom, transport)
+        bom.get_cell_model_elevation = AsyncMock(return_value=800)
+
+        forecasts = await bom.get_forecasts(self.POINTS, days=3, resolution="daily")
+
+        for kind in ("supplement", "history"):
+            requests = [p for k, p in zip(stats["kinds"], stats["params"]) if k == kind]
+            assert len(requests) == 1
+            assert requests[0]["latitude"].count(",") == 2
+        assert all(f is not None and f.source == "bom" for f in forecasts)
+        assert all(f.recent_precip.rain_24h > 0 for f in forecasts)
+        assert bom._pending_supplements == {}
+
+    @pytest.mark.asyncio
+    async def test_supplement_batch_chunked(self):
+        """Large batches are split into OPEN_METEO_MAX_LOCATIONS-sized requests."""
+        transport, stats = make_supplement_transport()
+        bom = BOMService(use_mock=False)
+        use_transport(bom, transport)
+
+        with patch.object(settings, "OPEN_METEO_MAX_LOCATIONS", 2):
+            supplements = await bom._fetch_openmeteo_supplements(self.POINTS)
+
+        assert len(supplements) == 3
+        assert stats["kinds"].count("supplement") == 2
+        assert all(s.wind_by_date for s in supplements)
+
+    @pytest.mark.asyncio
+    async def test_cached_points_not_in_batch(self):
+        """Points with a cached forecast aren't included in the batch."""
+        transport, stats = make_supplement_transport()
+        bom = BOMService(use_mock=False)
+        use_transport(bom, transport)
+        bom.get_cell_model_elevation = AsyncMock(return_value=800)
+
+        await bom.get_daily_forecast(*self.POINTS[0], days=3)
+        stats["params"].clear()
+        stats["kinds"].clear()
+        await bom.get_forecasts(self.POINTS, days=3, resolution="daily")
+
+        openmeteo = [p for k, p in zip(stats["kinds"], stats["params"]) if k == "supplement"]
+        assert len(openmeteo) == 1
+        assert openmeteo[0]["latitude"].count(",") == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_and_failures_isolated(self):
+        """At most max_concurrency points in flight; failures become None."""
+        bom = BOMService(use_mock=False)
+        active = 0
+        peak = 0
+
+        async def fetch(lat, lon, days=7):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            if lat < -43.25:
+                raise BOMAPIError("All weather APIs failed")
+            return make_cell_forecast()
+
+        bom.get_daily_forecast = fetch
+        bom._prefetch_supplements = MagicMock(return_value=[])
+        points = self.POINTS * 2
+
+        forecasts = await bom.get_forecasts(points, days=3, resolution="daily", max_concurrency=2)
+
+        assert peak == 2
+        assert [f is None for f in forecasts] == [False, False, True] * 2
+
+
+class TestBOMHedging:
+    """Tests for latency-budgeted (SMS) BOM forecasts."""
+
+    @pytest.mark.asyncio
+    async def test_slow_bom_hedged_with_openmeteo(self):
+        """Open-Meteo answers when BOM is slower than the hedge delay."""
+        bom = BOMService(use_mock=False)
+        bom.hedge_delay = 0.02
+
+        async def slow_bom(*args, **kwargs):
+            await asyncio.sleep(1.0)
+            return make_cell_forecast()
+
+        bom._fetch_bom_forecast = slow_bom
+        bom._fetch_openmeteo_fallback = AsyncMock(return_value=make_cell_forecast(source="openmeteo"))
+
+        forecast = await bom.get_hourly_forecast(-43.1486, 146.2722, latency_budget=0.5)
+
+        assert forecast.source == "openmeteo"
+        assert bom.hedge_stats.summary()["fallback_hedged"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unbudgeted_request_waits_for_bom(self):
+        """Without a budget, Open-Meteo is only used when BOM fails."""
+        bom = BOMService(use_mock=False)
+        bom.hedge_delay = 0.01
+
+        async def slow_bom(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return make_cell_forecast()
+
+        bom._fetch_bom_forecast = slow_bom
+        bom._fetch_openmeteo_fallback = AsyncMock()
+
+        forecast = await bom.get_hourly_forecast(-43.1486, 146.2722)
+
+        assert forecast.source == "bom"
+        bom._fetch_openmeteo_fallback.assert_not_called()
+        assert bom.hedge_stats.summary() == {}
@@ -0,0 +1,264 @@
+"""
+Tests for per-provider circuit breakers.
+
+Tests:
+- Opens on error rate over the rolling window, not on isolated errors
+- Open breaker refuses calls; half-open trial closes or re-opens it
+- Adaptive timeout from observed p99 latency
+- WeatherRouter and BOMService skip an open provider straight to the fallback
+- Breaker state exposed through the monitoring API
+"""
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.bom import BOMService, CellForecast
+from app.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitTimeout,
+    breaker_states,
+    get_breaker,
+)
+from app.services.weather.base import NormalizedDailyForecast
+from app.services.weather.router import WeatherRouter
+from config.settings import TZ_HOBART
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def succeed():
+    return "ok"
+
+
+async def fail():
+    raise httpx.ConnectError("upstream down")
+
+
+def make_breaker(clock: FakeClock = None, **kwargs) -> CircuitBreaker:
+    """Breaker with a small window (opens after 4 calls at 50% errors)."""
+    options = dict(window=10, min_calls=4, error_rate=0.5, open_seconds=30.0,
+                   min_timeout=0.05, max_timeout=5.0, timeout_multiplier=2.0)
+    options.update(kwargs)
+    return CircuitBreaker("test:endpoint", clock=clock or FakeClock(), **options)
+
+
+async def run_calls(breaker: CircuitBreaker, *requests) -> None:
+    """Run requests through the breaker, ignoring their errors."""
+    for request in requests:
+        try:
+            await breaker.call(request)
+        except Exception:
+            pass
+
+
+class TestBreakerStates:
+    """Tests for closed/open/half-open transitions."""
+
+    @pytest.mark.asyncio
+    async def test_isolated_errors_keep_breaker_closed(self):
+        """Below min_calls or under the error rate, the breaker stays closed."""
+        breaker = make_breaker()
+        await run_calls(breaker, fail, succeed, succeed, succeed, fail, succeed)
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_opens_on_error_rate_and_refuses_calls(self):
+        """Half the window failing opens it; calls are refused without running."""
+        breaker = make_breaker()
+        await run_calls(breaker, succeed, fail, succeed, fail)
+        assert breaker.state == OPEN
+
+        request = AsyncMock(return_value="ok")
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(request)
+        request.assert_not_called()
+        assert breaker.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_success_closes(self):
+        """After open_seconds one trial call is allowed; success closes."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        await run_calls(breaker, fail, fail, fail, fail)
+
+        clock.now += 30
+        assert breaker.state == HALF_OPEN
+        assert await breaker.call(succeed) == "ok"
+        assert breaker.state == CLOSED
+        assert breaker.current_error_rate() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_failure_reopens(self):
+        """A failed trial re-opens the breaker for another open_seconds."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        await run_calls(breaker, fail, fail, fail, fail)
+
+        clock.now += 30
+        await run_calls(breaker, fail)
+        assert breaker.state == OPEN
+        assert breaker.times_opened == 2
+
+    @pytest.mark.asyncio
+    async def test_one_trial_at_a_time(self):
+        """Concurrent callers during a trial are refused."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        await run_calls(breaker, fail, fail, fail, fail)
+        clock.now += 30
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        trial = asyncio.ensure_future(breaker.call(slow))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(succeed)
+        assert await trial == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_not_counted(self):
+        """A cancelled call (e.g. a hedge loser) isn't a failure."""
+        breaker = make_breaker()
+
+        task = asyncio.ensure_future(breaker.call(lambda: asyncio.sleep(1)))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert breaker.snapshot()["calls"] == 0
+
+
+class TestAdaptiveTimeout:
+    """Tests for the p99-derived per-call timeout."""
+
+    def test_max_timeout_until_enough_samples(self):
+        """Too few successes to estimate p99: use max_timeout."""
+        breaker = make_breaker()
+        breaker._record(True, 0.1, trial=False)
+        assert breaker.timeout() == 5.0
+
+    def test_timeout_from_p99(self):
+        """Timeout is p99 x multiplier, clamped to the bounds."""
+        breaker = make_breaker()
+        for elapsed in (0.1, 0.1, 0.2, 0.4):
+            breaker._record(True, elapsed, trial=False)
+        assert breaker.timeout() == pytest.approx(0.8)
+
+        for _ in range(10):
+            breaker._record(True, 0.001, trial=False)
+        assert breaker.timeout() == 0.05
+
+    @pytest.mark.asyncio
+    async def test_slow_call_times_out_and_counts_as_failure(self):
+        """A call slower than the adaptive timeout fails with CircuitTimeout."""
+        breaker = make_breaker(max_timeout=0.02)
+
+        with pytest.raises(CircuitTimeout):
+            await breaker.call(lambda: asyncio.sleep(1))
+        assert breaker.current_error_rate() == 1.0
+
+
+def open_breaker(name: str) -> None:
+    """Force a registry breaker open."""
+    breaker = get_breaker(name)
+    breaker._open()
+
+
+class TestProviderIntegration:
+    """Open breakers skip straight to the fallback."""
+
+    @pytest.mark.asyncio
+    async def test_router_skips_open_primary(self):
+        """With NWS's breaker open, the router goes to Open-Meteo without calling NWS."""
+        router = WeatherRouter()
+        router.providers["US"].get_forecast = AsyncMock(side_effect=AssertionError("NWS called"))
+        router.precip_supplements["US"].get_forecast = AsyncMock(side_effect=AssertionError("supplement"))
+        router.fallback.get_forecast = AsyncMock(return_value=NormalizedDailyForecast(
+            provider="Open-Meteo", lat=40.0, lon=-74.0, country_code="US",
+            periods=[], alerts=[], fetched_at=datetime.now(timezone.utc),
+        ))
+        open_breaker(f"weather:{router.providers['US'].provider_name}")
+
+        forecast = await router.get_forecast(40.0, -74.0, "US", days=2)
+
+        assert forecast.is_fallback is True
+        router.providers["US"].get_forecast.assert_not_called()
+        router.precip_supplements["US"].get_forecast.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_repeated_primary_failures_open_breaker(self):
+        """Enough failures open the provider's breaker."""
+        router = WeatherRouter()
+        nws = router.providers["US"]
+        nws.get_forecast = AsyncMock(side_effect=httpx.ConnectError("down"))
+        router.precip_supplements["US"].get_forecast = AsyncMock(return_value=None)
+        router.fallback.get_forecast = AsyncMock(return_value=NormalizedDailyForecast(
+            provider="Open-Meteo", lat=40.0, lon=-74.0, country_code="US",
+            periods=[], alerts=[], fetched_at=datetime.now(timezone.utc),
+        ))
+
+        for i in range(12):
+            router.cache.clear()
+            await router.get_forecast(40.0 + i, -74.0, "US", days=2)
+
+        assert get_breaker(f"weather:{nws.provider_name}").state == OPEN
+        assert nws.get_forecast.await_count < 12
+
+    @pytest.mark.asyncio
+    async def test_bom_open_breaker_falls_back_to_openmeteo(self):
+        """BOMService skips an endpoint whose breaker is open."""
+        bom = BOMService(use_mock=False)
+        bom.get_client = AsyncMock(side_effect=AssertionError("BOM requested"))
+        bom.get_cell_model_elevation = AsyncMock(return_value=800)
+        bom._fetch_openmeteo_supplement = AsyncMock()
+        now = datetime.now(TZ_HOBART)
+        fallback = CellForecast(
+            cell_id="201-117", geohash="r22489", lat=-43.1, lon=146.2, base_elevation=900,
+            periods=[], fetched_at=now, expires_at=now, source="openmeteo",
+        )
+        bom._fetch_openmeteo_fallback = AsyncMock(return_value=fallback)
+        open_breaker("bom:hourly")
+
+        forecast = await bom.get_hourly_forecast(-43.1486, 146.2722)
+
+        assert forecast.source == "openmeteo"
+        bom.get_client.assert_not_called()
+
+
+class TestMonitoringEndpoint:
+    """Breaker state through the monitoring API."""
+
+    @pytest.mark.asyncio
+    async def test_breakers_listed(self):
+        """GET /api/monitoring/breakers lists every breaker and the open count."""
+        from monitoring.api import get_circuit_breakers
+
+        get_breaker("bom:daily")
+        open_breaker("weather:NWS")
+
+        result = await get_circuit_breakers()
+
+        assert [b["name"] for b in result["breakers"]] == ["bom:daily", "weather:NWS"]
+        assert result["open"] == 1
+        assert breaker_states()[1]["state"] == OPEN
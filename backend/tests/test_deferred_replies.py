@@ -0,0 +1,162 @@
+"""
+Tests for deferred SMS replies.
+
+Tests:
+- Latency tracked per command key; p90 over a rolling window
+- Fast forecast replies stay inline in the TwiML
+- Replies over budget get an empty TwiML ack and go out via the SMS queue
+- Commands with slow history are deferred without waiting the budget out
+- A deferred reply that fails still gets a short failure SMS
+- Non-forecast commands are always inline
+"""
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.routers import webhook
+from app.services.command_latency import CommandLatencyTracker, command_key
+from app.services.commands import CommandParser
+from app.services.sms_queue import OutboxStore, SMSQueue
+
+PHONE = "+61412345678"
+
+
+class StubSMSService:
+    def get_from_number(self, to: str) -> str:
+        return "+61400000000"
+
+
+@pytest.fixture
+def queue():
+    return SMSQueue(store=OutboxStore(":memory:"), sms_service=StubSMSService())
+
+
+@pytest.fixture
+def tracker():
+    return CommandLatencyTracker(budget=0.05, window=5)
+
+
+@pytest.fixture
+def reply_env(queue, tracker):
+    """Patch the webhook's queue, tracker and response logging; yields logged replies."""
+    logged = []
+    with patch("app.routers.webhook.get_sms_queue", return_value=queue), \
+            patch("app.routers.webhook.get_command_latency", return_value=tracker), \
+            patch("app.routers.webhook.log_twiml_response",
+                  side_effect=lambda phone, text, cmd, kind: logged.append((phone, text, cmd, kind))):
+        yield logged
+
+
+def fake_command(delay: float, reply: str = "CAST7 forecast"):
+    async def process_command(phone, parsed, context=None):
+        await asyncio.sleep(delay)
+        return reply
+    return process_command
+
+
+class TestLatencyTracker:
+    """Tests for the per-command latency window."""
+
+    def test_command_keys(self):
+        parser = CommandParser()
+        assert command_key(parser.parse("CAST7 CAMPS")) == "CAST7:CAMPS"
+        assert command_key(parser.parse("CAST7 PEAKS")) == "CAST7:PEAKS"
+        assert command_key(parser.parse("CAST24 LAKEO")) == "CAST24"
+
+    def test_estimate_follows_recent_samples(self, tracker):
+        """Slow history marks a command slow; fast replies bring it back."""
+        tracker.observe("CAST7:CAMPS", 0.2)
+        tracker.observe("CAST7:CAMPS", 0.2)
+        assert tracker.estimate("CAST7:CAMPS") is None  # Too few samples
+        assert not tracker.expect_slow("CAST7:CAMPS")
+
+        tracker.observe("CAST7:CAMPS", 0.2)
+        assert tracker.expect_slow("CAST7:CAMPS")
+
+        for _ in range(5):
+            tracker.observe("CAST7:CAMPS", 0.01)
+        assert not tracker.expect_slow("CAST7:CAMPS")
+        assert not tracker.expect_slow("CAST12")
+
+
+class TestReplyModes:
+    """Tests for inline vs deferred replies."""
+
+    @pytest.mark.asyncio
+    async def test_fast_reply_inline(self, reply_env, queue, tracker):
+        parsed = CommandParser().parse("CAST7 CAMPS")
+        with patch("app.routers.webhook.process_command", side_effect=fake_command(0)):
+            response = await webhook.reply_to_command(PHONE, parsed, "CAST7")
+
+        assert b"<Message>CAST7 forecast</Message>" in response.body
+        assert reply_env == [(PHONE, "CAST7 forecast", "CAST7", "response")]
+        assert queue.store.counts()["pending"] == 0
+        assert (tracker.inline, tracker.deferred) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_slow_reply_deferred_to_queue(self, reply_env, queue, tracker):
+        """Over budget: empty ack now, reply queued when the forecast finishes."""
+        parsed = CommandParser().parse("CAST7 CAMPS")
+        with patch("app.routers.webhook.process_command", side_effect=fake_command(0.15, "Camps & peaks")):
+            started = time.monotonic()
+            response = await webhook.reply_to_command(PHONE, parsed, "CAST7")
+            acked_after = time.monotonic() - started
+            assert queue.store.counts()["pending"] == 0
+            await asyncio.sleep(0.2)
+
+        assert acked_after < 0.12
+        assert b"<Message>" not in response.body and b"<Response></Response>" in response.body
+        assert reply_env == []  # Logged by the outbound send instead
+        row = queue.store.get(1)
+        assert (row["to_phone"], row["body"], row["command_type"]) == (PHONE, "Camps & peaks", "CAST7")
+        assert tracker.deferred == 1
+        assert tracker.estimate("CAST7:CAMPS") is None and len(tracker._samples["CAST7:CAMPS"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_deferred_reply_queues_failure_sms(self, reply_env, queue, tracker):
+        """The hiker already got an empty ack, so a failure still gets a reply."""
+        async def failing_command(phone, parsed, context=None):
+            await asyncio.sleep(0.1)
+            raise RuntimeError("BOM down")
+
+        parsed = CommandParser().parse("CAST7 CAMPS")
+        with patch("app.routers.webhook.process_command", side_effect=failing_command):
+            response = await webhook.reply_to_command(PHONE, parsed, "CAST7")
+            await asyncio.sleep(0.15)
+
+        assert b"<Response></Response>" in response.body
+        row = queue.store.get(1)
+        assert (row["to_phone"], row["body"], row["command_type"]) == \
+            (PHONE, webhook.DEFERRED_FAILURE_REPLY, "CAST7")
+
+    @pytest.mark.asyncio
+    async def test_slow_history_defers_immediately(self, reply_env, queue, tracker):
+        """A command known to be slow doesn't wait the budget out."""
+        tracker.budget = 1.0
+        for _ in range(3):
+            tracker.observe("CAST7:PEAKS", 2.0)
+        parsed = CommandParser().parse("CAST7 PEAKS")
+
+        with patch("app.routers.webhook.process_command", side_effect=fake_command(0.05)):
+            started = time.monotonic()
+            response = await webhook.reply_to_command(PHONE, parsed, "CAST7")
+            assert time.monotonic() - started < 0.04
+            await asyncio.sleep(0.1)
+
+        assert b"<Response></Response>" in response.body
+        assert queue.store.counts()["pending"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_forecast_commands_inline(self, reply_env, queue, tracker):
+        tracker.budget = 0
+        parsed = CommandParser().parse("HELP")
+        with patch("app.routers.webhook.process_command", side_effect=fake_command(0.02, "Help text")):
+            response = await webhook.reply_to_command(PHONE, parsed, "HELP")
+
+        assert b"<Message>Help text</Message>" in response.body
+        assert tracker.stats()["p90_seconds"] == {}
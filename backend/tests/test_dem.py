@@ -0,0 +1,164 @@
+"""
+Tests for the local memory-mapped DEM tile store.
+
+Uses small synthetic .hgt tiles written to a temp directory.
+
+Tests:
+- SRTM tile naming and sample lookup (row 0 = north edge)
+- Bilinear interpolation between samples, ignoring voids
+- Batch sampling grouped by tile, one vectorized call per tile; edge
+  points fall back to the neighbouring tile; missing tiles return None
+- Cell elevation grid served locally, HTTP only for gaps
+"""
+import struct
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import dem as dem_module
+from app.services import elevation
+from app.services.dem import DEMTileStore, HGTTile, HGT_VOID, reset_dem_store
+from app.services.bom import BOMService
+
+
+def write_tile(directory: Path, name: str, samples: int, value_fn) -> Path:
+    """Write a synthetic big-endian .hgt tile; value_fn(row, col) -> metres."""
+    path = directory / f"{name}.hgt"
+    values = [value_fn(r, c) for r in range(samples) for c in range(samples)]
+    path.write_bytes(struct.pack(f">{len(values)}h", *values))
+    return path
+
+
+@pytest.fixture
+def tile_dir(tmp_path):
+    """Directory with one 11x11 tile for S44E146: elevation = 100*row + col."""
+    write_tile(tmp_path, "S44E146", 11, lambda r, c: 100 * r + c)
+    yield tmp_path
+    reset_dem_store()
+
+
+@pytest.fixture
+def local_dem(tile_dir):
+    """Point the DEM singleton at the synthetic tile directory."""
+    reset_dem_store()
+    with patch.object(dem_module.settings, "DEM_TILE_DIR", str(tile_dir)):
+        yield dem_module.get_dem_store()
+    reset_dem_store()
+
+
+class TestHGTTile:
+    """Tests for single-tile sampling."""
+
+    def test_tile_name(self):
+        """Tiles are named by their south-west corner."""
+        assert DEMTileStore.tile_name(-44, 146) == "S44E146"
+        assert DEMTileStore.tile_name(45, -122) == "N45W122"
+        assert DEMTileStore.tile_name(0, 6) == "N00E006"
+
+    def test_corner_samples(self, tile_dir):
+        """North-west corner is row 0; south-east corner is the last sample."""
+        tile = HGTTile(tile_dir / "S44E146.hgt", -44, 146)
+        assert tile.samples == 11
+        assert tile.sample(-43.0, 146.0) == 0          # NW: row 0, col 0
+        assert tile.sample(-44.0, 147.0) == 1010       # SE: row 10, col 10
+        tile.close()
+
+    def test_bilinear_interpolation(self, tile_dir):
+        """Points between samples are interpolated."""
+        tile = HGTTile(tile_dir / "S44E146.hgt", -44, 146)
+        # Half-way between rows 2/3 and cols 4/5
+        assert tile.sample(-43.25, 146.45) == pytest.approx(254.5)
+        tile.close()
+
+    def test_voids_ignored(self, tmp_path):
+        """Void corners are dropped from the interpolation."""
+        write_tile(tmp_path, "S44E146", 3, lambda r, c: HGT_VOID if (r, c) == (0, 0) else 500)
+        tile = HGTTile(tmp_path / "S44E146.hgt", -44, 146)
+        assert tile.sample(-43.25, 146.25) == pytest.approx(500)
+        tile.close()
+
+    def test_non_square_file_rejected(self, tmp_path):
+        """Files that aren't a square 16-bit grid are rejected."""
+        path = tmp_path / "S44E146.hgt"
+        path.write_bytes(b"\x00" * 10)
+        with pytest.raises(ValueError):
+            HGTTile(path, -44, 146)
+
+
+class TestDEMTileStore:
+    """Tests for batch sampling through the tile store."""
+
+    def test_batch_sampling(self, tile_dir):
+        """A grid of points is sampled in one call."""
+        store = DEMTileStore(str(tile_dir))
+        results = store.sample_points([(-43.0, 146.0), (-43.5, 146.5), (-44.0, 147.0)])
+        assert results == [0, pytest.approx(505), 1010]
+        store.close()
+
+    def test_missing_tile_returns_none(self, tile_dir):
+        """Points outside available tiles return None (HTTP fallback)."""
+        store = DEMTileStore(str(tile_dir))
+        assert store.sample_points([(-42.5, 146.5), (-43.5, 146.5)]) == [None, pytest.approx(505)]
+        store.close()
+
+    def test_grid_sampled_once_per_tile(self, tile_dir):
+        """Points spanning two tiles make one array call per tile, results in order."""
+        write_tile(tile_dir, "S44E147", 11, lambda r, c: 2000 + c)
+        store = DEMTileStore(str(tile_dir))
+        points = [(-43.5, 146.5), (-43.5, 147.5), (-43.2, 146.1), (-43.9, 147.9)]
+
+        with patch.object(HGTTile, "sample_many", autospec=True, side_effect=HGTTile.sample_many) as sample_many:
+            results = store.sample_points(points)
+
+        assert results == [pytest.approx(505), pytest.approx(2005), pytest.approx(201), pytest.approx(2009)]
+        assert sample_many.call_count == 2
+        # North-east corner of S44E147, whose own tiles (S43E148 etc.) are missing
+        assert store.elevation(-43.0, 148.0) == 2010
+        store.close()
+
+    def test_store_disabled_without_tile_dir(self):
+        """No DEM_TILE_DIR means no local store."""
+        reset_dem_store()
+        with patch.object(dem_module.settings, "DEM_TILE_DIR", None):
+            assert dem_module.get_dem_store() is None
+
+
+class TestLocalElevationSources:
+    """Elevation services prefer local tiles over HTTP."""
+
+    @pytest.mark.asyncio
+    async def test_cell_grid_served_locally(self, local_dem):
+        """A fully covered cell makes no HTTP calls."""
+        elevation._cell_cache.clear(persistent=True)
+        with patch.object(elevation, "get_bulk_elevations", AsyncMock()) as bulk:
+            cell = await elevation.get_cell_elevation_data(-43.5, 146.5, "test")
+        bulk.assert_not_called()
+        assert cell.sample_count == 49
+        assert cell.average_elevation == pytest.approx(505, abs=1)
+        elevation._cell_cache.clear(persistent=True)
+
+    @pytest.mark.asyncio
+    async def test_cell_grid_gaps_filled_over_http(self, local_dem):
+        """Points off the local tiles are fetched from Open Topo Data."""
+        elevation._cell_cache.clear(persistent=True)
+        # Grid straddles the north edge of S44E146 (S43E146 is missing)
+        with patch.object(elevation, "get_bulk_elevations", AsyncMock(side_effect=lambda pts: [0.0] * len(pts))) as bulk:
+            cell = await elevation.get_cell_elevation_data(-43.005, 146.5, "edge")
+        bulk.assert_awaited_once()
+        requested = bulk.await_args.args[0]
+        assert 0 < len(requested) < 49
+        assert all(lat >= -43.0 for lat, _ in requested)
+        assert cell.sample_count == 49
+        elevation._cell_cache.clear(persistent=True)
+
+    @pytest.mark.asyncio
+    async def test_grid_elevation_uses_local_tiles(self, local_dem):
+        """BOMService point elevation reads local tiles before Open-Meteo."""
+        bom = BOMService(use_mock=False)
+        bom._elevation_cache.clear(persistent=True)
+        bom.get_openmeteo_client = AsyncMock()
+        assert await bom.get_grid_elevation(-43.5, 146.5) == 505
+        bom.get_openmeteo_client.assert_not_called()
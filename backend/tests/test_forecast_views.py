@@ -0,0 +1,158 @@
+"""
+Tests for forecast views derived from the hourly BOM forecast.
+
+Tests:
+- Hourly periods aggregated into local 3-hour N/AM/PM windows
+- Partial current window kept; windows past the requested days dropped
+- Hourly forecast left untouched
+- Derived view identical to a parsed BOM 3-hourly fixture for the same hours
+"""
+import pytest
+from datetime import datetime, timedelta
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.bom import BOMService, CellForecast, ForecastPeriod
+from app.services.forecast_views import aggregate_periods, period_name, to_3hourly
+from config.settings import TZ_HOBART
+
+
+def make_hour(when: datetime, **overrides) -> ForecastPeriod:
+    """Hourly ForecastPeriod with plausible values."""
+    values = dict(
+        datetime=when,
+        period=f"{when.hour:02d}",
+        temp_min=8.0,
+        temp_max=8.0,
+        rain_chance=20,
+        rain_min=0.0,
+        rain_max=0.4,
+        snow_min=0.0,
+        snow_max=0.0,
+        wind_avg=20,
+        wind_max=35,
+        cloud_cover=60,
+        cloud_base=1200,
+        freezing_level=1500,
+        cape=50,
+        dewpoint=3.0,
+    )
+    values.update(overrides)
+    return ForecastPeriod(**values)
+
+
+def make_hourly_forecast(periods) -> CellForecast:
+    """Cached hourly CellForecast with the given periods."""
+    now = datetime.now(TZ_HOBART)
+    return CellForecast(
+        cell_id="201-117",
+        geohash="r22489",
+        lat=-43.1486,
+        lon=146.2722,
+        base_elevation=863,
+        periods=periods,
+        fetched_at=now,
+        expires_at=now + timedelta(hours=1),
+        is_cached=True,
+    )
+
+
+class TestAggregatePeriods:
+    """Tests for combining hourly periods into one 3-hourly period."""
+
+    def test_aggregation_rules(self):
+        """A window becomes a BOM 3-hourly row: start temperature, peaks, sums, mean wind."""
+        start = datetime(2026, 1, 5, 12, tzinfo=TZ_HOBART)
+        window = [
+            make_hour(start, temp_min=9.0, temp_max=11.0, rain_chance=10, wind_avg=20, cape=40),
+            make_hour(start + timedelta(hours=1), temp_min=14.0, temp_max=16.0, rain_chance=60,
+                      wind_avg=25, wind_max=50, cloud_base=900),
+            make_hour(start + timedelta(hours=2), temp_min=12.0, temp_max=14.0, cape=300, dewpoint=5.0),
+        ]
+
+        period = aggregate_periods(window)
+
+        assert period.datetime == start
+        assert period.period == "PM"
+        assert (period.temp_min, period.temp_max) == (7.0, 10.0)  # One temperature, PM range
+        assert period.rain_chance == 60
+        assert period.rain_max == 1.2
+        assert period.wind_avg == 21  # int(65 / 3)
+        assert period.wind_max == 50
+        assert period.cloud_cover == 90  # From the rain chance
+        assert period.cloud_base == 800
+        assert (period.cape, period.dewpoint) == (0, None)  # Not in BOM's 3-hourly product
+
+    def test_partial_window_stamped_at_window_start(self):
+        """A window joined mid-way is labelled with its 3-hour boundary."""
+        period = aggregate_periods([make_hour(datetime(2026, 1, 5, 20, tzinfo=TZ_HOBART))])
+        assert period.datetime.hour == 18
+        assert period.period == "N"
+
+    def test_period_names(self):
+        """Names match the BOM 3-hourly parser's local-hour bands."""
+        assert [period_name(h) for h in (0, 3, 6, 9, 12, 15, 18, 21)] == \
+            ["N", "N", "AM", "AM", "PM", "PM", "N", "N"]
+
+
+class TestTo3Hourly:
+    """Tests for the 3-hourly view of an hourly forecast."""
+
+    def test_windows_and_cutoff(self):
+        """Hours group by local date and 3-hour block, up to `days` ahead."""
+        now = datetime.now(TZ_HOBART).replace(minute=0, second=0, microsecond=0)
+        hourly = make_hourly_forecast([make_hour(now + timedelta(hours=h)) for h in range(48)])
+
+        forecast = to_3hourly(hourly, days=1)
+
+        starts = [p.datetime for p in forecast.periods]
+        assert starts == sorted(set(starts))
+        assert all(p.datetime.hour % 3 == 0 for p in forecast.periods)
+        assert starts[-1] <= now + timedelta(days=1)
+        assert len(forecast.periods) in (8, 9)
+        assert forecast.is_cached is True
+
+    def test_hourly_forecast_untouched(self):
+        """The (possibly cached) hourly forecast keeps its periods."""
+        now = datetime.now(TZ_HOBART)
+        periods = [make_hour(now + timedelta(hours=h)) for h in range(6)]
+        hourly = make_hourly_forecast(list(periods))
+
+        to_3hourly(hourly, days=1)
+
+        assert hourly.periods == periods
+
+
+class TestAgainstBOM3Hourly:
+    """The derived view matches BOM's 3-hourly product for the same hours."""
+
+    # Per 3-hour window: hourly (temp, rain max, rain chance, wind, gust)
+    HOURS = ((8, 0.4, 20, 20, 35), (12, 0.6, 50, 25, 45), (10, 1.0, 40, 30, 40))
+    # BOM's 3-hourly row for the same window
+    WINDOW = {"temp": 8, "rain": {"amount": {"min": 0, "max": 2.0}, "chance": 50},
+              "wind": {"speed_kilometre": 25, "gust_speed_kilometre": 45}}
+
+    def test_derived_matches_parsed_3hourly(self):
+        bom = BOMService(use_mock=False)
+        day = datetime.now(TZ_HOBART).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        hourly_rows, window_rows = [], []
+        for start in range(0, 24, 3):
+            window_start = day + timedelta(hours=start)
+            window_rows.append({"time": window_start.isoformat(), **self.WINDOW})
+            for offset, (temp, rain_max, chance, wind, gust) in enumerate(self.HOURS):
+                hourly_rows.append({
+                    "time": (window_start + timedelta(hours=offset)).isoformat(),
+                    "temp": temp,
+                    "rain": {"amount": {"min": 0, "max": rain_max}, "chance": chance},
+                    "wind": {"speed_kilometre": wind, "gust_speed_kilometre": gust},
+                })
+
+        args = ("201-117", "r22489", -43.1486, 146.2722)
+        hourly = bom._parse_bom_hourly_response(*args, {"data": hourly_rows}, days=3, grid_elevation=863)
+        direct = bom._parse_bom_3hourly_response(*args, {"data": window_rows}, days=3, grid_elevation=863)
+
+        derived = to_3hourly(hourly, days=3).periods
+        assert len(derived) == 8
+        assert derived == direct.periods
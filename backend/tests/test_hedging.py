@@ -0,0 +1,150 @@
+"""
+Tests for latency-budgeted hedged requests.
+
+Tests:
+- Fast primary wins without firing the fallback
+- Slow primary is hedged; first valid answer wins, loser cancelled
+- Early primary failure starts the fallback immediately
+- Budget exhaustion raises HedgeTimeout
+- Outcomes recorded in HedgeStats
+"""
+import asyncio
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.hedging import (
+    HedgeStats,
+    HedgeTimeout,
+    hedged_race,
+    OUTCOME_PRIMARY,
+    OUTCOME_PRIMARY_HEDGED,
+    OUTCOME_FALLBACK,
+    OUTCOME_FALLBACK_HEDGED,
+    OUTCOME_FAILED,
+    OUTCOME_TIMEOUT,
+)
+
+
+def delayed(value, delay: float, calls: list = None, error: Exception = None):
+    """Coroutine factory answering `value` (or raising) after `delay` seconds."""
+    async def run():
+        if calls is not None:
+            calls.append(value)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return value
+    return run
+
+
+class TestHedgedRace:
+    """Tests for hedged_race()."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_skips_fallback(self):
+        """Primary answering inside the hedge delay never fires the fallback."""
+        calls = []
+        result, outcome = await hedged_race(
+            delayed("bom", 0.01, calls), delayed("om", 0.01, calls),
+            hedge_delay=0.1, budget=1.0,
+        )
+        assert (result, outcome) == ("bom", OUTCOME_PRIMARY)
+        assert calls == ["bom"]
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged_fallback_wins(self):
+        """Fallback fired after the hedge delay wins over a slow primary."""
+        result, outcome = await hedged_race(
+            delayed("bom", 0.5), delayed("om", 0.01),
+            hedge_delay=0.02, budget=1.0,
+        )
+        assert (result, outcome) == ("om", OUTCOME_FALLBACK_HEDGED)
+
+    @pytest.mark.asyncio
+    async def test_hedged_primary_can_still_win(self):
+        """Primary answering after the hedge but before the fallback wins."""
+        result, outcome = await hedged_race(
+            delayed("bom", 0.05), delayed("om", 0.5),
+            hedge_delay=0.02, budget=1.0,
+        )
+        assert (result, outcome) == ("bom", OUTCOME_PRIMARY_HEDGED)
+
+    @pytest.mark.asyncio
+    async def test_loser_is_cancelled(self):
+        """The slower request is cancelled once a winner is found."""
+        cancelled = asyncio.Event()
+
+        async def slow_primary():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        await hedged_race(slow_primary, delayed("om", 0.01), hedge_delay=0.01, budget=1.0)
+        await asyncio.sleep(0)
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_primary_failure_starts_fallback_immediately(self):
+        """Primary error before the hedge delay falls back without waiting."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result, outcome = await hedged_race(
+            delayed("bom", 0.01, error=RuntimeError("503")), delayed("om", 0.01),
+            hedge_delay=1.0, budget=2.0,
+        )
+        assert (result, outcome) == ("om", OUTCOME_FALLBACK)
+        assert loop.time() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_hedged_fallback_failure_waits_for_primary(self):
+        """A failed hedge doesn't end the race while the primary can still answer."""
+        result, outcome = await hedged_race(
+            delayed("bom", 0.05), delayed("om", 0.01, error=RuntimeError("down")),
+            hedge_delay=0.01, budget=1.0,
+        )
+        assert (result, outcome) == ("bom", OUTCOME_PRIMARY_HEDGED)
+
+    @pytest.mark.asyncio
+    async def test_all_failed_raises_last_error(self):
+        """When every path fails, the last error propagates."""
+        with pytest.raises(ValueError, match="fallback"):
+            await hedged_race(
+                delayed("bom", 0.01, error=RuntimeError("primary")),
+                delayed("om", 0.01, error=ValueError("fallback")),
+                hedge_delay=1.0, budget=1.0,
+            )
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted_raises_timeout(self):
+        """No valid answer inside the budget raises HedgeTimeout."""
+        with pytest.raises(HedgeTimeout):
+            await hedged_race(
+                delayed("bom", 1.0), delayed("om", 1.0),
+                hedge_delay=0.01, budget=0.05,
+            )
+
+    @pytest.mark.asyncio
+    async def test_budget_only_without_fallback(self):
+        """With no fallback the primary just gets the budget."""
+        with pytest.raises(HedgeTimeout):
+            await hedged_race(delayed("om", 1.0), None, hedge_delay=0.01, budget=0.05)
+
+    @pytest.mark.asyncio
+    async def test_outcomes_recorded(self):
+        """Each race records its outcome in HedgeStats."""
+        stats = HedgeStats()
+        await hedged_race(delayed("bom", 0.0), delayed("om", 0.0), 0.1, 1.0, stats=stats)
+        await hedged_race(delayed("bom", 0.5), delayed("om", 0.0), 0.01, 1.0, stats=stats)
+        with pytest.raises(RuntimeError):
+            await hedged_race(delayed("om", 0.0, error=RuntimeError("x")), None, 0.1, 1.0, stats=stats)
+
+        summary = stats.summary()
+        assert summary[OUTCOME_PRIMARY]["count"] == 1
+        assert summary[OUTCOME_FALLBACK_HEDGED]["count"] == 1
+        assert summary[OUTCOME_FAILED]["count"] == 1
+        assert OUTCOME_TIMEOUT not in summary
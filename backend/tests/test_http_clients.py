@@ -0,0 +1,143 @@
+"""
+Tests for the shared pooled HTTP client registry.
+
+Tests:
+- One client per upstream service and settings, reused across callers
+- Different headers/timeout get their own client on the service's pool
+- Connection limits applied to every client
+- Closed clients are recreated; aclose() closes everything
+- HTTP/2 falls back to HTTP/1.1 without the h2 package
+- Providers and elevation lookups share the pooled clients
+"""
+import pytest
+from unittest.mock import patch
+
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import http_clients
+from app.services.http_clients import (
+    HTTPClientRegistry,
+    OPEN_METEO,
+    OPEN_TOPO_DATA,
+    get_http_client,
+    reset_http_clients,
+)
+from app.services.weather.providers.openmeteo import OpenMeteoProvider, OpenMeteoModel
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Start and finish each test with a fresh registry."""
+    reset_http_clients()
+    yield
+    reset_http_clients()
+
+
+class TestHTTPClientRegistry:
+    """Tests for HTTPClientRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_same_service_shares_client(self):
+        """Repeated lookups for one service return the same pooled client."""
+        registry = HTTPClientRegistry()
+        assert registry.get(OPEN_METEO) is registry.get(OPEN_METEO)
+        assert registry.get(OPEN_METEO) is not registry.get(OPEN_TOPO_DATA)
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_different_settings_share_pool(self, caplog):
+        """A caller's headers and timeout are honoured without a second connection pool."""
+        registry = HTTPClientRegistry()
+        default = registry.get(OPEN_METEO)
+        custom = registry.get(OPEN_METEO, headers={"User-Agent": "Custom/1.0"}, timeout=5.0)
+
+        assert custom is not default
+        assert custom._transport is default._transport
+        assert custom.headers["User-Agent"] == "Custom/1.0"
+        assert custom.timeout.read == 5.0
+        assert "different headers/timeout" in caplog.text
+        assert registry.get(OPEN_METEO, headers={"User-Agent": "Custom/1.0"}, timeout=5.0) is custom
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_limits_applied(self):
+        """Each client is created with the registry's connection limits."""
+        registry = HTTPClientRegistry(max_connections=7, max_keepalive=3)
+        registry.get(OPEN_METEO)
+        assert registry.stats()["max_connections"] == 7
+        assert registry.stats()["max_keepalive"] == 3
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_recreated(self):
+        """A client closed out from under the registry is replaced."""
+        registry = HTTPClientRegistry()
+        first = registry.get(OPEN_METEO)
+        await first.aclose()
+        second = registry.get(OPEN_METEO)
+        assert second is not first
+        assert not second.is_closed
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_all_clients(self):
+        """Shutdown closes every client and empties the registry."""
+        registry = HTTPClientRegistry()
+        clients = [registry.get(OPEN_METEO), registry.get(OPEN_TOPO_DATA)]
+        await registry.aclose()
+        assert all(c.is_closed for c in clients)
+        assert registry.stats()["clients"] == []
+
+    def test_http2_requires_h2(self):
+        """HTTP/2 is disabled with a warning when h2 isn't installed."""
+        with patch.object(http_clients, "_h2_available", return_value=False):
+            registry = HTTPClientRegistry(http2=True)
+        assert registry.http2 is False
+
+
+class TestSharedClientUsage:
+    """Providers and elevation lookups use the shared registry."""
+
+    @pytest.mark.asyncio
+    async def test_openmeteo_providers_share_client(self):
+        """Every OpenMeteoProvider instance uses one pooled client."""
+        hrrr = OpenMeteoProvider(model=OpenMeteoModel.HRRR)
+        ecmwf = OpenMeteoProvider(model=OpenMeteoModel.ECMWF)
+        assert await hrrr._get_client() is await ecmwf._get_client()
+        assert (await hrrr._get_client())._transport is get_http_client(OPEN_METEO)._transport
+
+    @pytest.mark.asyncio
+    async def test_provider_timeout_honoured(self):
+        """A provider's timeout= applies even when another provider created the pool first."""
+        await OpenMeteoProvider()._get_client()
+        client = await OpenMeteoProvider(timeout=5.0)._get_client()
+        assert client.timeout.read == 5.0
+
+    @pytest.mark.asyncio
+    async def test_elevation_calls_reuse_client(self):
+        """Point and bulk elevation lookups reuse one client instead of one per call."""
+        from app.services import elevation
+
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            count = request.url.params["locations"].count("|") + 1
+            return httpx.Response(200, json={
+                "status": "OK",
+                "results": [{"elevation": 1000.0}] * count,
+            })
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(elevation, "get_http_client", return_value=client) as get_client:
+            assert await elevation.get_point_elevation(-43.1, 146.2) == 1000.0
+            assert await elevation.get_bulk_elevations([(-43.1, 146.2), (-43.2, 146.3)]) == [1000.0, 1000.0]
+
+        assert len(requests) == 2
+        assert get_client.call_count == 2
+        assert not client.is_closed
+        await client.aclose()
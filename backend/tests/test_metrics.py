@@ -0,0 +1,285 @@
+"""
+Tests for the in-process metrics registry.
+
+Tests:
+- Latency histograms per provider/endpoint/status, percentiles from buckets
+- Upstream requests timed by the pooled clients' transport, IDs collapsed
+- BOMService's Open-Meteo requests recorded under open-meteo, not bom
+- Cache hit/miss/stale/coalesced counters from each cache layer
+- Prometheus text at /metrics, admin key required
+- Interval snapshots persisted to app_metrics (one row per endpoint), not health checks
+"""
+import asyncio
+import json
+import sqlite3
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.bom import BOMService
+from app.services.http_clients import BOM, OPEN_METEO, InstrumentedTransport, endpoint_label
+from app.services.metrics import (
+    COALESCED,
+    HIT,
+    MISS,
+    STALE,
+    Histogram,
+    get_metrics,
+    persist_metrics_snapshot,
+    reset_metrics,
+)
+from app.services.terrain_cache import TerrainCache
+from app.services.weather.base import NormalizedDailyForecast
+from app.services.weather.cache import WeatherCache
+from app.services.weather.router import WeatherRouter
+from app.services.weather_cache import WeatherCache as LegacyWeatherCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    """Start and finish each test with an empty registry."""
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def make_forecast() -> NormalizedDailyForecast:
+    return NormalizedDailyForecast(
+        provider="Open-Meteo", lat=40.0, lon=-74.0, country_code="US",
+        periods=[], alerts=[], fetched_at=datetime.now(timezone.utc),
+    )
+
+
+class TestHistogram:
+    """Tests for the bucketed latency histogram."""
+
+    def test_percentiles_from_buckets(self):
+        """Percentiles report the upper bound of the bucket they fall in."""
+        histogram = Histogram((0.1, 0.5, 1.0))
+        for seconds in (0.05, 0.05, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.8, 5.0):
+            histogram.observe(seconds)
+
+        assert histogram.count == 10
+        assert histogram.percentile(0.5) == 0.5
+        assert histogram.percentile(0.9) == 1.0
+        assert histogram.percentile(0.99) == 1.0  # Past the last bound
+        assert Histogram().percentile(0.5) is None
+
+    def test_interval_snapshot_reports_only_new_samples(self):
+        """Each interval snapshot covers what happened since the previous one."""
+        metrics = get_metrics()
+        metrics.observe_upstream("bom", "/v1/locations/*/forecasts/daily", "200", 0.2)
+        metrics.count_cache("weather", HIT)
+
+        first = metrics.interval_snapshot()
+        metrics.observe_upstream("bom", "/v1/locations/*/forecasts/daily", "200", 0.4)
+        second = metrics.interval_snapshot()
+
+        assert first["upstream"][0]["count"] == 1
+        assert second["upstream"][0]["count"] == 1
+        assert second["upstream"][0]["mean_ms"] == pytest.approx(400.0)
+        assert "weather" not in second["caches"]
+        assert metrics.interval_snapshot() == {"upstream": [], "caches": {}}
+        assert metrics.snapshot()["upstream"][0]["count"] == 2
+
+
+class TestUpstreamLatency:
+    """Tests for request timing in the pooled clients."""
+
+    def test_endpoint_label_collapses_identifiers(self):
+        """Geohashes, coordinates and NWS grid ids don't become separate series."""
+        assert endpoint_label(httpx.URL(
+            "https://api.weather.bom.gov.au/v1/locations/r22489/forecasts/hourly"
+        )) == "/v1/locations/*/forecasts/hourly"
+        assert endpoint_label(httpx.URL("https://api.weather.gov/points/40.0,-74.0")) == "/points/*"
+        assert endpoint_label(httpx.URL(
+            "https://api.weather.gov/gridpoints/OKX/33,35/forecast"
+        )) == "/gridpoints/*/*/forecast"
+        assert endpoint_label(httpx.URL(
+            "https://api.open-meteo.com/v1/forecast?latitude=1,2"
+        )) == "/v1/forecast"
+
+    @pytest.mark.asyncio
+    async def test_requests_recorded_by_status(self):
+        """Responses are recorded per endpoint and status once their body is read."""
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if "daily" in request.url.path:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"data": []})
+
+        transport = InstrumentedTransport(httpx.MockTransport(handler), "bom")
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://api.weather.bom.gov.au/v1/locations/r22489/forecasts/hourly")
+            await client.get("https://api.weather.bom.gov.au/v1/locations/r0zzzz/forecasts/hourly")
+            await client.get("https://api.weather.bom.gov.au/v1/locations/r22489/forecasts/daily")
+
+        series = {(s["endpoint"], s["status"]): s for s in get_metrics().snapshot()["upstream"]}
+        assert series[("/v1/locations/*/forecasts/hourly", "200")]["count"] == 2
+        assert series[("/v1/locations/*/forecasts/daily", "503")]["count"] == 1
+        assert all(s["provider"] == "bom" for s in series.values())
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_recorded(self):
+        """A request with no response is recorded with status "error"."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        transport = InstrumentedTransport(httpx.MockTransport(handler), "nws")
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("https://api.weather.gov/alerts/active")
+
+        [series] = get_metrics().snapshot()["upstream"]
+        assert (series["provider"], series["endpoint"], series["status"]) == ("nws", "/alerts/active", "error")
+
+
+    @pytest.mark.asyncio
+    async def test_bom_supplement_attributed_to_open_meteo(self):
+        """Supplements go through the Open-Meteo client, so their latency isn't labelled bom."""
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"hourly": {"time": []}})
+
+        clients = {}
+
+        def pooled_client(name, **kwargs):
+            if name not in clients:
+                clients[name] = httpx.AsyncClient(
+                    transport=InstrumentedTransport(httpx.MockTransport(handler), name), **kwargs
+                )
+            return clients[name]
+
+        with patch("app.services.bom.get_http_client", side_effect=pooled_client):
+            await BOMService(use_mock=False)._fetch_supplement_chunk([(-43.1486, 146.2722)])
+
+        [series] = get_metrics().snapshot()["upstream"]
+        assert (series["provider"], series["endpoint"]) == (OPEN_METEO, "/v1/forecast")
+        assert set(clients) == {OPEN_METEO} and BOM not in clients
+
+
+class TestCacheCounters:
+    """Tests for the cache layers' hit/miss/stale/coalesced counters."""
+
+    def test_weather_cache_counts(self):
+        """WeatherCache counts hits, misses (including expired) and stale serves."""
+        cache = WeatherCache()
+        cache.get("test", 40.0, -74.0, 7)
+        cache.set("test", 40.0, -74.0, 7, make_forecast())
+        cache.get("test", 40.0, -74.0, 7)
+
+        key = cache.key_for("test", 40.0, -74.0, 7)
+        forecast, _ = cache._cache[key]
+        cache._cache[key] = (forecast, datetime.now(timezone.utc) - timedelta(minutes=5))
+        cache.get("test", 40.0, -74.0, 7)
+        cache.get_stale("test", 40.0, -74.0, 7)
+
+        assert get_metrics().cache_counters("weather") == {HIT: 1, MISS: 2, STALE: 1, COALESCED: 0}
+        assert get_metrics().snapshot()["caches"]["weather"]["hit_rate"] == pytest.approx(0.333)
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["stale_hits"]) == (1, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_router_counts_coalesced_requests(self):
+        """Callers joining an in-flight fetch are counted as coalesced."""
+        router = WeatherRouter()
+        router.cache = WeatherCache()
+
+        async def slow_forecast(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return make_forecast()
+
+        router.fallback.get_forecast = AsyncMock(side_effect=slow_forecast)
+        await asyncio.gather(*(router.get_forecast(45.0, 6.8, "ZZ", days=2) for _ in range(3)))
+
+        assert get_metrics().cache_counters("weather")[COALESCED] == 2
+
+    def test_legacy_and_terrain_caches_count(self):
+        """weather_cache.py and the terrain namespaces report hits and misses."""
+        legacy = LegacyWeatherCache()
+        legacy.get(-43.1, 146.2)
+        legacy.set(-43.1, 146.2, {"temp": 5})
+        legacy.get(-43.1, 146.2)
+
+        grid = TerrainCache("nws_grid", store=None)
+        grid.get("40.0000,-74.0000")
+        grid.set("40.0000,-74.0000", {"office": "OKX"})
+        grid.get("40.0000,-74.0000")
+
+        assert get_metrics().cache_counters("weather_legacy")[HIT] == 1
+        assert get_metrics().cache_counters("weather_legacy")[MISS] == 1
+        assert get_metrics().cache_counters("nws_grid")[HIT] == 1
+        assert get_metrics().cache_counters("nws_grid")[MISS] == 1
+
+
+class TestExposure:
+    """Tests for /metrics and snapshot persistence."""
+
+    @pytest.mark.asyncio
+    async def test_prometheus_endpoint(self):
+        """GET /metrics returns histograms and counters in Prometheus text format."""
+        from app.main import metrics as metrics_endpoint
+
+        get_metrics().observe_upstream("open-meteo", "/v1/forecast", "200", 0.3)
+        get_metrics().count_cache("point_elevation", MISS)
+
+        text = await metrics_endpoint()
+
+        labels = 'provider="open-meteo",endpoint="/v1/forecast",status="200"'
+        assert f'thunderbird_upstream_request_seconds_bucket{{{labels},le="0.25"}} 0' in text
+        assert f'thunderbird_upstream_request_seconds_bucket{{{labels},le="0.5"}} 1' in text
+        assert f'thunderbird_upstream_request_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f"thunderbird_upstream_request_seconds_count{{{labels}}} 1" in text
+        assert 'thunderbird_cache_requests_total{cache="point_elevation",result="miss"} 1' in text
+
+    def test_prometheus_endpoint_requires_admin_key(self):
+        """/metrics exposes upstream names and error counts, so it isn't public."""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from config.settings import settings
+
+        client = TestClient(app)
+        with patch.object(settings, "ADMIN_PASSWORD", "secret"):
+            assert client.get("/metrics").status_code in (403, 422)
+            assert client.get("/metrics", headers={"X-Admin-Key": "wrong"}).status_code == 403
+            response = client.get("/metrics", headers={"X-Admin-Key": "secret"})
+
+        assert response.status_code == 200
+        assert "thunderbird_upstream_request_seconds" in response.text
+
+    def test_snapshot_persisted_outside_health_checks(self, tmp_path):
+        """Interval snapshots go to app_metrics, one row per endpoint, never the checks table."""
+        from monitoring.config import settings as monitoring_settings
+        from monitoring.storage import get_all_latest_statuses
+
+        db_path = tmp_path / "monitoring.db"
+        metrics = get_metrics()
+        metrics.observe_upstream("bom", "/v1/locations/*/forecasts/daily", "200", 0.2)
+        metrics.observe_upstream("bom", "/v1/locations/*/forecasts/daily", "200", 0.2)
+        metrics.observe_upstream("bom", "/v1/locations/*/forecasts/daily", "error", 30.0)
+        metrics.observe_upstream("bom", "/v1/locations/*/forecasts/daily", "503", 0.1)
+        metrics.count_cache("weather", HIT)
+
+        with patch.object(monitoring_settings, "MONITOR_DB_PATH", str(db_path)):
+            assert persist_metrics_snapshot() == 2
+            assert persist_metrics_snapshot() == 0  # Nothing new since
+            assert get_all_latest_statuses() == []
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT series, metadata FROM app_metrics ORDER BY series").fetchall()
+        conn.close()
+
+        assert [series for series, _ in rows] == [
+            "cache:weather",
+            "upstream:bom:/v1/locations/*/forecasts/daily",
+        ]
+        upstream = json.loads(rows[1][1])
+        assert upstream["statuses"] == {"200": 2, "503": 1, "error": 1}
+        assert upstream["error_count"] == 2
+        assert upstream["count"] == 4
+        assert upstream["p50_ms"] == 250.0
+        assert json.loads(rows[0][1])["hit"] == 1
@@ -0,0 +1,169 @@
+"""
+Tests for the recent precipitation history cache.
+
+Tests:
+- 24/48/72h totals rolled forward from a fetched series
+- Repeat lookups within a UTC hour served from cache
+- Next hour fetches only the newest hours
+- Batched, single-flight updates; failures keep the last totals
+"""
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.weather.precip_history import (
+    PrecipHistory,
+    PrecipHistoryCache,
+    current_utc_hour,
+)
+from config.settings import settings
+
+POINTS = [(-43.1486, 146.2722), (45.0, 6.8), (-43.14865, 146.27225)]
+
+
+def stamps(hour: datetime, count: int) -> list:
+    """GMT timestamps for the `count` hours up to and including `hour`."""
+    return [(hour - timedelta(hours=n)).strftime("%Y-%m-%dT%H:%M") for n in reversed(range(count))]
+
+
+def history_transport(rain: float = 1.0, fail: bool = False):
+    """Mock Open-Meteo answering past_hours requests; returns (transport, requests)."""
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        await asyncio.sleep(0.01)
+        if fail:
+            return httpx.Response(503)
+        count = int(request.url.params["past_hours"]) + 1
+        hourly = {"time": stamps(current_utc_hour(), count), "precipitation": [rain] * count, "snowfall": [0.0] * count}
+        lats = request.url.params["latitude"].split(",")
+        locations = [{"hourly": hourly} for _ in lats]
+        return httpx.Response(200, json=locations if len(lats) > 1 else locations[0])
+
+    return httpx.MockTransport(handler), requests
+
+
+class TestPrecipHistory:
+    """Tests for one cell's rolling series."""
+
+    def test_totals_per_horizon(self):
+        """Sums cover the 24/48/72 hours up to the current hour."""
+        hour = datetime(2026, 1, 28, 12, tzinfo=timezone.utc)
+        history = PrecipHistory()
+
+        history.roll_forward(hour, stamps(hour, 73), [1.0] * 72 + [2.0], [0.5] * 73)
+
+        assert history.totals["rain_24h"] == 25.0
+        assert history.totals["rain_72h"] == 73.0
+        assert history.totals["snow_48h"] == 24.0
+        assert len(history.hours) == 72
+
+    def test_roll_forward_replaces_and_drops(self):
+        """A new hour replaces the held hour's value and ages out the oldest."""
+        hour = datetime(2026, 1, 28, 12, tzinfo=timezone.utc)
+        history = PrecipHistory()
+        history.roll_forward(hour, stamps(hour, 72), [1.0] * 72, [None] * 72)
+
+        later = hour + timedelta(hours=1)
+        assert history.missing_hours(later) == 1
+        history.roll_forward(later, stamps(later, 2), [3.0, 0.0], [0.0, 0.0])
+
+        assert history.through == later
+        assert history.hours[hour] == (3.0, 0.0)
+        assert history.totals["rain_72h"] == 73.0  # 70 x 1.0 + 3.0 + 0.0
+        assert min(history.hours) == later - timedelta(hours=71)
+
+    def test_future_and_bad_hours_ignored(self):
+        """Forecast hours past `hour` and unparseable timestamps are skipped."""
+        hour = datetime(2026, 1, 28, 12, tzinfo=timezone.utc)
+        history = PrecipHistory()
+
+        history.roll_forward(hour, ["bad", "2026-01-28T12:00", "2026-01-28T13:00"], [9.0, 1.0, 9.0], [])
+
+        assert history.totals["rain_24h"] == 1.0
+
+
+class TestPrecipHistoryCache:
+    """Tests for the per-cell cache and its incremental updates."""
+
+    @pytest.mark.asyncio
+    async def test_cached_within_hour(self):
+        """A second lookup in the same UTC hour makes no request."""
+        transport, requests = history_transport()
+        cache = PrecipHistoryCache()
+        async with httpx.AsyncClient(transport=transport) as client:
+            first = await cache.get_recent(client, POINTS[:1])
+            second = await cache.get_recent(client, POINTS[:1])
+
+        assert len(requests) == 1
+        assert requests[0]["past_hours"] == "72"
+        assert "past_days" not in requests[0]
+        assert first == second
+        assert first[0]["rain_24h"] == 24.0
+
+    @pytest.mark.asyncio
+    async def test_next_hour_fetches_newest_hours_only(self):
+        """An update an hour later asks for one past hour, not 72."""
+        transport, requests = history_transport()
+        cache = PrecipHistoryCache()
+        async with httpx.AsyncClient(transport=transport) as client:
+            await cache.get_recent(client, POINTS[:1])
+            history = cache._cells[cache.cell_key(*POINTS[0])]
+            history.through -= timedelta(hours=1)
+            await cache.get_recent(client, POINTS[:1])
+
+        assert [r["past_hours"] for r in requests] == ["72", "1"]
+
+    @pytest.mark.asyncio
+    async def test_cells_batched_and_shared(self):
+        """Distinct cells go in one request; concurrent callers share it."""
+        transport, requests = history_transport()
+        cache = PrecipHistoryCache()
+        async with httpx.AsyncClient(transport=transport) as client:
+            results = await asyncio.gather(
+                cache.get_recent(client, POINTS),
+                cache.get_recent(client, POINTS[:1]),
+            )
+
+        assert len(requests) == 1
+        assert requests[0]["latitude"].count(",") == 1  # Points 0 and 2 share a cell
+        assert all(totals is not None for totals in results[0])
+        assert results[1][0] == results[0][0]
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_chunked_by_max_locations(self):
+        """Cells are sent OPEN_METEO_MAX_LOCATIONS per request."""
+        transport, requests = history_transport()
+        cache = PrecipHistoryCache()
+        points = [(45.0 + i / 10, 6.8) for i in range(5)]
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(settings, "OPEN_METEO_MAX_LOCATIONS", 2):
+                results = await cache.get_recent(client, points)
+
+        assert len(requests) == 3
+        assert all(totals is not None for totals in results)
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_last_totals(self):
+        """A failed update serves the previous totals; unknown cells get None."""
+        transport, _ = history_transport(rain=2.0)
+        failing, _ = history_transport(fail=True)
+        cache = PrecipHistoryCache()
+        async with httpx.AsyncClient(transport=transport) as client:
+            before = await cache.get_recent(client, POINTS[:1])
+        cache._cells[cache.cell_key(*POINTS[0])].through -= timedelta(hours=2)
+
+        async with httpx.AsyncClient(transport=failing) as client:
+            after = await cache.get_recent(client, POINTS[:2])
+
+        assert after[0] == before[0]
+        assert after[1] is None
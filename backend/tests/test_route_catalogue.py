@@ -0,0 +1,166 @@
+"""
+Tests for the hot-reloadable route catalogue.
+
+Tests:
+- Every route file loaded once; RouteLoader delegates to the catalogue
+- Edited files re-parsed on refresh, unchanged Route objects reused
+- Added and removed files picked up; unparseable files keep their old version
+- Listeners called with each new snapshot
+- Template endpoints serve precomputed bodies with ETags and 304s
+"""
+import json
+import os
+import shutil
+import pytest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.route_catalogue import RouteCatalogue
+from app.services.routes import RouteLoader
+from config.settings import ROUTES_DIR
+
+
+@pytest.fixture
+def routes_dir(tmp_path):
+    """Copy of two bundled route files."""
+    directory = tmp_path / "routes"
+    directory.mkdir()
+    for name in ("overland_track.json", "western_arthurs_ak.json"):
+        shutil.copy(ROUTES_DIR / name, directory / name)
+    return directory
+
+
+@pytest.fixture
+def catalogue(routes_dir):
+    return RouteCatalogue(routes_dir)
+
+
+def touch_later(path: Path) -> None:
+    """Bump a file's mtime so polling sees a change."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def rename_first_camp(path: Path, name: str) -> None:
+    data = json.loads(path.read_text())
+    data["camps"][0]["name"] = name
+    path.write_text(json.dumps(data))
+    touch_later(path)
+
+
+class TestLoading:
+    """Tests for loading and reloading route files."""
+
+    def test_routes_loaded_once(self, catalogue):
+        """Routes are parsed on first use; later reads don't touch the filesystem."""
+        assert catalogue.route_ids() == ["overland_track", "western_arthurs_ak"]
+
+        with patch.object(Path, "glob", side_effect=AssertionError("globbed")):
+            assert catalogue.get("overland_track").name
+            assert catalogue.get("nope") is None
+            assert catalogue.route_ids() == ["overland_track", "western_arthurs_ak"]
+
+    def test_refresh_reloads_only_changed_files(self, catalogue, routes_dir):
+        """An edited file is re-parsed; the other Route and its payload are reused."""
+        before = catalogue.snapshot
+        assert catalogue.refresh() is False
+
+        rename_first_camp(routes_dir / "overland_track.json", "Ronny Creek (renamed)")
+        assert catalogue.refresh() is True
+
+        after = catalogue.snapshot
+        assert after.version == before.version + 1
+        assert after.routes["overland_track"].camps[0].name == "Ronny Creek (renamed)"
+        assert after.routes["western_arthurs_ak"] is before.routes["western_arthurs_ak"]
+        assert after.details["western_arthurs_ak"] is before.details["western_arthurs_ak"]
+        assert after.details["overland_track"].etag != before.details["overland_track"].etag
+        assert before.routes["overland_track"].camps[0].name != "Ronny Creek (renamed)"
+
+    def test_added_and_removed_files(self, catalogue, routes_dir):
+        """New files appear and deleted files disappear on refresh."""
+        catalogue.snapshot
+        shutil.copy(ROUTES_DIR / "federation_peak.json", routes_dir / "federation_peak.json")
+        (routes_dir / "western_arthurs_ak.json").unlink()
+
+        assert catalogue.refresh() is True
+        assert catalogue.route_ids() == ["federation_peak", "overland_track"]
+        assert catalogue.get("western_arthurs_ak") is None
+
+    def test_unparseable_file_keeps_previous_version(self, catalogue, routes_dir):
+        """A broken edit leaves the old route in place and is retried next poll."""
+        path = routes_dir / "overland_track.json"
+        held = catalogue.get("overland_track")
+
+        path.write_text('{"route_id": "overland_track", "camps": [')
+        touch_later(path)
+        catalogue.refresh()
+        assert catalogue.get("overland_track") is held
+
+        shutil.copy(ROUTES_DIR / "overland_track.json", path)
+        touch_later(path)
+        assert catalogue.refresh() is True
+        assert catalogue.get("overland_track") is not held
+
+    def test_listeners_get_new_snapshots(self, catalogue, routes_dir):
+        """Listeners are called once per swapped-in snapshot."""
+        seen = []
+        catalogue.add_listener(seen.append)
+        catalogue.snapshot
+        catalogue.refresh()
+        rename_first_camp(routes_dir / "overland_track.json", "Renamed")
+        catalogue.refresh()
+
+        assert [snapshot.version for snapshot in seen] == [1, 2]
+        catalogue.remove_listener(seen.append)
+        rename_first_camp(routes_dir / "overland_track.json", "Again")
+        catalogue.refresh()
+        assert len(seen) == 2
+
+    def test_route_loader_delegates(self, catalogue):
+        """RouteLoader.load and list_routes read the catalogue."""
+        with patch("app.services.route_catalogue.get_route_catalogue", return_value=catalogue):
+            assert RouteLoader.list_routes() == ["overland_track", "western_arthurs_ak"]
+            assert RouteLoader.load("overland_track") is catalogue.get("overland_track")
+
+
+class TestTemplateEndpoints:
+    """Tests for the precomputed /route-templates payloads."""
+
+    @pytest.mark.asyncio
+    async def test_listing_with_etag(self, catalogue):
+        """The listing is served with an ETag; a matching If-None-Match gets 304."""
+        from app.routers.api import list_route_templates
+
+        with patch("app.routers.api.get_route_catalogue", return_value=catalogue):
+            response = await list_route_templates(if_none_match=None)
+            etag = response.headers["etag"]
+            cached = await list_route_templates(if_none_match=f'"other", {etag}')
+
+        routes = json.loads(response.body)["routes"]
+        assert response.status_code == 200
+        assert [r["route_id"] for r in routes] == ["overland_track", "western_arthurs_ak"]
+        assert {"name", "distance_km", "grade", "is_loop"} <= routes[0].keys()
+        assert cached.status_code == 304
+        assert cached.body == b""
+
+    @pytest.mark.asyncio
+    async def test_detail_changes_with_file(self, catalogue, routes_dir):
+        """Detail payloads get a new ETag when their file changes; unknown routes 404."""
+        from fastapi import HTTPException
+        from app.routers.api import get_route_template_info
+
+        with patch("app.routers.api.get_route_catalogue", return_value=catalogue):
+            first = await get_route_template_info("overland_track", if_none_match=None)
+            rename_first_camp(routes_dir / "overland_track.json", "Renamed")
+            catalogue.refresh()
+            second = await get_route_template_info("overland_track", if_none_match=first.headers["etag"])
+            with pytest.raises(HTTPException) as missing:
+                await get_route_template_info("nope", if_none_match=None)
+
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+        assert json.loads(second.body)["camps"][0]["name"] == "Renamed"
+        assert missing.value.status_code == 404
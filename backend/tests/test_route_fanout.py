@@ -0,0 +1,94 @@
+"""
+Tests for cell-deduplicated route forecast fan-out.
+
+Tests:
+- One fetch per weather zone, not per waypoint
+- Temperatures lapse-rate adjusted per waypoint
+- A failed zone drops only its own waypoints
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.bom import CellForecast, ForecastPeriod
+from app.services.route_fanout import fetch_route_forecasts, forecast_for_waypoint, group_by_zone
+from app.services.routes import Waypoint
+
+
+def make_waypoint(code: str, zone: str, elevation: int, lat: float = -43.1) -> Waypoint:
+    return Waypoint(code=code, name=code, lat=lat, lon=146.2, elevation=elevation, bom_cell=zone)
+
+
+def make_forecast(lat: float, lon: float, base_elevation: int = 500) -> CellForecast:
+    now = datetime.now(timezone.utc)
+    period = ForecastPeriod(
+        datetime=now, period="AM", temp_min=5.0, temp_max=10.0,
+        rain_chance=20, rain_min=0, rain_max=2, snow_min=0, snow_max=0,
+        wind_avg=20, wind_max=35, cloud_cover=50, cloud_base=1200,
+        freezing_level=1500, cape=0,
+    )
+    return CellForecast(
+        cell_id="zone", geohash="r22u0", lat=lat, lon=lon,
+        base_elevation=base_elevation, periods=[period],
+        fetched_at=now, expires_at=now + timedelta(hours=1),
+    )
+
+
+class TestRouteFanout:
+    """Tests for fetch_route_forecasts."""
+
+    def test_group_by_zone_keeps_route_order(self):
+        """Zones appear in order of their first waypoint."""
+        waypoints = [make_waypoint("A", "1-1", 800), make_waypoint("B", "2-2", 900), make_waypoint("C", "1-1", 850)]
+        zones = group_by_zone(waypoints)
+        assert list(zones) == ["1-1", "2-2"]
+        assert [w.code for w in zones["1-1"]] == ["A", "C"]
+
+    @pytest.mark.asyncio
+    async def test_one_fetch_per_zone(self):
+        """Waypoints sharing a zone share one point in the batch fetch."""
+        batches = []
+
+        async def fetch_many(points):
+            batches.append(points)
+            return [make_forecast(lat, lon) for lat, lon in points]
+
+        waypoints = [make_waypoint(c, z, 800) for c, z in [("A", "1-1"), ("B", "1-1"), ("C", "2-2"), ("D", "1-1")]]
+        results = await fetch_route_forecasts(waypoints, fetch_many)
+
+        assert len(batches) == 1
+        assert len(batches[0]) == 2
+        assert list(results) == ["A", "B", "C", "D"]
+
+    @pytest.mark.asyncio
+    async def test_temps_adjusted_per_waypoint(self):
+        """Each waypoint's temps are adjusted from the model elevation."""
+        async def fetch_many(points):
+            return [make_forecast(lat, lon, base_elevation=500) for lat, lon in points]
+
+        waypoints = [make_waypoint("LOW", "1-1", 500), make_waypoint("HIGH", "1-1", 1500)]
+        results = await fetch_route_forecasts(waypoints, fetch_many)
+
+        assert results["LOW"].periods[0].temp_max == pytest.approx(10.0)
+        assert results["HIGH"].periods[0].temp_max == pytest.approx(3.5)    # 1000m * 0.65/100m
+        assert results["HIGH"].periods[0].freezing_level == 1500            # Not elevation dependent
+
+    def test_zone_forecast_not_mutated(self):
+        """Deriving a waypoint forecast leaves the shared zone forecast alone."""
+        forecast = make_forecast(-43.1, 146.2, base_elevation=500)
+        forecast_for_waypoint(forecast, make_waypoint("HIGH", "1-1", 1500))
+        assert forecast.periods[0].temp_max == 10.0
+
+    @pytest.mark.asyncio
+    async def test_failed_zone_drops_only_its_waypoints(self):
+        """A zone that fails to fetch doesn't fail the whole route."""
+        async def fetch_many(points):
+            return [None if lat < -43.5 else make_forecast(lat, lon) for lat, lon in points]
+
+        waypoints = [make_waypoint("OK", "1-1", 800), make_waypoint("BAD", "2-2", 800, lat=-43.6)]
+        results = await fetch_route_forecasts(waypoints, fetch_many)
+
+        assert list(results) == ["OK"]
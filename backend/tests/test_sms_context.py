@@ -0,0 +1,133 @@
+"""
+Tests for the per-message SMS request context.
+
+Tests:
+- User, account, active trail and balance each loaded at most once
+- Missing user/account remembered (no repeat lookups)
+- Database round trips (pooled connection checkouts) per inbound message,
+  by command type
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import create_test_tables
+from app.models.account import AccountStore
+from app.models.database import SQLiteUserStore
+from app.models.payments import BalanceStore
+from app.models.sqlite_pool import get_connection_pool
+from app.routers import webhook
+from app.services.balance import BalanceService
+from app.services.command_latency import CommandLatencyTracker
+from app.services.sms_context import SMSRequestContext
+from app.services.waypoint_index import get_waypoint_index
+
+PHONE = "+61412345678"
+
+
+@pytest.fixture
+def stores(tmp_path):
+    """User/account/balance stores on a temp database with one linked hiker."""
+    db_path = str(tmp_path / "thunderbird.db")
+    create_test_tables(db_path)
+    users = SQLiteUserStore(db_path)
+    accounts = AccountStore(db_path)
+    balances = BalanceStore(db_path)
+
+    users.create_user(PHONE, "overland_track", unit_system="imperial")
+    account = accounts.create("hiker@example.com", "hash")
+    accounts.link_phone(account.id, PHONE)
+    accounts.update_stripe_customer_id(account.id, "cus_test")
+    balances.add_credits(account.id, 150, "Test credit")
+    get_waypoint_index().lookup("LAKEO")  # Built once per process, not per message
+
+    with patch("app.models.database.user_store", users), \
+            patch("app.models.account.account_store", accounts), \
+            patch("app.services.balance.get_balance_service", return_value=BalanceService(balances)):
+        yield users, accounts, balances
+
+
+class StubRequest:
+    """Just enough of a Starlette request for the inbound webhook."""
+
+    def __init__(self, body: str):
+        self.body = body
+        self.url = "https://thunderbird.bot/webhook/sms/inbound"
+
+    async def form(self):
+        return {"From": PHONE, "Body": self.body}
+
+
+class TestContext:
+    """Tests for lazy, cached lookups."""
+
+    def test_each_lookup_once(self, stores):
+        users, accounts, balances = stores
+        with patch.object(users, "get_user", wraps=users.get_user) as get_user, \
+                patch.object(accounts, "get_by_phone", wraps=accounts.get_by_phone) as get_by_phone, \
+                patch.object(balances, "get_balance", wraps=balances.get_balance) as get_balance:
+            context = SMSRequestContext(PHONE)
+            for _ in range(3):
+                assert context.unit_system == "imperial"
+                assert context.account.stripe_customer_id == "cus_test"
+                assert context.balance_cents == 150
+                assert context.active_trail_id is None
+
+        assert (get_user.call_count, get_by_phone.call_count, get_balance.call_count) == (1, 1, 1)
+
+    def test_missing_sender_remembered(self, stores):
+        """An unknown phone is looked up once, then treated as absent."""
+        users, accounts, _ = stores
+        with patch.object(users, "get_user", wraps=users.get_user) as get_user, \
+                patch.object(accounts, "get_by_phone", wraps=accounts.get_by_phone) as get_by_phone:
+            context = SMSRequestContext("+61499999999")
+            for _ in range(2):
+                assert context.user is None and context.account is None
+                assert context.balance_cents is None and context.active_trail_id is None
+                assert context.unit_system == "metric"
+
+        assert (get_user.call_count, get_by_phone.call_count) == (1, 1)
+
+
+class TestRoundTrips:
+    """Database round trips per inbound message."""
+
+    @pytest.mark.parametrize("body, round_trips", [
+        ("CAST LAKEO", 3),    # account, user (units), balance
+        ("CAST7 CAMPS", 3),   # account, active trail, user
+        ("HELP", 1),          # account (beta gate)
+        ("SAFELIST", 3),      # account, user, contacts
+    ])
+    @pytest.mark.asyncio
+    async def test_round_trips_per_command(self, stores, body, round_trips):
+        users, _, _ = stores
+        pool = get_connection_pool()
+
+        with patch("app.services.bom.get_bom_service", return_value=AsyncMock()), \
+                patch("app.services.formatter.FormatCastLabeled.format", return_value="Forecast"), \
+                patch("app.routers.webhook.get_command_latency", return_value=CommandLatencyTracker(budget=30)), \
+                patch("app.routers.webhook.log_twiml_response"), \
+                patch.object(users, "log_message"), \
+                patch.object(pool, "connection", wraps=pool.connection) as connection:
+            response = await webhook.handle_inbound_sms(StubRequest(body))
+
+        assert b"<Message>" in response.body
+        assert connection.call_count == round_trips
+
+    @pytest.mark.asyncio
+    async def test_low_balance_warning_uses_context(self, stores):
+        """CAST reuses the gate's account and appends the low-balance warning."""
+        _, accounts, _ = stores
+        with patch.object(accounts, "get_by_phone", wraps=accounts.get_by_phone) as get_by_phone, \
+                patch("app.services.bom.get_bom_service", return_value=AsyncMock()), \
+                patch("app.services.formatter.FormatCastLabeled.format", return_value="Forecast"), \
+                patch("app.routers.webhook.get_command_latency", return_value=CommandLatencyTracker(budget=30)), \
+                patch("app.routers.webhook.log_twiml_response"), \
+                patch("app.models.database.user_store.log_message"):
+            response = await webhook.handle_inbound_sms(StubRequest("CAST LAKEO"))
+
+        assert b"Low balance: $1.50" in response.body
+        assert get_by_phone.call_count == 1
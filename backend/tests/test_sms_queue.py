@@ -0,0 +1,217 @@
+"""
+Tests for the durable outbound SMS queue.
+
+Tests:
+- Enqueued messages persist and survive a restart (including mid-send)
+- Per-recipient ordering with the inter-message gap; other recipients not held up
+- Sends paced per sender number
+- Failed sends retried with backoff, then given up on
+- Results written back in one transaction per pass
+- SafeCheck notifications are queued rather than sent inline
+"""
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.sms import SMSMessage
+from app.services.sms_queue import FAILED, PENDING, SENT, OutboxStore, QueuedSMS, SMSQueue
+
+ALICE = "+61412345678"
+BOB = "+61487654321"
+
+
+class FakeSMSService:
+    """Records sends; bodies in `failures` fail that many times first."""
+
+    def __init__(self, failures=None, sender=lambda to: "+61400000000"):
+        self.sent = []
+        self.failures = dict(failures or {})
+        self.sender = sender
+
+    def get_from_number(self, to: str) -> str:
+        return self.sender(to)
+
+    async def send_message(self, to, body, command_type=None, message_type="response"):
+        await asyncio.sleep(0)
+        if self.failures.get(body):
+            self.failures[body] -= 1
+            return SMSMessage(to=to, body=body, segments=1, cost_cents=0, error="Twilio error 20503")
+        self.sent.append((to, body, time.monotonic()))
+        return SMSMessage(to=to, body=body, segments=1, cost_cents=5, sid=f"SM{len(self.sent)}")
+
+
+def make_queue(service, store=None, **kwargs) -> SMSQueue:
+    options = dict(workers=4, sender_rate=0, recipient_gap=0, max_retries=2, retry_delay=0.02)
+    options.update(kwargs)
+    return SMSQueue(store=store or OutboxStore(":memory:"), sms_service=service, **options)
+
+
+async def drain(queue: SMSQueue, timeout: float = 3.0) -> None:
+    """Run until nothing is pending or in flight."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = queue.stats()
+        if stats[PENDING] == 0 and stats["sending"] == 0 and stats["in_flight"] == 0:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Queue did not drain: {queue.stats()}")
+
+
+class TestDurability:
+    """Tests for the SQLite outbox."""
+
+    def test_enqueue_normalizes_and_persists(self, tmp_path):
+        """Queued rows are written to disk with the sender chosen up front."""
+        db_path = str(tmp_path / "queue.db")
+        queue = make_queue(FakeSMSService(), store=OutboxStore(db_path))
+
+        ids = queue.enqueue_batch("0412345678", ["one", "two"], command_type="ONBOARDING", message_type="quick_start")
+        with pytest.raises(ValueError):
+            queue.enqueue("not a phone", "three")
+        queue.store.close()
+
+        reopened = OutboxStore(db_path)
+        row = reopened.get(ids[0])
+        assert (row["to_phone"], row["sender"], row["status"]) == (ALICE, "+61400000000", PENDING)
+        assert (row["command_type"], row["message_type"]) == ("ONBOARDING", "quick_start")
+        assert reopened.counts()[PENDING] == 2
+
+    def test_sender_from_sms_service(self):
+        """The sender number is the one SMSService would pick for the destination."""
+        from app.services.sms import SMSService
+
+        service = SMSService()
+        service.from_number, service.from_number_au, service.from_number_us = \
+            "+61400000000", "+61411111111", None
+        queue = make_queue(service)
+
+        assert queue.store.get(queue.enqueue(ALICE, "one"))["sender"] == "+61411111111"
+
+    @pytest.mark.asyncio
+    async def test_rows_interrupted_mid_send_resent(self, tmp_path):
+        """Rows still "sending" when the process died go out on the next start."""
+        db_path = str(tmp_path / "queue.db")
+        store = OutboxStore(db_path)
+        store.add([(ALICE, "lost", "+61400000000", None, "response")], not_before=0)
+        assert len(store.claim(1, time.time(), skip=set())) == 1
+        store.close()
+
+        service = FakeSMSService()
+        queue = make_queue(service, store=OutboxStore(db_path))
+        queue.start()
+        try:
+            await drain(queue)
+        finally:
+            await queue.stop()
+
+        assert [body for _, body, _ in service.sent] == ["lost"]
+
+
+class TestDelivery:
+    """Tests for ordering, pacing and retries."""
+
+    @pytest.mark.asyncio
+    async def test_recipient_order_and_gap(self):
+        """One recipient's messages go out in order, spaced; others aren't held up."""
+        service = FakeSMSService()
+        queue = make_queue(service, recipient_gap=0.05)
+        queue.enqueue_batch(ALICE, ["a1", "a2", "a3"])
+        queue.enqueue(BOB, "b1")
+
+        queue.start()
+        try:
+            await drain(queue)
+        finally:
+            await queue.stop()
+
+        alice = [(body, at) for to, body, at in service.sent if to == ALICE]
+        assert [body for body, _ in alice] == ["a1", "a2", "a3"]
+        assert all(later - earlier >= 0.045 for (_, earlier), (_, later) in zip(alice, alice[1:]))
+        assert [body for _, body, _ in service.sent].index("b1") < 2
+
+    @pytest.mark.asyncio
+    async def test_sender_pacing(self):
+        """Sends from one number are spaced by the sender rate; other numbers aren't."""
+        service = FakeSMSService(sender=lambda to: "+61400000000" if to != BOB else "+15550000000")
+        queue = make_queue(service, sender_rate=20)  # 50ms apart
+        phones = ["+61411111111", "+61422222222", "+61433333333"]
+        for phone in phones:
+            queue.enqueue(phone, f"to {phone}")
+        queue.enqueue(BOB, "to bob")
+
+        queue.start()
+        try:
+            await drain(queue)
+        finally:
+            await queue.stop()
+
+        paced = sorted(at for to, _, at in service.sent if to in phones)
+        assert all(later - earlier >= 0.045 for earlier, later in zip(paced, paced[1:]))
+        bob_at = next(at for to, _, at in service.sent if to == BOB)
+        assert bob_at - paced[0] < 0.045
+
+    @pytest.mark.asyncio
+    async def test_retry_with_backoff_then_give_up(self):
+        """Failures retry after a growing delay; the recipient's next message waits."""
+        service = FakeSMSService(failures={"flaky": 1, "dead": 10})
+        queue = make_queue(service)
+        flaky, after = queue.enqueue_batch(ALICE, ["flaky", "after flaky"])
+        dead = queue.enqueue(BOB, "dead")
+
+        queue.start()
+        try:
+            await drain(queue)
+        finally:
+            await queue.stop()
+
+        assert [body for to, body, _ in service.sent if to == ALICE] == ["flaky", "after flaky"]
+        assert (queue.store.get(flaky)["status"], queue.store.get(flaky)["attempts"]) == (SENT, 2)
+        assert queue.store.get(after)["sid"]
+        row = queue.store.get(dead)
+        assert (row["status"], row["attempts"], row["error"]) == (FAILED, 3, "Twilio error 20503")
+
+    def test_results_written_in_one_transaction(self):
+        """Every finished send since the last pass is written with one call."""
+        queue = make_queue(FakeSMSService())
+        ids = queue.enqueue_batch(ALICE, ["one", "two", "three"])
+        claimed = queue.store.claim(3, time.time(), skip=set())
+        assert [item.id for item in claimed] == ids[:1]  # Head of line only
+
+        queue._completed = [
+            (QueuedSMS(row_id, ALICE, "x", "+61400000000", None, "response", 0), f"SM{row_id}", None, time.time())
+            for row_id in ids
+        ]
+        with patch.object(queue.store, "finish", wraps=queue.store.finish) as finish:
+            queue._flush()
+
+        finish.assert_called_once()
+        assert queue.store.counts()[SENT] == 3
+
+
+class TestProducers:
+    """Handlers enqueue instead of sending inline."""
+
+    @pytest.mark.asyncio
+    async def test_safecheck_contacts_queued(self):
+        from app.routers import webhook
+
+        queue = make_queue(FakeSMSService())
+        user = SimpleNamespace(phone=ALICE, route_id="overland_track", trail_name="Andrew", last_checkin_at=None)
+        camp = SimpleNamespace(name="Lake Will", lat=-41.8, lon=146.0)
+        contacts = [SimpleNamespace(phone=BOB), SimpleNamespace(phone="+61499999999")]
+
+        with patch("app.models.database.user_store.get_safecheck_contacts", return_value=contacts), \
+                patch("app.routers.webhook.get_sms_queue", return_value=queue), \
+                patch("app.routers.webhook.get_sms_service", side_effect=AssertionError("sent inline")):
+            await webhook.notify_safecheck_contacts(user, camp, "checkin")
+
+        assert queue.store.counts()[PENDING] == 2
+        row = queue.store.get(1)
+        assert row["to_phone"] == BOB and row["body"].startswith("SafeCheck: All OK")
+        assert row["command_type"] == "SAFECHECK"
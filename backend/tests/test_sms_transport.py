@@ -0,0 +1,152 @@
+"""
+Tests for the non-blocking Twilio send path.
+
+Tests:
+- Messages are created through the Twilio REST API with basic auth
+- The event loop keeps running while a send is in flight
+- Twilio errors and network failures come back as SMSMessage errors
+- send_batch and send_with_retry go through the async path
+"""
+import asyncio
+import base64
+import time
+import pytest
+from urllib.parse import parse_qs
+from unittest.mock import patch
+
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.sms import SMSService
+
+
+def make_service() -> SMSService:
+    service = SMSService()
+    service.account_sid = "AC123"
+    service.auth_token = "secret"
+    service.from_number = "+61400000000"
+    service.from_number_au = None
+    service.from_number_us = None
+    return service
+
+
+@pytest.fixture
+def twilio():
+    """Mock Twilio REST API; records requests and can be made slow or failing."""
+    state = {"requests": [], "delay": 0.0, "responses": []}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["requests"].append(request)
+        if state["delay"]:
+            await asyncio.sleep(state["delay"])
+        if state["responses"]:
+            return state["responses"].pop(0)
+        return httpx.Response(201, json={"sid": f"SM{len(state['requests'])}", "status": "queued"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("app.services.sms.get_http_client", return_value=client), \
+            patch.object(SMSService, "_log_message"):
+        yield state
+
+
+class TestTwilioTransport:
+    """Tests for message creation over the async HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_message_created_via_rest_api(self, twilio):
+        """The send is a form POST to the account's Messages resource."""
+        result = await make_service().send_message("0412345678", "Hello")
+
+        assert (result.sid, result.error, result.segments) == ("SM1", None, 1)
+        [request] = twilio["requests"]
+        assert request.method == "POST"
+        assert request.url.path == "/2010-04-01/Accounts/AC123/Messages.json"
+        assert parse_qs(request.content.decode()) == {
+            "To": ["+61412345678"], "From": ["+61400000000"], "Body": ["Hello"],
+        }
+        assert request.headers["authorization"] == "Basic " + base64.b64encode(b"AC123:secret").decode()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_responsive_during_send(self, twilio):
+        """Other tasks keep running while a slow send is in flight."""
+        twilio["delay"] = 0.3
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        try:
+            results = await asyncio.gather(*(
+                make_service().send_message("0412345678", f"Message {i}") for i in range(3)
+            ))
+        finally:
+            task.cancel()
+
+        assert all(result.sid for result in results)
+        assert time.perf_counter() - started < 0.6  # Sends overlapped
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_twilio_error_reported(self, twilio):
+        """A rejected message comes back with Twilio's error code and message."""
+        twilio["responses"].append(httpx.Response(
+            400, json={"code": 21211, "message": "Invalid 'To' Phone Number", "status": 400}
+        ))
+
+        result = await make_service().send_message("0412345678", "Hello")
+
+        assert result.sid is None
+        assert result.error == "Twilio error 21211: Invalid 'To' Phone Number"
+        assert result.cost_cents == 0
+
+    @pytest.mark.asyncio
+    async def test_network_failure_reported(self):
+        """Timeouts and connection errors don't escape send_message."""
+        def handler(request):
+            raise httpx.ConnectTimeout("timed out")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("app.services.sms.get_http_client", return_value=client), \
+                patch.object(SMSService, "_log_message"):
+            result = await make_service().send_message("0412345678", "Hello")
+
+        assert "timed out" in result.error
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials(self, twilio):
+        """No request is made without credentials."""
+        service = make_service()
+        service.auth_token = ""
+
+        result = await service.send_message("0412345678", "Hello")
+
+        assert result.error == "Twilio credentials not configured"
+        assert twilio["requests"] == []
+
+
+class TestBatchAndRetry:
+    """send_batch and send_with_retry use the async send path."""
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_in_order(self, twilio):
+        results = await make_service().send_batch("0412345678", ["one", "two"], delay=0)
+
+        assert [r.sid for r in results] == ["SM1", "SM2"]
+        assert [parse_qs(r.content.decode())["Body"] for r in twilio["requests"]] == [["one"], ["two"]]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_failure(self, twilio):
+        twilio["responses"].append(httpx.Response(503, json={"code": 20503, "message": "Unavailable"}))
+
+        result = await make_service().send_with_retry("0412345678", "Hello", max_retries=2, retry_delay=0)
+
+        assert result.sid == "SM2"
+        assert len(twilio["requests"]) == 2
@@ -0,0 +1,167 @@
+"""
+Tests for pooled SQLite connections.
+
+Tests:
+- One connection per thread per file, reused across blocks and stores
+- Pragmas applied (WAL, synchronous=NORMAL, busy_timeout, mmap_size)
+- Uncommitted changes rolled back at the end of the outermost block
+- Replaced database files reopened; ":memory:" never pooled
+- Stores read and write through the pool
+"""
+import os
+import sqlite3
+import threading
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import create_test_tables
+from app.models.account import AccountStore
+from app.models.database import SQLiteUserStore
+from app.models.sqlite_pool import ConnectionPool, get_connection_pool
+
+
+@pytest.fixture
+def pool():
+    pool = ConnectionPool(busy_timeout_ms=2000, mmap_size=1 << 20, cached_statements=64)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "pool.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (name TEXT)")
+    conn.close()
+    return path
+
+
+class TestReuse:
+    """Tests for per-thread connection reuse."""
+
+    def test_reused_within_thread(self, pool, db_path):
+        with pool.connection(db_path) as first:
+            pass
+        with pool.connection(db_path) as second:
+            assert second is first
+            assert isinstance(second.execute("SELECT 1 AS one").fetchone(), sqlite3.Row)
+
+        assert (pool.stats()["opened"], pool.stats()["reused"]) == (1, 1)
+
+    def test_separate_per_thread(self, pool, db_path):
+        with pool.connection(db_path) as main_conn:
+            pass
+        seen = []
+
+        def worker():
+            with pool.connection(db_path) as conn:
+                seen.append(conn)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen[0] is not main_conn
+        assert pool.stats()["opened"] == 2
+
+    def test_pragmas(self, pool, db_path):
+        with pool.connection(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 2000
+            assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 1 << 20
+
+
+class TestTransactions:
+    """Pooling keeps the old close-per-call transaction behaviour."""
+
+    def test_uncommitted_rolled_back(self, pool, db_path):
+        with pool.connection(db_path) as conn:
+            conn.execute("INSERT INTO items VALUES ('kept')")
+            conn.commit()
+            conn.execute("INSERT INTO items VALUES ('dropped')")
+
+        with pool.connection(db_path) as conn:
+            assert not conn.in_transaction
+            assert [row["name"] for row in conn.execute("SELECT name FROM items")] == ["kept"]
+
+    def test_rolled_back_on_error(self, pool, db_path):
+        with pytest.raises(RuntimeError):
+            with pool.connection(db_path) as conn:
+                conn.execute("INSERT INTO items VALUES ('dropped')")
+                raise RuntimeError("boom")
+
+        with pool.connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+    def test_nested_blocks_share_transaction(self, pool, db_path):
+        """An inner block doesn't roll back the outer block's pending write."""
+        with pool.connection(db_path) as outer:
+            outer.execute("INSERT INTO items VALUES ('pending')")
+            with pool.connection(db_path) as inner:
+                assert inner is outer
+            assert outer.in_transaction
+            outer.commit()
+
+        with pool.connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+
+class TestLifecycle:
+    """Tests for reopening and closing."""
+
+    def test_replaced_file_reopened(self, pool, db_path):
+        with pool.connection(db_path) as old:
+            old.execute("INSERT INTO items VALUES ('old')")
+            old.commit()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE items (name TEXT)")
+        conn.close()
+
+        with pool.connection(db_path) as new:
+            assert new is not old
+            assert new.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+    def test_memory_not_pooled(self, pool):
+        with pool.connection(":memory:") as conn:
+            conn.execute("CREATE TABLE scratch (x)")
+        with pool.connection(":memory:") as conn:
+            assert conn.execute("SELECT name FROM sqlite_master").fetchall() == []
+
+    def test_close(self, pool, db_path):
+        with pool.connection(db_path) as conn:
+            pass
+        pool.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        with pool.connection(db_path) as reopened:
+            assert reopened is not conn
+
+
+class TestStores:
+    """Stores go through the shared pool."""
+
+    def test_stores_share_connection(self, tmp_path):
+        db_path = str(tmp_path / "thunderbird.db")
+        create_test_tables(db_path)
+        users = SQLiteUserStore(db_path)
+        accounts = AccountStore(db_path)
+        pool = get_connection_pool()
+        opened = pool.stats()["opened"]
+
+        users.create_user("+61412345678", "overland_track")
+        account = accounts.create("hiker@example.com", "hash")
+        accounts.link_phone(account.id, "+61412345678")
+        users.log_message(user_phone="+61412345678", direction="inbound", message_type="command",
+                          command_type="CAST", content="CAST LAKEO")
+
+        assert users.get_user("+61412345678").route_id == "overland_track"
+        assert accounts.get_by_phone("+61412345678").id == account.id
+        assert pool.stats()["opened"] == opened  # Already open from the stores' setup
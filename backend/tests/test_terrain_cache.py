@@ -0,0 +1,157 @@
+"""
+Tests for the persistent, size-bounded terrain cache.
+
+Tests:
+- LRU eviction at max_entries with hit/miss/eviction counters
+- Entries persisted to SQLite survive a restart (new store, same file)
+- Warm start preloads the most recent entries
+- peek() reads without touching the counters
+- Relative store paths resolve against the backend directory, not the cwd
+- Elevation and NWS grid lookups go through the cache
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import terrain_cache
+from app.services.terrain_cache import TerrainCache, TerrainStore
+from config.settings import BASE_DIR, settings
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path for an on-disk terrain cache database."""
+    return str(tmp_path / "terrain_cache.db")
+
+
+class TestTerrainCache:
+    """Tests for TerrainCache and TerrainStore."""
+
+    def test_lru_eviction_and_counters(self):
+        """Least recently used entries are evicted past max_entries."""
+        cache = TerrainCache("test", store=None, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1      # a is now most recently used
+        cache.set("c", 3)               # evicts b
+
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats() == {
+            "size": 2,
+            "max_entries": 2,
+            "hits": 2,
+            "disk_hits": 0,
+            "misses": 1,
+            "evictions": 1,
+        }
+
+    def test_evicted_entry_reloaded_from_disk(self, db_path):
+        """Entries evicted from memory are still served from SQLite."""
+        cache = TerrainCache("test", TerrainStore(db_path), max_entries=1)
+        cache.set("a", 100)
+        cache.set("b", 200)
+
+        assert cache.get("a") == 100
+        assert cache.disk_hits == 1
+        assert cache.misses == 0
+
+    def test_survives_restart(self, db_path):
+        """A new process (new store on the same file) sees earlier entries."""
+        first = TerrainCache("point_elevation", TerrainStore(db_path))
+        first.set("-43.149,146.272", 863)
+        first.store.close()
+
+        second = TerrainCache("point_elevation", TerrainStore(db_path))
+        assert second.get("-43.149,146.272") == 863
+
+    def test_namespaces_isolated(self, db_path):
+        """The same key in different namespaces doesn't collide."""
+        store = TerrainStore(db_path)
+        TerrainCache("a", store).set("k", 1)
+        assert TerrainCache("b", store).get("k") is None
+
+    def test_warm_start_loads_most_recent(self, db_path):
+        """Warm start preloads up to max_entries, newest most recently used."""
+        writer = TerrainCache("test", TerrainStore(db_path), max_entries=10)
+        for i in range(5):
+            writer.set(f"k{i}", {"elevation": i})
+        writer.store.close()
+
+        reader = TerrainCache("test", TerrainStore(db_path), max_entries=3)
+        assert reader.warm() == 3
+        assert len(reader) == 3
+        assert reader.get("k4") == {"elevation": 4}
+        assert reader.stats()["hits"] == 1
+        assert reader.stats()["evictions"] == 0
+
+    def test_clear_persistent(self, db_path):
+        """clear(persistent=True) also deletes the disk rows."""
+        cache = TerrainCache("test", TerrainStore(db_path))
+        cache.set("a", 1)
+        cache.clear(persistent=True)
+        assert cache.get("a") is None
+
+    def test_peek_leaves_counters(self, db_path):
+        """peek() reads memory and disk without counting a hit or miss."""
+        cache = TerrainCache("test", TerrainStore(db_path), max_entries=1)
+        cache.set("a", 1)
+        cache.set("b", 2)                # a now only on disk
+
+        assert cache.peek("a") == 1
+        assert cache.peek("missing") is None
+        assert (cache.hits, cache.disk_hits, cache.misses) == (0, 0, 0)
+        assert len(cache) == 1
+
+
+    def test_relative_path_resolved_against_backend(self, tmp_path, monkeypatch):
+        """The default "terrain_cache.db" lands in the backend directory whatever the cwd."""
+        monkeypatch.chdir(tmp_path)
+        with patch.object(settings, "TERRAIN_CACHE_DB_PATH", "terrain_cache.db"), \
+                patch.object(terrain_cache, "_store", None), \
+                patch.object(terrain_cache, "TerrainStore") as store_cls:
+            terrain_cache._get_store()
+
+        store_cls.assert_called_once_with(str(BASE_DIR / "terrain_cache.db"))
+
+    def test_absolute_and_memory_paths_unchanged(self, db_path):
+        from config.settings import resolve_backend_path
+
+        assert resolve_backend_path(db_path) == db_path
+        assert resolve_backend_path(":memory:") == ":memory:"
+        assert resolve_backend_path("") == ""
+
+
+class TestTerrainCacheUsage:
+    """Elevation and NWS grid lookups use the terrain cache."""
+
+    @pytest.mark.asyncio
+    async def test_nws_grid_info_cached(self):
+        """NWS grid metadata is rebuilt from the cache without HTTP."""
+        from app.services.weather.providers.nws import NWSProvider
+
+        provider = NWSProvider()
+        provider._grid_cache.clear(persistent=True)
+
+        points = MagicMock()
+        points.json.return_value = {"properties": {
+            "gridId": "SEW", "gridX": 120, "gridY": 50,
+            "forecast": "https://api.weather.gov/gridpoints/SEW/120,50/forecast",
+            "forecastHourly": "https://api.weather.gov/gridpoints/SEW/120,50/forecast/hourly",
+        }}
+        gridpoints = MagicMock()
+        gridpoints.json.return_value = {"properties": {"elevation": {"value": 1650}}}
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=[points, gridpoints])
+        provider._get_client = AsyncMock(return_value=client)
+
+        first = await provider._get_grid_info(46.8523, -121.7603)
+        second = await NWSProvider()._get_grid_info(46.8523, -121.7603)
+
+        assert client.get.await_count == 2
+        assert second == first
+        assert second.elevation == 1650
+        provider._grid_cache.clear(persistent=True)
@@ -0,0 +1,185 @@
+"""
+Tests for the SMS waypoint code index.
+
+Tests:
+- Bundled camps and peaks resolve case-insensitively, with their route
+- Lookups after the first do no filesystem or database access
+- Rebuilt from route catalogue snapshots; removed routes dropped
+- Custom waypoints indexed and kept current by store change callbacks
+- CAST resolves codes through the index
+"""
+import json
+import os
+import shutil
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.custom_route import CustomRouteStore, CustomWaypointStore, WaypointType
+from app.services.route_catalogue import RouteCatalogue
+from app.services.waypoint_index import WaypointIndex
+from config.settings import ROUTES_DIR
+
+
+@pytest.fixture
+def routes_dir(tmp_path):
+    """Copy of two bundled route files."""
+    directory = tmp_path / "routes"
+    directory.mkdir()
+    for name in ("overland_track.json", "western_arthurs_ak.json"):
+        shutil.copy(ROUTES_DIR / name, directory / name)
+    return directory
+
+
+@pytest.fixture
+def stores(tmp_path):
+    """Custom route and waypoint stores on a fresh database."""
+    db_path = str(tmp_path / "custom.db")
+    return CustomRouteStore(db_path=db_path), CustomWaypointStore(db_path=db_path)
+
+
+@pytest.fixture
+def catalogue(routes_dir):
+    return RouteCatalogue(routes_dir)
+
+
+@pytest.fixture
+def index(catalogue, stores):
+    index = WaypointIndex(catalogue=catalogue, waypoint_store=stores[1])
+    yield index
+    index.close()
+
+
+def touch_later(path: Path) -> None:
+    """Bump a file's mtime so polling sees a change."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestBundledRoutes:
+    """Tests for route file waypoints."""
+
+    def test_camps_and_peaks_resolved(self, index):
+        """Camp and peak codes resolve, case-insensitively, with their route."""
+        camp = index.lookup("ronny")
+        peak = index.lookup("CRADL")
+
+        assert camp.name and not camp.is_peak
+        assert camp.route_id == "overland_track"
+        assert peak.is_peak and peak.elevation > 1000
+        assert peak.route.route_id == "overland_track"
+        assert index.lookup("NOPE1") is None
+
+    def test_lookups_do_no_io(self, index):
+        """Once built, lookups touch neither the filesystem nor the database."""
+        index.lookup("RONNY")
+
+        with patch.object(Path, "glob", side_effect=AssertionError("globbed")), \
+                patch.object(index.waypoint_store, "get_by_sms_code", side_effect=AssertionError("queried")):
+            assert index.lookup("CRADL") is not None
+            assert index.lookup("NOPE1") is None
+
+    def test_follows_catalogue_reloads(self, index, catalogue, routes_dir):
+        """Edited routes are re-indexed when the catalogue reloads; removed ones are dropped."""
+        index.lookup("RONNY")
+        unchanged = index._routes["western_arthurs_ak"]
+
+        path = routes_dir / "overland_track.json"
+        data = json.loads(path.read_text())
+        data["camps"][0]["name"] = "Ronny Creek (renamed)"
+        path.write_text(json.dumps(data))
+        touch_later(path)
+
+        assert catalogue.refresh() is True
+        assert index.lookup("RONNY").name == "Ronny Creek (renamed)"
+        assert index._routes["western_arthurs_ak"] is unchanged
+
+        path.unlink()
+        catalogue.refresh()
+        assert index.lookup("RONNY") is None
+        assert index.stats()["routes"] == 1
+
+
+class TestCustomWaypoints:
+    """Tests for custom waypoints kept current by store callbacks."""
+
+    def test_custom_waypoint_changes_tracked(self, index, stores):
+        """Created, updated and deleted waypoints are reflected without a rebuild."""
+        route_store, waypoint_store = stores
+        route = route_store.create(account_id=1, name="Alps")
+        index.lookup("RONNY")
+
+        waypoint = waypoint_store.create(
+            route_id=route.id, name="Col du Palet", sms_code="palet",
+            lat=45.4, lng=6.8, waypoint_type=WaypointType.PEAK, elevation=2652.4,
+        )
+        entry = index.lookup("PALET")
+        assert (entry.name, entry.elevation, entry.is_peak) == ("Col du Palet", 2652, True)
+        assert entry.route_id == f"custom:{route.id}"
+
+        waypoint_store.update(waypoint.id, name="Col du Palet (2652m)")
+        assert index.lookup("PALET").name == "Col du Palet (2652m)"
+
+        waypoint_store.delete(waypoint.id)
+        assert index.lookup("PALET") is None
+
+    def test_route_delete_drops_its_waypoints(self, index, stores):
+        """Deleting a custom route removes its codes from the index."""
+        route_store, waypoint_store = stores
+        route = route_store.create(account_id=1, name="Alps")
+        waypoint_store.create(route_id=route.id, name="Lac", sms_code="LACXX", lat=45.0, lng=6.0)
+        assert index.lookup("LACXX") is not None
+
+        route_store.delete(route.id)
+        assert index.lookup("LACXX") is None
+
+    def test_existing_waypoints_loaded_and_routes_win(self, catalogue, stores):
+        """Waypoints created before the index are loaded; route codes take precedence."""
+        route_store, waypoint_store = stores
+        route = route_store.create(account_id=1, name="Mine")
+        waypoint_store.create(route_id=route.id, name="My Ronny", sms_code="RONNY", lat=1.0, lng=2.0)
+        waypoint_store.create(route_id=route.id, name="Hut", sms_code="HUTXX", lat=1.0, lng=2.0)
+
+        index = WaypointIndex(catalogue=catalogue, waypoint_store=waypoint_store)
+        try:
+            assert index.lookup("RONNY").route_id == "overland_track"
+            assert index.lookup("HUTXX").name == "Hut"
+        finally:
+            index.close()
+
+    def test_other_databases_ignored(self, index, tmp_path):
+        """Changes to a different database don't touch the index."""
+        index.lookup("RONNY")
+        other_db = str(tmp_path / "other.db")
+        other_route = CustomRouteStore(db_path=other_db).create(account_id=1, name="Other")
+        CustomWaypointStore(db_path=other_db).create(
+            route_id=other_route.id, name="Else", sms_code="ELSEX", lat=0.0, lng=0.0
+        )
+        assert index.lookup("ELSEX") is None
+
+
+class TestCastLookup:
+    """CAST resolves codes through the index."""
+
+    @pytest.mark.asyncio
+    async def test_cast_uses_index(self, index):
+        """generate_cast_forecast looks the code up in the index, not the route files."""
+        from app.routers import webhook
+
+        bom = AsyncMock()
+        bom.get_hourly_forecast.side_effect = RuntimeError("stop after lookup")
+        index.lookup("RONNY")
+
+        with patch("app.services.waypoint_index.get_waypoint_index", return_value=index), \
+                patch("app.services.bom.get_bom_service", return_value=bom), \
+                patch.object(Path, "glob", side_effect=AssertionError("globbed")):
+            unknown = await webhook.generate_cast_forecast("NOPE1")
+            known = await webhook.generate_cast_forecast("RONNY")
+
+        assert unknown.startswith("Unknown location: NOPE1")
+        assert known.startswith("Unable to get forecast for RONNY")
+        camp = index.lookup("RONNY")
+        assert bom.get_hourly_forecast.await_args.args[:2] == (camp.lat, camp.lon)
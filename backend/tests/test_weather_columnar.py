@@ -0,0 +1,223 @@
+"""
+Tests for the columnar hourly forecast representation.
+
+Tests:
+- Reshape-based window aggregation, ignoring missing hours
+- Partial trailing windows dropped; daily windows grouped by date
+- Circular mean of wind directions
+- Past precipitation totals
+- Lazy period materialization in the Open-Meteo parsers
+"""
+import math
+from datetime import datetime
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.weather.columnar import (
+    HourlyColumns,
+    LazyPeriods,
+    CIRCULAR_MEAN,
+    FIRST,
+    MAX,
+    MEAN,
+    MIN,
+    SUM,
+)
+from app.services.weather.providers.openmeteo import OpenMeteoProvider
+from app.services.bom import BOMService
+
+
+def hours(day: int, count: int) -> list:
+    """Hourly timestamps from midnight on 2026-01-<day>."""
+    return [f"2026-01-{day + h // 24:02d}T{h % 24:02d}:00" for h in range(count)]
+
+
+class TestWindowAggregation:
+    """Tests for HourlyColumns.aggregate."""
+
+    def test_reducers(self):
+        """Each reducer works per window and skips missing hours."""
+        columns = HourlyColumns.from_hourly({
+            "time": hours(5, 6),
+            "temp": [8, None, 12, 14, 15, 16],
+            "rain": [0.5, 1.0, None, None, None, None],
+            "dir": [None, 90, 180, 270, 0, 0],
+        }, ["temp", "rain", "dir"])
+
+        windows = columns.aggregate(3, {
+            "min": ("temp", MIN),
+            "max": ("temp", MAX),
+            "mean": ("temp", MEAN),
+            "rain": ("rain", SUM),
+            "dir": ("dir", FIRST),
+        })
+
+        assert windows.starts == ["2026-01-05T00:00", "2026-01-05T03:00"]
+        assert [windows.value("min", i) for i in range(2)] == [8, 14]
+        assert [windows.value("max", i) for i in range(2)] == [12, 16]
+        assert windows.value("mean", 0) == pytest.approx(10)
+        assert windows.value("rain", 0) == pytest.approx(1.5)
+        assert [windows.value("dir", i) for i in range(2)] == [90, 270]
+
+    def test_empty_window_uses_default(self):
+        """A window with no valid hours falls back to the caller's default."""
+        columns = HourlyColumns.from_hourly(
+            {"time": hours(5, 3), "rain": [None, None, None]}, ["rain"]
+        )
+        windows = columns.aggregate(3, {"rain": ("rain", SUM), "wind": ("missing", MEAN)})
+
+        assert math.isnan(windows.fields["rain"][0])
+        assert windows.value("rain", 0, default=0.0) == 0.0
+        assert windows.value("wind", 0) is None
+
+    def test_partial_window_dropped(self):
+        """Trailing hours that don't fill a window are dropped."""
+        columns = HourlyColumns.from_hourly({"time": hours(5, 8), "temp": list(range(8))}, ["temp"])
+        assert len(columns.aggregate(3, {"t": ("temp", MAX)})) == 2
+        assert len(columns.aggregate(1, {"t": ("temp", MAX)})) == 8
+
+    def test_short_column_padded(self):
+        """Variables shorter than the time axis are NaN-padded."""
+        columns = HourlyColumns.from_hourly({"time": hours(5, 6), "temp": [1, 2]}, ["temp"])
+        windows = columns.aggregate(3, {"t": ("temp", MAX)})
+        assert windows.value("t", 0) == 2
+        assert windows.value("t", 1, default=15.0) == 15.0
+
+    def test_daily(self):
+        """Daily aggregation is one window per calendar day."""
+        columns = HourlyColumns.from_hourly(
+            {"time": hours(5, 48), "temp": list(range(48))}, ["temp"]
+        )
+        days = columns.daily({"low": ("temp", MIN), "high": ("temp", MAX)})
+        assert days.starts == ["2026-01-05T00:00", "2026-01-06T00:00"]
+        assert [days.value("high", i) for i in range(2)] == [23, 47]
+
+    def test_daily_groups_by_date(self):
+        """Days follow the timestamps' dates, not 24-hour blocks."""
+        times = hours(5, 30)[6:]  # Starts 06:00, ends 05:00 next day
+        times.insert(10, "2026-01-05T15:30")  # 25-hour day
+        columns = HourlyColumns.from_hourly(
+            {"time": times, "temp": list(range(len(times)))}, ["temp"]
+        )
+
+        days = columns.daily({"n": ("temp", SUM), "high": ("temp", MAX)})
+
+        assert days.starts == ["2026-01-05T06:00", "2026-01-06T00:00"]
+        assert [days.value("high", i) for i in range(2)] == [18, 24]
+        assert days.value("n", 1) == sum(range(19, 25))
+
+    def test_circular_mean(self):
+        """Directions either side of north average to north, not south."""
+        columns = HourlyColumns.from_hourly({
+            "time": hours(5, 6),
+            "dir": [350, 10, None, 80, 100, 90],
+        }, ["dir"])
+
+        windows = columns.aggregate(3, {"dir": ("dir", CIRCULAR_MEAN)})
+
+        assert windows.value("dir", 0) == pytest.approx(0)
+        assert windows.value("dir", 1) == pytest.approx(90)
+
+    def test_invalid_step_rejected(self):
+        """Window step must be positive."""
+        columns = HourlyColumns.from_hourly({"time": hours(5, 3)}, [])
+        with pytest.raises(ValueError):
+            columns.aggregate(0, {})
+
+
+class TestPastTotals:
+    """Tests for recent precipitation sums."""
+
+    def test_horizons_exclude_future(self):
+        """Past hours are summed per horizon; future hours are skipped."""
+        columns = HourlyColumns.from_hourly({
+            "time": hours(1, 96),
+            "precipitation": [1.0] * 96,
+        }, ["precipitation"])
+        now = datetime(2026, 1, 4, 0, 0)  # Hour 72 of the series
+
+        # Hours 0..72 inclusive are past; 24h back includes both ends
+        assert columns.past_totals("precipitation", now, (24, 48, 72)) == [25.0, 49.0, 73.0]
+
+    def test_missing_values_count_as_zero(self):
+        """None hours contribute nothing."""
+        columns = HourlyColumns.from_hourly(
+            {"time": hours(1, 3), "snowfall": [None, 2.0, None]}, ["snowfall"]
+        )
+        assert columns.past_totals("snowfall", datetime(2026, 1, 1, 3), (24,)) == [2.0]
+
+
+class TestLazyPeriods:
+    """Tests for on-demand period construction."""
+
+    def test_built_on_access_and_kept(self):
+        """Periods are built once, when first read."""
+        built = []
+
+        def build(i):
+            built.append(i)
+            return {"index": i}
+
+        periods = LazyPeriods(10, build)
+        assert len(periods) == 10
+        assert built == []
+
+        assert [p["index"] for p in periods[:3]] == [0, 1, 2]
+        periods[0]["index"] = 99
+        assert periods[0]["index"] == 99
+        assert periods[-1]["index"] == 9
+        assert built == [0, 1, 2, 9]
+
+    def test_sequence_behaviour(self):
+        """Behaves like a read-only list for formatters."""
+        periods = LazyPeriods(3, lambda i: i * 10)
+        assert list(periods) == [0, 10, 20]
+        assert periods == [0, 10, 20]
+        assert not LazyPeriods(0, lambda i: i)
+        with pytest.raises(IndexError):
+            periods[3]
+
+
+class TestParserMaterialization:
+    """Open-Meteo parsers return lazily built periods."""
+
+    @staticmethod
+    def response(count: int) -> dict:
+        return {"hourly": {
+            "time": hours(5, count),
+            "temperature_2m": [10.0] * count,
+            "precipitation_probability": [40] * count,
+            "precipitation": [0.5] * count,
+            "wind_speed_10m": [20] * count,
+            "wind_gusts_10m": [35] * count,
+            "wind_direction_10m": [225] * count,
+            "cloud_cover": [90] * count,
+        }}
+
+    def test_provider_periods_lazy(self):
+        """OpenMeteoProvider builds only the periods that are read."""
+        forecast = OpenMeteoProvider()._parse_response(45.0, 6.8, self.response(168))
+
+        assert isinstance(forecast.periods, LazyPeriods)
+        assert len(forecast.periods) == 56
+        first = forecast.periods[0]
+        assert first.rain_amount == 1.5
+        assert first.wind_direction == "SW"
+        assert repr(forecast.periods) == "LazyPeriods(56 periods, 1 built)"
+
+    def test_bom_supplement_periods(self):
+        """BOMService Open-Meteo fallback keeps its int fields and defaults."""
+        forecast = BOMService(use_mock=True)._parse_openmeteo_response(
+            "201-117", "r22489", -43.1, 146.2, self.response(24), days=1
+        )
+
+        assert len(forecast.periods) == 8
+        period = forecast.periods[2]
+        assert period.period == "AM"
+        assert isinstance(period.wind_avg, int)
+        assert period.cloud_base == 800
+        assert period.freezing_level == 1500  # Default: not in response
@@ -32,6 +32,15 @@ from app.services.weather.providers.openmeteo import (
 from app.services.weather.providers.nws import NWSProvider
 from app.services.weather.providers.envcanada import EnvironmentCanadaProvider
 from app.services.weather.providers.metoffice import MetOfficeProvider
+from app.services.weather.precip_history import reset_precip_history
+
+
+@pytest.fixture(autouse=True)
+def fresh_precip_history():
+    """Each test starts with an empty precipitation history cache."""
+    reset_precip_history()
+    yield
+    reset_precip_history()
 
 
 class TestOpenMeteoProvider:
@@ -127,6 +136,52 @@ class TestOpenMeteoProvider:
         assert 0 <= period.rain_chance <= 100
         assert period.wind_direction == "S"  # 180 degrees
 
+    @pytest.mark.asyncio
+    async def test_get_forecasts_batches_points(self):
+        """Many points go out as one comma-separated request per chunk."""
+        import httpx
+        from config.settings import settings
+
+        requests = []
+
+        history = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            lats = request.url.params["latitude"].split(",")
+            if "past_hours" in request.url.params:
+                history.append(request)
+                locations = [
+                    {"hourly": {"time": ["2026-01-21T00:00"], "precipitation": [1.0]}}
+                    for _ in lats
+                ]
+            else:
+                requests.append(request)
+                locations = [
+                    {"elevation": 1000 + i, "hourly": {"time": []}}
+                    for i, _ in enumerate(lats)
+                ]
+            return httpx.Response(200, json=locations if len(lats) > 1 else locations[0])
+
+        provider = OpenMeteoProvider()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        provider._get_client = AsyncMock(return_value=client)
+        points = [(45.0 + i / 10, 6.8) for i in range(5)]
+
+        with patch.object(settings, "OPEN_METEO_MAX_LOCATIONS", 3):
+            forecasts = await provider.get_forecasts(points, days=2)
+
+        assert len(requests) == 2
+        assert requests[0].url.params["latitude"] == "45.0,45.1,45.2"
+        assert [(f.lat, f.model_elevation) for f in forecasts] == [
+            (45.0, 1000), (45.1, 1001), (45.2, 1002), (45.3, 1000), (45.4, 1001)
+        ]
+        assert "past_days" not in requests[0].url.params
+
+        # Recent precipitation comes from the (batched) history cache
+        assert len(history) == 2
+        assert all(f.recent_precip is not None for f in forecasts)
+        await client.aclose()
+
     @pytest.mark.asyncio
     async def test_fetch_forecast_empty_response(self):
         """Open-Meteo handles empty API response gracefully."""
@@ -521,6 +576,33 @@ class TestProviderModelConfiguration:
         assert provider.model == OpenMeteoModel.BEST_MATCH
 
 
+class TestCompactForecastTypes:
+    """Forecast types cached in bulk carry no per-instance __dict__."""
+
+    def test_forecast_types_slotted(self):
+        """Period and forecast dataclasses use __slots__."""
+        from app.services.bom import CellForecast, ForecastPeriod, RecentPrecipitation
+
+        for cls in (NormalizedForecast, NormalizedDailyForecast, WeatherAlert,
+                    ForecastPeriod, CellForecast, RecentPrecipitation):
+            assert "__slots__" in cls.__dict__, cls.__name__
+
+    def test_period_alerts_shared_empty(self):
+        """Periods without alerts share one empty tuple instead of a list each."""
+        provider = OpenMeteoProvider()
+        forecast = provider._parse_response(45.0, 6.8, {"hourly": {
+            "time": ["2026-01-21T00:00", "2026-01-21T01:00", "2026-01-21T02:00",
+                     "2026-01-21T03:00", "2026-01-21T04:00", "2026-01-21T05:00"],
+            "temperature_2m": [10.0] * 6,
+        }})
+
+        first, second = forecast.periods
+        assert first.alerts == ()
+        assert first.alerts is second.alerts
+        with pytest.raises(AttributeError):
+            first.unknown_field = 1
+
+
 # Run with: pytest backend/tests/test_weather_providers.py -v
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -9,7 +9,12 @@ Tests:
 - Fallback on provider failure
 - is_fallback flag tracking
 - Cache behavior (get, set, invalidate)
+- Cache keys on the model grid (resolved NWS gridpoints)
+- Request coalescing (single-flight)
+- Primary and precipitation supplement fetched concurrently
+- Latency-budgeted hedging of slow primaries
 """
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
@@ -27,6 +32,9 @@ from app.services.weather.cache import (
     WeatherCache,
     reset_weather_cache,
 )
+from app.services.terrain_cache import TerrainCache, NWS_GRID
+from app.services.weather.providers.nws import grid_cache_key
+from app.services.weather.providers.openmeteo import MODEL_NAMES, OpenMeteoModel
 from app.services.weather.base import (
     NormalizedDailyForecast,
     NormalizedForecast,
@@ -407,7 +415,7 @@ class TestWeatherCache:
         assert cache.get("test", 40.0, -74.0, 7) is not None
 
         # Manually expire by manipulating cache entry
-        key = cache._make_key("test", 40.0, -74.0, 7)
+        key = cache.key_for("test", 40.0, -74.0, 7)
         cache._cache[key] = (mock_forecast, datetime.now(timezone.utc) - timedelta(seconds=10))
 
         # Should be expired now
@@ -418,8 +426,8 @@ class TestWeatherCache:
         cache = WeatherCache()
 
         # These should produce the same cache key
-        key1 = cache._make_key("test", 40.71280001, -74.00600001, 7)
-        key2 = cache._make_key("test", 40.71280009, -74.00600009, 7)
+        key1 = cache.key_for("test", 40.71280001, -74.00600001, 7)
+        key2 = cache.key_for("test", 40.71280009, -74.00600009, 7)
         assert key1 == key2
 
     def test_cache_stats(self):
@@ -446,8 +454,8 @@ class TestWeatherCache:
         assert stats["ttl_seconds"] == 3600
 
     def test_cache_cleanup_expired(self):
-        """Cache cleanup removes expired entries."""
-        cache = WeatherCache(ttl_seconds=1)
+        """Cache cleanup removes entries past the stale window."""
+        cache = WeatherCache(ttl_seconds=1, max_stale_seconds=0)
 
         mock_forecast = NormalizedDailyForecast(
             provider="test",
@@ -463,7 +471,7 @@ class TestWeatherCache:
         cache.set("test", 40.0, -74.0, 7, mock_forecast)
 
         # Manually expire
-        key = cache._make_key("test", 40.0, -74.0, 7)
+        key = cache.key_for("test", 40.0, -74.0, 7)
         cache._cache[key] = (mock_forecast, datetime.now(timezone.utc) - timedelta(seconds=10))
 
         # Cleanup
@@ -539,6 +547,554 @@ class TestRouterCacheIntegration:
         assert cached.is_fallback is True
 
 
+class TestRouterCoalescing:
+    """Tests for single-flight request coalescing in the router."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self):
+        """N concurrent misses for one point make one upstream call."""
+        router = WeatherRouter()
+        calls = 0
+
+        async def slow_forecast(lat, lon, days):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return NormalizedDailyForecast(
+                provider="Open-Meteo (Meteo-France)",
+                lat=lat,
+                lon=lon,
+                country_code="",
+                periods=[],
+                alerts=[],
+                fetched_at=datetime.now(timezone.utc),
+            )
+
+        router.providers["FR"].get_forecast = slow_forecast
+
+        results = await asyncio.gather(*[
+            router.get_forecast(45.83, 6.86, "FR", days=2)
+            for _ in range(5)
+        ])
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert router.coalescing_stats() == {
+            "originating": 1,
+            "coalesced": 4,
+            "in_flight": 0,
+            "stale_revalidations": 0,
+            "stale_on_error": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_share_fallback(self):
+        """Coalesced callers all receive the fallback result."""
+        router = WeatherRouter()
+
+        async def failing_primary(lat, lon, days):
+            await asyncio.sleep(0.01)
+            raise Exception("Met Office down")
+
+        router.providers["GB"].get_forecast = failing_primary
+        router.fallback.get_forecast = AsyncMock(return_value=NormalizedDailyForecast(
+            provider="Open-Meteo",
+            lat=54.45,
+            lon=-3.21,
+            country_code="",
+            periods=[],
+            alerts=[],
+            fetched_at=datetime.now(timezone.utc),
+        ))
+
+        results = await asyncio.gather(
+            router.get_forecast(54.45, -3.21, "GB", days=2),
+            router.get_forecast(54.45, -3.21, "GB", days=2),
+        )
+
+        assert router.fallback.get_forecast.await_count == 1
+        assert all(r.is_fallback for r in results)
+
+    @pytest.mark.asyncio
+    async def test_different_days_not_coalesced(self):
+        """Different day counts are separate in-flight keys."""
+        router = WeatherRouter()
+        router.providers["FR"].get_forecast = AsyncMock(return_value=NormalizedDailyForecast(
+            provider="Open-Meteo (Meteo-France)",
+            lat=45.83,
+            lon=6.86,
+            country_code="",
+            periods=[],
+            alerts=[],
+            fetched_at=datetime.now(timezone.utc),
+        ))
+
+        await asyncio.gather(
+            router.get_forecast(45.83, 6.86, "FR", days=2),
+            router.get_forecast(45.83, 6.86, "FR", days=7),
+        )
+
+        assert router.providers["FR"].get_forecast.await_count == 2
+        assert router.coalesced_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_unbudgeted_caller_not_bound_by_sms_budget(self):
+        """A web caller arriving during a budgeted fetch waits for the slow primary."""
+        router = WeatherRouter()
+        calls = 0
+
+        async def slow_forecast(lat, lon, days):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.2)
+            return NormalizedDailyForecast(
+                provider="Open-Meteo (Meteo-France)", lat=lat, lon=lon, country_code="",
+                periods=[], alerts=[], fetched_at=datetime.now(timezone.utc),
+            )
+
+        router.providers["FR"].get_forecast = slow_forecast
+
+        sms, web = await asyncio.gather(
+            router.get_forecast(45.83, 6.86, "FR", days=2, latency_budget=0.05),
+            router.get_forecast(45.83, 6.86, "FR", days=2),
+            return_exceptions=True,
+        )
+
+        assert isinstance(sms, WeatherProviderError)
+        assert web.provider == "Open-Meteo (Meteo-France)"
+        assert calls == 2
+        assert router.coalescing_stats()["in_flight"] == 0
+
+
+def make_period(provider: str, ts: datetime, rain_amount: float = 0.0) -> NormalizedForecast:
+    """Build a single forecast period for supplement tests."""
+    return NormalizedForecast(
+        provider=provider,
+        lat=40.0,
+        lon=-105.0,
+        timestamp=ts,
+        temp_min=5.0,
+        temp_max=15.0,
+        rain_chance=30,
+        rain_amount=rain_amount,
+        wind_avg=20.0,
+        wind_max=35.0,
+        wind_direction="W",
+        cloud_cover=50,
+    )
+
+
+class TestRouterSupplementConcurrency:
+    """Tests for running primary and precipitation supplement in parallel."""
+
+    def _setup_us(self, router, supplement_error=None):
+        """Wire slow NWS and HRRR mocks that record overlap."""
+        ts = datetime(2026, 7, 1, 12, tzinfo=timezone.utc)
+        state = {"open": 0, "max_open": 0, "supplement_cancelled": False}
+
+        async def run(error, result):
+            state["open"] += 1
+            state["max_open"] = max(state["max_open"], state["open"])
+            try:
+                await asyncio.sleep(0.05)
+            finally:
+                state["open"] -= 1
+            if error:
+                raise error
+            return result
+
+        async def primary(lat, lon, days):
+            return await run(None, NormalizedDailyForecast(
+                provider="NWS", lat=lat, lon=lon, country_code="",
+                periods=[make_period("NWS", ts)], alerts=[],
+                fetched_at=datetime.now(timezone.utc),
+            ))
+
+        async def supplement(lat, lon, days):
+            try:
+                return await run(supplement_error, NormalizedDailyForecast(
+                    provider="Open-Meteo (HRRR)", lat=lat, lon=lon, country_code="",
+                    periods=[make_period("Open-Meteo (HRRR)", ts, rain_amount=7.5)], alerts=[],
+                    fetched_at=datetime.now(timezone.utc),
+                ))
+            except asyncio.CancelledError:
+                state["supplement_cancelled"] = True
+                raise
+
+        router.providers["US"].get_forecast = primary
+        router.precip_supplements["US"].get_forecast = supplement
+        return state
+
+    @pytest.mark.asyncio
+    async def test_supplement_overlaps_primary(self):
+        """HRRR supplement runs alongside NWS and is merged in."""
+        router = WeatherRouter()
+        state = self._setup_us(router)
+
+        forecast = await router.get_forecast(40.0, -105.0, "US", days=2)
+
+        assert state["max_open"] == 2
+        assert forecast.is_fallback is False
+        assert forecast.periods[0].rain_amount == 7.5
+
+    @pytest.mark.asyncio
+    async def test_supplement_failure_keeps_primary(self):
+        """A failed supplement leaves the primary forecast unchanged."""
+        router = WeatherRouter()
+        self._setup_us(router, supplement_error=Exception("HRRR down"))
+
+        forecast = await router.get_forecast(40.0, -105.0, "US", days=2)
+
+        assert forecast.provider == "NWS"
+        assert forecast.is_fallback is False
+        assert forecast.periods[0].rain_amount == 0.0
+
+    @pytest.mark.asyncio
+    async def test_primary_failure_cancels_supplement_and_falls_back(self):
+        """Primary failure still falls back; the pending supplement is cancelled."""
+        router = WeatherRouter()
+        state = self._setup_us(router)
+
+        async def failing_primary(lat, lon, days):
+            await asyncio.sleep(0.01)
+            raise Exception("NWS down")
+
+        router.providers["US"].get_forecast = failing_primary
+        router.fallback.get_forecast = AsyncMock(return_value=NormalizedDailyForecast(
+            provider="Open-Meteo", lat=40.0, lon=-105.0, country_code="",
+            periods=[], alerts=[], fetched_at=datetime.now(timezone.utc),
+        ))
+
+        forecast = await router.get_forecast(40.0, -105.0, "US", days=2)
+        await asyncio.sleep(0)
+
+        assert forecast.is_fallback is True
+        assert state["supplement_cancelled"] is True
+
+
+class TestRouterHedging:
+    """Tests for latency-budgeted (SMS) forecasts."""
+
+    def _forecast(self, provider: str) -> NormalizedDailyForecast:
+        return NormalizedDailyForecast(
+            provider=provider, lat=54.45, lon=-3.21, country_code="",
+            periods=[], alerts=[], fetched_at=datetime.now(timezone.utc),
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged_with_fallback(self):
+        """A slow Met Office answer is beaten by the hedged Open-Meteo fallback."""
+        router = WeatherRouter()
+        router.hedge_delay = 0.02
+
+        async def slow_primary(lat, lon, days):
+            await asyncio.sleep(1.0)
+            return self._forecast("Met Office")
+
+        router.providers["GB"].get_forecast = slow_primary
+        router.precip_supplements["GB"].get_forecast = AsyncMock(return_value=self._forecast("Open-Meteo"))
+        router.fallback.get_forecast = AsyncMock(return_value=self._forecast("Open-Meteo"))
+
+        forecast = await router.get_forecast(54.45, -3.21, "GB", days=2, latency_budget=0.5)
+
+        assert forecast.is_fallback is True
+        assert router.hedge_stats.summary()["fallback_hedged"]["count"] == 1
+        # Cached under the fallback provider name, as for sequential fallback
+        assert router.cache.get(router.fallback.provider_name, 54.45, -3.21, 2) is not None
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        """A primary answering inside the hedge delay never fires the fallback."""
+        router = WeatherRouter()
+        router.providers["FR"].get_forecast = AsyncMock(return_value=self._forecast("Open-Meteo (Meteo-France)"))
+        router.fallback.get_forecast = AsyncMock()
+
+        forecast = await router.get_forecast(45.83, 6.86, "FR", days=2, latency_budget=5.0)
+
+        assert forecast.is_fallback is False
+        router.fallback.get_forecast.assert_not_called()
+        assert router.hedge_stats.summary()["primary"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted_raises(self):
+        """Nothing inside the budget surfaces as WeatherProviderError."""
+        router = WeatherRouter()
+
+        async def hung(lat, lon, days):
+            await asyncio.sleep(1.0)
+
+        router.providers["FR"].get_forecast = hung
+
+        with pytest.raises(WeatherProviderError):
+            await router.get_forecast(45.83, 6.86, "FR", days=2, latency_budget=0.05)
+        assert router.coalescing_stats()["in_flight"] == 0
+
+
 # Run with: pytest backend/tests/test_weather_router.py -v
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+@pytest.fixture
+def nws_grid_cache():
+    """In-memory NWS grid info cache, as filled by /points lookups."""
+    grid_cache = TerrainCache(NWS_GRID, store=None)
+    with patch("app.services.weather.providers.nws.get_terrain_cache", return_value=grid_cache):
+        yield grid_cache
+
+
+def _resolve_gridpoint(grid_cache, lat, lon, office, grid_x, grid_y):
+    """Record a /points lookup result the way NWSProvider caches it."""
+    grid_cache.set(grid_cache_key(lat, lon), {
+        "office": office,
+        "gridX": grid_x,
+        "gridY": grid_y,
+        "forecast_url": "",
+        "forecast_hourly_url": "",
+        "elevation": None,
+    })
+
+
+class TestModelGridCacheKeys:
+    """Cache keys snap to the provider's native model grid."""
+
+    def test_nearby_points_share_nws_gridpoint(self, nws_grid_cache):
+        """Two hikers 50m apart in one NWS gridpoint share a cache entry."""
+        cache = WeatherCache()
+        mock_forecast = NormalizedDailyForecast(
+            provider="NWS",
+            lat=46.8523,
+            lon=-121.7603,
+            country_code="US",
+            periods=[],
+            alerts=[],
+            fetched_at=datetime.now(timezone.utc),
+        )
+        _resolve_gridpoint(nws_grid_cache, 46.8523, -121.7603, "SEW", 134, 50)
+        _resolve_gridpoint(nws_grid_cache, 46.8527, -121.7608, "SEW", 134, 50)
+        cache.set("NWS", 46.8523, -121.7603, 7, mock_forecast)
+
+        assert cache.key_for("NWS", 46.8523, -121.7603, 7) == "NWS:nws/SEW/134,50:7"
+        assert cache.get("NWS", 46.8527, -121.7608, 7) is mock_forecast
+        # Same point under a provider without a known grid is still precise
+        assert cache.key_for("test", 46.8523, -121.7603, 7) != cache.key_for("test", 46.8527, -121.7608, 7)
+
+    def test_neighbouring_nws_gridpoints_not_shared(self, nws_grid_cache):
+        """Close points in different NWS gridpoints keep separate entries."""
+        cache = WeatherCache()
+        _resolve_gridpoint(nws_grid_cache, 46.8523, -121.7603, "SEW", 134, 50)
+        _resolve_gridpoint(nws_grid_cache, 46.8524, -121.7603, "SEW", 134, 51)
+        assert cache.key_for("NWS", 46.8523, -121.7603, 7) != cache.key_for("NWS", 46.8524, -121.7603, 7)
+
+    def test_unresolved_nws_point_keeps_coordinate_key(self, nws_grid_cache):
+        """Before the /points lookup is cached, NWS keys on the exact coordinates."""
+        cache = WeatherCache()
+        assert cache.key_for("NWS", 46.8523, -121.7603, 7) == "NWS:46.8523,-121.7603:7"
+        assert cache.key_for("NWS", 46.8523, -121.7603, 7) != cache.key_for("NWS", 46.8527, -121.7608, 7)
+        assert nws_grid_cache.stats()["misses"] == 0
+
+    def test_distant_points_different_cells(self):
+        """Points several km apart get different cells."""
+        cache = WeatherCache()
+        ecmwf = MODEL_NAMES[OpenMeteoModel.ECMWF]
+        assert cache.key_for(ecmwf, -43.0, 172.0, 7) != cache.key_for(ecmwf, -43.2, 172.0, 7)
+
+    def test_projected_grid_error_bound(self):
+        """Approximated projected grids only share keys within one cell diagonal."""
+        import math
+        from app.services.weather.grid import ICON_CH2, KM_PER_DEGREE
+
+        spacing_km = ICON_CH2.lat_step * KM_PER_DEGREE
+        points = [(46.5 + i * 0.004, 7.9 + j * 0.006) for i in range(10) for j in range(10)]
+        for a in points:
+            for b in points:
+                if ICON_CH2.cell_id(*a) != ICON_CH2.cell_id(*b):
+                    continue
+                dy = (a[0] - b[0]) * KM_PER_DEGREE
+                dx = (a[1] - b[1]) * KM_PER_DEGREE * math.cos(math.radians(a[0]))
+                assert math.hypot(dx, dy) <= spacing_km * math.sqrt(2)
+
+    def test_bom_key_matches_geohash(self):
+        """BOM cells are the geohash-6 cells the BOM API resolves."""
+        import geohash2
+        from app.services.weather.grid import BOM_ACCESS_C
+
+        points = [(-43.1490, 146.2720), (-43.1510, 146.2790), (-41.0, 145.5), (-43.5472, 146.6231)]
+        for a in points:
+            for b in points:
+                same_hash = geohash2.encode(*a, precision=6) == geohash2.encode(*b, precision=6)
+                assert (BOM_ACCESS_C.cell_id(*a) == BOM_ACCESS_C.cell_id(*b)) == same_hash
+
+    def test_jma_snaps_to_nearest_node(self):
+        """Regular lat/lon grids snap to the nearest grid node."""
+        from app.services.weather.grid import JMA_MSM
+
+        assert JMA_MSM.cell(35.3606, 138.7274) == JMA_MSM.cell(35.3500, 138.7500)
+        assert JMA_MSM.cell(35.3606, 138.7274) != JMA_MSM.cell(35.3800, 138.7274)
+
+    def test_invalidate_clears_whole_cell(self, nws_grid_cache):
+        """Invalidating a location drops the entry for its model cell."""
+        cache = WeatherCache()
+        mock_forecast = NormalizedDailyForecast(
+            provider="NWS",
+            lat=46.8523,
+            lon=-121.7603,
+            country_code="US",
+            periods=[],
+            alerts=[],
+            fetched_at=datetime.now(timezone.utc),
+        )
+        _resolve_gridpoint(nws_grid_cache, 46.8523, -121.7603, "SEW", 134, 50)
+        _resolve_gridpoint(nws_grid_cache, 46.8527, -121.7608, "SEW", 134, 50)
+        cache.set("NWS", 46.8523, -121.7603, 7, mock_forecast)
+        assert cache.invalidate("NWS", 46.8527, -121.7608) == 1
+
+    def test_provider_grids_match_provider_names(self):
+        """Grid lookup uses the names the providers actually report."""
+        from app.services.weather.grid import get_model_grid, JMA_MSM
+        from app.services.weather.providers.nws import NWSProvider
+        from app.services.weather.providers.bom import BOMProvider
+        from app.services.weather.providers.openmeteo import OpenMeteoProvider, OpenMeteoModel
+
+        assert get_model_grid(OpenMeteoProvider(model=OpenMeteoModel.JMA).provider_name) is JMA_MSM
+        assert get_model_grid(NWSProvider().provider_name) is None  # Keyed on resolved gridpoints
+        assert get_model_grid(BOMProvider().provider_name) is not None
+        assert get_model_grid(OpenMeteoProvider().provider_name) is None
+
+    def test_grids_only_for_cached_providers(self):
+        """Every gridded provider is a primary provider, so its grid is actually used."""
+        from app.services.weather.grid import PROVIDER_GRIDS
+
+        router = WeatherRouter()
+        primaries = {provider.provider_name for provider in router.providers.values()}
+        assert set(PROVIDER_GRIDS) <= primaries
+
+
+def _expire(cache, provider, lat, lon, days, seconds_ago):
+    """Backdate a cache entry's expiry."""
+    key = cache.key_for(provider, lat, lon, days)
+    forecast, _ = cache._cache[key]
+    cache._cache[key] = (forecast, datetime.now(timezone.utc) - timedelta(seconds=seconds_ago))
+
+
+class TestModelRunExpiry:
+    """Entries expire when the model's next run is published."""
+
+    def test_next_run_available(self):
+        """ECMWF 6-hourly runs published 8h after run time."""
+        from app.services.weather.schedule import ModelSchedule
+
+        ecmwf = ModelSchedule(interval_hours=6, delay_minutes=480)
+        # 10:00Z: 00Z run published at 08:00Z, 06Z run due at 14:00Z
+        now = datetime(2026, 1, 10, 10, 0, tzinfo=timezone.utc)
+        assert ecmwf.next_run_available(now) == datetime(2026, 1, 10, 14, 0, tzinfo=timezone.utc)
+        # 05:00Z: 18Z (previous day) run due at 02:00Z already out, 00Z due 08:00Z
+        now = datetime(2026, 1, 10, 5, 0, tzinfo=timezone.utc)
+        assert ecmwf.next_run_available(now) == datetime(2026, 1, 10, 8, 0, tzinfo=timezone.utc)
+
+    def test_scheduled_provider_uses_run_expiry(self):
+        """Scheduled models expire at the next run, others after the TTL."""
+        cache = WeatherCache(ttl_seconds=3600)
+        forecast = NormalizedDailyForecast(
+            provider="Open-Meteo (ECMWF)",
+            lat=-41.0,
+            lon=174.0,
+            country_code="NZ",
+            periods=[],
+            alerts=[],
+            fetched_at=datetime.now(timezone.utc),
+        )
+        before = datetime.now(timezone.utc)
+        cache.set("Open-Meteo (ECMWF)", -41.0, 174.0, 7, forecast)
+        cache.set("test", -41.0, 174.0, 7, forecast)
+
+        _, ecmwf_expiry = cache._cache[cache.key_for("Open-Meteo (ECMWF)", -41.0, 174.0, 7)]
+        _, ttl_expiry = cache._cache[cache.key_for("test", -41.0, 174.0, 7)]
+        assert before < ecmwf_expiry <= before + timedelta(hours=6)
+        assert ecmwf_expiry.minute == 0
+        assert ttl_expiry == pytest.approx(before + timedelta(hours=1), abs=timedelta(seconds=5))
+
+
+class TestStaleServing:
+    """Stale-while-revalidate and stale-on-error in the router."""
+
+    @staticmethod
+    def _forecast(lat, lon, label="fresh"):
+        return NormalizedDailyForecast(
+            provider=label,
+            lat=lat,
+            lon=lon,
+            country_code="NZ",
+            periods=[],
+            alerts=[],
+            fetched_at=datetime.now(timezone.utc),
+        )
+
+    def test_get_stale_window(self):
+        """get_stale returns expired entries only within the window."""
+        cache = WeatherCache(max_stale_seconds=600)
+        cache.set("test", 40.0, -74.0, 7, self._forecast(40.0, -74.0))
+        _expire(cache, "test", 40.0, -74.0, 7, seconds_ago=300)
+
+        assert cache.get("test", 40.0, -74.0, 7) is None
+        assert cache.get_stale("test", 40.0, -74.0, 7) is not None
+        assert cache.get_stale("test", 40.0, -74.0, 7, max_stale_seconds=60) is None
+
+    @pytest.mark.asyncio
+    async def test_stale_served_while_revalidating(self):
+        """A recently expired entry is returned at once and refreshed behind."""
+        router = WeatherRouter()
+        refreshed = asyncio.Event()
+
+        async def slow_forecast(lat, lon, days):
+            await asyncio.sleep(0.05)
+            refreshed.set()
+            return self._forecast(lat, lon)
+
+        router.providers["NZ"].get_forecast = slow_forecast
+        name = router.providers["NZ"].provider_name
+        router.cache.set(name, -41.0, 174.0, 7, self._forecast(-41.0, 174.0, "stale"))
+        _expire(router.cache, name, -41.0, 174.0, 7, seconds_ago=60)
+
+        result = await router.get_forecast(-41.0, 174.0, "NZ")
+        assert result.provider == "stale"
+        assert router.coalescing_stats()["stale_revalidations"] == 1
+
+        await asyncio.wait_for(refreshed.wait(), 1.0)
+        await asyncio.sleep(0)
+        assert router.cache.get(name, -41.0, 174.0, 7).provider == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_stale_served_on_outage(self):
+        """Older stale data beats an error when every provider fails."""
+        router = WeatherRouter()
+        router.stale_while_revalidate = 0
+
+        async def failing(lat, lon, days):
+            raise Exception("upstream down")
+
+        router.providers["NZ"].get_forecast = failing
+        name = router.providers["NZ"].provider_name
+        router.cache.set(name, -41.0, 174.0, 7, self._forecast(-41.0, 174.0, "stale"))
+        _expire(router.cache, name, -41.0, 174.0, 7, seconds_ago=3 * 3600)
+
+        result = await router.get_forecast(-41.0, 174.0, "NZ")
+        assert result.provider == "stale"
+        assert router.coalescing_stats()["stale_on_error"] == 1
+
+    @pytest.mark.asyncio
+    async def test_too_stale_raises(self):
+        """Entries past max_stale_seconds aren't served."""
+        router = WeatherRouter()
+        router.stale_while_revalidate = 0
+
+        async def failing(lat, lon, days):
+            raise Exception("upstream down")
+
+        router.providers["NZ"].get_forecast = failing
+        name = router.providers["NZ"].provider_name
+        router.cache.set(name, -41.0, 174.0, 7, self._forecast(-41.0, 174.0, "stale"))
+        _expire(router.cache, name, -41.0, 174.0, 7, seconds_ago=router.cache.max_stale_seconds + 60)
+
+        with pytest.raises(WeatherProviderError):
+            await router.get_forecast(-41.0, 174.0, "NZ")